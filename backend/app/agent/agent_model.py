@@ -18,11 +18,11 @@ from collections.abc import Callable
 from typing import Any
 
 from camel.messages import BaseMessage
-from camel.models import ModelFactory
 from camel.toolkits import FunctionTool, RegisteredAgentToolkit
 from camel.types import ModelPlatformType
 
 from app.agent.listen_chat_agent import ListenChatAgent, logger
+from app.component.model_factory import create_model
 from app.model.chat import AgentModelConfig, Chat
 from app.service.task import ActionCreateAgentData, Agents, get_task_lock
 from app.utils.event_loop_utils import _schedule_async_task
@@ -135,7 +135,7 @@ def agent_model(
             )
             model_platform_enum = None
 
-    model = ModelFactory.create(
+    model = create_model(
         model_platform=effective_config["model_platform"],
         model_type=effective_config["model_type"],
         api_key=effective_config["api_key"],
@@ -14,11 +14,10 @@
 import asyncio
 import uuid
 
-from camel.models import ModelFactory
-
 from app.agent.listen_chat_agent import ListenChatAgent, logger
 from app.agent.prompt import MCP_SYS_PROMPT
 from app.agent.tools import get_mcp_tools
+from app.component.model_factory import create_model
 from app.model.chat import Chat
 from app.service.task import ActionCreateAgentData, Agents, get_task_lock
 from app.utils.toolkit.mcp_search_toolkit import McpSearchToolkit
@@ -77,7 +76,7 @@ async def mcp_agent(options: Chat):
         options.project_id,
         Agents.mcp_agent,
         system_message=MCP_SYS_PROMPT,
-        model=ModelFactory.create(
+        model=create_model(
             model_platform=options.model_platform,
             model_type=options.model_type,
             api_key=options.api_key,
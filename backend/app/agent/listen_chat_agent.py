@@ -39,6 +39,7 @@ from app.service.task import (
     Action,
     ActionActivateAgentData,
     ActionActivateToolkitData,
+    ActionAgentOutputData,
     ActionBudgetNotEnough,
     ActionDeactivateAgentData,
     ActionDeactivateToolkitData,
@@ -46,6 +47,8 @@ from app.service.task import (
     set_process_task,
 )
 from app.utils.event_loop_utils import _schedule_async_task
+from app.utils.log_utils import LazyJson, Truncated
+from app.utils.stream_accumulator import ChunkAccumulator
 
 # Logger for agent tracking
 logger = logging.getLogger("agent")
@@ -121,6 +124,34 @@ class ListenChatAgent(ChatAgent):
 
     process_task_id: str = ""
 
+    stream_flush_chars: int = 0
+    r"""When positive, streamed output is forwarded to the frontend as
+    ``agent_output`` deltas of about this many characters. 0 sends the
+    text only once, with the deactivate event."""
+
+    def _send_agent_output(self, delta: str) -> None:
+        task_lock = get_task_lock(self.api_task_id)
+        _schedule_async_task(
+            task_lock.put_queue(
+                ActionAgentOutputData(
+                    data={
+                        "agent_name": self.agent_name,
+                        "process_task_id": self.process_task_id,
+                        "agent_id": self.agent_id,
+                        "content": delta,
+                    },
+                )
+            )
+        )
+
+    def _chunk_accumulator(self) -> ChunkAccumulator:
+        if self.stream_flush_chars <= 0:
+            return ChunkAccumulator()
+        return ChunkAccumulator(
+            on_flush=self._send_agent_output,
+            flush_chars=self.stream_flush_chars,
+        )
+
     def _send_agent_deactivate(self, message: str, tokens: int) -> None:
         """Send agent deactivation event to the frontend.
 
@@ -177,18 +208,18 @@ class ListenChatAgent(ChatAgent):
             Tuple of (accumulated_content, total_tokens) via
             StopIteration value
         """
-        accumulated_content = ""
+        accumulated = self._chunk_accumulator()
         last_chunk = None
 
         try:
             for chunk in response_gen:
                 last_chunk = chunk
-                if chunk.msg and chunk.msg.content:
-                    accumulated_content += chunk.msg.content
+                accumulated.add_chunk(chunk)
                 yield chunk
         finally:
+            accumulated.flush()
             total_tokens = self._extract_tokens(last_chunk)
-            self._send_agent_deactivate(accumulated_content, total_tokens)
+            self._send_agent_deactivate(accumulated.text, total_tokens)
 
     async def _astream_chunks(self, response_gen):
         """Async generator that wraps a streaming response.
@@ -201,19 +232,18 @@ class ListenChatAgent(ChatAgent):
         Yields:
             Each chunk from the original generator
         """
-        accumulated_content = ""
+        accumulated = self._chunk_accumulator()
         last_chunk = None
 
         try:
             async for chunk in response_gen:
                 last_chunk = chunk
-                if chunk.msg and chunk.msg.content:
-                    delta_content = chunk.msg.content
-                    accumulated_content += delta_content
+                accumulated.add_chunk(chunk)
                 yield chunk
         finally:
+            accumulated.flush()
             total_tokens = self._extract_tokens(last_chunk)
-            self._send_agent_deactivate(accumulated_content, total_tokens)
+            self._send_agent_deactivate(accumulated.text, total_tokens)
 
     def step(
         self,
@@ -246,7 +276,9 @@ class ListenChatAgent(ChatAgent):
             else input_message
         )
         logger.info(
-            f"Agent {self.agent_name} starting step with message: {msg}"
+            "Agent %s starting step with message: %s",
+            self.agent_name,
+            Truncated(msg),
         )
         try:
             res = super().step(input_message, response_format)
@@ -288,8 +320,9 @@ class ListenChatAgent(ChatAgent):
                 usage_info.get("total_tokens", 0) if usage_info else 0
             )
             logger.info(
-                f"Agent {self.agent_name} completed step, "
-                f"tokens used: {total_tokens}"
+                "Agent %s completed step, tokens used: %s",
+                self.agent_name,
+                total_tokens,
             )
 
         assert message is not None
@@ -344,7 +377,9 @@ class ListenChatAgent(ChatAgent):
             else input_message
         )
         logger.debug(
-            f"Agent {self.agent_name} starting async step with message: {msg}"
+            "Agent %s starting async step with message: %s",
+            self.agent_name,
+            Truncated(msg),
         )
 
         try:
@@ -391,8 +426,9 @@ class ListenChatAgent(ChatAgent):
                 usage_info.get("total_tokens", 0) if usage_info else 0
             )
             logger.info(
-                f"Agent {self.agent_name} completed step, "
-                f"tokens used: {total_tokens}"
+                "Agent %s completed step, tokens used: %s",
+                self.agent_name,
+                total_tokens,
             )
 
         # Send deactivation for all non-streaming cases (success or error)
@@ -449,9 +485,11 @@ class ListenChatAgent(ChatAgent):
                 else "mcp_toolkit"
             )
             logger.debug(
-                f"Agent {self.agent_name} executing tool: "
-                f"{func_name} from toolkit: {toolkit_name} "
-                f"with args: {json.dumps(args, ensure_ascii=False)}"
+                "Agent %s executing tool: %s from toolkit: %s with args: %s",
+                self.agent_name,
+                func_name,
+                toolkit_name,
+                LazyJson(args),
             )
 
             # Only send activate event if tool is
@@ -475,7 +513,7 @@ class ListenChatAgent(ChatAgent):
             # Set process_task context for all tool executions
             with set_process_task(self.process_task_id):
                 raw_result = tool(**args)
-            logger.debug(f"Tool {func_name} executed successfully")
+            logger.debug("Tool %s executed successfully", func_name)
             if self.mask_tool_output:
                 self._secure_result_store[tool_call_id] = raw_result
                 result = (
@@ -581,9 +619,11 @@ class ListenChatAgent(ChatAgent):
             toolkit_name = "mcp_toolkit"
 
         logger.info(
-            f"Agent {self.agent_name} executing async tool: {func_name} "
-            f"from toolkit: {toolkit_name} "
-            f"with args: {json.dumps(args, ensure_ascii=False)}"
+            "Agent %s executing async tool: %s from toolkit: %s with args: %s",
+            self.agent_name,
+            func_name,
+            toolkit_name,
+            LazyJson(args),
         )
 
         # Check if tool is wrapped by @listen_toolkit decorator
@@ -13,75 +13,120 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import asyncio
+import importlib
 import logging
 import os
+import sys
+from typing import Any
 
 from camel.toolkits import MCPToolkit
 
-from app.component.environment import env
+from app.component.environment import env, project_environ
 from app.model.chat import McpServers
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
-from app.utils.toolkit.audio_analysis_toolkit import AudioAnalysisToolkit
-from app.utils.toolkit.excel_toolkit import ExcelToolkit
-from app.utils.toolkit.file_write_toolkit import FileToolkit
-from app.utils.toolkit.github_toolkit import GithubToolkit
-from app.utils.toolkit.google_calendar_toolkit import GoogleCalendarToolkit
-from app.utils.toolkit.google_drive_mcp_toolkit import GoogleDriveMCPToolkit
-from app.utils.toolkit.google_gmail_mcp_toolkit import GoogleGmailMCPToolkit
-from app.utils.toolkit.image_analysis_toolkit import ImageAnalysisToolkit
-from app.utils.toolkit.lark_toolkit import LarkToolkit
-from app.utils.toolkit.linkedin_toolkit import LinkedInToolkit
-from app.utils.toolkit.mcp_search_toolkit import McpSearchToolkit
-from app.utils.toolkit.notion_mcp_toolkit import NotionMCPToolkit
-from app.utils.toolkit.openai_image_toolkit import OpenAIImageToolkit
-from app.utils.toolkit.pptx_toolkit import PPTXToolkit
-from app.utils.toolkit.rag_toolkit import RAGToolkit
-from app.utils.toolkit.reddit_toolkit import RedditToolkit
-from app.utils.toolkit.search_toolkit import SearchToolkit
-from app.utils.toolkit.slack_toolkit import SlackToolkit
-from app.utils.toolkit.terminal_toolkit import TerminalToolkit
-from app.utils.toolkit.twitter_toolkit import TwitterToolkit
-from app.utils.toolkit.video_analysis_toolkit import VideoAnalysisToolkit
-from app.utils.toolkit.video_download_toolkit import VideoDownloaderToolkit
-from app.utils.toolkit.whatsapp_toolkit import WhatsAppToolkit
 
 logger = logging.getLogger(__name__)
 
+# Toolkit name -> (module, class). Toolkit modules import large parts of
+# CAMEL and their own SDKs, so they are only imported when an agent asks
+# for them. The classes are still reachable as attributes of this module
+# (see __getattr__), which keeps them patchable by name.
+TOOLKITS: dict[str, tuple[str, str]] = {
+    "audio_analysis_toolkit": (
+        "app.utils.toolkit.audio_analysis_toolkit",
+        "AudioAnalysisToolkit",
+    ),
+    "openai_image_toolkit": (
+        "app.utils.toolkit.openai_image_toolkit",
+        "OpenAIImageToolkit",
+    ),
+    "excel_toolkit": ("app.utils.toolkit.excel_toolkit", "ExcelToolkit"),
+    "file_write_toolkit": (
+        "app.utils.toolkit.file_write_toolkit",
+        "FileToolkit",
+    ),
+    "github_toolkit": ("app.utils.toolkit.github_toolkit", "GithubToolkit"),
+    "google_calendar_toolkit": (
+        "app.utils.toolkit.google_calendar_toolkit",
+        "GoogleCalendarToolkit",
+    ),
+    "google_drive_mcp_toolkit": (
+        "app.utils.toolkit.google_drive_mcp_toolkit",
+        "GoogleDriveMCPToolkit",
+    ),
+    "google_gmail_mcp_toolkit": (
+        "app.utils.toolkit.google_gmail_mcp_toolkit",
+        "GoogleGmailMCPToolkit",
+    ),
+    "image_analysis_toolkit": (
+        "app.utils.toolkit.image_analysis_toolkit",
+        "ImageAnalysisToolkit",
+    ),
+    "linkedin_toolkit": (
+        "app.utils.toolkit.linkedin_toolkit",
+        "LinkedInToolkit",
+    ),
+    "lark_toolkit": ("app.utils.toolkit.lark_toolkit", "LarkToolkit"),
+    "mcp_search_toolkit": (
+        "app.utils.toolkit.mcp_search_toolkit",
+        "McpSearchToolkit",
+    ),
+    "notion_mcp_toolkit": (
+        "app.utils.toolkit.notion_mcp_toolkit",
+        "NotionMCPToolkit",
+    ),
+    "pptx_toolkit": ("app.utils.toolkit.pptx_toolkit", "PPTXToolkit"),
+    "rag_toolkit": ("app.utils.toolkit.rag_toolkit", "RAGToolkit"),
+    "reddit_toolkit": ("app.utils.toolkit.reddit_toolkit", "RedditToolkit"),
+    "search_toolkit": ("app.utils.toolkit.search_toolkit", "SearchToolkit"),
+    "slack_toolkit": ("app.utils.toolkit.slack_toolkit", "SlackToolkit"),
+    "terminal_toolkit": (
+        "app.utils.toolkit.terminal_toolkit",
+        "TerminalToolkit",
+    ),
+    "twitter_toolkit": ("app.utils.toolkit.twitter_toolkit", "TwitterToolkit"),
+    "video_analysis_toolkit": (
+        "app.utils.toolkit.video_analysis_toolkit",
+        "VideoAnalysisToolkit",
+    ),
+    "video_download_toolkit": (
+        "app.utils.toolkit.video_download_toolkit",
+        "VideoDownloaderToolkit",
+    ),
+    "whatsapp_toolkit": (
+        "app.utils.toolkit.whatsapp_toolkit",
+        "WhatsAppToolkit",
+    ),
+}
+_TOOLKIT_MODULES = {cls: module for module, cls in TOOLKITS.values()}
+
+
+def __getattr__(name: str) -> Any:
+    module = _TOOLKIT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    toolkit = getattr(importlib.import_module(module), name)
+    globals()[name] = toolkit
+    return toolkit
+
+
+def load_toolkit(name: str) -> type[AbstractToolkit] | None:
+    """Return the toolkit class registered under name, importing it."""
+    entry = TOOLKITS.get(name)
+    if entry is None:
+        return None
+    return getattr(sys.modules[__name__], entry[1])
+
 
 async def get_toolkits(tools: list[str], agent_name: str, api_task_id: str):
     logger.info(
         f"Getting toolkits for agent: {agent_name}, "
         f"task: {api_task_id}, tools: {tools}"
     )
-    toolkits = {
-        "audio_analysis_toolkit": AudioAnalysisToolkit,
-        "openai_image_toolkit": OpenAIImageToolkit,
-        "excel_toolkit": ExcelToolkit,
-        "file_write_toolkit": FileToolkit,
-        "github_toolkit": GithubToolkit,
-        "google_calendar_toolkit": GoogleCalendarToolkit,
-        "google_drive_mcp_toolkit": GoogleDriveMCPToolkit,
-        "google_gmail_mcp_toolkit": GoogleGmailMCPToolkit,
-        "image_analysis_toolkit": ImageAnalysisToolkit,
-        "linkedin_toolkit": LinkedInToolkit,
-        "lark_toolkit": LarkToolkit,
-        "mcp_search_toolkit": McpSearchToolkit,
-        "notion_mcp_toolkit": NotionMCPToolkit,
-        "pptx_toolkit": PPTXToolkit,
-        "rag_toolkit": RAGToolkit,
-        "reddit_toolkit": RedditToolkit,
-        "search_toolkit": SearchToolkit,
-        "slack_toolkit": SlackToolkit,
-        "terminal_toolkit": TerminalToolkit,
-        "twitter_toolkit": TwitterToolkit,
-        "video_analysis_toolkit": VideoAnalysisToolkit,
-        "video_download_toolkit": VideoDownloaderToolkit,
-        "whatsapp_toolkit": WhatsAppToolkit,
-    }
     res = []
     for item in tools:
-        if item in toolkits:
-            toolkit: AbstractToolkit = toolkits[item]
+        toolkit = load_toolkit(item)
+        if toolkit is not None:
             toolkit.agent_name = agent_name
             toolkit_tools = toolkit.get_can_use_tools(api_task_id)
             toolkit_tools = (
@@ -102,17 +147,20 @@ async def get_mcp_tools(mcp_server: McpServers):
     if len(mcp_server["mcpServers"]) == 0:
         return []
 
-    # Ensure unified auth directory for all mcp-remote servers to avoid
-    # re-authentication on each task
-    config_dict = {**mcp_server}
-    for server_config in config_dict["mcpServers"].values():
-        if "env" not in server_config:
-            server_config["env"] = {}
+    # Stdio servers only inherit a few process variables, so hand them the
+    # project's configuration; a server's own env entries still win. The
+    # installed config is copied, keeping project secrets out of it.
+    project_values = project_environ(base={})
+    config_dict = {**mcp_server, "mcpServers": {}}
+    for name, server_config in mcp_server["mcpServers"].items():
+        server_env = {**project_values, **(server_config.get("env") or {})}
         # Set global auth directory to persist authentication across tasks
-        if "MCP_REMOTE_CONFIG_DIR" not in server_config["env"]:
-            server_config["env"]["MCP_REMOTE_CONFIG_DIR"] = env(
+        # and avoid re-authentication of mcp-remote servers on each task
+        if "MCP_REMOTE_CONFIG_DIR" not in server_env:
+            server_env["MCP_REMOTE_CONFIG_DIR"] = env(
                 "MCP_REMOTE_CONFIG_DIR", os.path.expanduser("~/.mcp-auth")
             )
+        config_dict["mcpServers"][name] = {**server_config, "env": server_env}
 
     mcp_toolkit = None
     try:
@@ -19,8 +19,9 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from camel.agents import ChatAgent
-from camel.models import ModelFactory
 
+from app.component.environment import env_snapshot
+from app.component.model_factory import create_model
 from app.service.workflow import (
     RequestType,
     RequirementItem,
@@ -189,7 +190,7 @@ If there are no schedule, doesn't need to mention it."""
 
 def _create_agent(model_config: Any) -> ChatAgent:
     """Create a ChatAgent for LLM calls using the provided model configuration."""
-    model = ModelFactory.create(
+    model = create_model(
         model_platform=model_config.model_platform,
         model_type=model_config.model_type,
         api_key=model_config.api_key,
@@ -555,7 +556,6 @@ async def validate_requirement(
     Returns:
         Updated RequirementItem with validation status
     """
-    import os
     from pathlib import Path
 
     try:
@@ -563,9 +563,7 @@ async def validate_requirement(
             env_var_name = (
                 requirement.name.upper().replace(" ", "_").replace("-", "_")
             )
-            if os.environ.get(env_var_name) or os.environ.get(
-                f"{env_var_name}_KEY"
-            ):
+            if any(env_snapshot(env_var_name, f"{env_var_name}_KEY").values()):
                 requirement.status = RequirementStatus.VALIDATED
             else:
                 requirement.status = RequirementStatus.MISSING
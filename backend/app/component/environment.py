@@ -17,10 +17,14 @@ import importlib.util
 import logging
 import os
 import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, overload
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 from fastapi import APIRouter, FastAPI
 
 logger = logging.getLogger("env")
@@ -95,6 +99,163 @@ def sanitize_env_path(env_path: str | None) -> str | None:
         return None
 
 
+def _stat_signature(st: os.stat_result) -> tuple[int, int, int, int]:
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class EnvFileCache:
+    """Parsed .env files keyed by path, re-parsed only when they change.
+
+    A file is re-parsed when its (device, inode, size, mtime) signature
+    changes, so edits, atomic replacements and deletions are all picked
+    up on the next lookup. Path validation is memoized the same way,
+    keyed by the lstat of the path, so swapping the file for a symlink
+    triggers re-validation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # path -> (stat signature, parsed values)
+        self._values: dict[
+            str, tuple[tuple[int, int, int, int], Mapping[str, str | None]]
+        ] = {}
+        # stored path -> (lstat signature, sanitized path)
+        self._validated: dict[
+            str, tuple[tuple[int, int, int, int], str | None]
+        ] = {}
+        self.parses = 0
+        self.hits = 0
+        self.validations = 0
+
+    def validate(self, env_path: str) -> str | None:
+        """sanitize_env_path, memoized until the path's lstat changes."""
+        try:
+            signature = _stat_signature(os.lstat(env_path))
+        except OSError:
+            return sanitize_env_path(env_path)
+        with self._lock:
+            cached = self._validated.get(env_path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        validated = sanitize_env_path(env_path)
+        with self._lock:
+            self.validations += 1
+            self._validated[env_path] = (signature, validated)
+        return validated
+
+    def get(self, path: str) -> Mapping[str, str | None] | None:
+        """Return the parsed file, or None if it does not exist."""
+        try:
+            signature = _stat_signature(os.stat(path))
+        except OSError:
+            with self._lock:
+                self._values.pop(path, None)
+            return None
+        with self._lock:
+            cached = self._values.get(path)
+            if cached is not None and cached[0] == signature:
+                self.hits += 1
+                return cached[1]
+        values = MappingProxyType(dict(dotenv_values(path)))
+        with self._lock:
+            self.parses += 1
+            self._values[path] = (signature, values)
+        return values
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "parses": self.parses,
+                "hits": self.hits,
+                "validations": self.validations,
+                "cached_files": len(self._values),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._validated.clear()
+
+
+_env_file_cache = EnvFileCache()
+
+
+def env_cache_stats() -> dict[str, int]:
+    """Return parse/hit counters of the user .env cache."""
+    return _env_file_cache.stats()
+
+
+class ProjectEnv:
+    """Configuration of one project, consulted by env() before os.environ.
+
+    Request handlers bind their project's instance to the current context
+    with set_project_env, so concurrent projects served by one process
+    never see each other's API keys, paths or ports. The project's own
+    .env file (env_path) takes precedence over values set here, just as
+    it did over the process environment.
+    """
+
+    def __init__(
+        self,
+        values: Mapping[str, str] | None = None,
+        env_path: str | None = None,
+    ) -> None:
+        self._values = dict(values or {})
+        self.env_path: str | None = None
+        self.set_env_path(env_path)
+
+    def set_env_path(self, env_path: str | None) -> None:
+        safe_env_path = sanitize_env_path(env_path)
+        if env_path and not safe_env_path:
+            logger.warning(
+                f"User environment path rejected by security "
+                f"validation: {env_path}"
+            )
+        self.env_path = safe_env_path
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def set(self, key: str, value: str) -> None:
+        self._values[key] = value
+
+    def update(self, values: Mapping[str, str]) -> None:
+        self._values.update(values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def as_dict(self) -> dict[str, str]:
+        return dict(self._values)
+
+
+_project_env = ContextVar[ProjectEnv | None]("project_env", default=None)
+
+
+def set_project_env(project_env: ProjectEnv | None) -> Token:
+    """
+    Bind a project's configuration to the current context.
+
+    Every request runs in its own asyncio task (and asyncio.to_thread
+    copies the context), so the binding is visible to everything the
+    request spawns and to nothing else.
+    """
+    return _project_env.set(project_env)
+
+
+def get_project_env() -> ProjectEnv | None:
+    return _project_env.get()
+
+
+@contextmanager
+def use_project_env(project_env: ProjectEnv | None) -> Iterator[None]:
+    origin = _project_env.set(project_env)
+    try:
+        yield
+    finally:
+        _project_env.reset(origin)
+
+
 def set_user_env_path(env_path: str | None = None):
     """
     Set user-specific environment path for current thread.
@@ -154,41 +315,56 @@ def env(key: str, default: str) -> str: ...
 def env(key: str, default: Any) -> Any: ...
 
 
+def _user_env_values(
+    project_env: ProjectEnv | None = None,
+) -> Mapping[str, str | None] | None:
+    """Return the current user .env values, if one is set.
+
+    The project's env_path wins over the thread-local one. The file is
+    parsed once and served from cache until it changes.
+    """
+    if project_env is not None and project_env.env_path:
+        validated_path = _env_file_cache.validate(project_env.env_path)
+        return _env_file_cache.get(validated_path) if validated_path else None
+    if not hasattr(_thread_local, "env_path"):
+        return None
+    # Re-validate path at point of use for security
+    stored_path = _thread_local.env_path
+    validated_path = _env_file_cache.validate(stored_path)
+
+    if validated_path:
+        return _env_file_cache.get(validated_path)
+    if stored_path:
+        # Path failed validation - clear it and log warning
+        logger.warning(
+            f"Security: Thread-local env_path failed re-validation, "
+            f"clearing: {stored_path}"
+        )
+        delattr(_thread_local, "env_path")
+    return None
+
+
 def env(key: str, default=None):
     """
     Get environment variable.
+    Lookup order: user .env file, current project configuration,
+    process environment.
     First checks thread-local user-specific environment,
     then falls back to global environment.
 
     Security: Re-validates path at point of use to ensure integrity.
     """
-    # If we have a user-specific environment path, try to reload it
-    # to get latest values.
-    if hasattr(_thread_local, "env_path"):
-        # Re-validate path at point of use for security
-        stored_path = _thread_local.env_path
-        validated_path = sanitize_env_path(stored_path)
-
-        if validated_path and os.path.exists(validated_path):
-            # Temporarily load user-specific env to get the latest value
-            from dotenv import dotenv_values
-
-            user_env_values = dotenv_values(validated_path)
-            if key in user_env_values:
-                value = user_env_values[key] or default
-                logger.debug(
-                    f"Environment variable retrieved from user-specific "
-                    f"config: key={key}, env_path={validated_path}, "
-                    f"has_value={value is not None}"
-                )
-                return value
-        elif stored_path and not validated_path:
-            # Path failed validation - clear it and log warning
-            logger.warning(
-                f"Security: Thread-local env_path failed re-validation, "
-                f"clearing: {stored_path}"
-            )
-            delattr(_thread_local, "env_path")
+    project_env = _project_env.get()
+    user_env_values = _user_env_values(project_env)
+    if user_env_values is not None and key in user_env_values:
+        value = user_env_values[key] or default
+        logger.debug(
+            f"Environment variable retrieved from user-specific "
+            f"config: key={key}, has_value={value is not None}"
+        )
+        return value
+    if project_env is not None and key in project_env:
+        return project_env.get(key)
 
     # Fall back to global environment
     value = os.getenv(key, default)
@@ -199,6 +375,78 @@ def env(key: str, default=None):
     return value
 
 
+def env_snapshot(*keys: str) -> dict[str, str | None]:
+    """
+    Get several environment variables at once, as env(key) would.
+    The user-specific environment is validated and read only once.
+    """
+    project_env = _project_env.get()
+    user_env_values = _user_env_values(project_env) or {}
+    snapshot = {}
+    for key in keys:
+        if key in user_env_values:
+            snapshot[key] = user_env_values[key] or None
+        elif project_env is not None and key in project_env:
+            snapshot[key] = project_env.get(key)
+        else:
+            snapshot[key] = os.getenv(key)
+    return snapshot
+
+
+def project_environ(
+    project_env: ProjectEnv | None = None,
+    base: Mapping[str, str] | None = None,
+) -> dict[str, str]:
+    """
+    Build the environment of a child process started for a project.
+    Values are layered as env() looks them up: user .env file over the
+    project configuration over base (the process environment by default).
+    Without project_env, the one bound to the current context is used.
+    """
+    if project_env is None:
+        project_env = _project_env.get()
+    environ = dict(os.environ if base is None else base)
+    if project_env is not None:
+        environ.update(
+            (key, str(value))
+            for key, value in project_env.as_dict().items()
+            if value is not None
+        )
+    user_env_values = _user_env_values(project_env) or {}
+    environ.update(
+        (key, value) for key, value in user_env_values.items() if value
+    )
+    return environ
+
+
+# Serializes scoped_environ blocks; os.environ is shared by all projects
+_environ_lock = threading.RLock()
+
+
+@contextmanager
+def scoped_environ(values: Mapping[str, str | None]) -> Iterator[None]:
+    """
+    Expose values in os.environ for the duration of the block.
+    For third-party code that reads os.environ itself; None unsets a key.
+    The previous values are restored afterwards.
+    """
+    with _environ_lock:
+        previous = {key: os.environ.get(key) for key in values}
+        _update_environ(values)
+        try:
+            yield
+        finally:
+            _update_environ(previous)
+
+
+def _update_environ(values: Mapping[str, str | None]) -> None:
+    for key, value in values.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
 def env_or_fail(key: str):
     value = env(key)
     if value is None:
@@ -0,0 +1,37 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from typing import Any
+
+from camel.models import BaseModelBackend, ModelFactory
+
+from app.component.environment import env
+
+
+def create_model(**kwargs: Any) -> BaseModelBackend:
+    """Create a CAMEL model backend with its logs in the project folder.
+
+    CAMEL reads ``CAMEL_LOG_DIR`` from ``os.environ`` when a backend is
+    built and falls back to ``./camel_logs`` in the working directory.
+    The per-project directory lives in the project env instead, so it is
+    applied here; without one, model logging is switched off rather than
+    written next to the backend's sources.
+    """
+    model = ModelFactory.create(**kwargs)
+    log_dir = env("CAMEL_LOG_DIR")
+    if log_dir:
+        model._log_dir = log_dir
+    else:
+        model._log_enabled = False
+    return model
@@ -13,7 +13,8 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 from camel.agents import ChatAgent
-from camel.models import ModelFactory
+
+from app.component.model_factory import create_model
 
 
 def get_website_content(url: str) -> str:
@@ -42,7 +43,7 @@ def create_agent(
         raise ValueError(f"Invalid model_type: {model_type}")
     if platform is None:
         raise ValueError(f"Invalid model_platform: {model_platform}")
-    model = ModelFactory.create(
+    model = create_model(
         model_platform=platform,
         model_type=mtype,
         api_key=api_key,
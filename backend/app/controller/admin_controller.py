@@ -0,0 +1,37 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import logging
+
+from fastapi import APIRouter
+
+from app.service.task_lifecycle import get_task_lifecycle
+
+logger = logging.getLogger("admin_controller")
+
+router = APIRouter(tags=["Admin"])
+
+
+@router.get("/admin/task-locks", name="task lock stats")
+async def task_lock_stats():
+    """Live task locks with their approximate memory and idle time."""
+    return get_task_lifecycle().stats()
+
+
+@router.post("/admin/task-locks/sweep", name="sweep task locks")
+async def sweep_task_locks():
+    """Evict idle task locks now instead of waiting for the next sweep."""
+    evicted = await get_task_lifecycle().sweep()
+    logger.info("Manual task lock sweep", extra={"evicted": len(evicted)})
+    return {"evicted": evicted}
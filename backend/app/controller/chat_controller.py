@@ -18,13 +18,13 @@ import os
 import re
 import time
 from pathlib import Path
+from typing import Any
 
-from dotenv import load_dotenv
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import StreamingResponse
 
 from app.component import code
-from app.component.environment import sanitize_env_path, set_user_env_path
+from app.component.environment import ProjectEnv, set_project_env
 from app.exception.exception import UserException
 from app.model.chat import (
     AddTaskRequest,
@@ -35,7 +35,6 @@ from app.model.chat import (
     SupplementChat,
     sse_json,
 )
-from app.service.chat_service import step_solve
 from app.service.task import (
     Action,
     ActionAddTaskData,
@@ -49,15 +48,23 @@ from app.service.task import (
     ActionStopData,
     ActionSupplementData,
     ActionUpdatePlanData,
+    RemoteTaskLock,
+    TaskLock,
     delete_task_lock,
     get_or_create_task_lock,
     get_task_lock,
+    routed_request_handler,
     set_current_task_id,
     task_locks,
 )
-from app.service.workflow_handler import (
-    get_plan_draft,
-    get_workflow_state,
+from app.utils.lazy_import import lazy_import
+
+# The chat service imports every agent factory and toolkit; defer it (and
+# the workflow handler) to the first request that needs them
+step_solve = lazy_import("app.service.chat_service", "step_solve")
+get_plan_draft = lazy_import("app.service.workflow_handler", "get_plan_draft")
+get_workflow_state = lazy_import(
+    "app.service.workflow_handler", "get_workflow_state"
 )
 
 router = APIRouter()
@@ -120,6 +127,8 @@ async def timeout_stream_wrapper(
     last_data_time = time.time()
     generator = stream_generator.__aiter__()
     cleanup_triggered = False
+    if task_lock is not None:
+        task_lock.attach_consumer()
 
     try:
         while True:
@@ -169,6 +178,9 @@ async def timeout_stream_wrapper(
         if not cleanup_triggered:
             await _cleanup_task_lock_safe(task_lock, "ERROR")
         raise
+    finally:
+        if task_lock is not None:
+            task_lock.detach_consumer()
 
 
 @router.post("/chat", name="start chat")
@@ -184,26 +196,25 @@ async def post(data: Chat, request: Request):
 
     task_lock = get_or_create_task_lock(data.project_id)
 
-    # Set user-specific environment path for this thread
-    set_user_env_path(data.env_path)
-    # Load environment with validated path
-    safe_env_path = sanitize_env_path(data.env_path)
-    if safe_env_path:
-        load_dotenv(dotenv_path=safe_env_path)
-
-    os.environ["file_save_path"] = data.file_save_path()
-    os.environ["browser_port"] = str(data.browser_port)
-    os.environ["OPENAI_API_KEY"] = data.api_key
-    os.environ["OPENAI_API_BASE_URL"] = (
-        data.api_url or "https://api.openai.com/v1"
+    # Request settings live on the task lock instead of os.environ, so
+    # concurrent projects in this process cannot clobber each other.
+    project_env = ProjectEnv(
+        {
+            "file_save_path": data.file_save_path(),
+            "browser_port": str(data.browser_port),
+            "OPENAI_API_KEY": data.api_key,
+            "OPENAI_API_BASE_URL": data.api_url or "https://api.openai.com/v1",
+        },
+        env_path=data.env_path,
     )
+    # Same value for every project, so it is safe to set process-wide
     os.environ["CAMEL_MODEL_LOG_ENABLED"] = "true"
 
     # Set user-specific search engine configuration if provided
     if data.search_config:
         for key, value in data.search_config.items():
             if value:
-                os.environ[key] = value
+                project_env.set(key, value)
                 chat_logger.info(
                     f"Set search config: {key}",
                     extra={"project_id": data.project_id},
@@ -222,10 +233,13 @@ async def post(data: Chat, request: Request):
     )
     camel_log.mkdir(parents=True, exist_ok=True)
 
-    os.environ["CAMEL_LOG_DIR"] = str(camel_log)
+    project_env.set("CAMEL_LOG_DIR", str(camel_log))
 
     if data.is_cloud():
-        os.environ["cloud_api_key"] = data.api_key
+        project_env.set("cloud_api_key", data.api_key)
+
+    task_lock.project_env = project_env
+    set_project_env(project_env)
 
     # Set the initial current_task_id in task_lock
     set_current_task_id(data.project_id, data.task_id)
@@ -251,39 +265,17 @@ async def post(data: Chat, request: Request):
     )
 
 
-@router.post("/chat/{id}", name="improve chat")
-def improve(id: str, data: SupplementChat):
-    chat_logger.info(
-        "Chat improvement requested",
-        extra={"task_id": id, "question_length": len(data.question)},
-    )
-    chat_logger.info(
-        "[DEBUG] improve() - Chat improvement request details",
-        extra={
-            "task_id": id,
-            "user_question": data.question[:100],
-            "new_task_id": data.task_id,
-        },
-    )
-    task_lock = get_task_lock(id)
-    chat_logger.info(
-        "[DEBUG] improve() - Task lock retrieved",
-        extra={
-            "task_id": id,
-            "task_lock_status": task_lock.status.value if task_lock.status else None,
-        },
-    )
-
+def _prepare_improve(
+    task_lock: TaskLock, id: str, data: SupplementChat
+) -> None:
+    """Update the task lock for a follow-up before it is queued."""
     # Allow continuing conversation even after task is done
     # This supports multi-turn conversation after complex task completion
-    is_post_execution_followup = False
     if task_lock.status == Status.done:
         chat_logger.info(
             "[DEBUG] improve() - Task is done, marking as post-execution follow-up",
             extra={"task_id": id},
         )
-        # Mark this as a post-execution follow-up
-        is_post_execution_followup = True
         # Set a flag on task_lock to preserve the post-execution context
         task_lock.is_post_execution_followup = True
         # Reset status to allow processing new messages
@@ -316,7 +308,9 @@ def improve(id: str, data: SupplementChat):
             current_email = None
 
             # Extract email from current file_save_path if available
-            current_file_save_path = os.environ.get("file_save_path", "")
+            current_file_save_path = task_lock.project_env.get(
+                "file_save_path", ""
+            )
             if current_file_save_path:
                 path_parts = Path(current_file_save_path).parts
                 if len(path_parts) >= 3 and "eigent" in path_parts:
@@ -337,7 +331,9 @@ def improve(id: str, data: SupplementChat):
                     / f"task_{data.task_id}"
                 )
                 new_folder_path.mkdir(parents=True, exist_ok=True)
-                os.environ["file_save_path"] = str(new_folder_path)
+                task_lock.project_env.set(
+                    "file_save_path", str(new_folder_path)
+                )
                 chat_logger.info(
                     f"Updated file_save_path to: {new_folder_path}"
                 )
@@ -361,6 +357,52 @@ def improve(id: str, data: SupplementChat):
                 f" {e}"
             )
 
+
+@routed_request_handler("improve")
+def _improve_on_owner(task_lock: TaskLock, payload: dict[str, Any]) -> None:
+    """Apply an improve request forwarded by another worker."""
+    data = SupplementChat.model_validate(payload)
+    _prepare_improve(task_lock, task_lock.id, data)
+    task_lock.put_queue_threadsafe(
+        ActionImproveData(data=data.question, new_task_id=data.task_id)
+    )
+
+
+@router.post("/chat/{id}", name="improve chat")
+def improve(id: str, data: SupplementChat):
+    chat_logger.info(
+        "Chat improvement requested",
+        extra={"task_id": id, "question_length": len(data.question)},
+    )
+    chat_logger.info(
+        "[DEBUG] improve() - Chat improvement request details",
+        extra={
+            "task_id": id,
+            "user_question": data.question[:100],
+            "new_task_id": data.task_id,
+        },
+    )
+    task_lock = get_task_lock(id)
+    chat_logger.info(
+        "[DEBUG] improve() - Task lock retrieved",
+        extra={
+            "task_id": id,
+            "task_lock_status": task_lock.status.value if task_lock.status else None,
+        },
+    )
+
+    if isinstance(task_lock, RemoteTaskLock):
+        # Status and project config live with the owner, which applies
+        # the whole request (see _improve_on_owner)
+        task_lock.forward_request("improve", data.model_dump(mode="json"))
+        chat_logger.info(
+            "Improvement request routed to owning worker",
+            extra={"project_id": id, "owner": task_lock.owner},
+        )
+        return Response(status_code=201)
+
+    _prepare_improve(task_lock, id, data)
+
     chat_logger.info(
         "[DEBUG] improve() - Queueing ActionImproveData",
         extra={
@@ -384,13 +426,30 @@ def improve(id: str, data: SupplementChat):
     return Response(status_code=201)
 
 
+def _require_done(task_lock: TaskLock) -> None:
+    if task_lock.status != Status.done:
+        raise UserException(code.error, "Please wait task done")
+
+
+@routed_request_handler("supplement")
+def _supplement_on_owner(task_lock: TaskLock, payload: dict[str, Any]) -> None:
+    """Apply a supplement request forwarded by another worker."""
+    _require_done(task_lock)
+    task_lock.put_queue_threadsafe(
+        ActionSupplementData(data=SupplementChat.model_validate(payload))
+    )
+
+
 @router.put("/chat/{id}", name="supplement task")
 def supplement(id: str, data: SupplementChat):
     chat_logger.info("Chat supplement requested", extra={"task_id": id})
     task_lock = get_task_lock(id)
-    if task_lock.status != Status.done:
-        raise UserException(code.error, "Please wait task done")
-    asyncio.run(task_lock.put_queue(ActionSupplementData(data=data)))
+    if isinstance(task_lock, RemoteTaskLock):
+        # The owner checks the status; wait so a rejection reaches the user
+        task_lock.call("supplement", data.model_dump(mode="json"))
+    else:
+        _require_done(task_lock)
+        asyncio.run(task_lock.put_queue(ActionSupplementData(data=data)))
     chat_logger.info("Supplement data queued", extra={"task_id": id})
     return Response(status_code=201)
 
@@ -660,6 +719,7 @@ def start_execution(id: str):
         extra={"task_id": id},
     )
     # Use get_task_lock_if_exists to avoid exception if task_lock is gone
+    # (a lock owned by another worker is returned as a RemoteTaskLock)
     from app.service.task import get_task_lock_if_exists
 
     task_lock = get_task_lock_if_exists(id)
@@ -682,6 +742,17 @@ def start_execution(id: str):
     return Response(status_code=201)
 
 
+@routed_request_handler("workflow_state")
+def _workflow_state_on_owner(
+    task_lock: TaskLock, payload: dict[str, Any]
+) -> dict[str, Any]:
+    """Describe the workflow state, for this or another worker."""
+    workflow_state = get_workflow_state(task_lock)
+    if workflow_state:
+        return workflow_state.model_dump(mode="json")
+    return {"phase": None, "step": None, "status_message": "No workflow state"}
+
+
 @router.get("/chat/{id}/workflow-state", name="get workflow state")
 def get_workflow_state_endpoint(id: str):
     """Get the current workflow state for the interactive workflow"""
@@ -690,10 +761,20 @@ def get_workflow_state_endpoint(id: str):
         extra={"task_id": id},
     )
     task_lock = get_task_lock(id)
-    workflow_state = get_workflow_state(task_lock)
-    if workflow_state:
-        return workflow_state.model_dump(mode="json")
-    return {"phase": None, "step": None, "status_message": "No workflow state"}
+    if isinstance(task_lock, RemoteTaskLock):
+        return task_lock.call("workflow_state", {})
+    return _workflow_state_on_owner(task_lock, {})
+
+
+@routed_request_handler("plan_draft")
+def _plan_draft_on_owner(
+    task_lock: TaskLock, payload: dict[str, Any]
+) -> dict[str, Any]:
+    """Describe the plan draft, for this or another worker."""
+    plan_draft = get_plan_draft(task_lock)
+    if plan_draft:
+        return plan_draft.model_dump(mode="json")
+    return {"tasks": [], "summary": None, "can_start": False}
 
 
 @router.get("/chat/{id}/plan-draft", name="get plan draft")
@@ -704,7 +785,6 @@ def get_plan_draft_endpoint(id: str):
         extra={"task_id": id},
     )
     task_lock = get_task_lock(id)
-    plan_draft = get_plan_draft(task_lock)
-    if plan_draft:
-        return plan_draft.model_dump(mode="json")
-    return {"tasks": [], "summary": None, "can_start": False}
+    if isinstance(task_lock, RemoteTaskLock):
+        return task_lock.call("plan_draft", {})
+    return _plan_draft_on_owner(task_lock, {})
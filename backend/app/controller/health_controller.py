@@ -17,6 +17,8 @@ import logging
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app.utils import startup_profile
+
 logger = logging.getLogger("health_controller")
 
 router = APIRouter(tags=["Health"])
@@ -32,6 +34,7 @@ async def health_check():
     """Health check endpoint for verifying backend
     is ready to accept requests."""
     logger.debug("Health check requested")
+    startup_profile.mark("first_health", once=True)
     response = HealthResponse(status="ok", service="eigent")
     logger.debug(
         "Health check completed",
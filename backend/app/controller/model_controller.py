@@ -18,8 +18,11 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, field_validator
 
 from app.component.error_format import normalize_error_to_openai_format
-from app.component.model_validation import create_agent
 from app.model.chat import PLATFORM_MAPPING
+from app.utils.lazy_import import lazy_import
+
+# Pulls in CAMEL agents and model backends; loaded on first validation
+create_agent = lazy_import("app.component.model_validation", "create_agent")
 
 logger = logging.getLogger("model_controller")
 
@@ -14,13 +14,11 @@
 
 import asyncio
 import logging
-from typing import Literal
+from typing import Any, Literal
 
-from dotenv import load_dotenv
 from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
-from app.component.environment import sanitize_env_path, set_user_env_path
 from app.model.chat import NewAgent, UpdateData
 from app.service.task import (
     Action,
@@ -29,7 +27,11 @@ from app.service.task import (
     ActionStopData,
     ActionTakeControl,
     ActionUpdateTaskData,
+    RemoteTaskLock,
+    TaskLock,
+    get_remote_task_locks,
     get_task_lock,
+    routed_request_handler,
     task_locks,
 )
 
@@ -85,6 +87,21 @@ def take_control(id: str, data: TakeControl):
     return Response(status_code=204)
 
 
+def _prepare_new_agent(task_lock: TaskLock, data: NewAgent) -> ActionNewAgent:
+    # The agent is built by the running task, which reads its project's
+    # configuration; point that at the user's env file
+    if data.env_path:
+        task_lock.project_env.set_env_path(data.env_path)
+    return ActionNewAgent(**data.model_dump())
+
+
+@routed_request_handler("add_agent")
+def _add_agent_on_owner(task_lock: TaskLock, payload: dict[str, Any]) -> None:
+    """Apply an add-agent request forwarded by another worker."""
+    data = NewAgent.model_validate(payload)
+    task_lock.put_queue_threadsafe(_prepare_new_agent(task_lock, data))
+
+
 @router.post("/task/{id}/add-agent", name="add new agent")
 def add_agent(id: str, data: NewAgent):
     logger.info(
@@ -95,15 +112,12 @@ def add_agent(id: str, data: NewAgent):
         "New agent data",
         extra={"task_id": id, "agent_data": data.model_dump_json()},
     )
-    # Set user-specific environment path for this thread
-    set_user_env_path(data.env_path)
-    # Load environment with validated path
-    safe_env_path = sanitize_env_path(data.env_path)
-    if safe_env_path:
-        load_dotenv(dotenv_path=safe_env_path)
-    asyncio.run(
-        get_task_lock(id).put_queue(ActionNewAgent(**data.model_dump()))
-    )
+    task_lock = get_task_lock(id)
+    if isinstance(task_lock, RemoteTaskLock):
+        # The env path belongs to the owner's project configuration
+        task_lock.forward_request("add_agent", data.model_dump(mode="json"))
+    else:
+        asyncio.run(task_lock.put_queue(_prepare_new_agent(task_lock, data)))
     logger.info(
         "Agent added to task", extra={"task_id": id, "agent_name": data.name}
     )
@@ -112,8 +126,12 @@ def add_agent(id: str, data: NewAgent):
 
 @router.delete("/task/stop-all", name="stop all tasks")
 def stop_all():
-    logger.warning("Stopping all tasks", extra={"task_count": len(task_locks)})
-    for task_lock in task_locks.values():
+    # Projects owned by other workers are stopped through the registry
+    all_task_locks = [*task_locks.values(), *get_remote_task_locks()]
+    logger.warning(
+        "Stopping all tasks", extra={"task_count": len(all_task_locks)}
+    )
+    for task_lock in all_task_locks:
         asyncio.run(task_lock.put_queue(ActionStopData()))
-    logger.info("All tasks stopped", extra={"task_count": len(task_locks)})
+    logger.info("All tasks stopped", extra={"task_count": len(all_task_locks)})
     return Response(status_code=204)
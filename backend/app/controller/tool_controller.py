@@ -20,10 +20,19 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from app.utils.cookie_manager import CookieManager
+from app.utils.lazy_import import lazy_import
 from app.utils.oauth_state_manager import oauth_state_manager
-from app.utils.toolkit.google_calendar_toolkit import GoogleCalendarToolkit
-from app.utils.toolkit.linkedin_toolkit import LinkedInToolkit
-from app.utils.toolkit.notion_mcp_toolkit import NotionMCPToolkit
+
+# Toolkits import CAMEL's toolkit stack; loaded on first install/auth call
+GoogleCalendarToolkit = lazy_import(
+    "app.utils.toolkit.google_calendar_toolkit", "GoogleCalendarToolkit"
+)
+LinkedInToolkit = lazy_import(
+    "app.utils.toolkit.linkedin_toolkit", "LinkedInToolkit"
+)
+NotionMCPToolkit = lazy_import(
+    "app.utils.toolkit.notion_mcp_toolkit", "NotionMCPToolkit"
+)
 
 
 class LinkedInTokenRequest(BaseModel):
@@ -22,6 +22,7 @@ import logging
 from fastapi import FastAPI
 
 from app.controller import (
+    admin_controller,
     chat_controller,
     health_controller,
     model_controller,
@@ -71,6 +72,11 @@ def register_routers(app: FastAPI, prefix: str = "") -> None:
             "tags": ["tool"],
             "description": "Tool installation and management",
         },
+        {
+            "router": admin_controller.router,
+            "tags": ["Admin"],
+            "description": "Task lock memory accounting and eviction",
+        },
     ]
 
     for config in routers_config:
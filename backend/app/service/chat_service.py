@@ -40,6 +40,11 @@ from app.agent.factory import (
 )
 from app.agent.listen_chat_agent import ListenChatAgent
 from app.agent.tools import get_mcp_tools, get_toolkits
+from app.component.environment import (
+    ProjectEnv,
+    env_snapshot,
+    set_project_env,
+)
 from app.model.chat import Chat, NewAgent, Status, TaskContent, sse_json
 from app.service.task import (
     Action,
@@ -61,6 +66,7 @@ from app.service.workflow import (
     WorkflowState,
 )
 from app.service.workflow_handler import (
+    discard_speculation,
     get_original_message,
     get_plan_draft,
     get_workflow_state,
@@ -68,8 +74,11 @@ from app.service.workflow_handler import (
     handle_phase1_step2,
     handle_phase1_step3,
     handle_plan_update,
+    rebase_speculation,
+    start_speculation,
     store_original_message,
     store_workflow_state,
+    take_speculative_workforce,
 )
 from app.utils.event_loop_utils import set_main_event_loop
 from app.utils.file_utils import get_working_directory
@@ -87,6 +96,10 @@ logger = logging.getLogger("chat_service")
 # When False, uses the original direct classify (simple/complex) → execute flow
 USE_INTERACTIVE_WORKFLOW = True
 
+# When True, the workforce is built and the task decomposition drafted in the
+# background while the user confirms requirements (interactive workflow only)
+USE_SPECULATIVE_PLANNING = True
+
 
 def format_task_context(
     task_data: dict, seen_files: set | None = None, skip_files: bool = False
@@ -342,6 +355,11 @@ def build_context_for_workforce(task_lock: TaskLock, options: Chat) -> str:
 async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
     start_event_loop = True
 
+    # Everything this request spawns (agents, toolkits, to_thread workers)
+    # inherits the context, so env() resolves against this project.
+    if isinstance(task_lock.project_env, ProjectEnv):
+        set_project_env(task_lock.project_env)
+
     # Initialize task_lock attributes
     if not hasattr(task_lock, "conversation_history"):
         task_lock.conversation_history = []
@@ -370,9 +388,17 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
     last_completed_task_result = ""  # Track the last completed task result
     summary_task_content = ""  # Track task summary
     loop_iteration = 0
-    event_loop = asyncio.get_running_loop()
     sub_tasks: list[Task] = []
 
+    async def build_workforce() -> tuple[Workforce, ListenChatAgent]:
+        (new_workforce, new_mcp) = await construct_workforce(options)
+        for new_agent in options.new_agents:
+            new_workforce.add_single_agent_worker(
+                format_agent_description(new_agent),
+                await new_agent_model(new_agent, options),
+            )
+        return new_workforce, new_mcp
+
     logger.info("=" * 80)
     logger.info(
         "🚀 [LIFECYCLE] step_solve STARTED",
@@ -450,6 +476,8 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
 
         try:
             if item.action == Action.improve or start_event_loop:
+                # Speculation was for the previous question
+                discard_speculation(task_lock)
                 logger.info("=" * 80)
                 logger.info(
                     "[NEW-QUESTION] Action.improve "
@@ -776,21 +804,18 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                                 current_workflow_state.schedule_suggestion
                             )
 
+                            if workforce is None:
+                                speculative = await take_speculative_workforce(
+                                    task_lock
+                                )
+                                if speculative is not None:
+                                    (workforce, mcp) = speculative
                             if workforce is None:
                                 logger.info(
                                     "[INTERACTIVE-WORKFLOW] Creating workforce for "
                                     "plan generation"
                                 )
-                                (workforce, mcp) = await construct_workforce(
-                                    options
-                                )
-                                for new_agent in options.new_agents:
-                                    workforce.add_single_agent_worker(
-                                        format_agent_description(new_agent),
-                                        await new_agent_model(
-                                            new_agent, options
-                                        ),
-                                    )
+                                (workforce, mcp) = await build_workforce()
 
                             async for event in handle_phase1_step3(
                                 task_lock,
@@ -892,6 +917,8 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                         "waiting for user to provide requirements (Step 2)",
                         extra={"project_id": options.project_id},
                     )
+                    if USE_SPECULATIVE_PLANNING and workforce is None:
+                        start_speculation(task_lock, options, build_workforce)
                     continue
 
                 # Determine task complexity: attachments
@@ -1094,17 +1121,18 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                             stream_state["last_content"] = accumulated_content
 
                             if delta_content:
-                                asyncio.run_coroutine_threadsafe(
-                                    task_lock.put_queue(
-                                        ActionDecomposeTextData(
-                                            data={
-                                                "project_id": options.project_id,
-                                                "task_id": options.task_id,
-                                                "content": delta_content,
-                                            }
+                                task_lock.add_background_task(
+                                    asyncio.create_task(
+                                        task_lock.put_queue(
+                                            ActionDecomposeTextData(
+                                                data={
+                                                    "project_id": options.project_id,
+                                                    "task_id": options.task_id,
+                                                    "content": delta_content,
+                                                }
+                                            )
                                         )
-                                    ),
-                                    event_loop,
+                                    )
                                 )
                         except Exception as e:
                             logger.warning(
@@ -1114,8 +1142,7 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     async def run_decomposition():
                         nonlocal summary_task_content
                         try:
-                            sub_tasks = await asyncio.to_thread(
-                                workforce.eigent_make_sub_tasks,
+                            sub_tasks = await workforce.eigent_make_sub_tasks(
                                 camel_task,
                                 context_for_coordinator,
                                 on_stream_batch,
@@ -1756,17 +1783,18 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                                 )
 
                                 if delta_content:
-                                    asyncio.run_coroutine_threadsafe(
-                                        task_lock.put_queue(
-                                            ActionDecomposeTextData(
-                                                data={
-                                                    "project_id": options.project_id,
-                                                    "task_id": options.task_id,
-                                                    "content": delta_content,
-                                                }
+                                    task_lock.add_background_task(
+                                        asyncio.create_task(
+                                            task_lock.put_queue(
+                                                ActionDecomposeTextData(
+                                                    data={
+                                                        "project_id": options.project_id,
+                                                        "task_id": options.task_id,
+                                                        "content": delta_content,
+                                                    }
+                                                )
                                             )
-                                        ),
-                                        event_loop,
+                                        )
                                     )
                             except Exception as e:
                                 logger.warning(
@@ -1882,6 +1910,8 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                 yield sse_json("activate_agent", item.data)
             elif item.action == Action.deactivate_agent:
                 yield sse_json("deactivate_agent", dict(item.data))
+            elif item.action == Action.agent_output:
+                yield sse_json("agent_output", item.data)
             elif item.action == Action.assign_task:
                 yield sse_json("assign_task", item.data)
             elif item.action == Action.activate_toolkit:
@@ -1963,6 +1993,8 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                 yield sse_json("decompose_text", item.data)
             elif item.action == Action.decompose_progress:
                 yield sse_json("to_sub_tasks", item.data)
+            elif item.action == Action.task_partial_result:
+                yield sse_json("task_partial_result", item.data)
 
             # Interactive workflow action handlers
             elif item.action == Action.provide_requirements:
@@ -1986,6 +2018,7 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     task_lock, options, item.data, requirements
                 ):
                     yield event
+                rebase_speculation(task_lock, options)
 
             elif item.action == Action.confirm_requirements:
                 if not USE_INTERACTIVE_WORKFLOW:
@@ -2009,17 +2042,16 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     else None
                 )
 
+                if workforce is None:
+                    speculative = await take_speculative_workforce(task_lock)
+                    if speculative is not None:
+                        (workforce, mcp) = speculative
                 if workforce is None:
                     logger.info(
                         "[INTERACTIVE-WORKFLOW] Creating workforce for "
                         "plan generation"
                     )
-                    (workforce, mcp) = await construct_workforce(options)
-                    for new_agent in options.new_agents:
-                        workforce.add_single_agent_worker(
-                            format_agent_description(new_agent),
-                            await new_agent_model(new_agent, options),
-                        )
+                    (workforce, mcp) = await build_workforce()
 
                 async for event in handle_phase1_step3(
                     task_lock, options, requirements, schedule, workforce
@@ -2077,12 +2109,13 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                 question = original_message or options.question
 
                 if workforce is None:
-                    (workforce, mcp) = await construct_workforce(options)
-                    for new_agent in options.new_agents:
-                        workforce.add_single_agent_worker(
-                            format_agent_description(new_agent),
-                            await new_agent_model(new_agent, options),
-                        )
+                    speculative = await take_speculative_workforce(task_lock)
+                    if speculative is not None:
+                        (workforce, mcp) = speculative
+                if workforce is None:
+                    (workforce, mcp) = await build_workforce()
+                # The speculative plan is committed from here on
+                discard_speculation(task_lock)
 
                 task_lock.status = Status.confirmed
                 yield sse_json("confirmed", {"question": question})
@@ -2203,6 +2236,7 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                 )
 
             elif item.action == Action.end:
+                discard_speculation(task_lock)
                 logger.info("=" * 80)
                 logger.info(
                     "[LIFECYCLE] END action "
@@ -2364,6 +2398,7 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     Action.budget_not_enough, {"message": "budget not enouth"}
                 )
             elif item.action == Action.stop:
+                discard_speculation(task_lock)
                 logger.info("=" * 80)
                 logger.info(
                     "[LIFECYCLE] STOP action received"
@@ -2609,17 +2644,18 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                             delta_content = accumulated_content
                         stream_state["last_content"] = accumulated_content
                         if delta_content:
-                            asyncio.run_coroutine_threadsafe(
-                                task_lock.put_queue(
-                                    ActionDecomposeTextData(
-                                        data={
-                                            "project_id": options.project_id,
-                                            "task_id": options.task_id,
-                                            "content": delta_content,
-                                        }
+                            task_lock.add_background_task(
+                                asyncio.create_task(
+                                    task_lock.put_queue(
+                                        ActionDecomposeTextData(
+                                            data={
+                                                "project_id": options.project_id,
+                                                "task_id": options.task_id,
+                                                "content": delta_content,
+                                            }
+                                        )
                                     )
-                                ),
-                                event_loop,
+                                )
                             )
                     except Exception as e:
                         logger.warning(
@@ -2629,12 +2665,13 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                 async def run_decomposition():
                     nonlocal camel_task, summary_task_content
                     try:
-                        decomposed_sub_tasks = await asyncio.to_thread(
-                            workforce.eigent_make_sub_tasks,
-                            camel_task,
-                            context_for_coordinator,
-                            on_stream_batch,
-                            on_stream_text,
+                        decomposed_sub_tasks = (
+                            await workforce.eigent_make_sub_tasks(
+                                camel_task,
+                                context_for_coordinator,
+                                on_stream_batch,
+                                on_stream_text,
+                            )
                         )
                         if stream_state["subtasks"]:
                             decomposed_sub_tasks = stream_state["subtasks"]
@@ -3097,7 +3134,7 @@ async def validate_requirements(
                     key_name.replace("_API", ""),
                 ]
 
-                found_key = any(os.getenv(k) for k in possible_keys)
+                found_key = any(env_snapshot(*possible_keys).values())
                 if found_key:
                     validation_result["ok"] = True
                     validation_result["message"] = (
@@ -3488,10 +3525,9 @@ the current date.
         use_structured_output_handler=False
         if model_platform_enum == ModelPlatformType.OPENAI
         else True,
+        callbacks=[workforce_metrics],
     )
 
-    # Register workforce metrics callback
-    workforce._callbacks.append(workforce_metrics)
     workforce.add_single_agent_worker(
         "Developer Agent: A master-level coding assistant with a powerful "
         "terminal. It can write and execute code, manage files, automate "
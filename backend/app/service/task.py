@@ -14,18 +14,20 @@
 
 import asyncio
 import logging
-import weakref
+from collections.abc import Callable
 from contextlib import contextmanager
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from typing import Any, Literal
 
 from camel.tasks import Task
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing_extensions import TypedDict
 
-from app.exception.exception import ProgramException
+from app.component import code
+from app.component.environment import ProjectEnv
+from app.exception.exception import ProgramException, UserException
 from app.model.chat import (
     AgentModelConfig,
     McpServers,
@@ -33,6 +35,9 @@ from app.model.chat import (
     UpdateData,
 )
 from app.model.enums import Status
+from app.service.task_registry import TaskRegistry, get_task_registry
+from app.utils.event_loop_utils import call_in_loop, get_main_event_loop
+from app.utils.log_utils import log_sampled
 
 logger = logging.getLogger("task_service")
 
@@ -45,10 +50,13 @@ class Action(str, Enum):
     # backend -> user (streaming decomposition)
     decompose_progress = "decompose_progress"
     decompose_text = "decompose_text"  # backend -> user (raw streaming text)
+    # backend -> user (worker result while it streams)
+    task_partial_result = "task_partial_result"
     start = "start"  # user -> backend
     create_agent = "create_agent"  # backend -> user
     activate_agent = "activate_agent"  # backend -> user
     deactivate_agent = "deactivate_agent"  # backend -> user
+    agent_output = "agent_output"  # backend -> user (streamed text delta)
     assign_task = "assign_task"  # backend -> user
     activate_toolkit = "activate_toolkit"  # backend -> user
     deactivate_toolkit = "deactivate_toolkit"  # backend -> user
@@ -137,6 +145,11 @@ class ActionDecomposeTextData(BaseModel):
     data: dict
 
 
+class ActionTaskPartialResultData(BaseModel):
+    action: Literal[Action.task_partial_result] = Action.task_partial_result
+    data: dict[Literal["task_id", "content"], str]
+
+
 class ActionNewTaskStateData(BaseModel):
     action: Literal[Action.new_task_state] = Action.new_task_state
     data: dict[
@@ -181,6 +194,13 @@ class ActionDeactivateAgentData(BaseModel):
     data: DataDict
 
 
+class ActionAgentOutputData(BaseModel):
+    action: Literal[Action.agent_output] = Action.agent_output
+    data: dict[
+        Literal["agent_name", "process_task_id", "agent_id", "content"], str
+    ]
+
+
 class ActionAssignTaskData(BaseModel):
     action: Literal[Action.assign_task] = Action.assign_task
     data: dict[
@@ -359,6 +379,7 @@ ActionData = (
     | ActionCreateAgentData
     | ActionActivateAgentData
     | ActionDeactivateAgentData
+    | ActionAgentOutputData
     | ActionAssignTaskData
     | ActionActivateToolkitData
     | ActionDeactivateToolkitData
@@ -379,6 +400,7 @@ ActionData = (
     | ActionSkipTaskData
     | ActionDecomposeTextData
     | ActionDecomposeProgressData
+    | ActionTaskPartialResultData
     | ActionRequirementsData
     | ActionRequirementsValidationData
     | ActionRequirementsReadyData
@@ -429,6 +451,10 @@ class TaskLock:
     """Track if summary has been generated for this project"""
     current_task_id: str | None
     """Current task ID to be used in SSE responses"""
+    sse_consumers: int
+    """Number of SSE streams currently reading the queue"""
+    project_env: ProjectEnv
+    """Per-project configuration read by env() while this task runs"""
 
     def __init__(
         self, id: str, queue: asyncio.Queue, human_input: dict
@@ -447,27 +473,85 @@ class TaskLock:
         self.last_task_summary = ""
         self.question_agent = None
         self.current_task_id = None
+        self.sse_consumers = 0
+        self.project_env = ProjectEnv()
+        # Event loop that consumes the queue; bound on first async use
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._bind_loop()
 
         logger.info(
             "Task lock initialized",
             extra={"task_id": id, "created_at": self.created_at.isoformat()},
         )
 
+    def _bind_loop(self) -> None:
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
     async def put_queue(self, data: ActionData):
         self.last_accessed = datetime.now()
-        logger.debug(
-            "Adding item to task queue",
-            extra={"task_id": self.id, "action": data.action},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            log_sampled(
+                logger,
+                logging.DEBUG,
+                f"put_queue:{data.action}",
+                "Adding item to task queue",
+                extra={"task_id": self.id, "action": data.action},
+            )
         await self.queue.put(data)
 
+    def put_queue_threadsafe(self, data: ActionData) -> bool:
+        r"""Put data to the queue from any thread without blocking.
+
+        On the loop that owns the queue the item is enqueued immediately;
+        from other threads it is handed to that loop via
+        ``call_soon_threadsafe``.
+
+        Returns:
+            bool: False if no running event loop is known for this queue
+                and the item was dropped.
+        """
+        loop = self._loop or get_main_event_loop()
+        return call_in_loop(loop, self._put_nowait, data)
+
+    def _put_nowait(self, data: ActionData) -> None:
+        self.last_accessed = datetime.now()
+        if logger.isEnabledFor(logging.DEBUG):
+            log_sampled(
+                logger,
+                logging.DEBUG,
+                f"put_queue:{data.action}",
+                "Adding item to task queue",
+                extra={"task_id": self.id, "action": data.action},
+            )
+        self.queue.put_nowait(data)
+
     async def get_queue(self):
+        self._bind_loop()
         self.last_accessed = datetime.now()
-        logger.debug(
-            "Getting item from task queue", extra={"task_id": self.id}
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            log_sampled(
+                logger,
+                logging.DEBUG,
+                "get_queue",
+                "Getting item from task queue",
+                extra={"task_id": self.id},
+            )
         return await self.queue.get()
 
+    @property
+    def has_consumer(self) -> bool:
+        r"""Whether an SSE stream is attached to read queued events."""
+        return self.sse_consumers > 0
+
+    def attach_consumer(self) -> None:
+        self.sse_consumers += 1
+
+    def detach_consumer(self) -> None:
+        self.sse_consumers = max(0, self.sse_consumers - 1)
+
     async def put_human_input(self, agent: str, data: Any = None):
         logger.debug(
             "Adding human input",
@@ -479,6 +563,11 @@ class TaskLock:
         )
         await self.human_input[agent].put(data)
 
+    def put_human_input_threadsafe(self, agent: str, data: Any = None) -> bool:
+        r"""Thread-safe counterpart of :meth:`put_human_input`."""
+        loop = self._loop or get_main_event_loop()
+        return call_in_loop(loop, self.human_input[agent].put_nowait, data)
+
     async def get_human_input(self, agent: str):
         logger.debug(
             "Getting human input", extra={"task_id": self.id, "agent": agent}
@@ -513,6 +602,12 @@ class TaskLock:
                 "background_tasks_count": len(self.background_tasks),
             },
         )
+        # Speculative planning (workflow_handler.SpeculativePlan) keeps
+        # its workforce alive until it is discarded
+        plan = getattr(self, "speculative_plan", None)
+        if plan is not None:
+            plan.cancel()
+            self.speculative_plan = None
         for task in list(self.background_tasks):
             if not task.done():
                 task.cancel()
@@ -605,23 +700,323 @@ class TaskLock:
         return context
 
 
+class TaskTreeIndex:
+    r"""Index over a CAMEL task tree owned by a single workforce.
+
+    Keeps id -> task, child -> parent and parent -> children maps so task
+    lookups and subtask synchronization are O(1) instead of recursive
+    scans over :obj:`Task.subtasks`. The children map mirrors the entries
+    of :obj:`parent.subtasks`, which may be distinct objects from the
+    executing tasks registered under the same id (e.g. streamed subtasks
+    vs. the final decomposition parse). Each workforce owns its own index,
+    so entries never leak across projects.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, Task] = {}
+        self._parents: dict[str, str | None] = {}
+        self._children: dict[str, dict[str, Task]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._nodes
+
+    def get(self, task_id: str) -> Task | None:
+        return self._nodes.get(task_id)
+
+    def get_parent(self, task_id: str) -> Task | None:
+        parent_id = self._parents.get(task_id)
+        return self._nodes.get(parent_id) if parent_id is not None else None
+
+    def get_children(self, task_id: str) -> list[Task]:
+        return list(self._children.get(task_id, {}).values())
+
+    def get_child(self, parent_id: str, child_id: str) -> Task | None:
+        r"""Return the entry for ``child_id`` in the parent's subtasks."""
+        return self._children.get(parent_id, {}).get(child_id)
+
+    def _register(self, task: Task, parent_id: str | None) -> None:
+        previous_parent_id = self._parents.get(task.id)
+        if previous_parent_id is not None and previous_parent_id != parent_id:
+            self._children.get(previous_parent_id, {}).pop(task.id, None)
+        self._nodes[task.id] = task
+        self._parents[task.id] = parent_id
+        self._children.setdefault(task.id, {})
+
+    def add(self, task: Task, parent: Task | None = None) -> None:
+        r"""Register ``task`` as the node for its id, with its subtasks.
+
+        Args:
+            task (Task): The task to index.
+            parent (Task, optional): The parent to attach the task to.
+                Defaults to :obj:`task.parent`.
+        """
+        if parent is None:
+            parent = task.parent
+        parent_id = parent.id if parent is not None else None
+        if parent is not None and parent_id not in self._nodes:
+            self.add(parent)
+
+        self._register(task, parent_id)
+        if parent_id is not None:
+            self._children[parent_id].setdefault(task.id, task)
+        for subtask in task.subtasks:
+            self.add(subtask, task)
+
+    def set_children(self, parent: Task, children: list[Task]) -> None:
+        r"""Replace the indexed children of ``parent`` with ``children``.
+
+        Children that are no longer present are removed together with
+        their descendants.
+        """
+        if parent.id not in self._nodes:
+            self.add(parent)
+        keep_ids = {child.id for child in children}
+        for child_id in list(self._children.get(parent.id, {})):
+            if child_id not in keep_ids:
+                self.remove(child_id)
+
+        self._children[parent.id] = {child.id: child for child in children}
+        for child in children:
+            self._register(child, parent.id)
+            for subtask in child.subtasks:
+                self.add(subtask, child)
+
+    def remove(self, task_id: str) -> Task | None:
+        r"""Remove a task and all of its descendants from the index.
+
+        Returns:
+            Task | None: The removed task, or :obj:`None` if not indexed.
+        """
+        task = self._nodes.get(task_id)
+        if task is None:
+            return None
+        parent_id = self._parents.get(task_id)
+        if parent_id is not None:
+            self._children.get(parent_id, {}).pop(task_id, None)
+
+        stack = [task_id]
+        while stack:
+            current_id = stack.pop()
+            stack.extend(self._children.pop(current_id, {}))
+            self._nodes.pop(current_id, None)
+            self._parents.pop(current_id, None)
+        return task
+
+    def clear(self) -> None:
+        self._nodes.clear()
+        self._parents.clear()
+        self._children.clear()
+
+
+# Seconds RemoteTaskLock.call waits for the owning worker's answer
+ROUTED_REQUEST_TIMEOUT = 10.0
+
+
+class RemoteTaskLock:
+    r"""Handle for a project whose TaskLock lives in another worker.
+
+    Control endpoints that only enqueue actions and human replies use it
+    like a TaskLock; both are forwarded to the owning worker through the
+    task registry, which puts them into the real TaskLock there. The
+    handle holds none of the lock's state: endpoints that read or change
+    it forward the whole request with ``forward_request``, or ``call``
+    when they need the owner's answer.
+    """
+
+    status: Status | None = None
+
+    def __init__(self, id: str, owner: str, registry: TaskRegistry) -> None:
+        self.id = id
+        self.owner = owner
+        self._registry = registry
+
+    async def put_queue(self, data: ActionData):
+        logger.debug(
+            "Routing action to owning worker",
+            extra={"task_id": self.id, "owner": self.owner},
+        )
+        self._registry.send(
+            self.owner,
+            {
+                "project_id": self.id,
+                "type": "action",
+                "data": data.model_dump(mode="json"),
+            },
+        )
+
+    async def put_human_input(self, agent: str, data: Any = None):
+        self._registry.send(
+            self.owner,
+            {
+                "project_id": self.id,
+                "type": "human_input",
+                "agent": agent,
+                "data": data,
+            },
+        )
+
+    def forward_request(self, name: str, data: dict[str, Any]) -> None:
+        r"""Have the owning worker run a routed request handler."""
+        logger.debug(
+            "Routing request to owning worker",
+            extra={"task_id": self.id, "owner": self.owner, "request": name},
+        )
+        self._registry.send(
+            self.owner,
+            {
+                "project_id": self.id,
+                "type": "request",
+                "name": name,
+                "data": data,
+            },
+        )
+
+    def call(
+        self,
+        name: str,
+        data: dict[str, Any],
+        timeout: float = ROUTED_REQUEST_TIMEOUT,
+    ) -> Any:
+        r"""Run a routed request handler on the owner and return its result.
+
+        Raises:
+            UserException: If the handler rejected the request.
+            ProgramException: If the owner did not answer in time.
+        """
+        reply = self._registry.request(
+            self.owner,
+            {
+                "project_id": self.id,
+                "type": "request",
+                "name": name,
+                "data": data,
+            },
+            timeout,
+        )
+        if reply is None:
+            logger.error(
+                "Owning worker did not answer routed request",
+                extra={
+                    "task_id": self.id,
+                    "owner": self.owner,
+                    "request": name,
+                },
+            )
+            raise ProgramException("Owning worker did not respond")
+        if "error" in reply:
+            raise UserException(code.error, reply["error"])
+        return reply.get("result")
+
+
 task_locks = dict[str, TaskLock]()
-# Cleanup task for removing stale task locks
-_cleanup_task: asyncio.Task | None = None
-task_index: dict[str, weakref.ref[Task]] = {}
+_action_adapter = TypeAdapter(ActionData)
 
+RoutedRequestHandler = Callable[[TaskLock, dict[str, Any]], Any]
+_routed_request_handlers: dict[str, RoutedRequestHandler] = {}
 
-def get_task_lock(id: str) -> TaskLock:
-    if id not in task_locks:
+
+def routed_request_handler(
+    name: str,
+) -> Callable[[RoutedRequestHandler], RoutedRequestHandler]:
+    r"""Register how the owning worker applies a forwarded request.
+
+    The handler receives the local TaskLock and the JSON payload passed
+    to ``RemoteTaskLock.forward_request`` or ``RemoteTaskLock.call``; for
+    ``call`` its JSON-serializable return value is sent back, and a
+    UserException it raises is re-raised on the calling worker. It runs
+    on the registry's thread, so it must queue actions with
+    ``put_queue_threadsafe``.
+    """
+
+    def decorator(handler: RoutedRequestHandler) -> RoutedRequestHandler:
+        _routed_request_handlers[name] = handler
+        return handler
+
+    return decorator
+
+
+def _deliver_routed_message(
+    message: dict[str, Any],
+) -> dict[str, Any] | None:
+    r"""Feed a message routed from another worker into the local lock.
+
+    Returns the reply to a request: its result, or an error message.
+    """
+    task_lock = task_locks.get(message.get("project_id", ""))
+    if task_lock is None:
+        logger.warning(
+            "Routed message for unknown task lock",
+            extra={"task_id": message.get("project_id")},
+        )
+        return {"error": "Task not found"}
+    message_type = message.get("type")
+    if message_type == "request":
+        handler = _routed_request_handlers.get(message.get("name", ""))
+        if handler is None:
+            logger.warning(
+                "Routed request has no handler",
+                extra={
+                    "task_id": task_lock.id,
+                    "request": message.get("name"),
+                },
+            )
+            return {"error": "Unsupported request"}
+        try:
+            result = handler(task_lock, message.get("data") or {})
+        except UserException as e:
+            return {"error": e.description}
+        return {"result": result}
+    elif message_type == "human_input":
+        task_lock.put_human_input_threadsafe(
+            message["agent"], message.get("data")
+        )
+    else:
+        task_lock.put_queue_threadsafe(
+            _action_adapter.validate_python(message["data"])
+        )
+    return None
+
+
+def get_task_lock(id: str) -> TaskLock | RemoteTaskLock:
+    task_lock = get_task_lock_if_exists(id)
+    if task_lock is None:
         logger.error("Task lock not found", extra={"task_id": id})
         raise ProgramException("Task not found")
     logger.debug("Task lock retrieved", extra={"task_id": id})
-    return task_locks[id]
+    return task_lock
 
 
-def get_task_lock_if_exists(id: str) -> TaskLock | None:
-    """Get task lock if it exists, otherwise return None"""
-    return task_locks.get(id)
+def get_task_lock_if_exists(id: str) -> TaskLock | RemoteTaskLock | None:
+    """Get task lock if it exists, otherwise return None
+
+    A project owned by another worker gets a RemoteTaskLock handle.
+    """
+    if id in task_locks:
+        return task_locks[id]
+    registry = get_task_registry()
+    owner = registry.remote_owner(id)
+    if owner is None:
+        return None
+    logger.debug(
+        "Task lock owned by another worker",
+        extra={"task_id": id, "owner": owner},
+    )
+    return RemoteTaskLock(id, owner, registry)
+
+
+def get_remote_task_locks() -> list[RemoteTaskLock]:
+    """Get handles for the projects owned by other workers"""
+    registry = get_task_registry()
+    if not registry.distributed:
+        return []
+    return [
+        RemoteTaskLock(project_id, owner, registry)
+        for project_id, owner in registry.owners().items()
+        if owner != registry.worker_id
+    ]
 
 
 def set_current_task_id(project_id: str, task_id: str) -> None:
@@ -642,13 +1037,22 @@ def create_task_lock(id: str) -> TaskLock:
         )
         raise ProgramException("Task already exists")
 
+    registry = get_task_registry()
+    registry.handler = _deliver_routed_message
+    if not registry.acquire(id):
+        raise ProgramException("Task is running on another worker")
+
     logger.info("Creating new task lock", extra={"task_id": id})
-    task_locks[id] = TaskLock(id=id, queue=asyncio.Queue(), human_input={})
+    task_lock = TaskLock(id=id, queue=asyncio.Queue(), human_input={})
+    task_locks[id] = task_lock
+
+    # Evicts idle locks in the background; restores history saved when
+    # this project's previous lock was evicted
+    from app.service.task_lifecycle import get_task_lifecycle
 
-    # Start cleanup task if not running
-    # global _cleanup_task
-    # if _cleanup_task is None or _cleanup_task.done():
-    #     _cleanup_task = asyncio.create_task(_periodic_cleanup())
+    lifecycle = get_task_lifecycle()
+    lifecycle.rehydrate(task_lock)
+    lifecycle.ensure_running()
 
     logger.info(
         "Task lock created successfully",
@@ -666,7 +1070,12 @@ def get_or_create_task_lock(id: str) -> TaskLock:
     return create_task_lock(id)
 
 
-async def delete_task_lock(id: str):
+async def delete_task_lock(id: str, keep_history: bool = False):
+    """Delete a project's task lock.
+
+    Unless keep_history is set (eviction saves it first), the project's
+    saved history is discarded: its next chat starts fresh.
+    """
     if id not in task_locks:
         logger.warning(
             "Attempting to delete non-existent task lock",
@@ -676,6 +1085,10 @@ async def delete_task_lock(id: str):
 
     # Clean up background tasks before deletion
     task_lock = task_locks[id]
+    if not keep_history:
+        from app.service.task_lifecycle import get_task_lifecycle
+
+        get_task_lifecycle().discard(id)
     logger.info(
         "Cleaning up task lock",
         extra={
@@ -686,62 +1099,40 @@ async def delete_task_lock(id: str):
     await task_lock.cleanup()
 
     del task_locks[id]
+    get_task_registry().release(id)
     logger.info(
         "Task lock deleted successfully",
         extra={"task_id": id, "remaining_task_locks": len(task_locks)},
     )
 
 
-def get_camel_task(id: str, tasks: list[Task]) -> None | Task:
-    if id in task_index:
-        task_ref = task_index[id]
-        task = task_ref()
+def get_camel_task(
+    id: str, tasks: list[Task], index: TaskTreeIndex | None = None
+) -> None | Task:
+    r"""Find a task by id in ``tasks`` and their subtasks.
+
+    Args:
+        id (str): The task id to look up.
+        tasks (list[Task]): Root tasks to search when the index misses.
+        index (TaskTreeIndex, optional): Index consulted first. Tasks found
+            by the fallback search are added to it.
+    """
+    if index is not None:
+        task = index.get(id)
         if task is not None:
             return task
-        else:
-            # Weak reference died, remove from index
-            del task_index[id]
-
-    # Fallback to search and rebuild index
-    for item in tasks:
-        # Add to index
-        task_index[item.id] = weakref.ref(item)
 
+    stack = list(reversed(tasks))
+    while stack:
+        item = stack.pop()
         if item.id == id:
+            if index is not None:
+                index.add(item)
             return item
-        else:
-            task = get_camel_task(id, item.subtasks)
-            if task is not None:
-                return task
+        stack.extend(reversed(item.subtasks))
     return None
 
 
-async def _periodic_cleanup():
-    r"""Periodically clean up stale task locks"""
-    while True:
-        try:
-            await asyncio.sleep(300)  # Run every 5 minutes
-
-            current_time = datetime.now()
-            stale_timeout = timedelta(
-                hours=4
-            )  # Consider tasks stale after 4 hours
-
-            stale_ids = []
-            for task_id, task_lock in task_locks.items():
-                if current_time - task_lock.last_accessed > stale_timeout:
-                    stale_ids.append(task_id)
-
-            for task_id in stale_ids:
-                logger.warning(f"Cleaning up stale task lock: {task_id}")
-                await delete_task_lock(task_id)
-
-        except asyncio.CancelledError:
-            break
-        except Exception as e:
-            logger.error(f"Error in periodic cleanup: {e}")
-
-
 process_task = ContextVar[str]("id")
 
 
@@ -0,0 +1,412 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""Lifecycle management for task locks.
+
+A TaskLock holds a project's conversation history, question agent,
+registered toolkits and queues for as long as it exists. The lifecycle
+manager estimates what each lock costs, evicts idle locks by TTL and,
+under a count or byte budget, least recently used first. The
+conversation history of an evicted lock can be written to disk and is
+restored when the project's lock is created again; a lock deleted because
+its task ended leaves nothing behind. Saved histories are pruned by count
+and age.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from app.component.environment import env
+from app.service.task import TaskLock, delete_task_lock, task_locks
+
+logger = logging.getLogger("task_lifecycle")
+
+DEFAULT_TTL_SECONDS = 4 * 60 * 60
+DEFAULT_SWEEP_INTERVAL = 300.0
+DEFAULT_HISTORY_MAX_FILES = 100
+DEFAULT_HISTORY_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+# Rough per-item costs for state that is too expensive to measure
+_QUEUE_ITEM_BYTES = 1024
+_TOOLKIT_BYTES = 64 * 1024
+_AGENT_BASE_BYTES = 32 * 1024
+
+
+def _json_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+def estimate_task_lock_bytes(task_lock: TaskLock) -> int:
+    """Approximate memory held by a task lock and what hangs off it."""
+    size = sys.getsizeof(task_lock)
+    size += _json_size(getattr(task_lock, "conversation_history", []))
+    size += len(getattr(task_lock, "last_task_result", "") or "")
+    size += len(getattr(task_lock, "last_task_summary", "") or "")
+    size += task_lock.queue.qsize() * _QUEUE_ITEM_BYTES
+    size += sum(
+        q.qsize() * _QUEUE_ITEM_BYTES for q in task_lock.human_input.values()
+    )
+    size += len(task_lock.registered_toolkits) * _TOOLKIT_BYTES
+    agent = getattr(task_lock, "question_agent", None)
+    if agent is not None:
+        size += _AGENT_BASE_BYTES
+        try:
+            size += _json_size(agent.chat_history)
+        except Exception:
+            pass
+    return size
+
+
+def _is_busy(task_lock: TaskLock) -> bool:
+    """Locks with a live stream or running work are never evicted."""
+    return task_lock.has_consumer or any(
+        not task.done() for task in task_lock.background_tasks
+    )
+
+
+class TaskLockLifecycle:
+    """Evicts idle task locks and keeps their history for rehydration.
+
+    Args:
+        ttl_seconds: Idle time after which a lock is evicted.
+        max_locks: Evict least recently used idle locks beyond this many
+            (0 for no limit).
+        max_bytes: Evict least recently used idle locks while the total
+            estimate exceeds this (0 for no limit).
+        persist_dir: Where evicted conversation history is written, or
+            None to drop it.
+        sweep_interval: Seconds between background sweeps.
+        history_max_files: Keep at most this many saved histories, newest
+            first (0 for no limit).
+        history_max_age_seconds: Saved histories older than this are
+            deleted instead of restored.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_locks: int = 0,
+        max_bytes: int = 0,
+        persist_dir: str | os.PathLike | None = None,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+        history_max_files: int = DEFAULT_HISTORY_MAX_FILES,
+        history_max_age_seconds: float = DEFAULT_HISTORY_MAX_AGE_SECONDS,
+    ) -> None:
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_locks = max_locks
+        self.max_bytes = max_bytes
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.sweep_interval = sweep_interval
+        self.history_max_files = history_max_files
+        self.history_max_age = timedelta(seconds=history_max_age_seconds)
+        self.evicted = 0
+        self.rehydrated = 0
+        self._task: asyncio.Task | None = None
+
+    # Persistence
+
+    def _history_path(self, project_id: str) -> Path | None:
+        if self.persist_dir is None:
+            return None
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", project_id)
+        return self.persist_dir / f"{safe}.json"
+
+    def persist(self, task_lock: TaskLock) -> bool:
+        """Write a lock's conversation state to disk.
+
+        A lock without history removes any file left from before, so an
+        older conversation is never restored in its place.
+        """
+        path = self._history_path(task_lock.id)
+        if path is None:
+            return False
+        if not task_lock.conversation_history:
+            path.unlink(missing_ok=True)
+            return False
+        payload = {
+            "project_id": task_lock.id,
+            "conversation_history": task_lock.conversation_history,
+            "last_task_result": task_lock.last_task_result,
+            "last_task_summary": getattr(task_lock, "last_task_summary", ""),
+            "evicted_at": datetime.now().isoformat(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, default=str), "utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(
+                f"Failed to persist task history: {e}",
+                extra={"task_id": task_lock.id},
+            )
+            return False
+        self.prune_history()
+        return True
+
+    def discard(self, project_id: str) -> None:
+        """Delete a project's saved history, if any."""
+        path = self._history_path(project_id)
+        if path is None:
+            return
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(
+                f"Failed to remove task history: {e}",
+                extra={"task_id": project_id},
+            )
+
+    def prune_history(self) -> int:
+        """Delete saved histories over the count limit or the age limit."""
+        if self.persist_dir is None:
+            return 0
+        files = []
+        for path in self.persist_dir.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        files.sort(reverse=True)
+        cutoff = time.time() - self.history_max_age.total_seconds()
+        pruned = 0
+        for index, (mtime, path) in enumerate(files):
+            over_count = self.history_max_files and (
+                index >= self.history_max_files
+            )
+            if over_count or mtime < cutoff:
+                try:
+                    path.unlink(missing_ok=True)
+                    pruned += 1
+                except OSError as e:
+                    logger.warning(f"Failed to prune task history: {e}")
+        return pruned
+
+    def rehydrate(self, task_lock: TaskLock) -> bool:
+        """Restore conversation state saved when the lock was evicted.
+
+        The file is consumed: the restored lock owns the history from now
+        on and saves it again only if it is evicted in turn.
+        """
+        path = self._history_path(task_lock.id)
+        if path is None or not path.exists():
+            return False
+        try:
+            expired = path.stat().st_mtime < (
+                time.time() - self.history_max_age.total_seconds()
+            )
+        except OSError:
+            return False
+        if expired:
+            self.discard(task_lock.id)
+            return False
+        try:
+            payload = json.loads(path.read_text("utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Failed to read persisted task history: {e}",
+                extra={"task_id": task_lock.id},
+            )
+            return False
+        if payload.get("project_id") != task_lock.id:
+            return False
+        task_lock.conversation_history = payload["conversation_history"]
+        task_lock.last_task_result = payload.get("last_task_result", "")
+        task_lock.last_task_summary = payload.get("last_task_summary", "")
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.warning(
+                f"Failed to remove rehydrated task history: {e}",
+                extra={"task_id": task_lock.id},
+            )
+        self.rehydrated += 1
+        logger.info(
+            "Task history rehydrated",
+            extra={
+                "task_id": task_lock.id,
+                "entries": len(task_lock.conversation_history),
+            },
+        )
+        return True
+
+    # Eviction
+
+    async def evict(self, project_id: str, reason: str) -> bool:
+        task_lock = task_locks.get(project_id)
+        if task_lock is None:
+            return False
+        # Only eviction keeps the history; the task has not ended
+        self.persist(task_lock)
+        try:
+            await delete_task_lock(project_id, keep_history=True)
+        except Exception as e:
+            logger.error(
+                f"Failed to evict task lock: {e}",
+                extra={"task_id": project_id},
+            )
+            return False
+        self.evicted += 1
+        logger.info(
+            "Task lock evicted",
+            extra={"task_id": project_id, "reason": reason},
+        )
+        return True
+
+    async def sweep(self, now: datetime | None = None) -> list[str]:
+        """Evict expired locks, then LRU locks over the budgets."""
+        now = now or datetime.now()
+        self.prune_history()
+        evicted = []
+        for project_id, task_lock in list(task_locks.items()):
+            if not _is_busy(task_lock) and (
+                now - task_lock.last_accessed >= self.ttl
+            ):
+                if await self.evict(project_id, "ttl"):
+                    evicted.append(project_id)
+
+        if not self.max_locks and not self.max_bytes:
+            return evicted
+        sizes = {
+            project_id: estimate_task_lock_bytes(task_lock)
+            for project_id, task_lock in task_locks.items()
+        }
+        total = sum(sizes.values())
+        count = len(sizes)
+        idle = sorted(
+            (
+                task_lock
+                for task_lock in task_locks.values()
+                if not _is_busy(task_lock)
+            ),
+            key=lambda task_lock: task_lock.last_accessed,
+        )
+        for task_lock in idle:
+            over_count = self.max_locks and count > self.max_locks
+            over_bytes = self.max_bytes and total > self.max_bytes
+            if not over_count and not over_bytes:
+                break
+            if await self.evict(task_lock.id, "lru"):
+                evicted.append(task_lock.id)
+                count -= 1
+                total -= sizes[task_lock.id]
+        return evicted
+
+    def stats(self) -> dict[str, Any]:
+        now = datetime.now()
+        locks = []
+        for project_id, task_lock in list(task_locks.items()):
+            locks.append(
+                {
+                    "project_id": project_id,
+                    "bytes": estimate_task_lock_bytes(task_lock),
+                    "idle_seconds": round(
+                        (now - task_lock.last_accessed).total_seconds(), 1
+                    ),
+                    "busy": _is_busy(task_lock),
+                    "history_entries": len(task_lock.conversation_history),
+                }
+            )
+        locks.sort(key=lambda item: item["bytes"], reverse=True)
+        return {
+            "count": len(locks),
+            "bytes": sum(item["bytes"] for item in locks),
+            "evicted": self.evicted,
+            "rehydrated": self.rehydrated,
+            "ttl_seconds": self.ttl.total_seconds(),
+            "max_locks": self.max_locks,
+            "max_bytes": self.max_bytes,
+            "locks": locks,
+        }
+
+    # Background sweeping
+
+    def ensure_running(self) -> None:
+        """Start the periodic sweep on the running loop, if not started."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if (
+            self._task is not None
+            and not self._task.done()
+            and self._task.get_loop() is loop
+        ):
+            return
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Error in task lock sweep: {e}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+_lifecycle: TaskLockLifecycle | None = None
+
+
+def get_task_lifecycle() -> TaskLockLifecycle:
+    """Return the process-wide lifecycle manager, configured from env."""
+    global _lifecycle
+    if _lifecycle is None:
+        persist_dir = env(
+            "TASK_LOCK_PERSIST_DIR",
+            os.path.join(os.path.expanduser("~"), ".eigent", "task_history"),
+        )
+        _lifecycle = TaskLockLifecycle(
+            ttl_seconds=float(
+                env("TASK_LOCK_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))
+            ),
+            max_locks=int(env("TASK_LOCK_MAX_COUNT", "0")),
+            max_bytes=int(env("TASK_LOCK_MAX_BYTES", "0")),
+            persist_dir=persist_dir or None,
+            sweep_interval=float(
+                env("TASK_LOCK_SWEEP_INTERVAL", str(DEFAULT_SWEEP_INTERVAL))
+            ),
+            history_max_files=int(
+                env(
+                    "TASK_LOCK_HISTORY_MAX_FILES",
+                    str(DEFAULT_HISTORY_MAX_FILES),
+                )
+            ),
+            history_max_age_seconds=float(
+                env(
+                    "TASK_LOCK_HISTORY_MAX_AGE_SECONDS",
+                    str(DEFAULT_HISTORY_MAX_AGE_SECONDS),
+                )
+            ),
+        )
+    return _lifecycle
@@ -0,0 +1,412 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""Cross-worker ownership of task locks.
+
+A TaskLock and its queues live in the worker process that accepted
+``POST /chat`` for the project. When the backend runs several workers,
+follow-up calls for that project can land on any of them. The registry
+records which worker owns each project (a renewable lease) and carries
+control messages to the owner, which feeds them into its local queues.
+Requests that need an answer carry a reply inbox the owner answers on.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from app.component.environment import env
+
+logger = logging.getLogger("task_registry")
+
+DEFAULT_LEASE_SECONDS = 30.0
+# How long the background worker blocks waiting for a message
+_RECEIVE_TIMEOUT = 1.0
+
+# Returns the reply for messages that carry a "reply_to" inbox
+MessageHandler = Callable[[dict[str, Any]], dict[str, Any] | None]
+
+# Compare-and-set on the owner key: the lease is only touched while it
+# still names this worker, even if it expired and was taken in between.
+_RENEW_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+_DROP_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class TaskRegistry(ABC):
+    """Project ownership and message routing between backend workers.
+
+    Subclasses provide the lease and inbox primitives. This class keeps
+    track of the projects owned by this worker and, while it owns any,
+    runs a background thread that renews their leases and hands
+    incoming messages to ``handler``.
+    """
+
+    def __init__(
+        self,
+        worker_id: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.handler: MessageHandler | None = None
+        self._owned: set[str] = set()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    # Backend primitives
+
+    @abstractmethod
+    def _claim(self, project_id: str) -> bool:
+        """Take or extend the lease on a project; False if held elsewhere."""
+
+    @abstractmethod
+    def _renew(self, project_id: str) -> bool:
+        """Extend a lease this worker holds; False if it was lost."""
+
+    @abstractmethod
+    def _drop(self, project_id: str) -> None:
+        """Give up the lease if this worker still holds it."""
+
+    @abstractmethod
+    def owner(self, project_id: str) -> str | None:
+        """Return the worker holding a live lease on the project."""
+
+    @abstractmethod
+    def send(self, worker_id: str, message: dict[str, Any]) -> None:
+        """Append a message to a worker's inbox."""
+
+    @abstractmethod
+    def receive(self, timeout: float) -> dict[str, Any] | None:
+        """Pop the next message for this worker, waiting up to timeout."""
+
+    @abstractmethod
+    def _receive_reply(
+        self, reply_to: str, timeout: float
+    ) -> dict[str, Any] | None:
+        """Pop the reply sent to a request's inbox, waiting up to timeout."""
+
+    @abstractmethod
+    def owners(self) -> dict[str, str]:
+        """Return every project with a live lease and its owner."""
+
+    @property
+    def distributed(self) -> bool:
+        """Whether other workers can own projects or send messages."""
+        return True
+
+    # Ownership
+
+    def acquire(self, project_id: str) -> bool:
+        """Become the owner of a project. False if another worker is."""
+        if not self._claim(project_id):
+            logger.warning(
+                "Project is owned by another worker",
+                extra={
+                    "project_id": project_id,
+                    "owner": self.owner(project_id),
+                },
+            )
+            return False
+        with self._lock:
+            self._owned.add(project_id)
+            if self.distributed and (
+                self._worker is None or not self._worker.is_alive()
+            ):
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="task-registry",
+                    daemon=True,
+                )
+                self._worker.start()
+        return True
+
+    def release(self, project_id: str) -> None:
+        with self._lock:
+            self._owned.discard(project_id)
+        self._drop(project_id)
+
+    def owned(self) -> set[str]:
+        with self._lock:
+            return set(self._owned)
+
+    def remote_owner(self, project_id: str) -> str | None:
+        """Return the owning worker if it is not this one."""
+        if not self.distributed:
+            return None
+        owner = self.owner(project_id)
+        return owner if owner and owner != self.worker_id else None
+
+    def request(
+        self, worker_id: str, message: dict[str, Any], timeout: float
+    ) -> dict[str, Any] | None:
+        """Send a message to a worker and wait for its handler's reply.
+
+        Returns None if no reply arrived within timeout.
+        """
+        reply_to = f"{self.worker_id}:reply:{uuid.uuid4().hex}"
+        self.send(worker_id, {**message, "reply_to": reply_to})
+        return self._receive_reply(reply_to, timeout)
+
+    def route(self, project_id: str, message: dict[str, Any]) -> bool:
+        """Send a message to the project's owner, if another worker."""
+        owner = self.remote_owner(project_id)
+        if owner is None:
+            return False
+        self.send(owner, {**message, "project_id": project_id})
+        return True
+
+    def _run(self) -> None:
+        next_renewal = 0.0
+        while True:
+            with self._lock:
+                if not self._owned:
+                    # Re-checked under the lock so acquire() starts a new
+                    # worker if it races with this exit.
+                    self._worker = None
+                    return
+                owned = set(self._owned)
+            now = time.monotonic()
+            if now >= next_renewal:
+                for project_id in owned:
+                    if not self._renew(project_id):
+                        logger.error(
+                            "Lost lease on project",
+                            extra={"project_id": project_id},
+                        )
+                        # Another worker may own it now; stop renewing
+                        with self._lock:
+                            self._owned.discard(project_id)
+                next_renewal = now + self.lease_seconds / 3
+            try:
+                # Wake up often enough to renew before the lease runs out
+                message = self.receive(
+                    min(_RECEIVE_TIMEOUT, self.lease_seconds / 3)
+                )
+            except Exception as e:
+                logger.error(f"Task registry receive failed: {e}")
+                time.sleep(_RECEIVE_TIMEOUT)
+                continue
+            if message is None or self.handler is None:
+                continue
+            try:
+                reply = self.handler(message)
+            except Exception as e:
+                logger.error(
+                    f"Failed to deliver routed message: {e}",
+                    extra={"project_id": message.get("project_id")},
+                    exc_info=True,
+                )
+                reply = {"error": "Failed to handle the request"}
+            reply_to = message.get("reply_to")
+            if reply_to:
+                try:
+                    self.send(reply_to, reply or {})
+                except Exception as e:
+                    logger.error(f"Failed to send routed reply: {e}")
+
+
+class LocalTaskRegistry(TaskRegistry):
+    """Single-process registry: every task lock lives in this worker."""
+
+    @property
+    def distributed(self) -> bool:
+        return False
+
+    def _claim(self, project_id: str) -> bool:
+        return True
+
+    def _renew(self, project_id: str) -> bool:
+        return True
+
+    def _drop(self, project_id: str) -> None:
+        pass
+
+    def owner(self, project_id: str) -> str | None:
+        return self.worker_id if project_id in self.owned() else None
+
+    def send(self, worker_id: str, message: dict[str, Any]) -> None:
+        raise RuntimeError("LocalTaskRegistry has no other workers")
+
+    def receive(self, timeout: float) -> dict[str, Any] | None:
+        return None
+
+    def _receive_reply(
+        self, reply_to: str, timeout: float
+    ) -> dict[str, Any] | None:
+        raise RuntimeError("LocalTaskRegistry has no other workers")
+
+    def owners(self) -> dict[str, str]:
+        return dict.fromkeys(self.owned(), self.worker_id)
+
+
+def _decode(value: Any) -> str | None:
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
+
+
+class RedisTaskRegistry(TaskRegistry):
+    """Registry shared through Redis (or any server speaking its protocol).
+
+    Ownership is a key per project holding the worker id, set with NX and
+    a TTL so a crashed worker's projects free up once the lease expires.
+    Renewing and dropping a lease are compare-and-set Lua scripts.
+    Each worker has a list as its inbox; senders RPUSH and the owner
+    BLPOPs. ``client`` is a synchronous redis-py compatible client.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        worker_id: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        prefix: str = "eigent:task",
+    ) -> None:
+        super().__init__(worker_id, lease_seconds)
+        self._client = client
+        self._prefix = prefix
+        self._lease_ms = int(lease_seconds * 1000)
+
+    def _owner_key(self, project_id: str) -> str:
+        return f"{self._prefix}:owner:{project_id}"
+
+    def _inbox_key(self, worker_id: str) -> str:
+        return f"{self._prefix}:inbox:{worker_id}"
+
+    def _claim(self, project_id: str) -> bool:
+        key = self._owner_key(project_id)
+        if self._client.set(key, self.worker_id, nx=True, px=self._lease_ms):
+            return True
+        return self._renew(project_id)
+
+    def _renew(self, project_id: str) -> bool:
+        return bool(
+            self._client.eval(
+                _RENEW_SCRIPT,
+                1,
+                self._owner_key(project_id),
+                self.worker_id,
+                self._lease_ms,
+            )
+        )
+
+    def _drop(self, project_id: str) -> None:
+        self._client.eval(
+            _DROP_SCRIPT, 1, self._owner_key(project_id), self.worker_id
+        )
+
+    def owner(self, project_id: str) -> str | None:
+        return _decode(self._client.get(self._owner_key(project_id)))
+
+    def send(self, worker_id: str, message: dict[str, Any]) -> None:
+        key = self._inbox_key(worker_id)
+        self._client.rpush(key, json.dumps(message))
+        # Messages for a worker that died expire with its leases
+        self._client.pexpire(key, self._lease_ms)
+
+    def receive(self, timeout: float) -> dict[str, Any] | None:
+        return self._pop(self._inbox_key(self.worker_id), timeout)
+
+    def _receive_reply(
+        self, reply_to: str, timeout: float
+    ) -> dict[str, Any] | None:
+        # Replies are sent like messages, to an inbox named by reply_to
+        return self._pop(self._inbox_key(reply_to), timeout)
+
+    def _pop(self, key: str, timeout: float) -> dict[str, Any] | None:
+        item = self._client.blpop([key], timeout=timeout)
+        if item is None:
+            return None
+        return json.loads(_decode(item[1]))
+
+    def owners(self) -> dict[str, str]:
+        prefix = self._owner_key("")
+        keys = list(self._client.scan_iter(match=f"{prefix}*"))
+        if not keys:
+            return {}
+        owners = {}
+        for key, value in zip(keys, self._client.mget(keys), strict=True):
+            if value is not None:
+                owners[_decode(key)[len(prefix) :]] = _decode(value)
+        return owners
+
+
+_registry: TaskRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def create_task_registry(url: str | None = None) -> TaskRegistry:
+    """Build a registry from a URL (``TASK_REGISTRY_URL``).
+
+    ``redis://`` and ``rediss://`` URLs need the optional ``redis``
+    package; anything else gives the single-process registry.
+    """
+    if not url or not url.startswith(("redis://", "rediss://")):
+        return LocalTaskRegistry()
+    try:
+        import redis
+    except ImportError as e:
+        raise RuntimeError(
+            "TASK_REGISTRY_URL points at Redis but the 'redis' package "
+            "is not installed"
+        ) from e
+    lease_seconds = float(
+        env("TASK_REGISTRY_LEASE_SECONDS", str(DEFAULT_LEASE_SECONDS))
+    )
+    return RedisTaskRegistry(
+        redis.Redis.from_url(url), lease_seconds=lease_seconds
+    )
+
+
+def get_task_registry() -> TaskRegistry:
+    """Return the process-wide task registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = create_task_registry(env("TASK_REGISTRY_URL"))
+            logger.info(
+                "Task registry initialized",
+                extra={
+                    "registry": type(_registry).__name__,
+                    "worker_id": _registry.worker_id,
+                },
+            )
+        return _registry
+
+
+def set_task_registry(registry: TaskRegistry | None) -> None:
+    """Replace the process-wide registry (None resets to the default)."""
+    global _registry
+    with _registry_lock:
+        _registry = registry
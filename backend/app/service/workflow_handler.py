@@ -12,9 +12,10 @@
 # limitations under the License.
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
+import asyncio
 import logging
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any
 
 from app.agent.workflow_orchestrator import (
@@ -100,6 +101,218 @@ def get_original_message(task_lock: TaskLock) -> str | None:
     return getattr(task_lock, "original_message", None)
 
 
+def build_plan_task_content(task_lock: TaskLock, options: Chat) -> str:
+    """Build the task content that plan generation decomposes.
+
+    For post-execution follow-ups the previous execution is included so the
+    new plan avoids duplicating steps that were already done.
+    """
+    original_message = get_original_message(task_lock) or options.question
+
+    for entry in reversed(getattr(task_lock, "conversation_history", [])):
+        if entry.get("role") != "task_result":
+            continue
+        task_data = entry.get("content", {})
+        prev_content = task_data.get("task_content", "")
+        prev_result = task_data.get("task_result", "")
+        if prev_content and prev_result:
+            return (
+                f"PREVIOUS EXECUTION:\n"
+                f"Task: {prev_content}\n"
+                f"Result: {prev_result}\n\n"
+                f"NEW REQUEST/FOLLOW-UP:\n{original_message}\n\n"
+                f"Instructions: Review previous execution above. "
+                f"In the new plan, avoid duplicating steps already done. "
+                f"Focus on improvements, additional requirements, "
+                f"or changes requested in the follow-up."
+            )
+    return original_message
+
+
+class SpeculativePlan:
+    """Workforce construction and a draft decomposition started in the
+    background while the user is still confirming requirements.
+
+    The workforce does not depend on the plan content, so it is built once
+    and only cancelled when the speculation is discarded. The draft
+    decomposition is keyed by its task content: when the content changes
+    the draft is cancelled and restarted on the same workforce.
+    """
+
+    def __init__(self, workforce_task: asyncio.Task) -> None:
+        self.workforce_task = workforce_task
+        self.draft_content: str | None = None
+        self.draft_task: asyncio.Task | None = None
+
+    def cancel_draft(self) -> None:
+        if self.draft_task is not None and not self.draft_task.done():
+            self.draft_task.cancel()
+        self.draft_task = None
+        self.draft_content = None
+
+    def cancel(self) -> None:
+        self.cancel_draft()
+        if not self.workforce_task.done():
+            self.workforce_task.cancel()
+
+
+def get_speculative_plan(task_lock: TaskLock) -> SpeculativePlan | None:
+    """Retrieve the in-flight speculative plan from TaskLock."""
+    return getattr(task_lock, "speculative_plan", None)
+
+
+async def _draft_decomposition(
+    workforce_task: asyncio.Task, task_content: str
+) -> list:
+    # Shield so cancelling a stale draft keeps the workforce being built
+    workforce, _ = await asyncio.shield(workforce_task)
+
+    from camel.tasks import Task as CamelTask
+
+    return await workforce.handle_decompose_append_task(
+        CamelTask(id=str(uuid.uuid4()), content=task_content),
+        reset=False,
+    )
+
+
+def start_speculation(
+    task_lock: TaskLock,
+    options: Chat,
+    build_workforce: Callable[[], Awaitable[tuple[Any, Any]]],
+) -> SpeculativePlan:
+    """Start building the workforce and drafting the decomposition.
+
+    If a speculation is already running it is rebased instead, reusing the
+    workforce that is being built.
+
+    Args:
+        task_lock: The TaskLock for this session
+        options: Chat options
+        build_workforce: Coroutine factory returning ``(workforce, mcp)``
+
+    Returns:
+        The speculative plan stored on the TaskLock
+    """
+    plan = get_speculative_plan(task_lock)
+    if plan is None:
+        workforce_task = asyncio.create_task(build_workforce())
+        task_lock.add_background_task(workforce_task)
+        plan = SpeculativePlan(workforce_task)
+        task_lock.speculative_plan = plan
+        logger.info(
+            "[SPECULATIVE] Workforce construction started",
+            extra={"task_id": task_lock.id},
+        )
+    rebase_speculation(task_lock, options)
+    return plan
+
+
+def rebase_speculation(task_lock: TaskLock, options: Chat) -> None:
+    """Restart the draft decomposition if the plan content has changed."""
+    plan = get_speculative_plan(task_lock)
+    if plan is None:
+        return
+
+    task_content = build_plan_task_content(task_lock, options)
+    if plan.draft_task is not None and plan.draft_content == task_content:
+        return
+
+    plan.cancel_draft()
+    plan.draft_content = task_content
+    plan.draft_task = asyncio.create_task(
+        _draft_decomposition(plan.workforce_task, task_content)
+    )
+    task_lock.add_background_task(plan.draft_task)
+    logger.info(
+        "[SPECULATIVE] Draft decomposition started",
+        extra={"task_id": task_lock.id},
+    )
+
+
+def cancel_speculative_draft(task_lock: TaskLock) -> None:
+    """Cancel a draft decomposition that has not been consumed yet."""
+    plan = get_speculative_plan(task_lock)
+    if plan is not None and plan.draft_task is not None:
+        plan.cancel_draft()
+        logger.info(
+            "[SPECULATIVE] Draft decomposition cancelled",
+            extra={"task_id": task_lock.id},
+        )
+
+
+def discard_speculation(task_lock: TaskLock) -> None:
+    """Cancel any speculative work and drop it from TaskLock."""
+    plan = get_speculative_plan(task_lock)
+    if plan is None:
+        return
+    plan.cancel()
+    task_lock.speculative_plan = None
+
+
+async def take_speculative_workforce(
+    task_lock: TaskLock,
+) -> tuple[Any, Any] | None:
+    """Wait for and return the speculatively built ``(workforce, mcp)``.
+
+    Returns:
+        The workforce tuple, or None if no speculation is running or the
+        background construction failed
+    """
+    plan = get_speculative_plan(task_lock)
+    if plan is None or plan.workforce_task.cancelled():
+        return None
+    try:
+        return await asyncio.shield(plan.workforce_task)
+    except Exception as e:
+        logger.warning(
+            f"[SPECULATIVE] Workforce construction failed: {e}",
+            extra={"task_id": task_lock.id},
+        )
+        discard_speculation(task_lock)
+        return None
+
+
+async def take_speculative_draft(
+    task_lock: TaskLock, task_content: str
+) -> list | None:
+    """Consume the draft decomposition if it matches ``task_content``.
+
+    A draft made for different content is cancelled. The draft is consumed
+    at most once; later plan regenerations decompose from scratch.
+
+    Returns:
+        The drafted subtasks, or None if no usable draft exists
+    """
+    plan = get_speculative_plan(task_lock)
+    if plan is None or plan.draft_task is None:
+        return None
+    if plan.draft_content != task_content:
+        cancel_speculative_draft(task_lock)
+        return None
+
+    draft_task = plan.draft_task
+    plan.draft_task = None
+    plan.draft_content = None
+    try:
+        subtasks = await draft_task
+    except asyncio.CancelledError:
+        if asyncio.current_task().cancelling():
+            raise
+        return None
+    except Exception as e:
+        logger.warning(
+            f"[SPECULATIVE] Draft decomposition failed: {e}",
+            extra={"task_id": task_lock.id},
+        )
+        return None
+
+    logger.info(
+        "[SPECULATIVE] Using draft decomposition",
+        extra={"task_id": task_lock.id, "subtask_count": len(subtasks)},
+    )
+    return subtasks
+
+
 async def handle_phase1_step1(
     task_lock: TaskLock,
     options: Chat,
@@ -154,10 +367,11 @@ async def handle_phase1_step1(
 
         # Generate simple answer using the model
         from camel.agents import ChatAgent
-        from camel.models import ModelFactory
+
+        from app.component.model_factory import create_model
 
         try:
-            model = ModelFactory.create(
+            model = create_model(
                 model_platform=model_config.model_platform,
                 model_type=model_config.model_type,
                 api_key=model_config.api_key,
@@ -477,36 +691,12 @@ async def handle_phase1_step3(
 
     # For post-execution follow-ups, include previous execution context in the task content
     # This helps the plan generation avoid duplicates and continue from previous work
-    task_content = original_message
-    if (
-        hasattr(task_lock, "conversation_history")
-        and task_lock.conversation_history
-    ):
-        # Look for previous task results in conversation
-        for entry in reversed(task_lock.conversation_history):
-            if entry.get("role") == "task_result":
-                task_data = entry.get("content", {})
-                prev_content = task_data.get("task_content", "")
-                prev_result = task_data.get("task_result", "")
-                if prev_content and prev_result:
-                    logger.info(
-                        "[POST-EXECUTION-PLAN] Including previous execution context in plan generation",
-                        extra={
-                            "task_id": task_lock.id,
-                            "prev_content_len": len(prev_content),
-                            "prev_result_len": len(prev_result),
-                        },
-                    )
-                    task_content = (
-                        f"PREVIOUS EXECUTION:\n"
-                        f"Task: {prev_content}\n"
-                        f"Result: {prev_result}\n\n"
-                        f"NEW REQUEST/FOLLOW-UP:\n{original_message}\n\n"
-                        f"Instructions: Review previous execution above. "
-                        f"In the new plan, avoid duplicating steps already done. "
-                        f"Focus on improvements, additional requirements, or changes requested in the follow-up."
-                    )
-                    break
+    task_content = build_plan_task_content(task_lock, options)
+    if task_content != original_message:
+        logger.info(
+            "[POST-EXECUTION-PLAN] Including previous execution context in plan generation",
+            extra={"task_id": task_lock.id},
+        )
 
     from camel.tasks import Task as CamelTask
 
@@ -518,10 +708,13 @@ async def handle_phase1_step3(
     plan_tasks: list[PlanTask] = []
 
     try:
-        subtasks = await workforce.handle_decompose_append_task(
-            decompose_task,
-            reset=False,
-        )
+        # Reuse the decomposition drafted while requirements were confirmed
+        subtasks = await take_speculative_draft(task_lock, task_content)
+        if subtasks is None:
+            subtasks = await workforce.handle_decompose_append_task(
+                decompose_task,
+                reset=False,
+            )
 
         for i, subtask in enumerate(subtasks):
             plan_task = PlanTask(
@@ -616,6 +809,9 @@ async def handle_plan_update(
         },
     )
 
+    # The user now owns the plan; a pending draft would be stale
+    cancel_speculative_draft(task_lock)
+
     plan_draft = get_plan_draft(task_lock)
     if not plan_draft:
         plan_draft = PlanDraft(tasks=[], can_start=False)
@@ -0,0 +1,307 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""BM25 keyword index kept alongside RAG vector collections."""
+
+import logging
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from camel.storages.vectordb_storages import (
+    BaseVectorStorage,
+    VectorDBQuery,
+    VectorDBQueryResult,
+    VectorDBStatus,
+    VectorRecord,
+)
+
+logger = logging.getLogger("bm25_index")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Rank offset for reciprocal rank fusion, as in Cormack et al.
+RRF_K = 60
+# Stay well below SQLite's bound-parameter limit
+_QUERY_CHUNK = 500
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class KeywordHit:
+    id: str
+    score: float
+    text: str
+    source: str
+
+
+class BM25Index:
+    """SQLite inverted index scoring chunks with Okapi BM25.
+
+    Chunks belong to a collection and a source (file path, URL or document
+    source). Searches are restricted to the given collections and source
+    before scoring, and only postings of the query terms are read.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "id TEXT PRIMARY KEY, collection TEXT NOT NULL, "
+                "source TEXT NOT NULL, text TEXT NOT NULL, "
+                "length INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS chunks_scope "
+                "ON chunks (collection, source)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                "term TEXT NOT NULL, chunk_id TEXT NOT NULL, "
+                "tf INTEGER NOT NULL, PRIMARY KEY (term, chunk_id))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS postings_chunk "
+                "ON postings (chunk_id)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def add(
+        self, collection: str, chunks: Iterable[tuple[str, str, str]]
+    ) -> None:
+        """Index (id, text, source) chunks, replacing existing ids."""
+        rows, postings = [], []
+        for chunk_id, text, source in chunks:
+            counts = Counter(tokenize(text))
+            rows.append(
+                (chunk_id, collection, source, text, sum(counts.values()))
+            )
+            postings.extend(
+                (term, chunk_id, tf) for term, tf in counts.items()
+            )
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            self._delete_ids(conn, [row[0] for row in rows])
+            conn.executemany(
+                "INSERT INTO chunks (id, collection, source, text, length) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT INTO postings (term, chunk_id, tf) VALUES (?, ?, ?)",
+                postings,
+            )
+            conn.commit()
+
+    @staticmethod
+    def _delete_ids(conn: sqlite3.Connection, ids: list[str]) -> None:
+        for i in range(0, len(ids), _QUERY_CHUNK):
+            chunk = ids[i : i + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(
+                f"DELETE FROM postings "  # noqa: S608
+                f"WHERE chunk_id IN ({placeholders})",
+                chunk,
+            )
+            conn.execute(
+                f"DELETE FROM chunks WHERE id IN ({placeholders})",  # noqa: S608
+                chunk,
+            )
+
+    def delete(self, ids: list[str]) -> None:
+        if not ids:
+            return
+        with self._lock:
+            conn = self._connect()
+            self._delete_ids(conn, ids)
+            conn.commit()
+
+    def clear(self, collection: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "DELETE FROM postings WHERE chunk_id IN "
+                "(SELECT id FROM chunks WHERE collection = ?)",
+                (collection,),
+            )
+            conn.execute(
+                "DELETE FROM chunks WHERE collection = ?", (collection,)
+            )
+            conn.commit()
+
+    def search(
+        self,
+        query: str,
+        top_k: int,
+        collections: list[str],
+        source: str | None = None,
+    ) -> list[KeywordHit]:
+        """Return the top_k chunks by BM25 score within the given scope.
+
+        Corpus statistics (chunk count, average length, document
+        frequency) are computed over the filtered scope only.
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms or not collections or top_k <= 0:
+            return []
+        scope = f"c.collection IN ({','.join('?' * len(collections))})"
+        scope_params: list[Any] = list(collections)
+        if source is not None:
+            scope += " AND c.source = ?"
+            scope_params.append(source)
+
+        with self._lock:
+            conn = self._connect()
+            count, avg_length = conn.execute(
+                f"SELECT COUNT(*), AVG(c.length) FROM chunks c "  # noqa: S608
+                f"WHERE {scope}",
+                scope_params,
+            ).fetchone()
+            if not count:
+                return []
+            rows = conn.execute(
+                f"SELECT p.term, p.chunk_id, p.tf, c.length "  # noqa: S608
+                f"FROM postings p JOIN chunks c ON c.id = p.chunk_id "
+                f"WHERE p.term IN ({','.join('?' * len(terms))}) "
+                f"AND {scope}",
+                [*terms, *scope_params],
+            ).fetchall()
+
+            doc_freq = Counter(term for term, _, _, _ in rows)
+            scores: dict[str, float] = defaultdict(float)
+            avg_length = avg_length or 1
+            for term, chunk_id, tf, length in rows:
+                df = doc_freq[term]
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                scores[chunk_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+            best = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+            best = best[:top_k]
+            texts = {}
+            if best:
+                ids = [chunk_id for chunk_id, _ in best]
+                texts = {
+                    chunk_id: (text, chunk_source)
+                    for chunk_id, text, chunk_source in conn.execute(
+                        f"SELECT id, text, source FROM chunks "  # noqa: S608
+                        f"WHERE id IN ({','.join('?' * len(ids))})",
+                        ids,
+                    )
+                }
+        return [
+            KeywordHit(chunk_id, score, *texts[chunk_id])
+            for chunk_id, score in best
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[str]], k: int = RRF_K
+) -> list[str]:
+    """Merge ranked key lists, scoring each key by sum(1 / (k + rank))."""
+    scores: dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, 1):
+            scores[key] += 1 / (k + rank)
+    return sorted(scores, key=lambda key: scores[key], reverse=True)
+
+
+def payload_source(payload: dict[str, Any] | None) -> str:
+    """Source of a chunk as written by CAMEL's VectorRetriever."""
+    if not payload:
+        return ""
+    extra_info = payload.get("extra_info") or {}
+    return str(extra_info.get("source") or payload.get("content path", ""))
+
+
+class KeywordIndexedStorage(BaseVectorStorage):
+    """Vector storage wrapper that mirrors writes into a BM25Index.
+
+    Every record added to the wrapped storage is indexed under this
+    collection using its payload text, so the keyword index stays in step
+    with the vectors without changing how retrievers ingest content.
+    """
+
+    def __init__(
+        self, storage: BaseVectorStorage, index: BM25Index, collection: str
+    ) -> None:
+        self.storage = storage
+        self.index = index
+        self.collection = collection
+
+    def add(self, records: list[VectorRecord], **kwargs: Any) -> None:
+        self.storage.add(records, **kwargs)
+        self.index.add(
+            self.collection,
+            (
+                (
+                    record.id,
+                    str(record.payload.get("text", "")),
+                    payload_source(record.payload),
+                )
+                for record in records
+                if record.payload
+            ),
+        )
+
+    def delete(self, ids: list[str], **kwargs: Any) -> None:
+        self.storage.delete(ids, **kwargs)
+        self.index.delete(ids)
+
+    def status(self) -> VectorDBStatus:
+        return self.storage.status()
+
+    def query(
+        self, query: VectorDBQuery, **kwargs: Any
+    ) -> list[VectorDBQueryResult]:
+        return self.storage.query(query, **kwargs)
+
+    def clear(self) -> None:
+        self.storage.clear()
+        self.index.clear(self.collection)
+
+    def load(self) -> None:
+        self.storage.load()
+
+    @property
+    def client(self) -> Any:
+        return self.storage.client
@@ -0,0 +1,257 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Content-addressed cache for MarkItDown document conversions."""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("conversion_cache")
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".eigent", "cache", "conversions"
+)
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Smallest batch of cache misses worth shipping to worker processes
+PROCESS_POOL_MIN_FILES = 2
+PROCESS_POOL_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+_loader: Any = None
+_loader_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_markitdown_loader():
+    """Return the process-wide MarkItDownLoader, creating it on first use."""
+    global _loader
+    if _loader is None:
+        with _loader_lock:
+            if _loader is None:
+                from camel.loaders.markitdown import MarkItDownLoader
+
+                _loader = MarkItDownLoader()
+    return _loader
+
+
+def _convert_in_worker(file_path: str) -> str:
+    return get_markitdown_loader().convert_file(file_path)
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs an event loop and
+            # threads is not safe
+            _pool = ProcessPoolExecutor(
+                max_workers=PROCESS_POOL_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _discard_process_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+class ConversionCache:
+    """On-disk cache of converted Markdown, evicted least recently used.
+
+    Entries are addressed by a hash of the file extension and content, so
+    identical documents share one entry. The (path, size, mtime) of every
+    file seen is remembered so unchanged files are not re-hashed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def _digest(self, file_path: str) -> str:
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is not None:
+            return digest
+
+        hasher = hashlib.sha256(Path(file_path).suffix.lower().encode())
+        with open(file_path, "rb") as f:
+            while block := f.read(_HASH_BLOCK_SIZE):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        with self._lock:
+            self._digests[key] = digest
+        return digest
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.md"
+
+    def get(self, digest: str) -> str | None:
+        entry = self._entry_path(digest)
+        try:
+            text = entry.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            # Touch the entry so eviction sees it as recently used
+            os.utime(entry)
+        except OSError:
+            pass
+        return text
+
+    def put(self, digest: str, text: str) -> None:
+        entry = self._entry_path(digest)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.warning(f"Failed to cache conversion {digest}: {e}")
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in self.cache_dir.glob("*.md"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            entry.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        with self._lock:
+            self._digests.clear()
+        for entry in self.cache_dir.glob("*.md"):
+            entry.unlink(missing_ok=True)
+
+    def _convert_many(
+        self, file_paths: list[str], parallel: bool
+    ) -> list[str | Exception]:
+        if parallel and len(file_paths) >= PROCESS_POOL_MIN_FILES:
+            try:
+                futures = [
+                    _get_process_pool().submit(_convert_in_worker, path)
+                    for path in file_paths
+                ]
+                results: list[str | Exception] = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        results.append(e)
+                return results
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(
+                    f"Process pool unavailable, converting in-process: {e}"
+                )
+                _discard_process_pool()
+
+        results = []
+        for path in file_paths:
+            try:
+                results.append(get_markitdown_loader().convert_file(path))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def convert_files(
+        self, file_paths: list[str], parallel: bool = True
+    ) -> dict[str, str]:
+        """Convert files to Markdown, serving unchanged files from cache.
+
+        Mirrors MarkItDownLoader.convert_files: failures are reported as
+        ``"Error: ..."`` values and are never cached.
+
+        Args:
+            file_paths (list[str]): Paths of the files to convert.
+            parallel (bool): Convert cache misses in worker processes when
+                there are enough of them.
+
+        Returns:
+            dict[str, str]: Converted Markdown keyed by input path.
+        """
+        results: dict[str, str] = {}
+        misses: list[str] = []
+        miss_digests: list[str | None] = []
+
+        for path in file_paths:
+            try:
+                digest = self._digest(path)
+            except OSError:
+                digest = None
+            if digest is not None:
+                cached = self.get(digest)
+                if cached is not None:
+                    results[path] = cached
+                    continue
+            misses.append(path)
+            miss_digests.append(digest)
+
+        if misses:
+            converted = self._convert_many(misses, parallel)
+            for path, digest, text in zip(misses, miss_digests, converted):
+                if isinstance(text, Exception):
+                    logger.error(f"Error processing file '{path}': {text}")
+                    results[path] = f"Error: {text}"
+                    continue
+                if digest is not None:
+                    self.put(digest, text)
+                results[path] = text
+
+        return {path: results[path] for path in file_paths}
+
+
+_cache: ConversionCache | None = None
+
+
+def get_conversion_cache() -> ConversionCache:
+    """Return the process-wide conversion cache."""
+    global _cache
+    if _cache is None:
+        _cache = ConversionCache()
+    return _cache
@@ -0,0 +1,199 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Dependency context for worker prompts.
+
+Every subtask prompt inlines the results of the tasks it depends on, so
+on a deep task graph the same large result is sent to the model once per
+dependent. ``DependencyContextCache`` keeps, per completed task, a
+compressed summary computed once, and builds each prompt's dependency
+section within a token budget: full results while they fit, summaries
+for the largest results otherwise. It counts the tokens it saved so a
+workforce run can report them.
+
+Token counts are estimated from character length; this is a budget, not
+a billing figure, and avoids loading a tokenizer per model.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from camel.tasks import Task
+
+logger = logging.getLogger("dependency_context")
+
+CHARS_PER_TOKEN = 4
+DEFAULT_SUMMARY_TOKENS = 400
+DEFAULT_BUDGET_TOKENS = 4000
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def summarize_result(text: str, max_tokens: int) -> str:
+    """Shorten ``text`` to about ``max_tokens``, keeping head and tail.
+
+    Results usually state what was done up front and the outcome (file
+    paths, totals, links) at the end, so both ends are kept.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    head_chars = max_chars * 2 // 3
+    tail_chars = max_chars - head_chars
+    head = text[:head_chars]
+    # Prefer to cut at a line break when one is close
+    cut = head.rfind("\n", head_chars // 2)
+    if cut != -1:
+        head = head[:cut]
+    tail = text[-tail_chars:]
+    cut = tail.find("\n", 0, tail_chars // 2)
+    if cut != -1:
+        tail = tail[cut + 1 :]
+    omitted = len(text) - len(head) - len(tail)
+    return f"{head}\n[... {omitted} characters omitted ...]\n{tail}"
+
+
+@dataclass
+class _Entry:
+    digest: str
+    full_tokens: int
+    summary: str
+    summary_tokens: int
+
+
+class DependencyContextCache:
+    """Per-run cache of task result summaries for dependency prompts.
+
+    Args:
+        budget_tokens: Target size of one prompt's dependency section.
+        summary_tokens: Size each stored summary is compressed to.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+        summary_tokens: int = DEFAULT_SUMMARY_TOKENS,
+    ) -> None:
+        self.budget_tokens = budget_tokens
+        self.summary_tokens = summary_tokens
+        self._entries: dict[str, _Entry] = {}
+        self._builds = 0
+        self._tokens_full = 0
+        self._tokens_sent = 0
+        self._summaries_used = 0
+
+    def record(self, task: Task) -> None:
+        """Summarize ``task.result`` once, when the task completes."""
+        self._entry(task.id, str(task.result or ""))
+
+    def _entry(self, key: str, text: str) -> _Entry:
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "replace"), digest_size=16
+        ).hexdigest()
+        entry = self._entries.get(key)
+        if entry is None or entry.digest != digest:
+            summary = summarize_result(text, self.summary_tokens)
+            entry = _Entry(
+                digest=digest,
+                full_tokens=estimate_tokens(text),
+                summary=summary,
+                summary_tokens=estimate_tokens(summary),
+            )
+            self._entries[key] = entry
+        return entry
+
+    def build(self, dependencies: list[Task]) -> str:
+        """Format dependency results for a worker prompt.
+
+        Same line format as CAMEL's ``Worker._get_dep_tasks_info``.
+        Starting from full results, the largest are swapped for their
+        summaries until the section fits :attr:`budget_tokens` (or every
+        result is summarized).
+        """
+        results = [str(dep.result or "") for dep in dependencies]
+        entries = [
+            self._entry(dep.id, result)
+            for dep, result in zip(dependencies, results)
+        ]
+        prefixes = [
+            f"id: {dep.id}, content: {dep.content}. result: "
+            for dep in dependencies
+        ]
+        overhead = sum(estimate_tokens(p) + 1 for p in prefixes)
+        full_total = overhead + sum(e.full_tokens for e in entries)
+        total = full_total
+        summarized: set[int] = set()
+        by_size = sorted(
+            range(len(entries)),
+            key=lambda i: entries[i].full_tokens - entries[i].summary_tokens,
+            reverse=True,
+        )
+        for i in by_size:
+            if total <= self.budget_tokens:
+                break
+            saving = entries[i].full_tokens - entries[i].summary_tokens
+            if saving <= 0:
+                break
+            summarized.add(i)
+            total -= saving
+
+        self._builds += 1
+        self._tokens_full += full_total
+        self._tokens_sent += total
+        self._summaries_used += len(summarized)
+        if summarized:
+            logger.debug(
+                "Dependency context summarized %d/%d results, %d -> %d tokens",
+                len(summarized),
+                len(entries),
+                full_total,
+                total,
+            )
+        return "\n".join(
+            f"{prefix}{entries[i].summary if i in summarized else results[i]}."
+            for i, prefix in enumerate(prefixes)
+        )
+
+    def parent_content(self, parent: Task | None) -> str:
+        """Parent task content, summarized if it alone exceeds the budget."""
+        if parent is None:
+            return ""
+        content = str(parent.content or "")
+        if estimate_tokens(content) <= self.budget_tokens:
+            return content
+        entry = self._entry(f"parent:{parent.id}", content)
+        self._tokens_full += entry.full_tokens
+        self._tokens_sent += entry.summary_tokens
+        return entry.summary
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "builds": self._builds,
+            "cached_results": len(self._entries),
+            "summaries_used": self._summaries_used,
+            "tokens_full": self._tokens_full,
+            "tokens_sent": self._tokens_sent,
+            "tokens_saved": self._tokens_full - self._tokens_sent,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._builds = 0
+        self._tokens_full = 0
+        self._tokens_sent = 0
+        self._summaries_used = 0
@@ -0,0 +1,212 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Persistent embedding cache shared by RAG retrievers."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from camel.embeddings import BaseEmbedding
+
+logger = logging.getLogger("embedding_cache")
+
+DEFAULT_EMBED_BATCH_SIZE = 64
+DEFAULT_MAX_CACHE_ENTRIES = 200_000
+# Stay well below SQLite's bound-parameter limit
+_QUERY_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite store of embedding vectors keyed by (model, text hash).
+
+    Vectors are stored as float32. Once more than max_entries rows exist
+    the least recently used ones are deleted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = DEFAULT_MAX_CACHE_ENTRIES,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, hash TEXT NOT NULL, "
+                "vector BLOB NOT NULL, last_used REAL NOT NULL, "
+                "PRIMARY KEY (model, hash))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used "
+                "ON embeddings (last_used)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(
+        self, model: str, hashes: list[str]
+    ) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        if not hashes:
+            return found
+        with self._lock:
+            conn = self._connect()
+            for i in range(0, len(hashes), _QUERY_CHUNK):
+                chunk = hashes[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT hash, vector FROM embeddings "  # noqa: S608
+                    f"WHERE model = ? AND hash IN ({placeholders})",
+                    [model, *chunk],
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_used = ? "
+                    "WHERE model = ? AND hash = ?",
+                    [(now, model, key) for key in found],
+                )
+                conn.commit()
+        return found
+
+    def put_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        if not vectors:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(model, hash, vector, last_used) VALUES (?, ?, ?, ?)",
+                [
+                    (model, key, array("f", vector).tobytes(), now)
+                    for key, vector in vectors.items()
+                ],
+            )
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM embeddings WHERE rowid IN ("
+                    "SELECT rowid FROM embeddings "
+                    "ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CachedEmbedding(BaseEmbedding[str]):
+    """Embedding model wrapper that serves repeated texts from a cache.
+
+    The wrapped model is created lazily by model_factory, so building the
+    wrapper never needs credentials. Cache misses are sent to the model in
+    batches of at most batch_size texts.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[], BaseEmbedding],
+        cache: EmbeddingCache,
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    ) -> None:
+        self._model_factory = model_factory
+        self._model: BaseEmbedding | None = None
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+
+    @property
+    def model(self) -> BaseEmbedding:
+        if self._model is None:
+            self._model = self._model_factory()
+        return self._model
+
+    @property
+    def model_key(self) -> str:
+        model_type = getattr(self.model, "model_type", None)
+        name = getattr(model_type, "value", model_type)
+        if not name:
+            name = getattr(self.model, "model_name", None)
+        if not name:
+            name = type(self.model).__name__
+        return f"{name}:{self.model.get_output_dim()}"
+
+    def _embed_batched(
+        self, texts: list[str], **kwargs: Any
+    ) -> list[list[float]]:
+        vectors: list[list[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            vectors.extend(
+                self.model.embed_list(texts[i : i + self.batch_size], **kwargs)
+            )
+        return vectors
+
+    def embed_list(self, objs: list[str], **kwargs: Any) -> list[list[float]]:
+        # Extra API kwargs may change the vectors, so don't cache them
+        if kwargs:
+            return self._embed_batched(objs, **kwargs)
+
+        model_key = self.model_key
+        keys = [text_hash(text) for text in objs]
+        try:
+            cached = self.cache.get_many(model_key, list(dict.fromkeys(keys)))
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache unavailable: {e}")
+            return self._embed_batched(objs)
+
+        missing = {
+            key: text for key, text in zip(keys, objs) if key not in cached
+        }
+        if missing:
+            vectors = self._embed_batched(list(missing.values()))
+            fresh = dict(zip(missing, vectors))
+            try:
+                self.cache.put_many(model_key, fresh)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to store embeddings: {e}")
+            cached.update(fresh)
+        logger.debug(
+            f"Embedded {len(objs)} texts, {len(missing)} cache misses"
+        )
+        return [cached[key] for key in keys]
+
+    def get_output_dim(self) -> int:
+        return self.model.get_output_dim()
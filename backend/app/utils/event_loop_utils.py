@@ -15,7 +15,9 @@
 import asyncio
 import contextvars
 import logging
+from collections.abc import Callable
 from threading import Lock
+from typing import Any
 
 # Thread-safe reference to main event loop using contextvars
 # This ensures each request has its own event loop reference, avoiding race conditions
@@ -42,6 +44,47 @@ def set_main_event_loop(loop: asyncio.AbstractEventLoop | None):
         _GLOBAL_MAIN_LOOP = loop
 
 
+def get_main_event_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the main event loop set by :func:`set_main_event_loop`.
+
+    Prefers the per-request contextvar and falls back to the global
+    reference for worker threads where contextvars don't propagate.
+    """
+    main_loop = _main_event_loop_var.get()
+    if main_loop is None:
+        with _GLOBAL_MAIN_LOOP_LOCK:
+            main_loop = _GLOBAL_MAIN_LOOP
+    return main_loop
+
+
+def call_in_loop(
+    loop: asyncio.AbstractEventLoop | None,
+    callback: Callable[..., Any],
+    *args: Any,
+) -> bool:
+    """Run ``callback(*args)`` on ``loop`` from any thread.
+
+    On the loop's own thread the callback runs immediately; from other
+    threads it is handed over with ``call_soon_threadsafe``, so callers
+    never block and no extra thread or event loop is created.
+
+    Returns:
+        bool: False if ``loop`` is missing or not running (callback skipped)
+    """
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    if loop is not None and running_loop is loop:
+        callback(*args)
+        return True
+    if loop is None or loop.is_closed() or not loop.is_running():
+        return False
+    loop.call_soon_threadsafe(callback, *args)
+    return True
+
+
 def _schedule_async_task(coro):
     """Schedule an async coroutine as a task, thread-safe.
 
@@ -52,18 +95,15 @@ def _schedule_async_task(coro):
         # Try to get the running loop (works in main event loop thread)
         loop = asyncio.get_running_loop()
         loop.create_task(coro)
+        return
     except RuntimeError:
         # No running loop in this thread (we're in a worker thread)
-        # First try contextvars, then fallback to global reference
-        main_loop = _main_event_loop_var.get()
-        if main_loop is None:
-            with _GLOBAL_MAIN_LOOP_LOCK:
-                main_loop = _GLOBAL_MAIN_LOOP
-        if main_loop is not None and main_loop.is_running():
-            asyncio.run_coroutine_threadsafe(coro, main_loop)
-        else:
-            # This should not happen in normal operation - log error and skip
-            logging.error(
-                "No event loop available for async task scheduling, task skipped. "
-                "Ensure set_main_event_loop() is called before parallel agent creation."
-            )
+        loop = get_main_event_loop()
+
+    if loop is None or not call_in_loop(loop, loop.create_task, coro):
+        # This should not happen in normal operation - log error and skip
+        coro.close()
+        logging.error(
+            "No event loop available for async task scheduling, task skipped. "
+            "Ensure set_main_event_loop() is called before parallel agent creation."
+        )
@@ -13,7 +13,11 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 """File system utilities."""
 
-from app.component.environment import env
+import mmap
+import os
+import re
+
+from app.component.environment import ProjectEnv, env
 from app.model.chat import Chat
 
 
@@ -21,7 +25,8 @@ def get_working_directory(options: Chat, task_lock=None) -> str:
     """
     Get the correct working directory for file operations.
     First checks if there's an updated path from improve API call,
-    then falls back to environment variable or default path.
+    then the project's configuration, then falls back to environment
+    variable or default path.
     """
     if not task_lock:
         from app.service.task import get_task_lock_if_exists
@@ -34,5 +39,210 @@ def get_working_directory(options: Chat, task_lock=None) -> str:
         and task_lock.new_folder_path
     ):
         return str(task_lock.new_folder_path)
-    else:
-        return env("file_save_path", options.file_save_path())
+    project_env = getattr(task_lock, "project_env", None)
+    if isinstance(project_env, ProjectEnv) and "file_save_path" in project_env:
+        return project_env.get("file_save_path")
+    return env("file_save_path", options.file_save_path())
+
+
+_SCAN_BLOCK_SIZE = 1024 * 1024
+
+
+def _decode_line(line: bytes) -> str:
+    return line.rstrip(b"\r\n").decode("utf-8", errors="replace")
+
+
+def count_lines(path: str | os.PathLike) -> int:
+    """Count lines by scanning the file in fixed-size blocks."""
+    count = 0
+    last = b""
+    with open(path, "rb") as f:
+        while block := f.read(_SCAN_BLOCK_SIZE):
+            count += block.count(b"\n")
+            last = block
+    if last and not last.endswith(b"\n"):
+        count += 1
+    return count
+
+
+def _clip_line(line: bytes, omitted: int = 0) -> str:
+    text = _decode_line(line)
+    if omitted > 0:
+        text += f" [{omitted} more bytes]"
+    return text
+
+
+def _skip_rest_of_line(f) -> int:
+    """Advance f past the next newline; return the bytes skipped."""
+    skipped = 0
+    while block := f.read(_SCAN_BLOCK_SIZE):
+        newline = block.find(b"\n")
+        if newline != -1:
+            f.seek(newline + 1 - len(block), os.SEEK_CUR)
+            return skipped + newline
+        skipped += len(block)
+    return skipped
+
+
+def read_line_window(
+    path: str | os.PathLike,
+    start_line: int,
+    num_lines: int,
+    max_line_bytes: int | None = None,
+    max_bytes: int | None = None,
+) -> list[str]:
+    """Return up to num_lines lines starting at the 1-based start_line.
+
+    Lines before the window are streamed past, never held in memory.
+    Each line is cut to max_line_bytes and the window to max_bytes in
+    total; cut lines end with a "[N more bytes]" marker.
+    """
+    lines: list[str] = []
+    budget = max_bytes
+    line_no = 0
+    with open(path, "rb") as f:
+        while len(lines) < num_lines:
+            if line_no + 1 < start_line:
+                # Skipped lines are read in bounded pieces too
+                limit = _SCAN_BLOCK_SIZE
+            else:
+                limit = max_line_bytes or -1
+                if budget is not None:
+                    limit = budget if limit < 0 else min(limit, budget)
+            line = f.readline(limit)
+            if not line:
+                break
+            omitted = 0
+            if not line.endswith(b"\n") and len(line) == limit:
+                omitted = _skip_rest_of_line(f)
+            line_no += 1
+            if line_no < start_line:
+                continue
+            lines.append(_clip_line(line, omitted))
+            if budget is not None:
+                budget -= len(line)
+                if budget <= 0:
+                    break
+    return lines
+
+
+def _line_start_before(f, pos: int) -> int:
+    """Return the offset where the line containing pos - 1 starts."""
+    while pos > 0:
+        step = min(_SCAN_BLOCK_SIZE, pos)
+        f.seek(pos - step)
+        newline = f.read(step).rfind(b"\n")
+        if newline != -1:
+            return pos - step + newline + 1
+        pos -= step
+    return 0
+
+
+def read_tail_lines(
+    path: str | os.PathLike,
+    num_lines: int,
+    max_line_bytes: int | None = None,
+    max_bytes: int | None = None,
+) -> list[str]:
+    """Return the last num_lines lines, reading backwards from the end.
+
+    At most max_bytes are read back from the end. A line longer than
+    max_line_bytes, or starting before that point, keeps only its end,
+    prefixed with an "[N earlier bytes]" marker.
+    """
+    if num_lines <= 0:
+        return []
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b""
+        # One extra newline: the file usually ends with one
+        while pos > 0 and data.count(b"\n") <= num_lines:
+            step = min(_SCAN_BLOCK_SIZE, pos)
+            if max_bytes is not None:
+                step = min(step, max_bytes - len(data))
+                if step <= 0:
+                    break
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+        all_lines = data.splitlines()
+        lines = all_lines[-num_lines:]
+        # Reading stopped mid-line: the first line started earlier
+        first_earlier = 0
+        if lines and len(lines) == len(all_lines) and pos > 0:
+            first_earlier = pos - _line_start_before(f, pos)
+
+    result = []
+    for i, line in enumerate(lines):
+        earlier = first_earlier if i == 0 else 0
+        if max_line_bytes is not None and len(line) > max_line_bytes:
+            earlier += len(line) - max_line_bytes
+            line = line[-max_line_bytes:]
+        text = _decode_line(line)
+        if earlier:
+            text = f"[{earlier} earlier bytes] {text}"
+        result.append(text)
+    return result
+
+
+def read_byte_window(
+    path: str | os.PathLike, offset: int, num_bytes: int
+) -> str:
+    """Return num_bytes bytes from offset, decoded leniently as UTF-8."""
+    with open(path, "rb") as f:
+        f.seek(max(0, offset))
+        return f.read(max(0, num_bytes)).decode("utf-8", errors="replace")
+
+
+def _count_newlines(mm: mmap.mmap, start: int, end: int) -> int:
+    """Count newlines in mm[start:end] without copying the whole span."""
+    count = 0
+    for pos in range(start, end, _SCAN_BLOCK_SIZE):
+        count += mm[pos : min(pos + _SCAN_BLOCK_SIZE, end)].count(b"\n")
+    return count
+
+
+def grep_lines(
+    path: str | os.PathLike,
+    pattern: str,
+    max_matches: int,
+    ignore_case: bool = False,
+) -> list[tuple[int, str]]:
+    """Return (line number, line) for lines matching a regular expression.
+
+    The file is memory-mapped and scanned in place, so only matching lines
+    are decoded.
+
+    Raises:
+        re.error: If pattern is not a valid regular expression.
+    """
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    regex = re.compile(pattern.encode("utf-8"), flags)
+    matches: list[tuple[int, str]] = []
+    if os.path.getsize(path) == 0 or max_matches <= 0:
+        return matches
+
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        line_no = 1
+        counted_to = 0
+        pos = 0
+        while len(matches) < max_matches:
+            match = regex.search(mm, pos)
+            if match is None:
+                break
+            line_start = mm.rfind(b"\n", 0, match.start()) + 1
+            line_end = mm.find(b"\n", match.start())
+            if line_end == -1:
+                line_end = len(mm)
+            line_no += _count_newlines(mm, counted_to, line_start)
+            counted_to = line_start
+            matches.append((line_no, _decode_line(mm[line_start:line_end])))
+            # Report each line once even if it matches several times
+            pos = line_end + 1
+            if pos > len(mm):
+                break
+    return matches
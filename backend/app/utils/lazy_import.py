@@ -0,0 +1,75 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""Deferred imports for modules that are expensive to load.
+
+Controllers only need agents, toolkits and CAMEL models once a request
+arrives, but importing them eagerly makes backend startup pay for all of
+them. ``lazy_import`` returns a stand-in that imports the real object on
+first use.
+"""
+
+import importlib
+import threading
+from typing import Any
+
+
+class LazyImport:
+    """Stand-in for ``module.name`` that imports it on first use.
+
+    Calls and attribute access are forwarded, so the proxy can replace a
+    function or a class used through its constructor and classmethods.
+    It is a module attribute like the import it replaces, so tests can
+    still patch it by name.
+    """
+
+    __slots__ = ("_module", "_name", "_target", "_lock")
+
+    def __init__(self, module: str, name: str) -> None:
+        object.__setattr__(self, "_module", module)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def resolve(self) -> Any:
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    module = importlib.import_module(self._module)
+                    target = getattr(module, self._name)
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.resolve(), attr, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy {self._module}.{self._name} ({state})>"
+
+
+def lazy_import(module: str, name: str) -> Any:
+    """Return a :class:`LazyImport` for ``from module import name``."""
+    return LazyImport(module, name)
@@ -15,9 +15,7 @@
 import asyncio
 import json
 import logging
-import queue
-import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from functools import wraps
 from inspect import iscoroutinefunction, signature
@@ -29,6 +27,7 @@ from app.service.task import (
     get_task_lock,
     process_task,
 )
+from app.utils.log_utils import log_sampled
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
 logger = logging.getLogger("toolkit_listen")
@@ -46,6 +45,112 @@ def _truncate(text: str, max_length: int = MAX_LENGTH) -> str:
     return text
 
 
+def _bounded_join(chunks: Iterable[str], max_length: int = MAX_LENGTH) -> str:
+    """Join chunks, stopping once the preview exceeds max_length.
+
+    Unlike ``_truncate`` the remaining chunks are never produced, so the
+    total length is unknown and is not reported.
+    """
+    parts: list[str] = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size > max_length:
+            text = "".join(parts)
+            return f"{text[:max_length]}... (truncated)"
+    return "".join(parts)
+
+
+def _iter_repr(value: Any, max_length: int = MAX_LENGTH) -> Iterator[str]:
+    """Yield repr(value) piecewise, clipping long strings and containers.
+
+    Only builtin containers are walked; anything else falls back to its own
+    ``repr``.
+    """
+    value_type = type(value)
+    if value_type in (str, bytes, bytearray):
+        yield repr(value[: max_length + 1])
+    elif value_type in (list, tuple):
+        yield "[" if value_type is list else "("
+        for i, item in enumerate(value):
+            if i:
+                yield ", "
+            yield from _iter_repr(item, max_length)
+        if value_type is tuple and len(value) == 1:
+            yield ","
+        yield "]" if value_type is list else ")"
+    elif value_type is dict:
+        yield "{"
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                yield ", "
+            yield from _iter_repr(key, max_length)
+            yield ": "
+            yield from _iter_repr(item, max_length)
+        yield "}"
+    else:
+        yield repr(value)
+
+
+def _iter_json(value: Any, max_length: int = MAX_LENGTH) -> Iterator[str]:
+    """Yield json.dumps(value, ensure_ascii=False) piecewise.
+
+    Raises:
+        TypeError: If a value is not JSON serializable.
+    """
+    if isinstance(value, str):
+        yield json.dumps(value[: max_length + 1], ensure_ascii=False)
+    elif value is None or isinstance(value, (bool, int, float)):
+        yield json.dumps(value)
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for i, item in enumerate(value):
+            if i:
+                yield ", "
+            yield from _iter_json(item, max_length)
+        yield "]"
+    elif isinstance(value, dict):
+        yield "{"
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                yield ", "
+            if not isinstance(key, str):
+                if key is not None and not isinstance(key, (bool, int, float)):
+                    raise TypeError(
+                        f"keys must be str, int, float, bool or None, "
+                        f"not {key.__class__.__name__}"
+                    )
+                key = json.dumps(key)
+            yield json.dumps(key[: max_length + 1], ensure_ascii=False)
+            yield ": "
+            yield from _iter_json(item, max_length)
+        yield "}"
+    else:
+        raise TypeError(
+            f"Object of type {value.__class__.__name__} "
+            f"is not JSON serializable"
+        )
+
+
+def _iter_args(
+    args: tuple, kwargs: dict, max_length: int = MAX_LENGTH
+) -> Iterator[str]:
+    """Yield the call arguments (excluding self) as ``a, b, k=v``."""
+    first = True
+    for arg in args[1:]:
+        if not first:
+            yield ", "
+        first = False
+        yield from _iter_repr(arg, max_length)
+    for key, value in kwargs.items():
+        if not first:
+            yield ", "
+        first = False
+        yield f"{key}="
+        yield from _iter_repr(value, max_length)
+
+
 def _format_args(
     args: tuple,
     kwargs: dict,
@@ -55,15 +160,8 @@ def _format_args(
     if inputs_formatter is not None:
         return _truncate(inputs_formatter(*args, **kwargs))
 
-    # Remove first param (self)
-    filtered_args = args[1:] if len(args) > 0 else []
-    args_str = ", ".join(repr(arg) for arg in filtered_args)
-
-    if kwargs:
-        kwargs_str = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
-        args_str = f"{args_str}, {kwargs_str}" if args_str else kwargs_str
-
-    return _truncate(args_str)
+    # Remove first param (self) and stop once the preview is full
+    return _bounded_join(_iter_args(args, kwargs))
 
 
 def _format_result(
@@ -82,11 +180,20 @@ def _format_result(
         return _truncate(res)
 
     try:
-        return _truncate(json.dumps(res, ensure_ascii=False))
+        return _bounded_join(_iter_json(res))
     except TypeError:
         return _truncate(str(res))
 
 
+def _should_emit(task_lock, skip: bool) -> bool:
+    """Whether activate/deactivate events are worth building at all.
+
+    Without an attached SSE consumer nobody reads the queue, so the
+    argument/result previews are not formatted either.
+    """
+    return not skip and task_lock.has_consumer
+
+
 def _get_context(
     toolkit: "AbstractToolkit",
     func_name: str,
@@ -106,10 +213,14 @@ def _get_context(
     if not process_task_id:
         process_task_id = getattr(toolkit, "api_task_id", "")
         if not process_task_id:
-            logger.warning(
-                f"[toolkit_listen] Both ContextVar process_task "
-                f"and toolkit.api_task_id are empty for "
-                f"{toolkit_name}.{method_name}"
+            log_sampled(
+                logger,
+                logging.WARNING,
+                f"empty_process_task:{toolkit_name}",
+                "[toolkit_listen] Both ContextVar process_task and "
+                "toolkit.api_task_id are empty for %s.%s",
+                toolkit_name,
+                method_name,
             )
 
     return toolkit_name, method_name, process_task_id, skip_workflow_display
@@ -161,76 +272,35 @@ def _log_deactivate(
     error: Exception | None,
 ) -> None:
     """Log toolkit deactivation."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     status = "ERROR" if error is not None else "SUCCESS"
-    timestamp = datetime.now().isoformat()
     logger.info(
-        f"[TOOLKIT DEACTIVATE] Toolkit: {toolkit_name} | "
-        f"Method: {method_name} | Task ID: {process_task_id} | "
-        f"Agent: {agent_name} | Status: {status} | "
-        f"Timestamp: {timestamp}"
+        "[TOOLKIT DEACTIVATE] Toolkit: %s | Method: %s | Task ID: %s | "
+        "Agent: %s | Status: %s | Timestamp: %s",
+        toolkit_name,
+        method_name,
+        process_task_id,
+        agent_name,
+        status,
+        datetime.now().isoformat(),
     )
 
 
 def _safe_put_queue(task_lock, data):
-    """Safely put data to the queue, handling both sync and async contexts"""
-    try:
-        # Try to get current event loop
-        asyncio.get_running_loop()
-
-        # We're in an async context, create a task
-        task = asyncio.create_task(task_lock.put_queue(data))
-
-        if hasattr(task_lock, "add_background_task"):
-            task_lock.add_background_task(task)
-
-        # Add done callback to handle any exceptions
-        def handle_task_result(t):
-            try:
-                t.result()
-            except Exception as e:
-                logger.error(f"[SAFE_PUT_QUEUE] Background task failed: {e}")
-
-        task.add_done_callback(handle_task_result)
-
-    except RuntimeError:
-        # No running event loop, run in a separate thread
-        try:
-            result_queue = queue.Queue()
-
-            def run_in_thread():
-                try:
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        new_loop.run_until_complete(task_lock.put_queue(data))
-                        result_queue.put(("success", None))
-                    except Exception as e:
-                        logger.error(f"[SAFE_PUT_QUEUE] put_queue failed: {e}")
-                        result_queue.put(("error", e))
-                    finally:
-                        new_loop.close()
-                except Exception as e:
-                    logger.error(f"[SAFE_PUT_QUEUE] Thread failed: {e}")
-                    result_queue.put(("error", e))
-
-            thread = threading.Thread(target=run_in_thread, daemon=False)
-            thread.start()
-
-            # Wait briefly for completion
-            try:
-                status, error = result_queue.get(timeout=1.0)
-                if status == "error":
-                    logger.error(
-                        f"[SAFE_PUT_QUEUE] Thread execution failed: {error}"
-                    )
-            except queue.Empty:
-                logger.warning(
-                    f"[SAFE_PUT_QUEUE] Thread timeout after 1s "
-                    f"for {data.__class__.__name__}"
-                )
+    """Safely put data to the queue from sync or async contexts.
 
-        except Exception as e:
-            logger.error(f"[SAFE_PUT_QUEUE] Failed to send data to queue: {e}")
+    Never blocks the caller: off-loop callers hand the item to the
+    TaskLock's event loop instead of spinning up a thread and loop.
+    """
+    try:
+        if not task_lock.put_queue_threadsafe(data):
+            logger.warning(
+                f"[SAFE_PUT_QUEUE] No running event loop for task queue, "
+                f"dropped {data.__class__.__name__}"
+            )
+    except Exception as e:
+        logger.error(f"[SAFE_PUT_QUEUE] Failed to send data to queue: {e}")
 
 
 def listen_toolkit(
@@ -248,7 +318,11 @@ def listen_toolkit(
     UI.
 
     Works with both sync and async methods. For sync methods called outside an
-    async context, events are sent via a background thread.
+    async context, events are handed to the task's event loop.
+
+    Events are only built while an SSE consumer is attached to the task
+    lock, and argument/result previews stop serializing once MAX_LENGTH
+    characters have been produced.
 
     Args:
         wrap_method (callable, optional): Method to use for preserving
@@ -291,17 +365,17 @@ def listen_toolkit(
                     return await func(*args, **kwargs)
 
                 task_lock = get_task_lock(toolkit.api_task_id)
-                args_str = _format_args(args, kwargs, inputs)
                 ctx = _get_context(toolkit, func.__name__)
                 toolkit_name, method_name, process_task_id, skip = ctx
+                emit = _should_emit(task_lock, skip)
 
-                if not skip:
+                if emit:
                     activate_data = _create_activate_data(
                         toolkit,
                         toolkit_name,
                         method_name,
                         process_task_id,
-                        args_str,
+                        _format_args(args, kwargs, inputs),
                     )
                     await task_lock.put_queue(activate_data)
 
@@ -312,7 +386,6 @@ def listen_toolkit(
                 except Exception as e:
                     error = e
 
-                res_msg = _format_result(res, error, return_msg)
                 _log_deactivate(
                     toolkit_name,
                     method_name,
@@ -321,13 +394,13 @@ def listen_toolkit(
                     error,
                 )
 
-                if not skip:
+                if emit:
                     deactivate_data = _create_deactivate_data(
                         toolkit,
                         toolkit_name,
                         method_name,
                         process_task_id,
-                        res_msg,
+                        _format_result(res, error, return_msg),
                     )
                     await task_lock.put_queue(deactivate_data)
 
@@ -351,17 +424,17 @@ def listen_toolkit(
                     return func(*args, **kwargs)
 
                 task_lock = get_task_lock(toolkit.api_task_id)
-                args_str = _format_args(args, kwargs, inputs)
                 ctx = _get_context(toolkit, func.__name__)
                 toolkit_name, method_name, process_task_id, skip = ctx
+                emit = _should_emit(task_lock, skip)
 
-                if not skip:
+                if emit:
                     activate_data = _create_activate_data(
                         toolkit,
                         toolkit_name,
                         method_name,
                         process_task_id,
-                        args_str,
+                        _format_args(args, kwargs, inputs),
                     )
                     _safe_put_queue(task_lock, activate_data)
 
@@ -384,7 +457,6 @@ def listen_toolkit(
                 except Exception as e:
                     error = e
 
-                res_msg = _format_result(res, error, return_msg)
                 _log_deactivate(
                     toolkit_name,
                     method_name,
@@ -393,13 +465,13 @@ def listen_toolkit(
                     error,
                 )
 
-                if not skip:
+                if emit:
                     deactivate_data = _create_deactivate_data(
                         toolkit,
                         toolkit_name,
                         method_name,
                         process_task_id,
-                        res_msg,
+                        _format_result(res, error, return_msg),
                     )
                     _safe_put_queue(task_lock, deactivate_data)
 
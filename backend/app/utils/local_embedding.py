@@ -0,0 +1,97 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Embedding models that run on the local CPU without an API key."""
+
+import logging
+import re
+import zlib
+from typing import Any
+
+import numpy as np
+from camel.embeddings import BaseEmbedding, SentenceTransformerEncoder
+
+logger = logging.getLogger("local_embedding")
+
+DEFAULT_LOCAL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_HASHING_DIM = 512
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class SentenceTransformerEmbedding(SentenceTransformerEncoder):
+    """SentenceTransformer encoder pinned to the CPU.
+
+    Requires the optional ``sentence-transformers`` package.
+    """
+
+    def __init__(
+        self, model_name: str = DEFAULT_LOCAL_MODEL, **kwargs: Any
+    ) -> None:
+        kwargs.setdefault("device", "cpu")
+        super().__init__(model_name=model_name, **kwargs)
+        # Lets CachedEmbedding key vectors by model
+        self.model_name = model_name
+
+
+class HashingEmbedding(BaseEmbedding[str]):
+    """Dependency-free embedding from hashed word unigrams and bigrams.
+
+    Much weaker than a neural model, but deterministic, offline and fast;
+    useful for keyword-heavy corpora or when no model can be loaded.
+    Vectors are L2-normalized.
+    """
+
+    def __init__(self, dim: int = DEFAULT_HASHING_DIM) -> None:
+        self.dim = dim
+        self.model_name = f"hashing-v1-{dim}"
+
+    def _embed_one(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            h = zlib.crc32(feature.encode("utf-8"))
+            # Low bits pick the bucket, one high bit picks the sign
+            vector[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        # Dampen repeated features
+        vector = np.sign(vector) * np.log1p(np.abs(vector))
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def embed_list(self, objs: list[str], **kwargs: Any) -> list[list[float]]:
+        return [self._embed_one(text).tolist() for text in objs]
+
+    def get_output_dim(self) -> int:
+        return self.dim
+
+
+def create_local_embedding(
+    model_name: str = DEFAULT_LOCAL_MODEL,
+) -> BaseEmbedding:
+    """Return a CPU embedding model, preferring SentenceTransformers.
+
+    Falls back to HashingEmbedding when ``sentence-transformers`` is not
+    installed or the model cannot be loaded (e.g. offline, not cached).
+    """
+    try:
+        return SentenceTransformerEmbedding(model_name)
+    except (ImportError, OSError) as e:
+        logger.warning(
+            f"Local model {model_name} unavailable ({e}), "
+            f"falling back to HashingEmbedding"
+        )
+        return HashingEmbedding()
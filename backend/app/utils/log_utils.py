@@ -0,0 +1,143 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Helpers for logging on hot paths.
+
+- ``Truncated`` / ``LazyJson`` wrap a payload so it is only rendered (and
+  cut to a maximum length) if the record is actually emitted; pass them
+  as ``%s`` arguments instead of building an f-string up front.
+- ``log_sampled`` rate-limits high-frequency events per logger and key,
+  reporting how many records were suppressed in between.
+
+Callers that attach ``extra`` dicts should guard them with
+``logger.isEnabledFor`` so the dict is not built for dropped levels.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+DEFAULT_MAX_CHARS = 500
+DEFAULT_MAX_SAMPLED_KEYS = 1024
+
+
+def truncate(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> str:
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... [{len(text) - max_chars} more chars]"
+
+
+class Truncated:
+    """Render ``str(value)`` cut to ``max_chars`` when formatted."""
+
+    __slots__ = ("value", "max_chars")
+
+    def __init__(self, value: Any, max_chars: int = DEFAULT_MAX_CHARS):
+        self.value = value
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        return truncate(str(self.value), self.max_chars)
+
+    __repr__ = __str__
+
+
+class LazyJson(Truncated):
+    """Render ``value`` as JSON, cut to ``max_chars``, when formatted."""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        try:
+            text = json.dumps(self.value, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            text = str(self.value)
+        return truncate(text, self.max_chars)
+
+    __repr__ = __str__
+
+
+class LogSampler:
+    """Allow at most one record per key every ``interval`` seconds.
+
+    At most ``max_keys`` keys are tracked; the least recently seen key is
+    forgotten first, losing only its suppressed count.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        max_keys: int = DEFAULT_MAX_SAMPLED_KEYS,
+    ) -> None:
+        self.interval = interval
+        self.max_keys = max_keys
+        # key -> (last emitted at, records suppressed since), LRU order
+        self._state: OrderedDict[tuple[str, str], tuple[float, int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def allow(self, logger_name: str, key: str) -> tuple[bool, int]:
+        """Return whether to emit, and how many records were dropped."""
+        now = time.monotonic()
+        state_key = (logger_name, key)
+        with self._lock:
+            last, suppressed = self._state.pop(state_key, (None, 0))
+            allowed = last is None or now - last >= self.interval
+            if allowed:
+                self._state[state_key] = (now, 0)
+            else:
+                self._state[state_key] = (last, suppressed + 1)
+            while len(self._state) > self.max_keys:
+                self._state.popitem(last=False)
+            return (True, suppressed) if allowed else (False, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state.clear()
+
+
+_sampler = LogSampler()
+
+
+def get_log_sampler() -> LogSampler:
+    return _sampler
+
+
+def log_sampled(
+    logger: logging.Logger,
+    level: int,
+    key: str,
+    msg: str,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """Log ``msg % args`` at most once per sampler interval per key.
+
+    The level check runs first, so nothing is sampled or formatted for
+    disabled levels. The next emitted record notes how many were
+    suppressed.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    allowed, suppressed = _sampler.allow(logger.name, key)
+    if not allowed:
+        return
+    if suppressed:
+        msg = f"{msg} (%d similar suppressed)"
+        args = (*args, suppressed)
+    logger.log(level, msg, *args, stacklevel=2, **kwargs)
@@ -0,0 +1,366 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""In-process vector storage backed by memory-mapped NumPy arrays."""
+
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from camel.storages.vectordb_storages import (
+    BaseVectorStorage,
+    VectorDBQuery,
+    VectorDBQueryResult,
+    VectorDBStatus,
+    VectorRecord,
+)
+
+logger = logging.getLogger("numpy_vector_storage")
+
+# Rows scored per block, bounds the temporary score matrix
+QUERY_BLOCK_ROWS = 65536
+
+_META_FILE = "meta.json"
+_VECTORS_FILE = "vectors.bin"
+_SCALES_FILE = "scales.bin"
+_RECORDS_FILE = "records.jsonl"
+
+
+def _matches(
+    payload: dict[str, Any] | None, conditions: dict[str, Any]
+) -> bool:
+    for key, expected in conditions.items():
+        value: Any = payload
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return False
+            value = value[part]
+        if value != expected:
+            return False
+    return True
+
+
+class NumpyVectorStorage(BaseVectorStorage):
+    """Cosine-similarity vector storage kept in a local directory.
+
+    Vectors are L2-normalized on insert and appended to a row-major matrix
+    file that is memory-mapped for queries, so resident memory stays close
+    to the OS page cache. With ``quantize="int8"`` each row is stored as
+    int8 with a float32 scale, cutting the matrix to a quarter of its size.
+
+    Deletes rewrite the collection and are meant to be rare.
+
+    Args:
+        vector_dim (int): Dimension of stored vectors.
+        path (str): Directory that holds all collections.
+        collection_name (str): Name of this collection's subdirectory.
+        quantize (str | None): ``"int8"`` to quantize stored vectors.
+    """
+
+    def __init__(
+        self,
+        vector_dim: int,
+        path: str,
+        collection_name: str = "default",
+        quantize: str | None = None,
+    ) -> None:
+        if quantize not in (None, "int8"):
+            raise ValueError(f"Unsupported quantization: {quantize}")
+        self.vector_dim = vector_dim
+        self.collection_name = collection_name
+        self.directory = Path(path) / collection_name
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._ids: list[str] = []
+        self._payloads: list[dict[str, Any] | None] = []
+        self._matrix: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+
+        meta = self._read_meta()
+        if meta is not None:
+            if meta["vector_dim"] != vector_dim:
+                raise ValueError(
+                    f"Collection {collection_name} has dimension "
+                    f"{meta['vector_dim']}, expected {vector_dim}"
+                )
+            self.quantize = meta["quantize"]
+            self._load(meta["count"])
+        else:
+            self.quantize = quantize
+            self._write_meta()
+
+    @property
+    def _dtype(self) -> type:
+        return np.int8 if self.quantize == "int8" else np.float32
+
+    def _read_meta(self) -> dict[str, Any] | None:
+        try:
+            with open(self.directory / _META_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self) -> None:
+        meta = {
+            "vector_dim": self.vector_dim,
+            "count": len(self._ids),
+            "quantize": self.quantize,
+        }
+        tmp = self.directory / f"{_META_FILE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, self.directory / _META_FILE)
+
+    def _load(self, count: int) -> None:
+        # meta.json is written last, so data past its count is left over
+        # from an interrupted add and is dropped
+        records = self.directory / _RECORDS_FILE
+        extra = False
+        if records.exists():
+            with open(records, encoding="utf-8") as f:
+                for line, _ in zip(f, range(count)):
+                    record = json.loads(line)
+                    self._ids.append(record["id"])
+                    self._payloads.append(record["payload"])
+                extra = f.readline() != ""
+        if extra:
+            self._write_records(self._ids, self._payloads)
+
+        itemsize = np.dtype(self._dtype).itemsize
+        sizes = {_VECTORS_FILE: count * self.vector_dim * itemsize}
+        if self.quantize == "int8":
+            sizes[_SCALES_FILE] = count * 4
+        for name, size in sizes.items():
+            path = self.directory / name
+            if path.exists() and path.stat().st_size > size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+        self._map(count)
+
+    def _write_records(
+        self, ids: list[str], payloads: list[dict[str, Any] | None]
+    ) -> None:
+        with open(self.directory / _RECORDS_FILE, "w", encoding="utf-8") as f:
+            for id_, payload in zip(ids, payloads):
+                f.write(json.dumps({"id": id_, "payload": payload}) + "\n")
+
+    def _map(self, count: int) -> None:
+        if count == 0:
+            self._matrix = self._scales = None
+            return
+        self._matrix = np.memmap(
+            self.directory / _VECTORS_FILE,
+            dtype=self._dtype,
+            mode="r",
+            shape=(count, self.vector_dim),
+        )
+        if self.quantize == "int8":
+            self._scales = np.memmap(
+                self.directory / _SCALES_FILE,
+                dtype=np.float32,
+                mode="r",
+                shape=(count,),
+            )
+
+    def _encode(
+        self, vectors: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+        if self.quantize != "int8":
+            return vectors.astype(np.float32), None
+        scales = np.abs(vectors).max(axis=1) / 127
+        scales[scales == 0] = 1
+        rows = np.rint(vectors / scales[:, None]).astype(np.int8)
+        return rows, scales.astype(np.float32)
+
+    @staticmethod
+    def _decode(
+        matrix: np.ndarray, scales: np.ndarray | None, index: int
+    ) -> list[float]:
+        row = np.asarray(matrix[index], dtype=np.float32)
+        if scales is not None:
+            row = row * scales[index]
+        return row.tolist()
+
+    def add(self, records: list[VectorRecord], **kwargs: Any) -> None:
+        if not records:
+            return
+        vectors = np.asarray([r.vector for r in records], dtype=np.float32)
+        if vectors.shape[1] != self.vector_dim:
+            raise ValueError(
+                f"Expected vectors of dimension {self.vector_dim}, "
+                f"got {vectors.shape[1]}"
+            )
+        rows, scales = self._encode(vectors)
+        with self._lock:
+            with open(self.directory / _VECTORS_FILE, "ab") as f:
+                f.write(rows.tobytes())
+            if scales is not None:
+                with open(self.directory / _SCALES_FILE, "ab") as f:
+                    f.write(scales.tobytes())
+            with open(
+                self.directory / _RECORDS_FILE, "a", encoding="utf-8"
+            ) as f:
+                for record in records:
+                    f.write(
+                        json.dumps(
+                            {"id": record.id, "payload": record.payload}
+                        )
+                        + "\n"
+                    )
+            self._ids.extend(r.id for r in records)
+            self._payloads.extend(r.payload for r in records)
+            self._write_meta()
+            self._map(len(self._ids))
+
+    def delete(self, ids: list[str], **kwargs: Any) -> None:
+        drop = set(ids)
+        with self._lock:
+            keep = [i for i, id_ in enumerate(self._ids) if id_ not in drop]
+            if len(keep) != len(self._ids):
+                self._rewrite(keep)
+
+    def _rewrite(self, keep: list[int]) -> None:
+        ids = [self._ids[i] for i in keep]
+        payloads = [self._payloads[i] for i in keep]
+        rows = np.empty((0, self.vector_dim), dtype=self._dtype)
+        scales = np.empty(0, dtype=np.float32)
+        if self._matrix is not None and keep:
+            rows = np.array(self._matrix[keep])
+            if self._scales is not None:
+                scales = np.array(self._scales[keep])
+        # Unmap before rewriting the files
+        self._matrix = self._scales = None
+        (self.directory / _VECTORS_FILE).write_bytes(rows.tobytes())
+        if self.quantize == "int8":
+            (self.directory / _SCALES_FILE).write_bytes(scales.tobytes())
+        self._write_records(ids, payloads)
+        self._ids, self._payloads = ids, payloads
+        self._write_meta()
+        self._map(len(ids))
+
+    def status(self) -> VectorDBStatus:
+        return VectorDBStatus(
+            vector_dim=self.vector_dim, vector_count=len(self._ids)
+        )
+
+    def query_batch(
+        self,
+        vectors: list[list[float]],
+        top_k: int,
+        filter_conditions: dict[str, Any] | None = None,
+    ) -> list[list[VectorDBQueryResult]]:
+        """Return the top_k most cosine-similar records for each vector.
+
+        All query vectors are scored together, one block of stored rows at
+        a time. filter_conditions maps payload keys (dotted for nested
+        keys, as in Qdrant) to required values; only matching rows are
+        scored.
+        """
+        with self._lock:
+            matrix, scales = self._matrix, self._scales
+            ids, payloads = self._ids, self._payloads
+        if matrix is None or top_k <= 0 or not vectors:
+            return [[] for _ in vectors]
+        candidates = None
+        if filter_conditions:
+            candidates = np.fromiter(
+                (
+                    i
+                    for i, payload in enumerate(payloads[: matrix.shape[0]])
+                    if _matches(payload, filter_conditions)
+                ),
+                dtype=np.int64,
+            )
+            if candidates.size == 0:
+                return [[] for _ in vectors]
+
+        queries = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries /= np.where(norms == 0, 1, norms)
+
+        count = matrix.shape[0] if candidates is None else candidates.size
+        k = min(top_k, count)
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        for start in range(0, count, QUERY_BLOCK_ROWS):
+            if candidates is None:
+                index = np.arange(start, min(start + QUERY_BLOCK_ROWS, count))
+                block = matrix[start : start + QUERY_BLOCK_ROWS]
+            else:
+                index = candidates[start : start + QUERY_BLOCK_ROWS]
+                block = matrix[index]
+            scores = queries @ np.asarray(block, dtype=np.float32).T
+            if scales is not None:
+                scores *= scales[index]
+            scores = np.concatenate([best_scores, scores], axis=1)
+            rows = np.concatenate(
+                [
+                    best_rows,
+                    np.broadcast_to(index, (len(queries), index.size)),
+                ],
+                axis=1,
+            )
+            if scores.shape[1] > k:
+                part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, part, axis=1)
+                rows = np.take_along_axis(rows, part, axis=1)
+            best_scores, best_rows = scores, rows
+
+        order = np.argsort(-best_scores, axis=1)
+        results = []
+        for q_scores, q_rows, q_order in zip(best_scores, best_rows, order):
+            results.append(
+                [
+                    VectorDBQueryResult.create(
+                        similarity=float(q_scores[j]),
+                        vector=self._decode(matrix, scales, int(q_rows[j])),
+                        id=ids[q_rows[j]],
+                        payload=payloads[q_rows[j]],
+                    )
+                    for j in q_order
+                ]
+            )
+        return results
+
+    def query(
+        self, query: VectorDBQuery, **kwargs: Any
+    ) -> list[VectorDBQueryResult]:
+        return self.query_batch(
+            [query.query_vector],
+            query.top_k,
+            filter_conditions=kwargs.get("filter_conditions"),
+        )[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matrix = self._scales = None
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._ids, self._payloads = [], []
+            self._write_meta()
+
+    def load(self) -> None:
+        # Local storage is always loaded
+        pass
+
+    @property
+    def client(self) -> "NumpyVectorStorage":
+        return self
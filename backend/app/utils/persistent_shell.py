@@ -0,0 +1,331 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Long-lived bash sessions with sentinel-based command completion."""
+
+import codecs
+import logging
+import os
+import select
+import shlex
+import signal
+import subprocess
+import threading
+import time
+import uuid
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+logger = logging.getLogger("persistent_shell")
+
+# Output kept per shell for offset-based reads
+DEFAULT_MAX_BUFFER_BYTES = 1024 * 1024
+_READ_SIZE = 65536
+
+
+@dataclass
+class ShellResult:
+    output: str
+    # None while the command is still running
+    exit_code: int | None
+    # Absolute output offset after this result
+    offset: int
+
+
+class PersistentShell:
+    """A bash process that runs commands one after another.
+
+    Shell state (working directory, exported variables, an activated
+    venv) carries over between commands, and no process is spawned per
+    command. Each command is run through ``eval`` with stdin from
+    /dev/null, or from a dedicated input pipe fed by ``write``; its
+    completion, exit code and resulting working directory are reported on
+    a separate control pipe, so output is never scanned for markers.
+
+    Output (stdout and stderr merged) is kept in a bounded buffer indexed
+    by absolute byte offsets, so callers can poll incrementally with
+    ``read(offset)``.
+
+    POSIX only.
+
+    Args:
+        cwd (str): Initial working directory.
+        env (Mapping[str, str] | None): Environment for the shell.
+        init_script (str | None): Commands run once at startup, e.g.
+            sourcing a venv's activate script.
+        on_output (Callable[[str], None] | None): Called from the reader
+            thread with each decoded output chunk.
+        max_buffer_bytes (int): Output kept for ``read``.
+        command_input (bool): Connect commands' stdin to a pipe written
+            with ``write`` instead of /dev/null. Bash reads its own
+            commands from another pipe, so input never runs as a command.
+    """
+
+    def __init__(
+        self,
+        cwd: str,
+        env: Mapping[str, str] | None = None,
+        init_script: str | None = None,
+        on_output: Callable[[str], None] | None = None,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+        command_input: bool = False,
+    ) -> None:
+        self.cwd = cwd
+        self.max_buffer_bytes = max_buffer_bytes
+        self._on_output = on_output
+        self._cond = threading.Condition()
+        self._buffer = bytearray()
+        # Absolute offset of _buffer[0]
+        self._base = 0
+        self._token: str | None = None
+        self.last_exit_code: int | None = None
+        self._closed = False
+
+        control_read, control_write = os.pipe()
+        self._control_fd = control_write
+        pass_fds = [control_write]
+        # Commands read the input pipe under the fd number bash inherits
+        self._input_fd: int | None = None
+        self._input_write: int | None = None
+        if command_input:
+            self._input_fd, self._input_write = os.pipe()
+            # A command that stops reading must not block the writer
+            os.set_blocking(self._input_write, False)
+            pass_fds.append(self._input_fd)
+        try:
+            self._process = subprocess.Popen(
+                ["bash", "--noprofile", "--norc"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                cwd=cwd,
+                env=dict(env) if env is not None else None,
+                pass_fds=pass_fds,
+                start_new_session=True,
+            )
+        finally:
+            os.close(control_write)
+            if self._input_fd is not None:
+                os.close(self._input_fd)
+        self._control_read = control_read
+        os.set_blocking(self._process.stdout.fileno(), False)
+        self._reader = threading.Thread(
+            target=self._read_loop, name="persistent-shell", daemon=True
+        )
+        self._reader.start()
+        if init_script:
+            # Queued ahead of the first command; bash runs it first
+            self._process.stdin.write(f"{init_script}\n".encode())
+            self._process.stdin.flush()
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed and self._process.poll() is None
+
+    @property
+    def busy(self) -> bool:
+        with self._cond:
+            return self._token is not None and self.alive
+
+    @property
+    def offset(self) -> int:
+        """Absolute offset of the end of the output so far."""
+        with self._cond:
+            return self._base + len(self._buffer)
+
+    def start(self, command: str) -> int:
+        """Start command without waiting; return its output start offset.
+
+        Raises:
+            RuntimeError: If the shell has exited or is still running a
+                previous command.
+        """
+        with self._cond:
+            if not self.alive:
+                raise RuntimeError("Shell is not running")
+            if self._token is not None:
+                raise RuntimeError("Shell is busy with a previous command")
+            token = uuid.uuid4().hex
+            self._token = token
+            start = self._base + len(self._buffer)
+        fd = self._control_fd
+        if self._input_fd is None:
+            stdin = "</dev/null"
+        else:
+            stdin = f"<&{self._input_fd} {self._input_fd}<&-"
+        line = (
+            f"eval {shlex.quote(command)} {stdin} {fd}>&-; "
+            f"__eigent_rc=$?; "
+            f'printf "%s %d %s\\n" {token} "$__eigent_rc" "$PWD" >&{fd}\n'
+        )
+        try:
+            self._process.stdin.write(line.encode())
+            self._process.stdin.flush()
+        except OSError as e:
+            with self._cond:
+                self._token = None
+            raise RuntimeError(f"Shell is not running: {e}") from e
+        return start
+
+    def write(self, data: str) -> None:
+        """Send data to the running command's stdin.
+
+        Raises:
+            RuntimeError: If the shell has no input pipe or is closed.
+        """
+        if self._input_write is None:
+            raise RuntimeError("Shell commands do not take input")
+        if not self.alive:
+            raise RuntimeError("Shell is not running")
+        encoded = data.encode()
+        try:
+            written = os.write(self._input_write, encoded)
+        except BlockingIOError:
+            written = 0
+        except OSError as e:
+            raise RuntimeError(f"Failed to write input: {e}") from e
+        if written < len(encoded):
+            raise RuntimeError(
+                "Input pipe is full; the command is not reading its input"
+            )
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the current command; return whether it finished."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._token is not None and not self._closed:
+                remaining = (
+                    None if deadline is None else deadline - time.monotonic()
+                )
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return self._token is None
+
+    def run(self, command: str, timeout: float | None = None) -> ShellResult:
+        """Run command and return its output once done or timed out."""
+        start = self.start(command)
+        done = self.wait(timeout)
+        output, offset = self.read(start)
+        return ShellResult(
+            output=output,
+            exit_code=self.last_exit_code if done else None,
+            offset=offset,
+        )
+
+    def read(self, offset: int) -> tuple[str, int]:
+        """Return output from offset onwards and the new end offset.
+
+        Output older than the buffer is skipped with a note.
+        """
+        with self._cond:
+            end = self._base + len(self._buffer)
+            note = ""
+            if offset < self._base:
+                note = f"[... {self._base - offset} bytes truncated ...]\n"
+                offset = self._base
+            data = bytes(self._buffer[offset - self._base :])
+        return note + data.decode("utf-8", errors="replace"), end
+
+    def _append(self, data: bytes) -> None:
+        with self._cond:
+            self._buffer += data
+            excess = len(self._buffer) - self.max_buffer_bytes
+            if excess > 0:
+                del self._buffer[:excess]
+                self._base += excess
+
+    def _read_loop(self) -> None:
+        stdout = self._process.stdout.fileno()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        control = b""
+        fds = [stdout, self._control_read]
+        try:
+            while fds:
+                ready, _, _ = select.select(fds, [], [])
+                # Drain stdout before handling completions: the command's
+                # output was written before its completion line, so it is
+                # all in the pipe by the time the control pipe is readable
+                if stdout in fds:
+                    while True:
+                        try:
+                            data = os.read(stdout, _READ_SIZE)
+                        except BlockingIOError:
+                            break
+                        if not data:
+                            fds.remove(stdout)
+                            break
+                        self._append(data)
+                        if self._on_output is not None:
+                            self._emit(decoder.decode(data))
+                if self._control_read in ready:
+                    chunk = os.read(self._control_read, _READ_SIZE)
+                    control += chunk
+                    *lines, control = control.split(b"\n")
+                    for line in lines:
+                        self._complete(line.decode("utf-8", "replace"))
+                    if not chunk:
+                        # Only bash holds the control pipe: it has exited.
+                        # Background jobs may keep stdout open, so stop
+                        # waiting for it too.
+                        break
+        except Exception:
+            logger.exception("Persistent shell reader failed")
+        finally:
+            os.close(self._control_read)
+            returncode = self._process.wait()
+            with self._cond:
+                if self._token is not None:
+                    # The command ended the shell (e.g. exit)
+                    self._token = None
+                    self.last_exit_code = returncode
+                self._closed = True
+                self._cond.notify_all()
+
+    def _emit(self, text: str) -> None:
+        if not text:
+            return
+        try:
+            self._on_output(text)
+        except Exception as e:
+            logger.warning(f"Shell output callback failed: {e}")
+
+    def _complete(self, line: str) -> None:
+        token, _, rest = line.partition(" ")
+        exit_code, _, cwd = rest.partition(" ")
+        with self._cond:
+            if token != self._token:
+                return
+            self._token = None
+            self.last_exit_code = int(exit_code)
+            self.cwd = cwd or self.cwd
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Terminate the shell and everything it started."""
+        if self._process.poll() is None:
+            try:
+                os.killpg(self._process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                os.killpg(self._process.pid, signal.SIGKILL)
+        with self._cond:
+            self._closed = True
+            input_write, self._input_write = self._input_write, None
+            self._cond.notify_all()
+        if input_write is not None:
+            os.close(input_write)
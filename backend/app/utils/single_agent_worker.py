@@ -24,13 +24,23 @@ from camel.societies.workforce.utils import TaskResult
 from camel.tasks.task import Task, TaskState, is_task_result_insufficient
 from camel.utils.context_utils import ContextUtility
 from colorama import Fore
+from pydantic import ValidationError
 
 from app.agent.listen_chat_agent import ListenChatAgent
+from app.exception.exception import ProgramException
+from app.service.task import ActionTaskPartialResultData, get_task_lock
+from app.utils.dependency_context import DependencyContextCache
+from app.utils.stream_accumulator import ChunkAccumulator
+from app.utils.streaming_json import StreamingJsonParser
 
 logger = logging.getLogger("single_agent_worker")
 
 
 class SingleAgentWorker(BaseSingleAgentWorker):
+    partial_result_min_chars = 200
+    r"""Characters of streamed result content between two partial result
+    events sent to the frontend."""
+
     def __init__(
         self,
         description: str,
@@ -42,6 +52,7 @@ class SingleAgentWorker(BaseSingleAgentWorker):
         use_structured_output_handler: bool = True,
         context_utility: ContextUtility | None = None,
         enable_workflow_memory: bool = False,
+        dependency_context: DependencyContextCache | None = None,
     ) -> None:
         logger.info(
             "Initializing SingleAgentWorker",
@@ -65,6 +76,12 @@ class SingleAgentWorker(BaseSingleAgentWorker):
             enable_workflow_memory=enable_workflow_memory,
         )
         self.worker = worker  # change type hint
+        self.dependency_context = dependency_context
+
+    def _get_dep_tasks_info(self, dependencies: list[Task]) -> str:
+        if self.dependency_context is None:
+            return super()._get_dep_tasks_info(dependencies)
+        return self.dependency_context.build(dependencies)
 
     async def _process_task(
         self, task: Task, dependencies: list[Task]
@@ -103,9 +120,15 @@ class SingleAgentWorker(BaseSingleAgentWorker):
         final_response = None
         try:
             dependency_tasks_info = self._get_dep_tasks_info(dependencies)
+            if self.dependency_context is not None:
+                parent_content = self.dependency_context.parent_content(
+                    task.parent
+                )
+            else:
+                parent_content = task.parent.content if task.parent else ""
             prompt = PROCESS_TASK_PROMPT.format(
                 content=task.content,
-                parent_task_content=task.parent.content if task.parent else "",
+                parent_task_content=parent_content,
                 dependency_tasks_info=dependency_tasks_info,
                 additional_info=task.additional_info,
             )
@@ -128,23 +151,15 @@ class SingleAgentWorker(BaseSingleAgentWorker):
                 response = await worker_agent.astep(enhanced_prompt)
 
                 # Handle streaming response
+                task_result = None
                 if isinstance(response, AsyncStreamingChatAgentResponse):
-                    # With stream_accumulate=False, we need to accumulate delta content
-                    accumulated_content = ""
-                    last_chunk = None
-                    chunk_count = 0
-                    async for chunk in response:
-                        chunk_count += 1
-                        last_chunk = chunk
-                        if chunk.msg and chunk.msg.content:
-                            accumulated_content += chunk.msg.content
-                    logger.info(
-                        f"Streaming complete: {chunk_count} chunks, content_length={len(accumulated_content)}"
-                    )
-                    response_content = accumulated_content
-                    # Store usage info from last chunk for later use
-                    response._last_chunk_info = (
-                        last_chunk.info if last_chunk else {}
+                    # With stream_accumulate=False, chunks are deltas; parse
+                    # them as they arrive instead of once at the end
+                    (
+                        task_result,
+                        response_content,
+                    ) = await self._consume_structured_stream(
+                        response, task, worker_agent
                     )
                 else:
                     # Regular ChatAgentResponse
@@ -152,16 +167,17 @@ class SingleAgentWorker(BaseSingleAgentWorker):
                         response.msg.content if response.msg else ""
                     )
 
-                task_result = (
-                    self.structured_handler.parse_structured_response(
-                        response_text=response_content,
-                        schema=TaskResult,
-                        fallback_values={
-                            "content": "Task processing failed",
-                            "failed": True,
-                        },
+                if task_result is None:
+                    task_result = (
+                        self.structured_handler.parse_structured_response(
+                            response_text=response_content,
+                            schema=TaskResult,
+                            fallback_values={
+                                "content": "Task processing failed",
+                                "failed": True,
+                            },
+                        )
                     )
-                )
             else:
                 # Use native structured output if supported
                 response = await worker_agent.astep(
@@ -172,16 +188,14 @@ class SingleAgentWorker(BaseSingleAgentWorker):
                 if isinstance(response, AsyncStreamingChatAgentResponse):
                     task_result = None
                     # With stream_accumulate=False, we need to accumulate delta content
-                    accumulated_content = ""
+                    accumulated = ChunkAccumulator()
                     last_chunk = None
                     async for chunk in response:
                         last_chunk = chunk
-                        if chunk.msg:
-                            if chunk.msg.content:
-                                accumulated_content += chunk.msg.content
-                            if chunk.msg.parsed:
-                                task_result = chunk.msg.parsed
-                    response_content = accumulated_content
+                        accumulated.add_chunk(chunk)
+                        if chunk.msg and chunk.msg.parsed:
+                            task_result = chunk.msg.parsed
+                    response_content = accumulated.text
                     # Store usage info from last chunk for later use
                     response._last_chunk_info = (
                         last_chunk.info if last_chunk else {}
@@ -329,3 +343,76 @@ class SingleAgentWorker(BaseSingleAgentWorker):
             )
             return TaskState.FAILED
         return TaskState.DONE
+
+    async def _consume_structured_stream(
+        self,
+        response: AsyncStreamingChatAgentResponse,
+        task: Task,
+        worker_agent: ListenChatAgent,
+    ) -> tuple[TaskResult | None, str]:
+        r"""Read a streamed structured-output response chunk by chunk.
+
+        The ``TaskResult`` JSON object is parsed as soon as it closes, and
+        the ``content`` received so far is sent to the frontend every
+        :attr:`partial_result_min_chars` characters until then. The stream
+        is still drained so the last chunk's usage info is recorded.
+
+        Returns:
+            Tuple[Optional[TaskResult], str]: The parsed result, or None if
+                no valid object was found and the caller should fall back to
+                the structured output handler, and the full response text.
+        """
+        parser = StreamingJsonParser(field="content", required=("content",))
+        last_chunk = None
+        chunk_count = 0
+        sent_length = 0
+        async for chunk in response:
+            chunk_count += 1
+            last_chunk = chunk
+            if not (chunk.msg and chunk.msg.content):
+                continue
+            if parser.result is not None:
+                parser.feed(chunk.msg.content)
+                continue
+            if parser.feed(chunk.msg.content) is not None:
+                logger.debug(
+                    "TaskResult complete after %d chunks for task %s",
+                    chunk_count,
+                    task.id,
+                )
+            elif (
+                parser.field_length - sent_length
+                >= self.partial_result_min_chars
+            ):
+                sent_length = parser.field_length
+                await self._send_partial_result(
+                    worker_agent, task, parser.partial()
+                )
+        logger.info(
+            "Streaming complete: %d chunks, content_length=%d",
+            chunk_count,
+            len(parser),
+        )
+        # Store usage info from last chunk for later use
+        response._last_chunk_info = last_chunk.info if last_chunk else {}
+
+        task_result = None
+        if parser.result is not None:
+            try:
+                task_result = TaskResult.model_validate(parser.result)
+            except ValidationError:
+                pass
+        return task_result, parser.text
+
+    async def _send_partial_result(
+        self, worker_agent: ListenChatAgent, task: Task, content: str
+    ) -> None:
+        try:
+            task_lock = get_task_lock(worker_agent.api_task_id)
+        except ProgramException:
+            return
+        await task_lock.put_queue(
+            ActionTaskPartialResultData(
+                data={"task_id": task.id, "content": content}
+            )
+        )
@@ -0,0 +1,90 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Startup phase profile for the backend process.
+
+Enabled by setting ``EIGENT_STARTUP_PROFILE`` to a report path. Each
+``mark`` records the elapsed time since this module was imported (the
+first thing ``main`` does) and the resident set size at that point, and
+rewrites the JSON report so an external harness can read it while the
+server keeps running. When the variable is unset, ``mark`` is a no-op.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+_started = time.perf_counter()
+_report_path = os.environ.get("EIGENT_STARTUP_PROFILE") or None
+_phases: list[dict] = []
+_lock = threading.Lock()
+
+
+def rss_bytes() -> int:
+    """Return the current resident set size, or the peak where unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def enabled() -> bool:
+    return _report_path is not None
+
+
+def mark(phase: str, once: bool = False) -> None:
+    """Record that startup reached ``phase``.
+
+    With ``once``, only the first call for the phase is recorded, which
+    suits per-request hooks such as the first ``/health`` response.
+    """
+    if _report_path is None:
+        return
+    with _lock:
+        if once and any(p["phase"] == phase for p in _phases):
+            return
+        _phases.append(
+            {
+                "phase": phase,
+                "elapsed_ms": round(
+                    (time.perf_counter() - _started) * 1000, 2
+                ),
+                "rss_bytes": rss_bytes(),
+            }
+        )
+        report = {"pid": os.getpid(), "phases": list(_phases)}
+    path = Path(_report_path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp.write_text(json.dumps(report, indent=2))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def phases() -> list[dict]:
+    with _lock:
+        return list(_phases)
@@ -0,0 +1,108 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Linear-time accumulation of streamed text deltas.
+
+Streaming wrappers receive a response as many small deltas and need the
+whole text at the end. ``ChunkAccumulator`` appends deltas to a list and
+joins once, instead of building a new string per chunk, and can hand the
+deltas to a callback in batches (e.g. to forward them to the SSE queue)
+by size or by time.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class ChunkAccumulator:
+    """Collect streamed text and optionally flush deltas in batches.
+
+    Args:
+        on_flush: Called with the text received since the previous
+            flush. None disables flushing.
+        flush_chars: Flush once this many characters are pending.
+        flush_interval: Also flush when this many seconds have passed
+            since the previous flush and something is pending.
+    """
+
+    __slots__ = (
+        "_parts",
+        "_length",
+        "_pending",
+        "_pending_length",
+        "_last_flush",
+        "on_flush",
+        "flush_chars",
+        "flush_interval",
+    )
+
+    def __init__(
+        self,
+        on_flush: Callable[[str], Any] | None = None,
+        flush_chars: int = 512,
+        flush_interval: float | None = None,
+    ) -> None:
+        self._parts: list[str] = []
+        self._length = 0
+        self._pending: list[str] = []
+        self._pending_length = 0
+        self._last_flush = time.monotonic()
+        self.on_flush = on_flush
+        self.flush_chars = flush_chars
+        self.flush_interval = flush_interval
+
+    def append(self, delta: str) -> None:
+        if not delta:
+            return
+        self._parts.append(delta)
+        self._length += len(delta)
+        if self.on_flush is None:
+            return
+        self._pending.append(delta)
+        self._pending_length += len(delta)
+        if self._pending_length >= self.flush_chars or (
+            self.flush_interval is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def add_chunk(self, chunk: Any) -> None:
+        """Append the content of a ``ChatAgentResponse`` chunk, if any."""
+        msg = getattr(chunk, "msg", None)
+        if msg is not None and msg.content:
+            self.append(msg.content)
+
+    def flush(self) -> None:
+        """Hand pending deltas to :attr:`on_flush`."""
+        self._last_flush = time.monotonic()
+        if not self._pending or self.on_flush is None:
+            return
+        delta = "".join(self._pending)
+        self._pending.clear()
+        self._pending_length = 0
+        self.on_flush(delta)
+
+    @property
+    def text(self) -> str:
+        """Everything received so far."""
+        if len(self._parts) > 1:
+            self._parts[:] = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
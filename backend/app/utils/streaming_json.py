@@ -0,0 +1,170 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Incremental detection of a JSON object in streamed model output.
+
+Models asked for structured output usually answer with one JSON object,
+possibly wrapped in prose or a code fence. ``StreamingJsonParser`` keeps
+the chunks in a ``ChunkAccumulator``, scans each chunk once as it arrives
+and parses the first complete top-level object as soon as its closing
+brace is seen, so the caller neither re-concatenates nor re-parses the
+whole response. It also exposes the partially received value of one
+string field, so progress can be shown before the object is complete.
+"""
+
+import json
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from app.utils.stream_accumulator import ChunkAccumulator
+
+# A trailing backslash or an unfinished \uXXXX escape
+_INCOMPLETE_ESCAPE = re.compile(r"(?<!\\)(\\\\)*\\(u[0-9a-fA-F]{0,3})?$")
+
+
+class StreamingJsonParser:
+    """Find the first complete JSON object in streamed text.
+
+    Args:
+        field: Top-level string field whose partial value is tracked
+            while the object is still open.
+        required: Keys an object must contain to be accepted; objects
+            without them (e.g. an example echoed by the model) are
+            skipped.
+    """
+
+    def __init__(
+        self, field: str | None = None, required: Iterable[str] = ()
+    ) -> None:
+        self.field = field
+        self.required = tuple(required)
+        self.result: dict[str, Any] | None = None
+        self._text = ChunkAccumulator()
+        # Scanner state, carried across chunks
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._role: str | None = None  # "key" or "field" while in a string
+        self._last_key: str | None = None
+        self._key_parts: list[str] = []
+        self._field_parts: list[str] = []
+        self._field_length = 0
+        self._object_parts: list[str] = []
+
+    def feed(self, chunk: str) -> dict[str, Any] | None:
+        """Consume a chunk; return the object once it is complete."""
+        if not chunk:
+            return self.result
+        self._text.append(chunk)
+        if self.result is None:
+            self._scan(chunk)
+        return self.result
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return self._text.text
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    @property
+    def field_length(self) -> int:
+        """Raw length of the tracked field received so far."""
+        return self._field_length
+
+    def partial(self) -> str:
+        """Decoded value of the tracked field received so far."""
+        raw = "".join(self._field_parts)
+        raw = _INCOMPLETE_ESCAPE.sub(lambda m: m.group(1) or "", raw, count=1)
+        try:
+            return json.loads(f'"{raw}"')
+        except ValueError:
+            return raw
+
+    def _scan(self, chunk: str) -> None:
+        object_start = 0 if self._depth else None
+        segment_start = 0
+        for i, ch in enumerate(chunk):
+            if self._depth == 0:
+                if ch == "{":
+                    self._open_object()
+                    object_start = i
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._collect(chunk[segment_start:i])
+                    if self._role == "key":
+                        self._last_key = "".join(self._key_parts)
+                        self._expect_key = False
+                    self._role = None
+                continue
+            if ch == '"':
+                self._in_string = True
+                segment_start = i + 1
+                if self._depth == 1 and self._expect_key:
+                    self._role = "key"
+                    self._key_parts = []
+                elif self._depth == 1 and self._last_key == self.field:
+                    self._role = "field"
+                    self._field_parts = []
+                    self._field_length = 0
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._object_parts.append(chunk[object_start : i + 1])
+                    if self._close_object():
+                        return
+            elif ch == "," and self._depth == 1:
+                self._expect_key = True
+        if self._depth:
+            self._object_parts.append(chunk[object_start:])
+        if self._in_string:
+            self._collect(chunk[segment_start:])
+
+    def _collect(self, segment: str) -> None:
+        if self._role == "key":
+            self._key_parts.append(segment)
+        elif self._role == "field":
+            self._field_parts.append(segment)
+            self._field_length += len(segment)
+
+    def _open_object(self) -> None:
+        self._depth = 1
+        self._expect_key = True
+        self._last_key = None
+        self._object_parts = []
+
+    def _close_object(self) -> bool:
+        candidate = "".join(self._object_parts)
+        self._object_parts = []
+        try:
+            value = json.loads(candidate)
+        except ValueError:
+            return False
+        if not isinstance(value, dict) or any(
+            key not in value for key in self.required
+        ):
+            return False
+        self.result = value
+        return True
@@ -0,0 +1,210 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import logging
+from collections.abc import Iterable, Mapping
+
+from camel.tasks.task import Task
+
+from app.service.task import Agents
+
+logger = logging.getLogger("task_scheduler")
+
+# Maximum number of tasks a single worker type runs at the same time.
+# Worker types not listed here are not limited.
+DEFAULT_WORKER_CONCURRENCY: dict[str, int] = {
+    Agents.developer_agent.value: 4,
+    Agents.browser_agent.value: 2,
+}
+
+
+class TaskScheduler:
+    r"""Dependency-aware dispatch policy for a :obj:`Workforce`.
+
+    Ready tasks are ordered by their critical-path rank, i.e. the length of
+    the longest dependency chain that still has to run after them, so long
+    chains start as early as possible. Each worker type has a concurrency
+    limit; tasks for a saturated worker are held back until one of its
+    running tasks returns.
+
+    Args:
+        worker_concurrency (Mapping[str, int] | None): Maximum number of
+            concurrently running tasks per worker type (the worker agent's
+            name). Defaults to :obj:`DEFAULT_WORKER_CONCURRENCY`.
+    """
+
+    def __init__(
+        self, worker_concurrency: Mapping[str, int] | None = None
+    ) -> None:
+        self._limits: dict[str, int] = dict(
+            DEFAULT_WORKER_CONCURRENCY
+            if worker_concurrency is None
+            else worker_concurrency
+        )
+        # worker node_id -> worker type
+        self._worker_types: dict[str, str] = {}
+        # task_id -> worker node_id, for tasks posted and not yet returned
+        self._running: dict[str, str] = {}
+        # Tasks whose dependencies are met but whose worker was saturated
+        self._held: list[Task] = []
+        self._ranks: dict[str, int] = {}
+
+    def register_worker(self, node_id: str, worker_type: str | None) -> None:
+        if worker_type:
+            self._worker_types[node_id] = worker_type
+
+    def limit_for(self, node_id: str) -> int | None:
+        worker_type = self._worker_types.get(node_id)
+        return self._limits.get(worker_type) if worker_type else None
+
+    def _running_on(self, node_id: str) -> int:
+        worker_type = self._worker_types.get(node_id)
+        if worker_type is None:
+            return sum(1 for n in self._running.values() if n == node_id)
+        return sum(
+            1
+            for n in self._running.values()
+            if self._worker_types.get(n) == worker_type
+        )
+
+    def try_acquire(self, task: Task, node_id: str) -> bool:
+        """Reserve a slot for ``task`` on ``node_id``.
+
+        Returns:
+            bool: True if the task may be posted now, False if it was held
+                back because its worker type is at its concurrency limit.
+        """
+        limit = self.limit_for(node_id)
+        if limit is not None and self._running_on(node_id) >= limit:
+            self._held.append(task)
+            return False
+        self.mark_running(task.id, node_id)
+        return True
+
+    def mark_running(self, task_id: str, node_id: str) -> None:
+        """Record a task as posted to ``node_id`` regardless of limits."""
+        self._running[task_id] = node_id
+
+    def release(self, task_id: str) -> None:
+        self._running.pop(task_id, None)
+
+    def release_all(self) -> None:
+        """Free every slot, e.g. once in-flight tasks were abandoned."""
+        self._running.clear()
+
+    def take_held(self) -> list[Task]:
+        """Return and clear the tasks held back during the last dispatch."""
+        held, self._held = self._held, []
+        return held
+
+    def update_ranks(
+        self,
+        tasks: Iterable[Task],
+        dependencies: Mapping[str, list[str]],
+    ) -> dict[str, int]:
+        """Compute the critical-path rank of each task.
+
+        The rank of a task is the number of tasks on the longest chain that
+        starts at it and follows dependents, so sinks have rank 1.
+
+        Args:
+            tasks (Iterable[Task]): Tasks that still have to run.
+            dependencies (Mapping[str, list[str]]): task_id -> ids of tasks
+                it depends on.
+
+        Returns:
+            dict[str, int]: task_id -> rank.
+        """
+        task_ids = {task.id for task in tasks}
+        dependents: dict[str, list[str]] = {tid: [] for tid in task_ids}
+        for tid in task_ids:
+            for dep in dependencies.get(tid, ()):
+                if dep in dependents:
+                    dependents[dep].append(tid)
+
+        ranks: dict[str, int] = {}
+        for root in task_ids:
+            if root in ranks:
+                continue
+            # Iterative post-order DFS; nodes on the stack are treated as
+            # rank 1 if reached again, which breaks accidental cycles.
+            stack = [(root, iter(dependents[root]))]
+            on_stack = {root}
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    on_stack.discard(node)
+                    ranks[node] = 1 + max(
+                        (ranks.get(c, 1) for c in dependents[node]),
+                        default=0,
+                    )
+                elif child not in ranks and child not in on_stack:
+                    on_stack.add(child)
+                    stack.append((child, iter(dependents[child])))
+
+        self._ranks = ranks
+        return ranks
+
+    def critical_path(
+        self, dependencies: Mapping[str, list[str]]
+    ) -> list[str]:
+        """Return the task ids on the current critical path, in order."""
+        if not self._ranks:
+            return []
+        dependents: dict[str, list[str]] = {tid: [] for tid in self._ranks}
+        for tid in self._ranks:
+            for dep in dependencies.get(tid, ()):
+                if dep in dependents:
+                    dependents[dep].append(tid)
+
+        node = max(self._ranks, key=self._ranks.__getitem__)
+        path = [node]
+        while dependents[node]:
+            node = max(dependents[node], key=self._ranks.__getitem__)
+            path.append(node)
+        return path
+
+    def prioritize(self, tasks: Iterable[Task]) -> list[Task]:
+        """Order ``tasks`` by descending rank, keeping ties stable."""
+        return sorted(tasks, key=lambda t: -self._ranks.get(t.id, 0))
+
+    def counts(
+        self, pending: Iterable[Task], dependencies_met: set[str]
+    ) -> dict[str, int]:
+        """Summarise the dispatch state.
+
+        Args:
+            pending (Iterable[Task]): Tasks not yet posted.
+            dependencies_met (set[str]): Ids of pending tasks whose
+                dependencies have all completed.
+
+        Returns:
+            dict[str, int]: ``scheduled`` (ready, waiting for a worker
+                slot), ``running`` (posted, not yet returned) and
+                ``waiting`` (dependencies not met yet).
+        """
+        pending_ids = [task.id for task in pending]
+        scheduled = sum(1 for tid in pending_ids if tid in dependencies_met)
+        return {
+            "scheduled": scheduled,
+            "running": len(self._running),
+            "waiting": len(pending_ids) - scheduled,
+        }
+
+    def reset(self) -> None:
+        self._running.clear()
+        self._held.clear()
+        self._ranks.clear()
@@ -17,6 +17,7 @@ import json
 import logging
 import os
 import re
+from datetime import UTC, datetime
 from typing import Any
 
 import camel
@@ -30,7 +31,9 @@ from camel.societies.workforce.events import (
     TaskStartedEvent,
     TaskUpdatedEvent,
     WorkerCreatedEvent,
+    WorkerDeletedEvent,
 )
+from camel.societies.workforce.workforce_callback import WorkforceCallback
 from camel.societies.workforce.workforce_metrics import WorkforceMetrics
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
@@ -41,6 +44,8 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import Status, StatusCode
 
+from app.component.environment import env
+
 logger = logging.getLogger(__name__)
 
 # Environment variable keys
@@ -96,6 +101,7 @@ TRACER_NAME_WORKFORCE = "eigent.workforce"
 # Span names
 SPAN_WORKFORCE_EXECUTION = "workforce.execution"
 SPAN_WORKER_CREATED = "worker.created"
+SPAN_WORKER_DELETED = "worker.deleted"
 SPAN_TASK_CREATED = "task.created"
 SPAN_TASK_DECOMPOSED = "task.decomposed"
 SPAN_TASK_ASSIGNED = "task.assigned"
@@ -124,11 +130,9 @@ def initialize_tracer_provider() -> None:
         return
 
     # Get configuration from environment
-    langfuse_public_key = os.getenv(ENV_LANGFUSE_PUBLIC_KEY)
-    langfuse_secret_key = os.getenv(ENV_LANGFUSE_SECRET_KEY)
-    langfuse_base_url = os.getenv(
-        ENV_LANGFUSE_BASE_URL, DEFAULT_LANGFUSE_BASE_URL
-    )
+    langfuse_public_key = env(ENV_LANGFUSE_PUBLIC_KEY)
+    langfuse_secret_key = env(ENV_LANGFUSE_SECRET_KEY)
+    langfuse_base_url = env(ENV_LANGFUSE_BASE_URL, DEFAULT_LANGFUSE_BASE_URL)
 
     # Create resource with service information
     resource = Resource(attributes={SERVICE_NAME: SERVICE_NAME_WORKFORCE})
@@ -212,7 +216,11 @@ def _create_basic_auth_header(public_key: str, secret_key: str) -> str:
     return f"Authorization=Basic {encoded}"
 
 
-class WorkforceMetricsCallback(WorkforceMetrics):
+def _timestamp() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+class WorkforceMetricsCallback(WorkforceCallback, WorkforceMetrics):
     """OpenTelemetry metrics callback for workforce events.
 
     Sends workforce events to Langfuse via OTLP protocol.
@@ -245,8 +253,8 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         self.task_id = task_id
 
         # Check if telemetry is enabled
-        langfuse_public_key = os.getenv(ENV_LANGFUSE_PUBLIC_KEY)
-        langfuse_secret_key = os.getenv(ENV_LANGFUSE_SECRET_KEY)
+        langfuse_public_key = env(ENV_LANGFUSE_PUBLIC_KEY)
+        langfuse_secret_key = env(ENV_LANGFUSE_SECRET_KEY)
         self.enabled = bool(langfuse_public_key and langfuse_secret_key)
 
         # Initialize tracer and root_span as None by default
@@ -281,6 +289,47 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         # Track quality scores (task_id -> quality_score)
         self.task_quality_scores = {}
 
+        # Per-task indexes, one entry per task however many events it has
+        # task_id -> latest error message
+        self.task_errors: dict[str, str] = {}
+        # task_id -> latest worker id
+        self.task_workers: dict[str, str] = {}
+        # task_id -> {"started_at", "finished_at", "processing_time_seconds"}
+        self.task_timings: dict[str, dict[str, Any]] = {}
+
+    def get_task_error(self, task_id: str) -> str | None:
+        """Get the latest error message recorded for a task.
+
+        Args:
+            task_id: The task identifier
+
+        Returns:
+            The latest error message, or None if the task never failed
+        """
+        return self.task_errors.get(task_id)
+
+    def get_task_worker(self, task_id: str) -> str | None:
+        """Get the worker that last handled a task.
+
+        Args:
+            task_id: The task identifier
+
+        Returns:
+            The worker id, or None if unknown
+        """
+        return self.task_workers.get(task_id)
+
+    def get_task_timing(self, task_id: str) -> dict[str, Any]:
+        """Get start/finish timings recorded for a task.
+
+        Args:
+            task_id: The task identifier
+
+        Returns:
+            Dictionary of timing fields, empty if none were recorded
+        """
+        return dict(self.task_timings.get(task_id, {}))
+
     def log_worker_created(
         self,
         event: WorkerCreatedEvent,
@@ -316,6 +365,22 @@ class WorkforceMetricsCallback(WorkforceMetrics):
 
             span.set_status(Status(StatusCode.OK))
 
+    def log_worker_deleted(self, event: WorkerDeletedEvent) -> None:
+        """Log worker deletion as a span.
+
+        Args:
+            event: Worker deletion event from CAMEL
+        """
+        if not self.enabled:
+            return
+
+        ctx = trace.set_span_in_context(self.root_span)
+        with self.tracer.start_as_current_span(
+            SPAN_WORKER_DELETED, context=ctx
+        ) as span:
+            span.set_attribute(ATTR_WORKER_ID, event.worker_id)
+            span.set_status(Status(StatusCode.OK))
+
     def log_task_created(self, event: TaskCreatedEvent) -> None:
         """Log task creation as a span.
 
@@ -369,6 +434,8 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         Args:
             event: Task assignment event from CAMEL
         """
+        self.task_workers[event.task_id] = event.worker_id
+
         if not self.enabled:
             return
 
@@ -434,6 +501,11 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         Args:
             event: Task started event from CAMEL
         """
+        worker_id = getattr(event, "worker_id", None)
+        if worker_id:
+            self.task_workers[event.task_id] = worker_id
+        self.task_timings[event.task_id] = {"started_at": _timestamp()}
+
         if not self.enabled:
             return
 
@@ -459,6 +531,12 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         Args:
             event: Task completion event from CAMEL
         """
+        self._record_task_finished(
+            event.task_id,
+            event.worker_id,
+            processing_time_seconds=event.processing_time_seconds,
+        )
+
         if not self.enabled:
             return
 
@@ -517,6 +595,10 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         Args:
             event: Task failure event from CAMEL
         """
+        self._record_task_finished(event.task_id, event.worker_id)
+        if event.error_message:
+            self.task_errors[event.task_id] = event.error_message
+
         if not self.enabled:
             return
 
@@ -534,6 +616,26 @@ class WorkforceMetricsCallback(WorkforceMetrics):
             span.set_status(Status(StatusCode.ERROR, event.error_message))
             span.end()
 
+    def _record_task_finished(
+        self,
+        task_id: str,
+        worker_id: str | None,
+        processing_time_seconds: float | None = None,
+    ) -> None:
+        """Update per-task indexes for a completed or failed task.
+
+        Args:
+            task_id: The task identifier
+            worker_id: The worker that handled the task (optional)
+            processing_time_seconds: Time the task took (optional)
+        """
+        if worker_id:
+            self.task_workers[task_id] = worker_id
+        timing = self.task_timings.setdefault(task_id, {})
+        timing["finished_at"] = _timestamp()
+        if processing_time_seconds is not None:
+            timing["processing_time_seconds"] = processing_time_seconds
+
     def log_message(self, log_event: LogEvent) -> None:
         """Log error and critical messages as span events.
         Also parse quality scores from info-level task completion messages.
@@ -663,3 +765,6 @@ class WorkforceMetricsCallback(WorkforceMetrics):
             span.end()
 
         self.task_spans.clear()
+        self.task_errors.clear()
+        self.task_workers.clear()
+        self.task_timings.clear()
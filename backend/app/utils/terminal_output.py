@@ -0,0 +1,245 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Coalescing of terminal output into rate-limited frames."""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger("terminal_output")
+
+# A session's pending output is flushed once it is this old or this large
+DEFAULT_FLUSH_INTERVAL = 0.1
+DEFAULT_FLUSH_BYTES = 8 * 1024
+# Recent output kept per session for subscribers that join late
+DEFAULT_HISTORY_BYTES = 64 * 1024
+
+
+@dataclass
+class _Session:
+    pending: list[str] = field(default_factory=list)
+    pending_bytes: int = 0
+    deadline: float = 0.0
+    history: deque[str] = field(default_factory=deque)
+    history_bytes: int = 0
+    # Chunks dropped since the last delivered frame; the next frame
+    # replays them from history
+    undelivered: int = 0
+    chunks: int = 0
+    frames: int = 0
+    merged: int = 0
+    dropped: int = 0
+    evicted_bytes: int = 0
+
+
+# _Session counters reported by stats()
+_COUNTERS = ("chunks", "frames", "merged", "dropped", "evicted_bytes")
+
+
+class TerminalOutputCoalescer:
+    """Merge small output chunks per session into frames.
+
+    Chunks written for a session are buffered and handed to ``emit`` as a
+    single frame once the oldest buffered chunk is ``flush_interval``
+    seconds old or ``flush_bytes`` are buffered, whichever comes first.
+    Frames for one session are emitted in write order.
+
+    The last ``history_bytes`` of each session are kept in a ring buffer.
+    ``emit`` returns False when nobody received the frame; its chunks are
+    counted as dropped and the next delivered frame replays those still in
+    history, so a subscriber that attaches late catches up. Sessions are
+    kept until ``end_sessions`` forgets them.
+
+    Args:
+        emit (Callable[[Hashable, str], bool]): Receives (session, frame)
+            and returns whether the frame was delivered. Called from the
+            writing thread or the flusher thread, never concurrently.
+        flush_interval (float): Max seconds a chunk waits in the buffer.
+        flush_bytes (int): Buffered size that triggers an early flush.
+        history_bytes (int): Size of the per-session ring buffer.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[Hashable, str], bool],
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        history_bytes: int = DEFAULT_HISTORY_BYTES,
+    ) -> None:
+        self._emit = emit
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.history_bytes = history_bytes
+        self._sessions: dict[Hashable, _Session] = {}
+        # Counters of sessions that have ended, for stats()
+        self._ended = _Session()
+        self._ended_sessions = 0
+        self._cond = threading.Condition()
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+
+    def write(self, session_id: Hashable, text: str) -> None:
+        if not text:
+            return
+        size = len(text.encode("utf-8", errors="replace"))
+        with self._cond:
+            session = self._sessions.setdefault(session_id, _Session())
+            session.chunks += 1
+            self._remember(session, text, size)
+            if self._closed:
+                self._deliver(session_id, session, [text])
+                return
+            if not session.pending:
+                session.deadline = time.monotonic() + self.flush_interval
+            session.pending.append(text)
+            session.pending_bytes += size
+            if session.pending_bytes >= self.flush_bytes:
+                self._flush_session(session_id, session)
+            else:
+                self._ensure_flusher()
+
+    def _remember(self, session: _Session, text: str, size: int) -> None:
+        session.history.append(text)
+        session.history_bytes += size
+        # Keep at least the newest chunk, even if it alone is too large
+        while (
+            session.history_bytes > self.history_bytes
+            and len(session.history) > 1
+        ):
+            old = session.history.popleft()
+            evicted = len(old.encode("utf-8", errors="replace"))
+            session.history_bytes -= evicted
+            session.evicted_bytes += evicted
+
+    def _flush_session(self, session_id: Hashable, session: _Session) -> None:
+        chunks = session.pending
+        if not chunks:
+            return
+        session.pending = []
+        session.pending_bytes = 0
+        self._deliver(session_id, session, chunks)
+
+    def _deliver(
+        self, session_id: Hashable, session: _Session, chunks: list[str]
+    ) -> None:
+        if session.undelivered:
+            # Chunks are the newest history entries; dropped ones precede
+            count = min(
+                session.undelivered + len(chunks), len(session.history)
+            )
+            start = len(session.history) - count
+            frame = "".join(itertools.islice(session.history, start, None))
+        else:
+            frame = "".join(chunks)
+        try:
+            delivered = self._emit(session_id, frame)
+        except Exception as e:
+            logger.warning(f"Failed to emit terminal output: {e}")
+            delivered = False
+        if delivered:
+            session.frames += 1
+            session.merged += len(chunks) - 1
+            session.undelivered = 0
+        else:
+            session.dropped += len(chunks)
+            session.undelivered += len(chunks)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._run, name="terminal-output-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                pending = [
+                    (session_id, session)
+                    for session_id, session in self._sessions.items()
+                    if session.pending
+                ]
+                if not pending or self._closed:
+                    # Exit when idle; the next write starts a new flusher
+                    self._flusher = None
+                    return
+                now = time.monotonic()
+                wait = None
+                for session_id, session in pending:
+                    if session.deadline <= now:
+                        self._flush_session(session_id, session)
+                    else:
+                        remaining = session.deadline - now
+                        wait = (
+                            remaining if wait is None else min(wait, remaining)
+                        )
+                if wait is not None:
+                    self._cond.wait(wait)
+
+    def flush(self, session_id: Hashable | None = None) -> None:
+        """Emit buffered output now, for one session or all of them."""
+        with self._cond:
+            if session_id is not None:
+                session = self._sessions.get(session_id)
+                if session is not None:
+                    self._flush_session(session_id, session)
+                return
+            for key, session in self._sessions.items():
+                self._flush_session(key, session)
+
+    def end_sessions(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Flush and forget the sessions whose id matches ``predicate``."""
+        with self._cond:
+            ended = [key for key in self._sessions if predicate(key)]
+            for key in ended:
+                session = self._sessions.pop(key)
+                self._flush_session(key, session)
+                self._ended_sessions += 1
+                for name in _COUNTERS:
+                    setattr(
+                        self._ended,
+                        name,
+                        getattr(self._ended, name) + getattr(session, name),
+                    )
+
+    def recent(self, session_id: Hashable) -> str:
+        """Return the session's buffered recent output."""
+        with self._cond:
+            session = self._sessions.get(session_id)
+            return "".join(session.history) if session else ""
+
+    def stats(self) -> dict[str, int]:
+        """Return chunk, frame, merged, dropped and evicted byte totals."""
+        with self._cond:
+            sessions = [self._ended, *self._sessions.values()]
+            return {
+                "sessions": self._ended_sessions + len(self._sessions),
+                **{
+                    name: sum(getattr(s, name) for s in sessions)
+                    for name in _COUNTERS
+                },
+            }
+
+    def close(self) -> None:
+        """Flush everything; later writes are emitted unbuffered."""
+        with self._cond:
+            self._closed = True
+            for key, session in self._sessions.items():
+                self._flush_session(key, session)
+            self._cond.notify_all()
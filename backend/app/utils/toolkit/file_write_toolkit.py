@@ -13,9 +13,11 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Union
 from camel.toolkits import FileToolkit as BaseFileToolkit
+from camel.toolkits.function_tool import FunctionTool
 
 from app.component.environment import env
 from app.service.task import (
@@ -24,6 +26,14 @@ from app.service.task import (
     get_task_lock,
     process_task,
 )
+from app.utils.conversion_cache import get_conversion_cache
+from app.utils.file_utils import (
+    count_lines,
+    grep_lines,
+    read_byte_window,
+    read_line_window,
+    read_tail_lines,
+)
 from app.utils.listen.toolkit_listen import (
     _safe_put_queue,
     auto_listen_toolkit,
@@ -34,6 +44,16 @@ from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 # File extensions that should be read as plain text (not via MarkItDownLoader)
 PLAIN_TEXT_EXTENSIONS = {'.md', '.markdown', '.rst', '.log', '.txt'}
 
+# Plain text files above this size are summarized instead of returned whole
+LARGE_FILE_BYTES = 1024 * 1024
+SUMMARY_HEAD_LINES = 100
+SUMMARY_TAIL_LINES = 50
+DEFAULT_WINDOW_LINES = 200
+MAX_WINDOW_LINES = 2000
+MAX_WINDOW_BYTES = 256 * 1024
+# Longer lines are cut, so a single huge line cannot fill the window
+MAX_LINE_BYTES = 16 * 1024
+
 
 @auto_listen_toolkit(BaseFileToolkit)
 class FileToolkit(BaseFileToolkit, AbstractToolkit):
@@ -105,13 +125,155 @@ class FileToolkit(BaseFileToolkit, AbstractToolkit):
         return path_obj.resolve()
 
     def _read_plain_text_file(self, file_path: Path) -> str:
-        """Read a file as plain text."""
+        """Read a file as plain text.
+
+        Files larger than LARGE_FILE_BYTES are not loaded; a summary with
+        the first and last lines is returned instead.
+        """
         try:
+            size = file_path.stat().st_size
+            if size > LARGE_FILE_BYTES:
+                return self._summarize_large_file(file_path, size)
             with open(file_path, 'r', encoding='utf-8') as f:
                 return f.read()
         except Exception as e:
             return f"Error reading file: {e}"
 
+    def _summarize_large_file(self, file_path: Path, size: int) -> str:
+        total_lines = count_lines(file_path)
+        head = read_line_window(
+            file_path,
+            1,
+            SUMMARY_HEAD_LINES,
+            max_line_bytes=MAX_LINE_BYTES,
+            max_bytes=MAX_WINDOW_BYTES // 2,
+        )
+        tail_count = min(SUMMARY_TAIL_LINES, max(0, total_lines - len(head)))
+        tail = read_tail_lines(
+            file_path,
+            tail_count,
+            max_line_bytes=MAX_LINE_BYTES,
+            max_bytes=MAX_WINDOW_BYTES // 2,
+        )
+        parts = [
+            f"[Large file: {file_path} ({size} bytes, {total_lines} lines). "
+            f"Showing the first {len(head)} and last {len(tail)} lines. "
+            f"Use read_file_range or grep_file to inspect the rest.]",
+            _number_lines(head, 1),
+        ]
+        if tail:
+            parts.append("...")
+            parts.append(_number_lines(tail, total_lines - len(tail) + 1))
+        return "\n".join(parts)
+
+    @listen_toolkit()
+    def read_file_range(
+        self,
+        file_path: str,
+        start_line: int = 1,
+        num_lines: int = DEFAULT_WINDOW_LINES,
+        byte_offset: int | None = None,
+        num_bytes: int = 64 * 1024,
+    ) -> str:
+        """Read part of a text file without loading the whole file.
+
+        Use this to page through large logs or data files.
+
+        Args:
+            file_path (str): Path of the file to read.
+            start_line (int): 1-based line to start from. A negative value
+                reads the last abs(start_line) lines (tail).
+                (default: :obj:`1`)
+            num_lines (int): Number of lines to return, at most 2000.
+                Lines over 16 KB and windows over 256 KB are cut.
+                (default: :obj:`200`)
+            byte_offset (int | None): If set, read raw bytes from this
+                offset instead of lines. (default: :obj:`None`)
+            num_bytes (int): Number of bytes to read with byte_offset, at
+                most 262144. (default: :obj:`65536`)
+
+        Returns:
+            str: A header describing the window followed by its content,
+                with line numbers for line windows.
+        """
+        try:
+            path = self._resolve_filepath_for_read(file_path)
+            size = path.stat().st_size
+            if byte_offset is not None:
+                num_bytes = min(max(0, num_bytes), MAX_WINDOW_BYTES)
+                text = read_byte_window(path, byte_offset, num_bytes)
+                end = min(size, max(0, byte_offset) + num_bytes)
+                return f"[Bytes {max(0, byte_offset)}-{end} of {size}]\n{text}"
+
+            num_lines = min(max(1, num_lines), MAX_WINDOW_LINES)
+            if start_line < 0:
+                total_lines = count_lines(path)
+                lines = read_tail_lines(
+                    path,
+                    min(-start_line, num_lines),
+                    max_line_bytes=MAX_LINE_BYTES,
+                    max_bytes=MAX_WINDOW_BYTES,
+                )
+                first = total_lines - len(lines) + 1
+            else:
+                first = max(1, start_line)
+                lines = read_line_window(
+                    path,
+                    first,
+                    num_lines,
+                    max_line_bytes=MAX_LINE_BYTES,
+                    max_bytes=MAX_WINDOW_BYTES,
+                )
+            if not lines:
+                return f"[No lines from line {first} in {path}]"
+            last = first + len(lines) - 1
+            return (
+                f"[Lines {first}-{last} of {path} ({size} bytes)]\n"
+                f"{_number_lines(lines, first)}"
+            )
+        except Exception as e:
+            return f"Error reading file: {e}"
+
+    @listen_toolkit()
+    def grep_file(
+        self,
+        file_path: str,
+        pattern: str,
+        max_matches: int = 100,
+        ignore_case: bool = False,
+    ) -> str:
+        """Find lines matching a regular expression in a text file.
+
+        The file is scanned in place, so this is suitable for very large
+        files. Use read_file_range to look at the lines around a match.
+
+        Args:
+            file_path (str): Path of the file to search.
+            pattern (str): Regular expression to search for.
+            max_matches (int): Maximum number of matching lines to return.
+                (default: :obj:`100`)
+            ignore_case (bool): Whether matching is case-insensitive.
+                (default: :obj:`False`)
+
+        Returns:
+            str: Matching lines prefixed with their line numbers.
+        """
+        try:
+            path = self._resolve_filepath_for_read(file_path)
+            matches = grep_lines(path, pattern, max_matches, ignore_case)
+        except re.error as e:
+            return f"Error: invalid pattern {pattern!r}: {e}"
+        except Exception as e:
+            return f"Error reading file: {e}"
+
+        if not matches:
+            return f"No lines matching {pattern!r} in {path}"
+        header = f"[{len(matches)} matching lines in {path}"
+        if len(matches) >= max_matches:
+            header += f", stopped after {max_matches}"
+        lines = "\n".join(f"{n:>6}: {line}" for n, line in matches)
+        return f"{header}]\n{lines}"
+
     def read_file(
         self, file_paths: Union[str, List[str]]
     ) -> Union[str, Dict[str, str]]:
@@ -122,9 +284,11 @@ class FileToolkit(BaseFileToolkit, AbstractToolkit):
         
         Plain text files (.md, .markdown, .rst, .log, .txt) are read directly
         without using MarkItDownLoader to avoid format support issues.
+        Other formats go through the shared conversion cache, so unchanged
+        documents are only converted once.
+        Plain text files over 1 MB return a summary with the first and
+        last lines; use read_file_range or grep_file to inspect the rest.
         """
-        from camel.loaders.markitdown import MarkItDownLoader
-
         try:
             if isinstance(file_paths, str):
                 resolved_path = self._resolve_filepath_for_read(file_paths)
@@ -133,7 +297,7 @@ class FileToolkit(BaseFileToolkit, AbstractToolkit):
                 if ext in PLAIN_TEXT_EXTENSIONS:
                     return self._read_plain_text_file(resolved_path)
                 
-                result = MarkItDownLoader().convert_files(
+                result = get_conversion_cache().convert_files(
                     file_paths=[str(resolved_path)], parallel=False
                 )
                 return result.get(
@@ -155,7 +319,7 @@ class FileToolkit(BaseFileToolkit, AbstractToolkit):
                         remaining_originals.append(fp)
                 
                 if remaining_files:
-                    markitdown_results = MarkItDownLoader().convert_files(
+                    markitdown_results = get_conversion_cache().convert_files(
                         file_paths=remaining_files, parallel=True
                     )
                     for original, resolved in zip(remaining_originals, remaining_files):
@@ -166,3 +330,16 @@ class FileToolkit(BaseFileToolkit, AbstractToolkit):
                 return results
         except Exception as e:
             return f"Error reading file(s): {e}"
+
+    def get_tools(self) -> list[FunctionTool]:
+        return [
+            *super().get_tools(),
+            FunctionTool(self.read_file_range),
+            FunctionTool(self.grep_file),
+        ]
+
+
+def _number_lines(lines: list[str], first: int) -> str:
+    return "\n".join(
+        f"{n:>6}: {line}" for n, line in enumerate(lines, start=first)
+    )
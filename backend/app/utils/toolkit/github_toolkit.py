@@ -31,6 +31,9 @@ class GithubToolkit(BaseGithubToolkit, AbstractToolkit):
         access_token: str | None = None,
         timeout: float | None = None,
     ) -> None:
+        if access_token is None:
+            # CAMEL falls back to os.environ, which lacks the project .env
+            access_token = env("GITHUB_ACCESS_TOKEN")
         super().__init__(access_token, timeout)
         self.api_task_id = api_task_id
 
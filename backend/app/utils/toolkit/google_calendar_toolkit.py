@@ -67,9 +67,7 @@ class GoogleCalendarToolkit(BaseGoogleCalendarToolkit, AbstractToolkit):
         if os.path.exists(default_env_path):
             load_dotenv(dotenv_path=default_env_path, override=True)
 
-        if os.environ.get("GOOGLE_CLIENT_ID") and os.environ.get(
-            "GOOGLE_CLIENT_SECRET"
-        ):
+        if env("GOOGLE_CLIENT_ID") and env("GOOGLE_CLIENT_SECRET"):
             return cls(api_task_id).get_tools()
         else:
             return []
@@ -142,11 +140,11 @@ class GoogleCalendarToolkit(BaseGoogleCalendarToolkit, AbstractToolkit):
 
         # If no token file, try environment variables
         if not creds:
-            client_id = os.environ.get("GOOGLE_CLIENT_ID")
-            client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
-            refresh_token = os.environ.get("GOOGLE_REFRESH_TOKEN")
+            client_id = env("GOOGLE_CLIENT_ID")
+            client_secret = env("GOOGLE_CLIENT_SECRET")
+            refresh_token = env("GOOGLE_REFRESH_TOKEN")
             token_uri = (
-                os.environ.get("GOOGLE_TOKEN_URI")
+                env("GOOGLE_TOKEN_URI")
                 or "https://oauth2.googleapis.com/token"
             )
 
@@ -249,10 +247,10 @@ class GoogleCalendarToolkit(BaseGoogleCalendarToolkit, AbstractToolkit):
                 if os.path.exists(default_env_path):
                     load_dotenv(dotenv_path=default_env_path, override=True)
 
-                client_id = os.environ.get("GOOGLE_CLIENT_ID")
-                client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
+                client_id = env("GOOGLE_CLIENT_ID")
+                client_secret = env("GOOGLE_CLIENT_SECRET")
                 token_uri = (
-                    os.environ.get("GOOGLE_TOKEN_URI")
+                    env("GOOGLE_TOKEN_URI")
                     or "https://oauth2.googleapis.com/token"
                 )
 
@@ -32,6 +32,7 @@ from typing_extensions import TypedDict
 from app.component.environment import env
 from app.service.task import Agents
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
+from app.utils.log_utils import Truncated, log_sampled
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
 logger = logging.getLogger("hybrid_browser_toolkit")
@@ -248,7 +249,11 @@ class WebSocketBrowserWrapper(BaseWebSocketBrowserWrapper):
                     _global_tab_registry[tab_id] = session_id
                     self._session_tab_ids.add(tab_id)
                     logger.info(
-                        f"[Session Tab Tracking] Auto-tracked current tab: {tab_id}, session {session_id} now has tabs: {self._session_tab_ids}"
+                        "[Session Tab Tracking] Auto-tracked current tab: "
+                        "%s, session %s now has tabs: %s",
+                        tab_id,
+                        session_id,
+                        Truncated(self._session_tab_ids),
                     )
                 elif _global_tab_registry[tab_id] == session_id:
                     # Already owned by this session, ensure local tracking
@@ -260,8 +265,16 @@ class WebSocketBrowserWrapper(BaseWebSocketBrowserWrapper):
             for tab in all_tabs
             if tab.get("tab_id") in self._session_tab_ids
         ]
-        logger.info(
-            f"[Session Tab Filtering] Session {session_id}: Returning {len(filtered_tabs)}/{len(all_tabs)} tabs, tracked: {self._session_tab_ids}"
+        log_sampled(
+            logger,
+            logging.DEBUG,
+            "tab_filter",
+            "[Session Tab Filtering] Session %s: Returning %d/%d tabs, "
+            "tracked: %s",
+            session_id,
+            len(filtered_tabs),
+            len(all_tabs),
+            Truncated(self._session_tab_ids),
         )
 
         return filtered_tabs
@@ -17,6 +17,7 @@ from pathlib import Path
 from camel.toolkits import MarkItDownToolkit as BaseMarkItDownToolkit
 
 from app.service.task import Agents
+from app.utils.conversion_cache import get_conversion_cache
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
@@ -54,12 +55,8 @@ class MarkItDownToolkit(BaseMarkItDownToolkit, AbstractToolkit):
                 remaining_files.append(file_path)
 
         if remaining_files:
-            base_results = super().read_files(
-                remaining_files,
-                message_title,
-                message_description,
-                message_attachment,
+            results.update(
+                get_conversion_cache().convert_files(remaining_files)
             )
-            results.update(base_results)
 
         return results
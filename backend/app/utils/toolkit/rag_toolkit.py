@@ -13,19 +13,32 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import hashlib
+import json
 import logging
 import os
 from pathlib import Path
 
 from camel.embeddings import BaseEmbedding, OpenAIEmbedding
 from camel.retrievers import AutoRetriever, VectorRetriever
-from camel.storages import BaseVectorStorage, QdrantStorage
-from camel.toolkits import RetrievalToolkit
+from camel.storages import BaseVectorStorage, QdrantStorage, VectorDBQuery
 from camel.toolkits.function_tool import FunctionTool
 from camel.types import StorageType
 
 from app.component.environment import env
 from app.service.task import Agents
+from app.utils.bm25_index import (
+    BM25Index,
+    KeywordIndexedStorage,
+    payload_source,
+    reciprocal_rank_fusion,
+)
+from app.utils.embedding_cache import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    CachedEmbedding,
+    EmbeddingCache,
+)
+from app.utils.local_embedding import create_local_embedding
+from app.utils.numpy_vector_storage import NumpyVectorStorage
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
 logger = logging.getLogger("rag_toolkit")
@@ -35,7 +48,15 @@ DEFAULT_RAG_STORAGE_PATH = "~/.eigent/rag_storage"
 DEFAULT_COLLECTION_NAME = "default"
 RAW_TEXT_SUBDIR = "raw_text"
 DEFAULT_STORAGE_TYPE = StorageType.QDRANT
-DEFAULT_EMBEDDING_DIM = 1536  # OpenAI text-embedding-ada-002 dimension
+# In-process NumPy storage, not one of CAMEL's StorageType members
+NUMPY_STORAGE_TYPE = "numpy"
+OPENAI_EMBEDDING = "openai"
+LOCAL_EMBEDDING = "local"
+EMBEDDING_CACHE_FILE = "embedding_cache.sqlite3"
+INGEST_MANIFEST_FILE = "ingested_files.json"
+KEYWORD_INDEX_FILE = "keyword_index.sqlite3"
+# Each ranker contributes top_k * this many candidates to fusion
+HYBRID_CANDIDATE_MULTIPLIER = 4
 
 
 class RAGToolkit(AbstractToolkit):
@@ -44,6 +65,8 @@ class RAGToolkit(AbstractToolkit):
     This toolkit provides RAG functionality with configurable storage:
     - Raw text document support via add_document + query_knowledge_base
     - File/URL retrieval via information_retrieval
+    - Hybrid ranking: dense vector hits and BM25 keyword hits are merged
+      with reciprocal rank fusion
     - Configurable collection_name and storage_path for flexibility
 
     Task isolation and other application-specific concerns should be handled
@@ -59,9 +82,11 @@ class RAGToolkit(AbstractToolkit):
         agent_name: str | None = None,
         collection_name: str | None = None,
         storage_path: str | Path | None = None,
-        storage_type: StorageType | None = None,
-        embedding_model: BaseEmbedding | None = None,
+        storage_type: StorageType | str | None = None,
+        embedding_model: BaseEmbedding | str | None = None,
         vector_dim: int | None = None,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        vector_quantization: str | None = None,
     ):
         """Initialize RAGToolkit with configurable storage.
 
@@ -70,9 +95,17 @@ class RAGToolkit(AbstractToolkit):
             agent_name (str | None): Optional agent name override.
             collection_name (str | None): Name for the vector collection.
             storage_path (str | Path | None): Path for vector storage.
-            storage_type (StorageType | None): Vector storage type (default: QDRANT).
-            embedding_model (BaseEmbedding | None): Custom embedding model.
-            vector_dim (int | None): Embedding dimension (required if custom model).
+            storage_type (StorageType | str | None): Vector storage type,
+                or "numpy" for the in-process store. Defaults to
+                $RAG_STORAGE_TYPE, then QDRANT.
+            embedding_model (BaseEmbedding | str | None): Custom embedding
+                model, or "openai" / "local" (CPU). Defaults to
+                $RAG_EMBEDDING_MODEL, then "openai".
+            vector_dim (int | None): Embedding dimension (defaults to the
+                model's output dimension).
+            embed_batch_size (int): Max texts per embedding request.
+            vector_quantization (str | None): "int8" to quantize vectors in
+                the numpy store. Defaults to $RAG_VECTOR_QUANTIZATION.
         """
         self.api_task_id = api_task_id
         if agent_name is not None:
@@ -87,31 +120,68 @@ class RAGToolkit(AbstractToolkit):
         self._storage_path.mkdir(parents=True, exist_ok=True)
 
         self._collection_name = collection_name or DEFAULT_COLLECTION_NAME
-        self._storage_type = storage_type or DEFAULT_STORAGE_TYPE
-        self._custom_embedding_model = embedding_model
-        self._vector_dim = vector_dim or DEFAULT_EMBEDDING_DIM
+        self._storage_type = self._resolve_storage_type(
+            storage_type or env("RAG_STORAGE_TYPE") or DEFAULT_STORAGE_TYPE
+        )
+        self._custom_embedding_model = embedding_model or env(
+            "RAG_EMBEDDING_MODEL", OPENAI_EMBEDDING
+        )
+        self._vector_dim = vector_dim
+        self._embed_batch_size = embed_batch_size
+        self._vector_quantization = vector_quantization or env(
+            "RAG_VECTOR_QUANTIZATION"
+        )
+        self._file_storages: dict[str, BaseVectorStorage] = {}
+
+        # Embeddings are cached by (model, chunk hash) across tasks
+        self._cached_embedding = CachedEmbedding(
+            self._get_embedding_model,
+            EmbeddingCache(self._storage_path / EMBEDDING_CACHE_FILE),
+            batch_size=embed_batch_size,
+        )
+        # Keyword index mirrored from every vector collection
+        self._keyword_index = BM25Index(
+            self._storage_path / KEYWORD_INDEX_FILE
+        )
 
         # Initialize CAMEL's AutoRetriever with configured storage
         auto_retriever = AutoRetriever(
             vector_storage_local_path=str(self._storage_path),
-            storage_type=self._storage_type,
-        )
-
-        # Wrap CAMEL's RetrievalToolkit using composition (for file/URL retrieval)
-        self._retrieval_toolkit = RetrievalToolkit(
-            auto_retriever=auto_retriever
+            storage_type=(
+                DEFAULT_STORAGE_TYPE
+                if self._storage_type == NUMPY_STORAGE_TYPE
+                else self._storage_type
+            ),
+            embedding_model=self._cached_embedding,
         )
+        # Route AutoRetriever's per-file collections through
+        # _get_file_storage so they are keyword-indexed (and, for "numpy",
+        # stored in-process)
+        self._create_file_storage = auto_retriever._initialize_vector_storage
+        auto_retriever._initialize_vector_storage = self._get_file_storage
+        self._auto_retriever = auto_retriever
 
         # Lazy-initialized components for raw text support
         self._embedding_model = None
         self._vector_retriever = None
         self._storage = None
 
+    @staticmethod
+    def _resolve_storage_type(value: StorageType | str) -> StorageType | str:
+        if isinstance(value, StorageType) or value == NUMPY_STORAGE_TYPE:
+            return value
+        return StorageType(value)
+
     def _get_embedding_model(self):
         """Lazily initialize embedding model."""
         if self._embedding_model is None:
-            if self._custom_embedding_model is not None:
-                self._embedding_model = self._custom_embedding_model
+            model = self._custom_embedding_model
+            if not isinstance(model, str):
+                self._embedding_model = model
+            elif model == LOCAL_EMBEDDING:
+                self._embedding_model = create_local_embedding()
+            elif model != OPENAI_EMBEDDING:
+                raise ValueError(f"Unknown embedding model: {model}")
             else:
                 api_key = env("OPENAI_API_KEY")
                 if not api_key:
@@ -124,13 +194,21 @@ class RAGToolkit(AbstractToolkit):
     def _get_storage(self):
         """Lazily initialize vector storage for raw text."""
         if self._storage is None:
-            self._storage = self._create_storage(
-                vector_dim=self._vector_dim,
-                path=str(self._storage_path / RAW_TEXT_SUBDIR),
-                collection_name=self._collection_name,
+            self._storage = KeywordIndexedStorage(
+                self._create_storage(
+                    vector_dim=self._get_vector_dim(),
+                    path=str(self._storage_path / RAW_TEXT_SUBDIR),
+                    collection_name=self._collection_name,
+                ),
+                self._keyword_index,
+                self._raw_text_collection(),
             )
         return self._storage
 
+    def _raw_text_collection(self) -> str:
+        # Keeps raw text chunks apart from file collections in the index
+        return f"{RAW_TEXT_SUBDIR}/{self._collection_name}"
+
     def _create_storage(
         self, vector_dim: int, path: str, collection_name: str
     ) -> BaseVectorStorage:
@@ -141,17 +219,97 @@ class RAGToolkit(AbstractToolkit):
                 path=path,
                 collection_name=collection_name,
             )
+        if self._storage_type == NUMPY_STORAGE_TYPE:
+            return NumpyVectorStorage(
+                vector_dim=vector_dim,
+                path=path,
+                collection_name=collection_name,
+                quantize=self._vector_quantization,
+            )
         raise ValueError(f"Unsupported storage type: {self._storage_type}")
 
+    def _get_vector_dim(self) -> int:
+        return self._vector_dim or self._cached_embedding.get_output_dim()
+
+    def _get_file_storage(
+        self, collection_name: str | None = None
+    ) -> BaseVectorStorage:
+        """Return the (cached) storage for one file/URL collection."""
+        name = collection_name or DEFAULT_COLLECTION_NAME
+        if name not in self._file_storages:
+            if self._storage_type == NUMPY_STORAGE_TYPE:
+                storage = self._create_storage(
+                    vector_dim=self._get_vector_dim(),
+                    path=str(self._storage_path),
+                    collection_name=name,
+                )
+            else:
+                storage = self._create_file_storage(name)
+            self._file_storages[name] = KeywordIndexedStorage(
+                storage, self._keyword_index, name
+            )
+        return self._file_storages[name]
+
     def _get_vector_retriever(self) -> VectorRetriever:
         """Lazily initialize vector retriever for raw text."""
         if self._vector_retriever is None:
             self._vector_retriever = VectorRetriever(
-                embedding_model=self._get_embedding_model(),
+                embedding_model=self._cached_embedding,
                 storage=self._get_storage(),
             )
         return self._vector_retriever
 
+    def _manifest_path(self) -> Path:
+        return self._storage_path / INGEST_MANIFEST_FILE
+
+    def _load_manifest(self) -> dict[str, str]:
+        try:
+            with open(self._manifest_path(), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: dict[str, str]) -> None:
+        path = self._manifest_path()
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Failed to save ingest manifest: {e}")
+
+    def _invalidate_changed_files(self, contents: str | list[str]) -> None:
+        """Drop indexed collections whose local file changed since ingest.
+
+        AutoRetriever names a file's collection after its path and skips
+        ingestion whenever that collection has vectors, so unchanged files
+        are never re-embedded. A changed file would otherwise be served
+        from stale vectors; clearing its collection makes AutoRetriever
+        re-ingest it.
+        """
+        items = [contents] if isinstance(contents, str) else contents
+        manifest = self._load_manifest()
+        changed = False
+        for content in items:
+            if not isinstance(content, str) or not os.path.isfile(content):
+                continue
+            stat = os.stat(content)
+            fingerprint = f"{stat.st_size}:{stat.st_mtime_ns}"
+            name = self._auto_retriever._collection_name_generator(content)
+            previous = manifest.get(name)
+            if previous == fingerprint:
+                continue
+            if previous is not None:
+                logger.info(
+                    f"File changed since ingest, re-indexing: {content}"
+                )
+                self._auto_retriever._initialize_vector_storage(name).clear()
+            manifest[name] = fingerprint
+            changed = True
+        if changed:
+            self._save_manifest(manifest)
+
     def information_retrieval(
         self,
         query: str,
@@ -163,6 +321,8 @@ class RAGToolkit(AbstractToolkit):
 
         This method connects to a task-isolated vector storage and retrieves
         relevant information. Content is automatically indexed on first use.
+        Vector and keyword matches from the given contents are combined, so
+        exact terms are found even when their similarity is low.
 
         Args:
             query (str): The question or query for which an answer is required.
@@ -180,12 +340,37 @@ class RAGToolkit(AbstractToolkit):
             )
         """
         try:
-            result = self._retrieval_toolkit.information_retrieval(
+            self._invalidate_changed_files(contents)
+            candidates = top_k * HYBRID_CANDIDATE_MULTIPLIER
+            retrieved = self._auto_retriever.run_vector_retriever(
                 query=query,
                 contents=contents,
-                top_k=top_k,
+                top_k=candidates,
                 similarity_threshold=similarity_threshold,
+                return_detailed_info=True,
+            )
+            dense = retrieved.get("Retrieved Context", [])
+            # Items without a score are "nothing above threshold" notes
+            scored = sorted(
+                (item for item in dense if "similarity score" in item),
+                key=lambda item: float(item["similarity score"]),
+                reverse=True,
+            )
+            items = [contents] if isinstance(contents, str) else contents
+            keyword = self._keyword_index.search(
+                query,
+                candidates,
+                collections=[
+                    self._auto_retriever._collection_name_generator(item)
+                    for item in items
+                ],
             )
+            texts = reciprocal_rank_fusion(
+                [[item["text"] for item in scored], [h.text for h in keyword]]
+            )[:top_k]
+            if not texts:
+                texts = [item["text"] for item in dense][:top_k]
+            result = str({"Original Query": query, "Retrieved Context": texts})
             logger.info(
                 f"Retrieved information for query in collection {self._collection_name}"
             )
@@ -235,11 +420,16 @@ class RAGToolkit(AbstractToolkit):
             # Prepare metadata
             doc_metadata = metadata or {}
             doc_metadata["doc_id"] = doc_id
+            doc_metadata.setdefault("source", doc_id)
             doc_metadata["collection"] = self._collection_name
 
             # Get vector retriever and add content
             retriever = self._get_vector_retriever()
-            retriever.process(content=content, extra_info=doc_metadata)
+            retriever.process(
+                content=content,
+                extra_info=doc_metadata,
+                embed_batch=self._embed_batch_size,
+            )
 
             logger.info(
                 f"Added document {doc_id} to collection {self._collection_name}"
@@ -257,16 +447,22 @@ class RAGToolkit(AbstractToolkit):
         query: str,
         top_k: int = 5,
         similarity_threshold: float = 0.5,
+        source: str | None = None,
     ) -> str:
         """Query the knowledge base for relevant information from added documents.
 
         This queries documents previously added via add_document().
         For querying files/URLs, use information_retrieval() instead.
+        Vector and keyword matches are combined, so exact terms are found
+        even when their similarity is low.
 
         Args:
             query (str): The question or search query to find relevant documents.
             top_k (int): Maximum number of relevant chunks to return (default: 5).
-            similarity_threshold (float): Minimum similarity score (default: 0.5).
+            similarity_threshold (float): Minimum similarity score for
+                vector matches (default: 0.5).
+            source (str | None): Only search documents whose metadata
+                source (or doc_id, if no source was given) equals this.
 
         Returns:
             Retrieved relevant text chunks from the knowledge base,
@@ -279,24 +475,46 @@ class RAGToolkit(AbstractToolkit):
             if not query or not query.strip():
                 return "Error: Query cannot be empty"
 
-            retriever = self._get_vector_retriever()
-            results = retriever.query(
-                query=query,
-                top_k=top_k,
-                similarity_threshold=similarity_threshold,
+            storage = self._get_storage()
+            candidates = top_k * HYBRID_CANDIDATE_MULTIPLIER
+            # Both rankers filter by source before scoring
+            dense = storage.query(
+                VectorDBQuery(
+                    query_vector=self._cached_embedding.embed(query),
+                    top_k=candidates,
+                ),
+                filter_conditions=(
+                    {"extra_info.source": source} if source else None
+                ),
             )
+            keyword = self._keyword_index.search(
+                query,
+                candidates,
+                collections=[self._raw_text_collection()],
+                source=source,
+            )
+
+            chunks = {hit.id: (hit.text, hit.source) for hit in keyword}
+            dense_ids = []
+            for match in dense:
+                payload = match.record.payload
+                if match.similarity >= similarity_threshold and payload:
+                    chunks[match.record.id] = (
+                        str(payload.get("text", "")),
+                        payload_source(payload),
+                    )
+                    dense_ids.append(match.record.id)
+            results = reciprocal_rank_fusion(
+                [dense_ids, [hit.id for hit in keyword]]
+            )[:top_k]
 
             # Format results as a simple numbered list
             formatted_results = []
-            for i, result in enumerate(results, 1):
-                text = result.get("text", result.get("content", ""))
-                metadata = result.get("metadata", {})
-
+            for i, chunk_id in enumerate(results, 1):
+                text, chunk_source = chunks[chunk_id]
                 result_text = f"{i}. {text}"
-                if metadata:
-                    source = metadata.get("source", metadata.get("doc_id", ""))
-                    if source:
-                        result_text += f" (Source: {source})"
+                if chunk_source:
+                    result_text += f" (Source: {chunk_source})"
                 formatted_results.append(result_text)
 
             if not formatted_results:
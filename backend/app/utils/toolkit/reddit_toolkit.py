@@ -15,7 +15,7 @@
 from camel.toolkits import RedditToolkit as BaseRedditToolkit
 from camel.toolkits.function_tool import FunctionTool
 
-from app.component.environment import env
+from app.component.environment import env, env_snapshot, scoped_environ
 from app.service.task import Agents
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
@@ -32,7 +32,13 @@ class RedditToolkit(BaseRedditToolkit, AbstractToolkit):
         delay: float = 0,
         timeout: float | None = None,
     ):
-        super().__init__(retries, delay, timeout)
+        # CAMEL reads the credentials from os.environ, which lacks the
+        # project .env
+        credentials = env_snapshot(
+            "REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USER_AGENT"
+        )
+        with scoped_environ(credentials):
+            super().__init__(retries, delay, timeout)
         self.api_task_id = api_task_id
 
     @classmethod
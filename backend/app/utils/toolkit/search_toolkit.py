@@ -14,17 +14,21 @@
 
 import logging
 import os
+import threading
 from typing import Any
 
 import httpx
 from camel.toolkits import SearchToolkit as BaseSearchToolkit
 from camel.toolkits.function_tool import FunctionTool
 
-from app.component.environment import env, env_not_empty
+from app.component.environment import env_not_empty, env_snapshot
 from app.service.task import Agents
 from app.utils.listen.toolkit_listen import auto_listen_toolkit, listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
+# Serializes the temporary os.environ swap in search_google
+_google_environ_lock = threading.Lock()
+
 logger = logging.getLogger("search_toolkit")
 
 
@@ -60,8 +64,9 @@ class SearchToolkit(BaseSearchToolkit, AbstractToolkit):
 
         # Try to get user-specific configuration from thread-local environment
         # which is set by the middleware based on the user's project settings
-        google_api_key = env("GOOGLE_API_KEY")
-        search_engine_id = env("SEARCH_ENGINE_ID")
+        config = env_snapshot("GOOGLE_API_KEY", "SEARCH_ENGINE_ID")
+        google_api_key = config["GOOGLE_API_KEY"]
+        search_engine_id = config["SEARCH_ENGINE_ID"]
 
         if google_api_key and search_engine_id:
             self._user_google_api_key = google_api_key
@@ -115,27 +120,31 @@ class SearchToolkit(BaseSearchToolkit, AbstractToolkit):
         # If user has configured their own Google API keys, use them
         if self._user_google_api_key and self._user_search_engine_id:
             logger.info("Using user-configured Google Search API")
-            # Temporarily set environment variables for this search
-            old_google_key = os.environ.get("GOOGLE_API_KEY")
-            old_search_id = os.environ.get("SEARCH_ENGINE_ID")
-
-            try:
-                os.environ["GOOGLE_API_KEY"] = self._user_google_api_key
-                os.environ["SEARCH_ENGINE_ID"] = self._user_search_engine_id
-                return super().search_google(
-                    query, search_type, number_of_result_pages, start_page
-                )
-            finally:
-                # Restore original environment variables
-                if old_google_key is not None:
-                    os.environ["GOOGLE_API_KEY"] = old_google_key
-                elif "GOOGLE_API_KEY" in os.environ:
-                    del os.environ["GOOGLE_API_KEY"]
-
-                if old_search_id is not None:
-                    os.environ["SEARCH_ENGINE_ID"] = old_search_id
-                elif "SEARCH_ENGINE_ID" in os.environ:
-                    del os.environ["SEARCH_ENGINE_ID"]
+            # The base toolkit reads its keys from os.environ. Swap them in
+            # for this search only, one project at a time.
+            with _google_environ_lock:
+                old_google_key = os.environ.get("GOOGLE_API_KEY")
+                old_search_id = os.environ.get("SEARCH_ENGINE_ID")
+
+                try:
+                    os.environ["GOOGLE_API_KEY"] = self._user_google_api_key
+                    os.environ["SEARCH_ENGINE_ID"] = (
+                        self._user_search_engine_id
+                    )
+                    return super().search_google(
+                        query, search_type, number_of_result_pages, start_page
+                    )
+                finally:
+                    # Restore original environment variables
+                    if old_google_key is not None:
+                        os.environ["GOOGLE_API_KEY"] = old_google_key
+                    elif "GOOGLE_API_KEY" in os.environ:
+                        del os.environ["GOOGLE_API_KEY"]
+
+                    if old_search_id is not None:
+                        os.environ["SEARCH_ENGINE_ID"] = old_search_id
+                    elif "SEARCH_ENGINE_ID" in os.environ:
+                        del os.environ["SEARCH_ENGINE_ID"]
         else:
             # Fallback to cloud search
             logger.info(
@@ -378,9 +387,12 @@ class SearchToolkit(BaseSearchToolkit, AbstractToolkit):
         # if env("BRAVE_API_KEY"):
         #     tools.append(FunctionTool(search_toolkit.search_brave))
 
-        if (env("GOOGLE_API_KEY") and env("SEARCH_ENGINE_ID")) or env(
+        config = env_snapshot(
+            "GOOGLE_API_KEY", "SEARCH_ENGINE_ID", "cloud_api_key"
+        )
+        if (config["GOOGLE_API_KEY"] and config["SEARCH_ENGINE_ID"]) or config[
             "cloud_api_key"
-        ):
+        ]:
             tools.append(FunctionTool(search_toolkit.search_google))
 
         # if env("TAVILY_API_KEY"):
@@ -13,6 +13,7 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import logging
+from ssl import SSLContext
 
 from camel.toolkits import SlackToolkit as BaseSlackToolkit
 from camel.toolkits.function_tool import FunctionTool
@@ -32,6 +33,13 @@ class SlackToolkit(BaseSlackToolkit, AbstractToolkit):
     def __init__(self, api_task_id: str, timeout: float | None = None):
         super().__init__(timeout)
         self.api_task_id = api_task_id
+        # CAMEL falls back to os.environ, which lacks the project .env
+        self._slack_token = env("SLACK_BOT_TOKEN") or env("SLACK_USER_TOKEN")
+
+    def _login_slack(
+        self, slack_token: str | None = None, ssl: SSLContext | None = None
+    ):
+        return super()._login_slack(slack_token or self._slack_token, ssl)
 
     @classmethod
     def get_can_use_tools(cls, api_task_id: str) -> list[FunctionTool]:
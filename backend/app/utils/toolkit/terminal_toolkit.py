@@ -12,21 +12,27 @@
 # limitations under the License.
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
-import asyncio
+import itertools
 import logging
 import os
 import platform
+import re
+import shlex
 import shutil
-import subprocess
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections.abc import Hashable
 
 from camel.toolkits.terminal_toolkit import (
     TerminalToolkit as BaseTerminalToolkit,
 )
 from camel.toolkits.terminal_toolkit.terminal_toolkit import _to_plain
 
-from app.component.environment import env
+from app.component.environment import (
+    env,
+    get_project_env,
+    project_environ,
+)
 from app.service.task import (
     Action,
     ActionTerminalData,
@@ -35,7 +41,10 @@ from app.service.task import (
     process_task,
 )
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
+from app.utils.persistent_shell import PersistentShell
+from app.utils.terminal_output import TerminalOutputCoalescer
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
+from app.utils.venv_pool import clone_venv, get_venv_pool
 
 logger = logging.getLogger("terminal_toolkit")
 
@@ -43,6 +52,21 @@ logger = logging.getLogger("terminal_toolkit")
 # TODO: Consider getting this from a shared config
 APP_VERSION = "0.0.82"
 
+# Persistent shell used by shell_exec calls without an id
+DEFAULT_SHELL_ID = "default"
+
+# An escape sequence cut off at the end of an output chunk
+_PARTIAL_ESCAPE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*)?\Z")
+# CSI, OSC and two-character escape sequences
+_ANSI_ESCAPE = re.compile(
+    r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])"
+)
+
+
+def _strip_ansi(text: str) -> str:
+    # _to_plain leaves the text unchanged when rich is not installed
+    return _ANSI_ESCAPE.sub("", _to_plain(text))
+
 
 def get_terminal_base_venv_path() -> str:
     """Get the path to the terminal base venv created during app installation."""
@@ -57,8 +81,6 @@ def get_terminal_base_venv_path() -> str:
 @auto_listen_toolkit(BaseTerminalToolkit)
 class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
     agent_name: str = Agents.developer_agent
-    _thread_pool: ThreadPoolExecutor | None = None
-    _thread_local = threading.local()
 
     def __init__(
         self,
@@ -72,7 +94,16 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
         safe_mode: bool = True,
         allowed_commands: list[str] | None = None,
         clone_current_env: bool = True,
+        persistent_shell: bool | None = None,
     ):
+        """Initialize the terminal toolkit.
+
+        Args:
+            persistent_shell (bool | None): Run shell_exec calls without an
+                id in a long-lived shell whose state carries over between
+                calls. Defaults to $TERMINAL_PERSISTENT_SHELL (on). Not
+                available on Windows or with the Docker backend.
+        """
         self.api_task_id = api_task_id
         if agent_name is not None:
             self.agent_name = agent_name
@@ -85,6 +116,30 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
         if working_directory is None:
             working_directory = base_dir
         self._agent_venv_dir = os.path.join(base_dir, self.agent_name)
+        # Chatty commands write many tiny chunks; send them as frames
+        self._output = TerminalOutputCoalescer(self._emit_terminal_frame)
+
+        if persistent_shell is None:
+            persistent_shell = (
+                env("TERMINAL_PERSISTENT_SHELL", "true").lower() == "true"
+            )
+        self._persistent_shell = (
+            persistent_shell
+            and not use_docker_backend
+            and platform.system() != "Windows"
+        )
+        self._shells: dict[str, PersistentShell] = {}
+        # Offset of the output each session has already returned
+        self._shell_offsets: dict[str, int] = {}
+        # Process task that issued each session's current command
+        self._shell_tasks: dict[str, str] = {}
+        # Output held back per session until a split escape sequence ends
+        self._shell_partial: dict[str, str] = {}
+        self._shells_lock = threading.Lock()
+        self._background_ids = itertools.count(1)
+        self._shell_cwd = working_directory
+        # Shells may start on a worker thread outside the request context
+        self._project_env = get_project_env()
 
         logger.debug(
             f"Initializing TerminalToolkit for agent={self.agent_name}",
@@ -95,11 +150,6 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
             },
         )
 
-        if TerminalToolkit._thread_pool is None:
-            TerminalToolkit._thread_pool = ThreadPoolExecutor(
-                max_workers=1, thread_name_prefix="terminal_toolkit"
-            )
-
         super().__init__(
             timeout=timeout,
             working_directory=working_directory,
@@ -113,10 +163,10 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
         )
 
         # Auto-register with TaskLock for cleanup when task ends
-        from app.service.task import get_task_lock_if_exists
+        from app.service.task import TaskLock, get_task_lock_if_exists
 
         task_lock = get_task_lock_if_exists(api_task_id)
-        if task_lock:
+        if isinstance(task_lock, TaskLock):
             task_lock.register_toolkit(self)
             logger.info(
                 "TerminalToolkit registered for cleanup",
@@ -129,8 +179,9 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
     def _setup_cloned_environment(self):
         """Override to clone from terminal_base venv instead of current process venv.
 
-        Creates a lightweight clone using symlinks to the terminal_base venv,
-        which contains pre-installed packages (pandas, numpy, matplotlib, etc.).
+        Uses a lightweight clone of the terminal_base venv, which contains
+        pre-installed packages (pandas, numpy, matplotlib, etc.). A ready
+        clone is taken from the venv pool when one is available.
         """
         self.cloned_env_path = os.path.join(self._agent_venv_dir, ".venv")
         terminal_base_path = get_terminal_base_venv_path()
@@ -165,17 +216,15 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
             self.python_executable = cloned_python
             return
 
+        if get_venv_pool(terminal_base_path).acquire(self.cloned_env_path):
+            logger.info(f"Using pooled environment: {self.cloned_env_path}")
+            self.python_executable = cloned_python
+            return
+
         logger.info(f"Cloning terminal_base venv to: {self.cloned_env_path}")
 
         try:
-            # Create the cloned venv directory
-            os.makedirs(self.cloned_env_path, exist_ok=True)
-
-            # Clone using symlinks for efficiency
-            # We need to create proper venv structure with symlinks to terminal_base
-            self._clone_venv_with_symlinks(
-                terminal_base_path, self.cloned_env_path
-            )
+            clone_venv(terminal_base_path, self.cloned_env_path)
 
             self.python_executable = cloned_python
             logger.info(
@@ -198,87 +247,6 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
             return cloned_env_path
         return None
 
-    def _clone_venv_with_symlinks(self, source_venv: str, target_venv: str):
-        """Clone a venv using symlinks for efficiency.
-
-        Creates the structure needed: pyvenv.cfg, bin/python, lib symlink, and activate scripts.
-        """
-        is_windows = platform.system() == "Windows"
-
-        # Read source pyvenv.cfg to get Python home
-        source_cfg = os.path.join(source_venv, "pyvenv.cfg")
-        python_home = None
-
-        with open(source_cfg, encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("home = "):
-                    python_home = line.split("=", 1)[1].strip()
-                    break
-
-        if not python_home:
-            raise RuntimeError(
-                f"Could not determine Python home from {source_cfg}"
-            )
-
-        # Copy pyvenv.cfg (simpler than recreating)
-        shutil.copy2(source_cfg, os.path.join(target_venv, "pyvenv.cfg"))
-
-        if is_windows:
-            # Windows: copy executables from source
-            target_bin = os.path.join(target_venv, "Scripts")
-            os.makedirs(target_bin, exist_ok=True)
-            source_scripts = os.path.join(source_venv, "Scripts")
-            for exe in ["python.exe", "pythonw.exe"]:
-                src = os.path.join(source_scripts, exe)
-                if os.path.exists(src):
-                    shutil.copy2(src, os.path.join(target_bin, exe))
-            # Copy activate scripts (need to modify VIRTUAL_ENV path)
-            for script in ["activate.bat", "activate.ps1", "deactivate.bat"]:
-                src = os.path.join(source_scripts, script)
-                if os.path.exists(src):
-                    with open(src, encoding="utf-8") as f:
-                        content = f.read()
-                    content = content.replace(source_venv, target_venv)
-                    dst = os.path.join(target_bin, script)
-                    with open(dst, "w", encoding="utf-8") as f:
-                        f.write(content)
-            # Use directory junction for Lib (no admin rights needed, unlike symlink)
-            source_lib = os.path.join(source_venv, "Lib")
-            target_lib = os.path.join(target_venv, "Lib")
-            subprocess.run(
-                ["cmd", "/c", "mklink", "/J", target_lib, source_lib],
-                check=True,
-                capture_output=True,
-            )
-        else:
-            # Unix: symlink python executable and lib directory
-            target_bin = os.path.join(target_venv, "bin")
-            os.makedirs(target_bin, exist_ok=True)
-
-            # Symlink python to the base Python
-            python_exe = os.path.join(python_home, "python3")
-            if not os.path.exists(python_exe):
-                python_exe = os.path.join(python_home, "python")
-            os.symlink(python_exe, os.path.join(target_bin, "python"))
-            os.symlink("python", os.path.join(target_bin, "python3"))
-
-            # Copy activate scripts (need to modify VIRTUAL_ENV path)
-            source_bin = os.path.join(source_venv, "bin")
-            for script in ["activate", "activate.csh", "activate.fish"]:
-                src = os.path.join(source_bin, script)
-                if os.path.exists(src):
-                    with open(src) as f:
-                        content = f.read()
-                    # Replace source venv path with target venv path
-                    content = content.replace(source_venv, target_venv)
-                    dst = os.path.join(target_bin, script)
-                    with open(dst, "w") as f:
-                        f.write(content)
-
-            # Symlink lib directory
-            source_lib = os.path.join(source_venv, "lib")
-            os.symlink(source_lib, os.path.join(target_venv, "lib"))
-
     def _write_to_log(self, log_file: str, content: str) -> None:
         r"""Write content to log file with optional ANSI stripping.
 
@@ -296,59 +264,28 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
                 "content_length": len(content),
             },
         )
-        self._update_terminal_output(_to_plain(content))
+        self._update_terminal_output(_strip_ansi(content), log_file)
 
-    def _update_terminal_output(self, output: str):
-        task_lock = get_task_lock(self.api_task_id)
-        process_task_id = process_task.get("")
+    def _update_terminal_output(self, output: str, session: str = ""):
+        # Output is coalesced per (process task, log file) session
+        self._output.write((process_task.get(""), session), output)
 
-        # Create the coroutine
-        coro = task_lock.put_queue(
+    def _end_terminal_output(self, session: str) -> None:
+        # Drop the coalescer state of a log file whose session has ended
+        self._output.end_sessions(lambda key: key[1] == session)
+
+    def _emit_terminal_frame(self, key: Hashable, frame: str) -> bool:
+        process_task_id, _ = key
+        task_lock = get_task_lock(self.api_task_id)
+        # Safe from both the event loop and the flusher thread
+        return task_lock.put_queue_threadsafe(
             ActionTerminalData(
                 action=Action.terminal,
                 process_task_id=process_task_id,
-                data=output,
+                data=frame,
             )
         )
 
-        # Try to get the current event loop, if none exists, create a new one in a thread
-        try:
-            loop = asyncio.get_running_loop()
-            # If we're in an async context, schedule the coroutine
-            task = loop.create_task(coro)
-            if hasattr(task_lock, "add_background_task"):
-                task_lock.add_background_task(task)
-        except RuntimeError:
-            self._thread_pool.submit(self._run_coro_in_thread, coro, task_lock)
-
-    @staticmethod
-    def _run_coro_in_thread(coro, task_lock):
-        """
-        Execute coro in the thread pool, with each thread bound to a long-term event loop
-        """
-        if not hasattr(TerminalToolkit._thread_local, "loop"):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            TerminalToolkit._thread_local.loop = loop
-        else:
-            loop = TerminalToolkit._thread_local.loop
-
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            TerminalToolkit._thread_local.loop = loop
-
-        try:
-            task = loop.create_task(coro)
-            if hasattr(task_lock, "add_background_task"):
-                task_lock.add_background_task(task)
-            loop.run_until_complete(task)
-        except Exception as e:
-            logging.error(
-                f"Failed to execute coroutine in thread pool: {str(e)}",
-                exc_info=True,
-            )
-
     def shell_exec(
         self,
         command: str,
@@ -358,20 +295,31 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
     ) -> str:
         r"""Executes a shell command in blocking or non-blocking mode.
 
+        Without an id, blocking commands run in a persistent shell session
+        ("default"): the working directory, exported variables and the
+        activated environment carry over between calls. Without an id,
+        non-blocking commands each start in a new persistent session
+        (in the default session's current directory) so several can run in
+        parallel; poll them with shell_view(id). A background session is
+        closed once shell_view has returned the output of its finished
+        command.
+
         Args:
             command (str): The shell command to execute.
             id (str, optional): A unique identifier for the command's session.
-                If not provided, a unique ID will be automatically generated.
+                If provided, the command runs in a fresh process tracked
+                under this id.
             block (bool, optional): Determines the execution mode. Defaults to True.
             timeout (float, optional): Timeout in seconds for blocking mode. Defaults to 20.0.
 
         Returns:
             str: The output of the command execution.
         """
+        if id is None and self._persistent_shell:
+            return self._persistent_exec(command, block, timeout)
+
         # Auto-generate ID if not provided
         if id is None:
-            import time
-
             id = f"auto_{int(time.time() * 1000)}"
 
         result = super().shell_exec(
@@ -386,6 +334,229 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
 
         return result
 
+    def _get_shell(
+        self, id: str, command_input: bool = False
+    ) -> PersistentShell:
+        with self._shells_lock:
+            shell = self._shells.get(id)
+            if shell is not None and shell.alive:
+                return shell
+            default = self._shells.get(DEFAULT_SHELL_ID)
+            if default is not None:
+                self._shell_cwd = default.cwd
+            env_vars = project_environ(self._project_env)
+            env_vars["PYTHONUNBUFFERED"] = "1"
+            venv_path = self._get_venv_path()
+            init_script = None
+            if venv_path:
+                activate = os.path.join(venv_path, "bin", "activate")
+                init_script = f". {shlex.quote(activate)}"
+            log_file = self._shell_log_file(id)
+            shell = PersistentShell(
+                cwd=self._shell_cwd or self.working_dir,
+                env=env_vars,
+                init_script=init_script,
+                on_output=lambda text: self._on_shell_output(
+                    id, log_file, text
+                ),
+                command_input=command_input,
+            )
+            self._shells[id] = shell
+            self._shell_offsets[id] = shell.offset
+            return shell
+
+    def _shell_log_file(self, id: str) -> str:
+        return os.path.join(self.log_dir, f"session_{id}.log")
+
+    def _on_shell_output(self, id: str, log_file: str, text: str) -> None:
+        text = self._shell_partial.pop(id, "") + text
+        # Hold back an escape sequence split across chunks, so it is
+        # stripped as a whole instead of reaching the frontend as text
+        match = _PARTIAL_ESCAPE.search(text)
+        if match:
+            self._shell_partial[id] = text[match.start() :]
+            text = text[: match.start()]
+        if not text:
+            return
+        # Runs on the shell's reader thread, where process_task is unset
+        token = process_task.set(self._shell_tasks.get(id, ""))
+        try:
+            self._write_to_log(log_file, text)
+        finally:
+            process_task.reset(token)
+
+    def _forget_shell(self, id: str) -> None:
+        self._shell_offsets.pop(id, None)
+        self._shell_tasks.pop(id, None)
+        self._shell_partial.pop(id, None)
+
+    def _persistent_exec(
+        self, command: str, block: bool, timeout: float
+    ) -> str:
+        if self.safe_mode:
+            is_safe, message = self._sanitize_command(command)
+            if not is_safe:
+                return f"Error: {message}"
+            command = message
+
+        if not block:
+            id = f"bg_{next(self._background_ids)}"
+            shell = self._get_shell(id, command_input=True)
+            self._shell_tasks[id] = process_task.get("")
+            self._write_to_log(self._shell_log_file(id), f"> {command}\n")
+            shell.start(command)
+            return (
+                f"Command started in background session '{id}'.\n"
+                f"Use shell_view('{id}') to get new output, "
+                f"shell_write_to_process('{id}', input) to send it input "
+                f"and shell_kill_process('{id}') to stop it."
+            )
+
+        id = DEFAULT_SHELL_ID
+        shell = self._get_shell(id)
+        if shell.busy:
+            return (
+                f"Error: session '{id}' is still running a previous "
+                f"command. Use shell_view('{id}') to get its output or "
+                f"shell_kill_process('{id}') to stop it."
+            )
+        self._shell_tasks[id] = process_task.get("")
+        self._write_to_log(self._shell_log_file(id), f"> {command}\n")
+        try:
+            result = shell.run(command, timeout)
+        except RuntimeError as e:
+            return f"Error: {e}"
+        self._shell_offsets[id] = result.offset
+        output = _strip_ansi(result.output)
+        if result.exit_code is None:
+            return (
+                f"{output}\n"
+                f"Command did not complete within {timeout} seconds. It "
+                f"continues in session '{id}'.\n"
+                f"Use shell_view('{id}') to get new output and "
+                f"shell_kill_process('{id}') to stop it."
+            )
+        if result.exit_code != 0:
+            return f"{output}\n(exit code {result.exit_code})"
+        if output == "":
+            return "Command executed successfully (no output)."
+        return output
+
+    def shell_view(self, id: str) -> str:
+        r"""Retrieves new output from a non-blocking session.
+
+        This function returns only NEW output since the last call. It does NOT
+        wait or block - it returns immediately with whatever is available.
+
+        Args:
+            id (str): The unique session ID of the non-blocking process.
+
+        Returns:
+            str: New output if available, or a status message.
+        """
+        shell = self._shells.get(id)
+        if shell is None:
+            return super().shell_view(id)
+        # Check before reading so output of a just-finished command is kept
+        busy = shell.busy
+        output, self._shell_offsets[id] = shell.read(
+            self._shell_offsets.get(id, 0)
+        )
+        output = _strip_ansi(output)
+        if busy:
+            status = "[still running]"
+        elif id == DEFAULT_SHELL_ID:
+            status = f"[finished with exit code {shell.last_exit_code}]"
+        else:
+            # Background sessions run one command; once it has finished
+            # and its output is read, close the shell instead of keeping
+            # an idle bash process per call
+            exit_code = shell.last_exit_code
+            with self._shells_lock:
+                if self._shells.get(id) is shell:
+                    del self._shells[id]
+                    self._forget_shell(id)
+            shell.close()
+            self._end_terminal_output(self._shell_log_file(id))
+            status = f"[finished with exit code {exit_code}, session closed]"
+        return f"{output}\n{status}" if output else status
+
+    def shell_write_to_process(self, id: str, command: str) -> str:
+        r"""Sends input to a running non-blocking process and returns the
+        output it produces until it becomes idle again. A newline \n is
+        automatically appended to the input.
+
+        Args:
+            id (str): The unique session ID of the non-blocking process.
+            command (str): The text to write to the process's standard input.
+
+        Returns:
+            str: The output from the process after the input is sent.
+        """
+        shell = self._shells.get(id)
+        if shell is None:
+            return super().shell_write_to_process(id, command)
+        if not shell.busy:
+            return f"Error: session '{id}' is not running a command."
+        self._write_to_log(self._shell_log_file(id), f"> {command}\n")
+        try:
+            shell.write(f"{command}\n")
+        except RuntimeError as e:
+            return f"Error: {e}"
+        self._wait_until_idle(shell)
+        output, self._shell_offsets[id] = shell.read(
+            self._shell_offsets.get(id, 0)
+        )
+        output = _strip_ansi(output)
+        if output.strip():
+            return output
+        return f"Input sent to session '{id}' successfully (no output)."
+
+    def _wait_until_idle(
+        self,
+        shell: PersistentShell,
+        idle_duration: float = 0.5,
+        max_wait: float = 5.0,
+    ) -> None:
+        # Output has settled once the offset stops moving for idle_duration
+        deadline = time.monotonic() + max_wait
+        offset = shell.offset
+        idle_since = time.monotonic()
+        while shell.busy and time.monotonic() < deadline:
+            time.sleep(0.1)
+            if shell.offset != offset:
+                offset = shell.offset
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= idle_duration:
+                break
+
+    def shell_kill_process(self, id: str) -> str:
+        r"""This function forcibly terminates a running non-blocking process.
+
+        Args:
+            id (str): The unique session ID of the process to kill.
+
+        Returns:
+            str: A confirmation message indicating the process was terminated.
+        """
+        with self._shells_lock:
+            shell = self._shells.pop(id, None)
+            self._forget_shell(id)
+            if shell is not None and id == DEFAULT_SHELL_ID:
+                # A new default session starts where this one was
+                self._shell_cwd = shell.cwd
+        if shell is None:
+            with self._session_lock:
+                session = self.shell_sessions.get(id)
+                log_file = session.get("log_file") if session else None
+            result = super().shell_kill_process(id)
+            if log_file:
+                self._end_terminal_output(log_file)
+            return result
+        shell.close()
+        self._end_terminal_output(self._shell_log_file(id))
+        return f"Session '{id}' terminated."
+
     def cleanup(self, remove_venv: bool = True):
         """Clean up all active sessions and optionally remove the virtual environment.
 
@@ -395,17 +566,29 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
         """
         # First call parent cleanup to kill all shell sessions
         super().cleanup()
+        with self._shells_lock:
+            shells = list(self._shells.values())
+            self._shells.clear()
+        for shell in shells:
+            shell.close()
+        self._output.close()
+        logger.info(
+            "Terminal output stats",
+            extra={"api_task_id": self.api_task_id, **self._output.stats()},
+        )
 
         if not remove_venv:
             return
 
-        # Remove cloned env (.venv) if it exists
+        # Return cloned env (.venv) to the pool, or remove it
         cloned_env_path = getattr(self, "cloned_env_path", None)
         if cloned_env_path and os.path.exists(cloned_env_path):
             try:
-                shutil.rmtree(cloned_env_path)
+                get_venv_pool(get_terminal_base_venv_path()).release(
+                    cloned_env_path
+                )
                 logger.info(
-                    "Removed cloned venv",
+                    "Released cloned venv",
                     extra={
                         "api_task_id": self.api_task_id,
                         "path": cloned_env_path,
@@ -413,7 +596,7 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
                 )
             except Exception as e:
                 logger.warning(
-                    "Failed to remove cloned venv",
+                    "Failed to release cloned venv",
                     extra={
                         "api_task_id": self.api_task_id,
                         "path": cloned_env_path,
@@ -442,9 +625,3 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
                         "error": str(e),
                     },
                 )
-
-    @classmethod
-    def shutdown(cls):
-        if cls._thread_pool:
-            cls._thread_pool.shutdown(wait=True)
-            cls._thread_pool = None
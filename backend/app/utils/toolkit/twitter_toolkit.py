@@ -21,7 +21,7 @@ from camel.toolkits.twitter_toolkit import (
     get_user_by_username,
 )
 
-from app.component.environment import env
+from app.component.environment import env, env_snapshot, scoped_environ
 from app.service.task import Agents
 from app.utils.listen.toolkit_listen import auto_listen_toolkit, listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
@@ -34,6 +34,14 @@ class TwitterToolkit(BaseTwitterToolkit, AbstractToolkit):
     def __init__(self, api_task_id: str, timeout: float | None = None):
         super().__init__(timeout)
         self.api_task_id = api_task_id
+        # CAMEL's tweet functions read os.environ, which lacks the project
+        # .env, so the credentials are exposed there around each call
+        self._credentials = env_snapshot(
+            "TWITTER_CONSUMER_KEY",
+            "TWITTER_CONSUMER_SECRET",
+            "TWITTER_ACCESS_TOKEN",
+            "TWITTER_ACCESS_TOKEN_SECRET",
+        )
 
     @listen_toolkit(
         create_tweet,
@@ -48,30 +56,34 @@ class TwitterToolkit(BaseTwitterToolkit, AbstractToolkit):
         poll_duration_minutes: int | None = None,
         quote_tweet_id: int | str | None = None,
     ) -> str:
-        return create_tweet(
-            text, poll_options, poll_duration_minutes, quote_tweet_id
-        )
+        with scoped_environ(self._credentials):
+            return create_tweet(
+                text, poll_options, poll_duration_minutes, quote_tweet_id
+            )
 
     @listen_toolkit(
         delete_tweet,
         lambda _, tweet_id: f"delete tweet with id: {tweet_id}",
     )
     def delete_tweet(self, tweet_id: str) -> str:
-        return delete_tweet(tweet_id)
+        with scoped_environ(self._credentials):
+            return delete_tweet(tweet_id)
 
     @listen_toolkit(
         get_user_by_username,
         lambda _: "get my user profile",
     )
     def get_my_user_profile(self) -> str:
-        return get_my_user_profile()
+        with scoped_environ(self._credentials):
+            return get_my_user_profile()
 
     @listen_toolkit(
         get_user_by_username,
         lambda _, username: f"get user by username: {username}",
     )
     def get_user_by_username(self, username: str) -> str:
-        return get_user_by_username(username)
+        with scoped_environ(self._credentials):
+            return get_user_by_username(username)
 
     def get_tools(self) -> list[FunctionTool]:
         return [
@@ -0,0 +1,397 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Pool of pre-cloned virtual environments for terminal agents."""
+
+import glob
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+
+from app.component.environment import env
+
+logger = logging.getLogger("venv_pool")
+
+DEFAULT_POOL_SIZE = 2
+# Marks a venv created by clone_venv, safe to reset and reuse
+CLONE_MARKER = ".eigent-venv-clone"
+BASE_PTH = "_eigent_base.pth"
+# Unfinished clones older than this are left over from a dead process
+STALE_BUILD_SECONDS = 600
+
+_ACTIVATE_SCRIPTS = {
+    True: ["activate.bat", "activate.ps1", "deactivate.bat"],
+    False: ["activate", "activate.csh", "activate.fish"],
+}
+
+
+def _is_windows() -> bool:
+    return platform.system() == "Windows"
+
+
+def _bin_dir(venv: str) -> str:
+    return os.path.join(venv, "Scripts" if _is_windows() else "bin")
+
+
+def venv_python(venv: str) -> str:
+    if _is_windows():
+        return os.path.join(venv, "Scripts", "python.exe")
+    return os.path.join(venv, "bin", "python")
+
+
+def _site_packages(venv: str) -> str | None:
+    if _is_windows():
+        path = os.path.join(venv, "Lib", "site-packages")
+        return path if os.path.isdir(path) else None
+    matches = sorted(
+        glob.glob(os.path.join(venv, "lib", "python3*", "site-packages"))
+    )
+    return matches[0] if matches else None
+
+
+def _rewrite_activate_scripts(venv: str, old: str, new: str) -> None:
+    """Point the activate scripts of venv at a new location."""
+    bin_dir = _bin_dir(venv)
+    for script in _ACTIVATE_SCRIPTS[_is_windows()]:
+        path = os.path.join(bin_dir, script)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content.replace(old, new))
+
+
+def _write_base_pth(site_packages: str, base_site_packages: str) -> None:
+    # addsitedir (unlike a bare path) also processes the base's .pth files
+    with open(
+        os.path.join(site_packages, BASE_PTH), "w", encoding="utf-8"
+    ) as f:
+        f.write(f"import site; site.addsitedir({base_site_packages!r})\n")
+
+
+def clone_venv(source_venv: str, target_venv: str) -> None:
+    """Create a lightweight clone of source_venv at target_venv.
+
+    The clone gets its own pyvenv.cfg, interpreter link and activate
+    scripts, plus an empty site-packages that chains to the source's via
+    a .pth file. Packages installed in the clone stay in the clone and
+    shadow the shared ones (copy-on-write); the source is never modified.
+    """
+    is_windows = _is_windows()
+
+    # Read source pyvenv.cfg to get Python home
+    source_cfg = os.path.join(source_venv, "pyvenv.cfg")
+    python_home = None
+
+    with open(source_cfg, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("home = "):
+                python_home = line.split("=", 1)[1].strip()
+                break
+
+    if not python_home:
+        raise RuntimeError(
+            f"Could not determine Python home from {source_cfg}"
+        )
+    base_site_packages = _site_packages(source_venv)
+    if base_site_packages is None:
+        raise RuntimeError(f"No site-packages found in {source_venv}")
+
+    os.makedirs(target_venv, exist_ok=True)
+    # Copy pyvenv.cfg (simpler than recreating)
+    shutil.copy2(source_cfg, os.path.join(target_venv, "pyvenv.cfg"))
+
+    target_bin = _bin_dir(target_venv)
+    os.makedirs(target_bin, exist_ok=True)
+    if is_windows:
+        # Windows: copy executables from source
+        source_scripts = os.path.join(source_venv, "Scripts")
+        for exe in ["python.exe", "pythonw.exe"]:
+            src = os.path.join(source_scripts, exe)
+            if os.path.exists(src):
+                shutil.copy2(src, os.path.join(target_bin, exe))
+    else:
+        # Unix: symlink python to the base Python
+        python_exe = os.path.join(python_home, "python3")
+        if not os.path.exists(python_exe):
+            python_exe = os.path.join(python_home, "python")
+        os.symlink(python_exe, os.path.join(target_bin, "python"))
+        os.symlink("python", os.path.join(target_bin, "python3"))
+
+    # Copy activate scripts (need to modify VIRTUAL_ENV path)
+    source_bin = _bin_dir(source_venv)
+    for script in _ACTIVATE_SCRIPTS[is_windows]:
+        src = os.path.join(source_bin, script)
+        if os.path.exists(src):
+            shutil.copy2(src, os.path.join(target_bin, script))
+    _rewrite_activate_scripts(target_venv, source_venv, target_venv)
+
+    site_packages = os.path.join(
+        target_venv, os.path.relpath(base_site_packages, source_venv)
+    )
+    os.makedirs(site_packages, exist_ok=True)
+    _write_base_pth(site_packages, base_site_packages)
+
+    open(os.path.join(target_venv, CLONE_MARKER), "w").close()
+
+
+def _reset_clone(venv: str) -> None:
+    """Drop everything installed into a clone since it was created."""
+    site_packages = _site_packages(venv)
+    if site_packages is None:
+        raise RuntimeError(f"No site-packages found in {venv}")
+    with open(os.path.join(site_packages, BASE_PTH), encoding="utf-8") as f:
+        base_pth = f.read()
+    shutil.rmtree(site_packages)
+    os.makedirs(site_packages)
+    with open(
+        os.path.join(site_packages, BASE_PTH), "w", encoding="utf-8"
+    ) as f:
+        f.write(base_pth)
+
+    keep_bin = {"python", "python3", "python.exe", "pythonw.exe"}
+    keep_bin.update(_ACTIVATE_SCRIPTS[_is_windows()])
+    bin_dir = _bin_dir(venv)
+    for name in os.listdir(bin_dir):
+        if name not in keep_bin:
+            _remove(os.path.join(bin_dir, name))
+
+    keep_top = {
+        "pyvenv.cfg",
+        CLONE_MARKER,
+        os.path.basename(bin_dir),
+        os.path.relpath(site_packages, venv).split(os.sep)[0],
+    }
+    for name in os.listdir(venv):
+        if name not in keep_top:
+            _remove(os.path.join(venv, name))
+
+
+def _remove(path: str) -> None:
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def remove_venv(path: str) -> None:
+    """Delete a venv directory, including a Windows Lib junction."""
+    if _is_windows():
+        # Old-style clones link Lib to the base; unlink it first so the
+        # base's packages are not deleted through the junction
+        lib = os.path.join(path, "Lib")
+        if os.path.isdir(lib) and not os.path.exists(
+            os.path.join(path, CLONE_MARKER)
+        ):
+            subprocess.run(
+                ["cmd", "/c", "rmdir", lib], check=False, capture_output=True
+            )
+    shutil.rmtree(path)
+
+
+class VenvPool:
+    """Pre-cloned venvs of one base venv, kept ready on disk.
+
+    ``acquire`` moves a ready clone into place with a rename, so agents
+    get an environment without waiting for a clone. Clones returned with
+    ``release`` are reset (agent-installed packages removed) and reused.
+    A background thread replenishes the pool to ``size`` ready clones;
+    it only runs while there is work and exits when the pool is full.
+
+    Layout under pool_dir: ``building/`` for clones in progress,
+    ``returned/`` for clones waiting to be reset, and ``ready/``.
+
+    Args:
+        base_venv (str): Venv that clones chain to.
+        pool_dir (str): Directory holding the pool. It must be on the
+            same filesystem as the agents' venvs for renames to work.
+        size (int): Number of ready clones to keep; 0 disables pooling.
+    """
+
+    def __init__(self, base_venv: str, pool_dir: str, size: int) -> None:
+        self.base_venv = base_venv
+        self.pool_dir = pool_dir
+        self.size = size
+        self._ready_dir = os.path.join(pool_dir, "ready")
+        self._returned_dir = os.path.join(pool_dir, "returned")
+        self._building_dir = os.path.join(pool_dir, "building")
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        for path in (self._ready_dir, self._returned_dir, self._building_dir):
+            os.makedirs(path, exist_ok=True)
+        self._remove_stale_builds()
+
+    def _remove_stale_builds(self) -> None:
+        cutoff = time.time() - STALE_BUILD_SECONDS
+        for name in os.listdir(self._building_dir):
+            path = os.path.join(self._building_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                pass
+
+    def _ready(self) -> list[str]:
+        try:
+            return sorted(os.listdir(self._ready_dir))
+        except OSError:
+            return []
+
+    @property
+    def ready_count(self) -> int:
+        return len(self._ready())
+
+    def acquire(self, target_venv: str) -> bool:
+        """Move a ready clone to target_venv.
+
+        Returns:
+            bool: False if no clone was available (or it could not be
+                moved); the caller should clone directly.
+        """
+        if self.size <= 0:
+            return False
+        acquired = False
+        os.makedirs(os.path.dirname(target_venv), exist_ok=True)
+        for name in self._ready():
+            source = os.path.join(self._ready_dir, name)
+            try:
+                os.rename(source, target_venv)
+            except FileNotFoundError:
+                # Taken by another process
+                continue
+            except OSError as e:
+                logger.info(f"Cannot move pooled venv to {target_venv}: {e}")
+                break
+            _rewrite_activate_scripts(target_venv, source, target_venv)
+            acquired = True
+            break
+        self.replenish()
+        return acquired
+
+    def release(self, venv: str) -> None:
+        """Hand a clone back for reset and reuse, or delete it."""
+        if self.size <= 0 or not os.path.exists(
+            os.path.join(venv, CLONE_MARKER)
+        ):
+            remove_venv(venv)
+            return
+        target = os.path.join(self._returned_dir, uuid.uuid4().hex)
+        try:
+            os.rename(venv, target)
+        except OSError:
+            remove_venv(venv)
+            return
+        _rewrite_activate_scripts(target, venv, target)
+        self.replenish()
+
+    def replenish(self) -> None:
+        """Start the background worker if it is not running."""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="venv-pool", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                if self._step():
+                    continue
+                # Recheck under the lock so work queued while this thread
+                # was finishing is not missed by replenish()
+                with self._lock:
+                    if not self._has_work():
+                        self._worker = None
+                        return
+        except Exception as e:
+            logger.warning(f"Venv pool replenishment failed: {e}")
+            with self._lock:
+                self._worker = None
+
+    def _has_work(self) -> bool:
+        return bool(os.listdir(self._returned_dir)) or (
+            self.ready_count < self.size
+        )
+
+    def _step(self) -> bool:
+        """Do one unit of pool work; return False when there is none."""
+        returned = sorted(os.listdir(self._returned_dir))
+        if returned:
+            path = os.path.join(self._returned_dir, returned[0])
+            if self.ready_count >= self.size:
+                shutil.rmtree(path, ignore_errors=True)
+                return True
+            try:
+                _reset_clone(path)
+            except Exception as e:
+                logger.info(f"Discarding venv that failed to reset: {e}")
+                shutil.rmtree(path, ignore_errors=True)
+                return True
+            self._publish(path)
+            return True
+        if self.ready_count >= self.size:
+            return False
+        path = os.path.join(self._building_dir, uuid.uuid4().hex)
+        try:
+            clone_venv(self.base_venv, path)
+        except Exception:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        self._publish(path)
+        return True
+
+    def _publish(self, path: str) -> None:
+        target = os.path.join(self._ready_dir, os.path.basename(path))
+        os.rename(path, target)
+        _rewrite_activate_scripts(target, path, target)
+
+    def wait_idle(self, timeout: float | None = None) -> None:
+        """Block until the background worker has finished (for tests)."""
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+
+_pools: dict[str, VenvPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_venv_pool(base_venv: str) -> VenvPool:
+    """Return the process-wide pool for base_venv.
+
+    The pool lives next to the base venv and its size comes from
+    $TERMINAL_VENV_POOL_SIZE (default 2, 0 disables pooling).
+    """
+    with _pools_lock:
+        pool = _pools.get(base_venv)
+        if pool is None:
+            size = int(env("TERMINAL_VENV_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+            pool_dir = os.path.join(
+                os.path.dirname(base_venv),
+                "pool",
+                os.path.basename(base_venv),
+            )
+            pool = VenvPool(base_venv, pool_dir, size)
+            _pools[base_venv] = pool
+        return pool
@@ -14,15 +14,15 @@
 
 import asyncio
 import logging
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, Generator
 
 from camel.agents import ChatAgent
+from camel.agents.chat_agent import AsyncStreamingChatAgentResponse
+from camel.messages import BaseMessage
 from camel.societies.workforce.base import BaseNode
 from camel.societies.workforce.events import (
-    TaskAssignedEvent,
-    TaskCompletedEvent,
     TaskCreatedEvent,
-    TaskFailedEvent,
     WorkerCreatedEvent,
 )
 from camel.societies.workforce.prompts import TASK_DECOMPOSE_PROMPT
@@ -37,8 +37,14 @@ from camel.societies.workforce.workforce import (
     Workforce as BaseWorkforce,
     WorkforceState,
 )
+from camel.societies.workforce.workforce_callback import WorkforceCallback
 from camel.societies.workforce.workforce_metrics import WorkforceMetrics
-from camel.tasks.task import Task, TaskState, validate_task_content
+from camel.tasks.task import (
+    Task,
+    TaskState,
+    parse_response,
+    validate_task_content,
+)
 
 from app.agent.listen_chat_agent import ListenChatAgent
 from app.component import code
@@ -49,10 +55,13 @@ from app.service.task import (
     ActionEndData,
     ActionTaskStateData,
     ActionTimeoutData,
+    TaskTreeIndex,
     get_camel_task,
     get_task_lock,
 )
+from app.utils.dependency_context import DependencyContextCache
 from app.utils.single_agent_worker import SingleAgentWorker
+from app.utils.task_scheduler import TaskScheduler
 from app.utils.telemetry.workforce_metrics import WorkforceMetricsCallback
 
 logger = logging.getLogger("workforce")
@@ -70,6 +79,8 @@ class Workforce(BaseWorkforce):
         graceful_shutdown_timeout: float = 3,
         share_memory: bool = False,
         use_structured_output_handler: bool = True,
+        worker_concurrency: dict[str, int] | None = None,
+        callbacks: list[WorkforceCallback] | None = None,
     ) -> None:
         self.api_task_id = api_task_id
         logger.info("=" * 80)
@@ -83,6 +94,14 @@ class Workforce(BaseWorkforce):
             f"{graceful_shutdown_timeout}, share_memory={share_memory}"
         )
         logger.info("=" * 80)
+        self._task_tree = TaskTreeIndex()
+        self._scheduler = TaskScheduler(worker_concurrency)
+        # Shared by this workforce's workers: dependency results are
+        # summarized once and reused across dependent subtask prompts
+        self._dependency_context = DependencyContextCache()
+        # True while _post_ready_tasks dispatches; only those posts are
+        # subject to worker concurrency limits (retries bypass them)
+        self._dispatching = False
         super().__init__(
             description=description,
             children=children,
@@ -92,6 +111,9 @@ class Workforce(BaseWorkforce):
             graceful_shutdown_timeout=graceful_shutdown_timeout,
             share_memory=share_memory,
             use_structured_output_handler=use_structured_output_handler,
+            # CAMEL adds its unbounded WorkforceLogger unless a metrics
+            # callback is passed here
+            callbacks=callbacks,
             task_timeout_seconds=3600,  # 60 minutes
             failure_handling_config=FailureHandlingConfig(
                 enabled_strategies=["retry", "replan"],
@@ -161,7 +183,7 @@ class Workforce(BaseWorkforce):
             )
             raise
 
-    def eigent_make_sub_tasks(
+    async def eigent_make_sub_tasks(
         self,
         task: Task,
         coordinator_context: str = "",
@@ -171,6 +193,10 @@ class Workforce(BaseWorkforce):
         """Split process_task method to eigent_make_sub_tasks
         and eigent_start method.
 
+        Decomposition runs on the caller's event loop, so streaming
+        callbacks are invoked on that loop and cancelling the awaiting
+        task cancels the underlying model request.
+
         Args:
             task: The main task to decompose
             coordinator_context: Optional context ONLY for coordinator
@@ -205,14 +231,12 @@ class Workforce(BaseWorkforce):
         self.set_channel(TaskChannel())
         self._state = WorkforceState.RUNNING
         task.state = TaskState.OPEN
-        subtasks = asyncio.run(
-            self.handle_decompose_append_task(
-                task,
-                reset=False,
-                coordinator_context=coordinator_context,
-                on_stream_batch=on_stream_batch,
-                on_stream_text=on_stream_text,
-            )
+        subtasks = await self.handle_decompose_append_task(
+            task,
+            reset=False,
+            coordinator_context=coordinator_context,
+            on_stream_batch=on_stream_batch,
+            on_stream_text=on_stream_text,
         )
 
         logger.info(
@@ -239,6 +263,7 @@ class Workforce(BaseWorkforce):
         self._pending_tasks.clear()
 
         self._pending_tasks.extendleft(reversed(subtasks))
+        self._index_subtasks(subtasks)
         self.save_snapshot("Initial task decomposition")
 
         try:
@@ -254,6 +279,83 @@ class Workforce(BaseWorkforce):
         finally:
             if self._state != WorkforceState.STOPPED:
                 self._state = WorkforceState.IDLE
+            logger.info(
+                "[WF] Dependency context: %s",
+                self._dependency_context.stats(),
+                extra={"api_task_id": self.api_task_id},
+            )
+
+    def reset(self) -> None:
+        super().reset()
+        self._task_tree.clear()
+        self._scheduler.reset()
+        self._dependency_context.clear()
+
+    def _initialize_callbacks(
+        self, callbacks: list[WorkforceCallback] | None
+    ) -> None:
+        super()._initialize_callbacks(callbacks)
+        self._resolve_metrics_callbacks()
+
+    def register_callback(
+        self, callback: WorkforceCallback | WorkforceMetrics
+    ) -> None:
+        """Register a callback after construction.
+
+        Use this instead of appending to :obj:`_callbacks` directly so the
+        cached metrics callbacks stay in sync.
+
+        Args:
+            callback: The callback to register.
+        """
+        self._callbacks.append(callback)
+        self._resolve_metrics_callbacks()
+
+    def _resolve_metrics_callbacks(self) -> None:
+        """Cache the metrics callbacks so event handlers don't re-filter
+        :obj:`_callbacks` on every event.
+
+        :obj:`_metrics_callback` is the primary metrics sink (the first
+        :obj:`WorkforceMetrics`), :obj:`_metrics_index` is the first
+        :obj:`WorkforceMetricsCallback`, whose per-task indexes are used
+        for failure lookups.
+        """
+        self._metrics_callback: WorkforceMetrics | None = next(
+            (cb for cb in self._callbacks if isinstance(cb, WorkforceMetrics)),
+            None,
+        )
+        self._metrics_index: WorkforceMetricsCallback | None = next(
+            (
+                cb
+                for cb in self._callbacks
+                if isinstance(cb, WorkforceMetricsCallback)
+            ),
+            None,
+        )
+
+    def _index_subtasks(self, subtasks: list[Task]) -> None:
+        """Refresh the task tree index for ``subtasks``.
+
+        The parents' children are re-synced from :obj:`parent.subtasks`
+        (which may have been edited by the user), then the given subtasks
+        are registered as the executing nodes for their ids.
+        """
+        parents = {
+            id(subtask.parent): subtask.parent
+            for subtask in subtasks
+            if subtask.parent is not None
+        }
+        for parent in parents.values():
+            self._task_tree.set_children(parent, parent.subtasks)
+        for subtask in subtasks:
+            self._task_tree.add(subtask)
+
+    def _update_dependencies_for_decomposition(
+        self, original_task: Task, subtasks: list[Task]
+    ) -> None:
+        super()._update_dependencies_for_decomposition(original_task, subtasks)
+        for subtask in subtasks:
+            self._task_tree.add(subtask, original_task)
 
     def _decompose_task(self, task: Task, stream_callback=None):
         """Decompose task with optional streaming text callback."""
@@ -289,6 +391,100 @@ class Workforce(BaseWorkforce):
                 self._update_dependencies_for_decomposition(task, subtasks)
             return subtasks
 
+    async def _adecompose_task(self, task: Task, stream_callback=None):
+        """Async counterpart of :meth:`_decompose_task`.
+
+        Steps the task agent with ``astep`` instead of the blocking
+        :meth:`Task.decompose`, so the request shares the running loop's
+        model client and can be cancelled with the awaiting task.
+
+        Returns:
+            list[Task] | AsyncGenerator[list[Task], None]: The subtasks,
+                or an async generator yielding batches of new subtasks
+                when the task agent streams.
+        """
+        decompose_prompt = str(
+            TASK_DECOMPOSE_PROMPT.format(
+                content=task.content,
+                child_nodes_info=self._get_child_nodes_info(),
+                additional_info=task.additional_info,
+            )
+        )
+
+        self.task_agent.reset()
+        msg = BaseMessage.make_user_message(
+            role_name=self.task_agent.role_name, content=decompose_prompt
+        )
+        started_at = time.perf_counter()
+        response = await self.task_agent.astep(msg)
+
+        if isinstance(response, AsyncStreamingChatAgentResponse):
+            return self._astream_decomposition(
+                task, response, started_at, stream_callback
+            )
+
+        logger.debug(
+            f"[DECOMPOSE] Response received after "
+            f"{(time.perf_counter() - started_at) * 1000:.1f}ms"
+        )
+        subtasks = task._decompose_non_streaming(response, parse_response)
+        if subtasks:
+            self._update_dependencies_for_decomposition(task, subtasks)
+        return subtasks
+
+    async def _astream_decomposition(
+        self,
+        task: Task,
+        response: AsyncStreamingChatAgentResponse,
+        started_at: float,
+        stream_callback=None,
+    ) -> AsyncGenerator[list[Task], None]:
+        """Parse subtasks from a streaming decomposition response.
+
+        Mirrors :meth:`Task._decompose_streaming`: yields newly parsed
+        subtasks as complete ``<task>`` blocks arrive and stores the
+        final parse on :obj:`task.subtasks`.
+        """
+        accumulated_content = ""
+        yielded_count = 0
+        all_subtasks: list[Task] = []
+        first_chunk = True
+
+        async for chunk in response:
+            if first_chunk:
+                first_chunk = False
+                logger.debug(
+                    f"[DECOMPOSE] First chunk received after "
+                    f"{(time.perf_counter() - started_at) * 1000:.1f}ms"
+                )
+            accumulated_content = chunk.msg.content if chunk.msg else ""
+            if stream_callback:
+                try:
+                    stream_callback(chunk)
+                except Exception as e:
+                    logger.warning(f"Streaming text callback failed: {e}")
+
+            try:
+                current_tasks = task._parse_partial_tasks(accumulated_content)
+            except Exception:
+                continue
+
+            if len(current_tasks) > yielded_count:
+                new_tasks = current_tasks[yielded_count:]
+                for new_task in new_tasks:
+                    new_task.additional_info = task.additional_info
+                    new_task.parent = task
+                yielded_count = len(current_tasks)
+                all_subtasks.extend(new_tasks)
+                self._update_dependencies_for_decomposition(task, all_subtasks)
+                yield new_tasks
+
+        final_tasks = parse_response(accumulated_content, task.id)
+        for final_task in final_tasks:
+            final_task.additional_info = task.additional_info
+            final_task.parent = task
+        task.subtasks = final_tasks
+
     async def handle_decompose_append_task(
         self,
         task: Task,
@@ -343,18 +539,20 @@ class Workforce(BaseWorkforce):
                 + original_content
             )
             task.content = task_with_context
-            subtasks_result = self._decompose_task(
-                task, stream_callback=on_stream_text
-            )
-            task.content = original_content
+            try:
+                subtasks_result = await self._adecompose_task(
+                    task, stream_callback=on_stream_text
+                )
+            finally:
+                task.content = original_content
         else:
-            subtasks_result = self._decompose_task(
+            subtasks_result = await self._adecompose_task(
                 task, stream_callback=on_stream_text
             )
 
-        if isinstance(subtasks_result, Generator):
+        if isinstance(subtasks_result, AsyncGenerator):
             subtasks = []
-            for new_tasks in subtasks_result:
+            async for new_tasks in subtasks_result:
                 subtasks.extend(new_tasks)
                 if on_stream_batch:
                     try:
@@ -371,13 +569,9 @@ class Workforce(BaseWorkforce):
 
         if subtasks:
             self._pending_tasks.extendleft(reversed(subtasks))
+            self._index_subtasks(subtasks)
             # Log task created events
-            metrics_callbacks = [
-                cb
-                for cb in self._callbacks
-                if isinstance(cb, WorkforceMetrics)
-            ]
-            if metrics_callbacks:
+            if self._metrics_callback:
                 for subtask in subtasks:
                     event = TaskCreatedEvent(
                         task_id=subtask.id,
@@ -385,7 +579,7 @@ class Workforce(BaseWorkforce):
                         parent_task_id=task.id if task else None,
                         task_type=None,
                     )
-                    metrics_callbacks[0].log_task_created(event)
+                    self._metrics_callback.log_task_created(event)
 
         if not subtasks:
             logger.warning(
@@ -398,21 +592,17 @@ class Workforce(BaseWorkforce):
             )
             task.subtasks = [fallback_task]
             subtasks = [fallback_task]
+            self._index_subtasks(subtasks)
 
             # Log fallback task created event
-            metrics_callbacks = [
-                cb
-                for cb in self._callbacks
-                if isinstance(cb, WorkforceMetrics)
-            ]
-            if metrics_callbacks:
+            if self._metrics_callback:
                 event = TaskCreatedEvent(
                     task_id=fallback_task.id,
                     description=fallback_task.content,
                     parent_task_id=task.id if task else None,
                     task_type=None,
                 )
-                metrics_callbacks[0].log_task_created(event)
+                self._metrics_callback.log_task_created(event)
 
         if on_stream_batch:
             try:
@@ -426,6 +616,38 @@ class Workforce(BaseWorkforce):
         )
         return subtasks
 
+    def add_task(
+        self,
+        content: str,
+        task_id: str | None = None,
+        additional_info: dict | None = None,
+        as_subtask: bool = False,
+        insert_position: int = -1,
+    ) -> Task:
+        new_task = super().add_task(
+            content,
+            task_id=task_id,
+            additional_info=additional_info,
+            as_subtask=as_subtask,
+            insert_position=insert_position,
+        )
+        self._task_tree.add(new_task)
+        return new_task
+
+    def remove_task(self, task_id: str) -> bool:
+        removed = super().remove_task(task_id)
+        if removed:
+            self._task_tree.remove(task_id)
+            self._scheduler.release(task_id)
+        return removed
+
+    async def _handle_skip_task(self) -> bool:
+        try:
+            return await super()._handle_skip_task()
+        finally:
+            # Skipping completes pending tasks and drops in-flight ones
+            self._scheduler.release_all()
+
     def _get_agent_id_from_node_id(self, node_id: str) -> str | None:
         """Map worker node_id to the actual agent_id for
         frontend communication.
@@ -478,20 +700,26 @@ class Workforce(BaseWorkforce):
         # to the frontend, and send "start execution" notification when the
         # task actually begins execution
         assigned = await super()._find_assignee(tasks)
+        # Rank with the new dependencies before CAMEL posts ready tasks
+        self._prioritize_pending(
+            {item.task_id: item.dependencies for item in assigned.assignments}
+        )
 
         task_lock = get_task_lock(self.api_task_id)
         for item in assigned.assignments:
             # DEBUG ▶ Task has been assigned to which worker
             # and its dependencies
             logger.debug(
-                f"[WF] ASSIGN {item.task_id} -> {item.assignee_id} "
-                f"deps={item.dependencies}"
+                "[WF] ASSIGN %s -> %s deps=%s",
+                item.task_id,
+                item.assignee_id,
+                item.dependencies,
             )
             # The main task itself does not need notification
             if self._task and item.task_id == self._task.id:
                 continue
             # Find task content
-            task_obj = get_camel_task(item.task_id, tasks)
+            task_obj = get_camel_task(item.task_id, tasks, self._task_tree)
             if task_obj is None:
                 logger.warning(
                     f"[WF] WARN: Task {item.task_id} not found in "
@@ -509,10 +737,12 @@ class Workforce(BaseWorkforce):
             # worker due to failure recovery
             if task_obj and task_obj.assigned_worker_id:
                 logger.debug(
-                    f"[WF] ASSIGN Skip notification for task {item.task_id}: "
-                    f"already has assigned_worker_id="
-                    f"{task_obj.assigned_worker_id}, "
-                    f"new assignee={item.assignee_id} (retry/replan scenario)"
+                    "[WF] ASSIGN Skip notification for task %s: already has "
+                    "assigned_worker_id=%s, new assignee=%s "
+                    "(retry/replan scenario)",
+                    item.task_id,
+                    task_obj.assigned_worker_id,
+                    item.assignee_id,
                 )
                 continue
 
@@ -549,27 +779,86 @@ class Workforce(BaseWorkforce):
             )
             # Track the task for cleanup
             task_lock.add_background_task(task)
-
-            metrics_callbacks = [
-                cb
-                for cb in self._callbacks
-                if isinstance(cb, WorkforceMetrics)
-            ]
-            if metrics_callbacks:
-                event = TaskAssignedEvent(
-                    task_id=item.task_id,
-                    worker_id=agent_id,
-                    dependencies=item.dependencies,
-                )
-                metrics_callbacks[0].log_task_assigned(event)
         return assigned
 
+    def _prioritize_pending(
+        self, new_dependencies: dict[str, list[str]] | None = None
+    ) -> None:
+        """Reorder pending tasks so critical-path tasks are posted first.
+
+        Args:
+            new_dependencies: Dependencies from assignments that CAMEL has
+                not stored in :obj:`_task_dependencies` yet.
+        """
+        dependencies = self._task_dependencies
+        if new_dependencies:
+            dependencies = {**dependencies, **new_dependencies}
+        self._scheduler.update_ranks(self._pending_tasks, dependencies)
+        ordered = self._scheduler.prioritize(self._pending_tasks)
+        self._pending_tasks.clear()
+        self._pending_tasks.extend(ordered)
+
+    async def _post_ready_tasks(self) -> None:
+        self._prioritize_pending()
+        self._dispatching = True
+        try:
+            await super()._post_ready_tasks()
+        finally:
+            self._dispatching = False
+            # CAMEL drops every task passed to _post_task from the pending
+            # queue, including those held back for worker capacity
+            held = self._scheduler.take_held()
+            if held:
+                self._pending_tasks.extendleft(reversed(held))
+        logger.debug(f"[WF] SCHED {self.get_schedule_counts()}")
+
+    def get_schedule_counts(self) -> dict[str, int]:
+        """Return how many tasks are scheduled, running and waiting.
+
+        Returns:
+            dict[str, int]: ``scheduled`` tasks have their dependencies met
+                and wait for a worker slot, ``running`` tasks are posted to
+                a worker, ``waiting`` tasks still wait for dependencies.
+        """
+        completed = {t.id: t.state for t in self._completed_tasks}
+        ready = {
+            task.id
+            for task in self._pending_tasks
+            if task.id in self._task_dependencies
+            and all(
+                completed.get(dep) == TaskState.DONE
+                for dep in self._task_dependencies[task.id]
+            )
+        }
+        return self._scheduler.counts(self._pending_tasks, ready)
+
     async def _post_task(self, task: Task, assignee_id: str) -> None:
         # DEBUG ▶ Dependencies are met, the task really starts to execute
         logger.debug(f"[WF] POST  {task.id} -> {assignee_id}")
         """Override the _post_task method to notify the frontend
         when the task really starts to execute
         """
+        if self._dispatching:
+            if not self._scheduler.try_acquire(task, assignee_id):
+                logger.debug(
+                    f"[WF] HOLD  {task.id} -> {assignee_id} "
+                    f"(worker type at concurrency limit)"
+                )
+                return
+        else:
+            self._scheduler.mark_running(task.id, assignee_id)
+        in_flight = self._in_flight_tasks
+        try:
+            await self._notify_and_post_task(task, assignee_id)
+        finally:
+            # CAMEL logs and swallows failures to post to the channel; such
+            # a task never returns, so its slot is freed here
+            if self._in_flight_tasks <= in_flight:
+                self._scheduler.release(task.id)
+
+    async def _notify_and_post_task(
+        self, task: Task, assignee_id: str
+    ) -> None:
         # When the dependency check is passed and the task is
         # about to be published to the execution queue, send a
         # notification to the frontend
@@ -633,6 +922,7 @@ class Workforce(BaseWorkforce):
             use_structured_output_handler=self.use_structured_output_handler,
             context_utility=None,
             enable_workflow_memory=enable_workflow_memory,
+            dependency_context=self._dependency_context,
         )
         self._children.append(worker_node)
 
@@ -642,12 +932,12 @@ class Workforce(BaseWorkforce):
 
         # If workforce is paused, start the worker's listening task
         self._start_child_node_when_paused(worker_node.start())
+        self._scheduler.register_worker(
+            worker_node.node_id, getattr(worker, "agent_name", None)
+        )
 
         # Use proper CAMEL pattern for metrics logging
-        metrics_callbacks = [
-            cb for cb in self._callbacks if isinstance(cb, WorkforceMetrics)
-        ]
-        if metrics_callbacks:
+        if self._metrics_callback:
             # Collect agent metadata for telemetry
             agent_class_name = getattr(
                 worker, "agent_name", worker.__class__.__name__
@@ -689,18 +979,21 @@ class Workforce(BaseWorkforce):
         if not parent or not parent.subtasks:
             return
 
-        for sub in parent.subtasks:
-            if sub.id == task.id:
-                sub.result = task.result
-                sub.state = task.state
-                logger.debug(
-                    f"[SYNC] Synced subtask {task.id} "
-                    f"result to parent.subtasks"
-                )
-                return
+        sub = self._task_tree.get_child(parent.id, task.id)
+        if sub is None:
+            # Index miss: parent.subtasks changed outside the workforce
+            self._task_tree.set_children(parent, parent.subtasks)
+            sub = self._task_tree.get_child(parent.id, task.id)
+        if sub is None:
+            logger.warning(
+                f"[SYNC] Subtask {task.id} not found in parent.subtasks"
+            )
+            return
 
-        logger.warning(
-            f"[SYNC] Subtask {task.id} not found in parent.subtasks"
+        sub.result = task.result
+        sub.state = task.state
+        logger.debug(
+            f"[SYNC] Synced subtask {task.id} result to parent.subtasks"
         )
 
     async def _notify_task_completion(self, task: Task) -> None:
@@ -740,19 +1033,6 @@ class Workforce(BaseWorkforce):
         }
         await task_lock.put_queue(ActionTaskStateData(data=task_data))
 
-        # Log task completion to metrics
-        metrics_callbacks = [
-            cb for cb in self._callbacks if isinstance(cb, WorkforceMetrics)
-        ]
-        if metrics_callbacks:
-            # worker_id is required and cannot be None
-            worker_id = getattr(task, "assigned_worker_id", None) or "unknown"
-            event = TaskCompletedEvent(
-                task_id=task.id,
-                worker_id=worker_id,
-            )
-            metrics_callbacks[0].log_task_completed(event)
-
     async def _handle_completed_task(self, task: Task) -> None:
         """Handle task completion: log, notify frontend, sync to parent,
         and delegate to CAMEL.
@@ -765,6 +1045,7 @@ class Workforce(BaseWorkforce):
         # TODO: CAMEL should handle this task sync or have a more
         # efficient sync
         self._sync_subtask_to_parent(task)
+        self._dependency_context.record(task)
         await self._notify_task_completion(task)
         await super()._handle_completed_task(task)
 
@@ -781,18 +1062,8 @@ class Workforce(BaseWorkforce):
             return result
 
         error_message = ""
-        # Use proper CAMEL pattern for metrics logging
-        metrics_callbacks = [
-            cb for cb in self._callbacks if isinstance(cb, WorkforceMetrics)
-        ]
-        if metrics_callbacks and hasattr(metrics_callbacks[0], "log_entries"):
-            for entry in reversed(metrics_callbacks[0].log_entries):
-                if (
-                    entry.get("event_type") == "task_failed"
-                    and entry.get("task_id") == task.id
-                ):
-                    error_message = entry.get("error_message")
-                    break
+        if self._metrics_index:
+            error_message = self._metrics_index.get_task_error(task.id) or ""
 
         task_lock = get_task_lock(self.api_task_id)
         await task_lock.put_queue(
@@ -807,16 +1078,6 @@ class Workforce(BaseWorkforce):
             )
         )
 
-        if metrics_callbacks:
-            error_msg = error_message or str(task.result or "Unknown error")
-            worker_id = getattr(task, "assigned_worker_id", None) or "unknown"
-            event = TaskFailedEvent(
-                task_id=task.id,
-                error_message=error_msg,
-                worker_id=worker_id,
-            )
-            metrics_callbacks[0].log_task_failed(event)
-
         return result
 
     async def _get_returned_task(self) -> Task | None:
@@ -830,11 +1091,17 @@ class Workforce(BaseWorkforce):
             asyncio.TimeoutError: If waiting for task exceeds timeout
         """
         try:
-            return await asyncio.wait_for(
+            task = await asyncio.wait_for(
                 self._channel.get_returned_task_by_publisher(self.node_id),
                 timeout=self.task_timeout_seconds,
             )
+            if task is not None:
+                self._scheduler.release(task.id)
+            return task
         except TimeoutError:
+            # CAMEL gives up on the in-flight tasks after a timeout, so
+            # none of them will return to free its slot
+            self._scheduler.release_all()
             # Send timeout notification to frontend before re-raising
             logger.warning(
                 f"⏰ [WF-TIMEOUT] Task timeout in workforce {self.node_id}. "
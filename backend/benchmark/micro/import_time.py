@@ -0,0 +1,118 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Micro-benchmark: backend import time (``python -X importtime``).
+
+Imports the backend entry module in fresh interpreters, reports the
+median cumulative import time, the slowest top-level imports and whether
+modules that should load lazily were pulled in at startup. Run from the
+``backend/`` directory:
+
+    python -m benchmark.micro.import_time [--module main] [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Loaded on first request, not at startup
+DEFERRED = (
+    "app.service.chat_service",
+    "app.agent.tools",
+    "app.agent.factory",
+    "app.component.model_validation",
+    "app.utils.toolkit.terminal_toolkit",
+    "camel.agents",
+    "camel.toolkits",
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) per ``import time:`` line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        rows.append((fields[2].rstrip(), int(fields[0]), int(fields[1])))
+    return rows
+
+
+def measure(module: str) -> list[tuple[str, int, int]]:
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    return parse_importtime(stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    totals = []
+    rows: list[tuple[str, int, int]] = []
+    for _ in range(args.runs):
+        rows = measure(args.module)
+        total = next(
+            cumulative
+            for name, _, cumulative in rows
+            if name.strip() == args.module
+        )
+        totals.append(total / 1000)
+
+    print(
+        f"import {args.module}: median {statistics.median(totals):.0f} ms "
+        f"(min {min(totals):.0f}, max {max(totals):.0f}, {args.runs} runs)"
+    )
+
+    # importtime prints children before their parent, so the direct
+    # children of the entry module are the rows just above it that sit
+    # one level deeper
+    def indent(name: str) -> int:
+        return len(name) - len(name.lstrip())
+
+    entry = max(
+        i for i, (name, _, _) in enumerate(rows) if name.strip() == args.module
+    )
+    top_level = []
+    for name, _, cumulative in reversed(rows[:entry]):
+        if indent(name) <= indent(rows[entry][0]):
+            break
+        if indent(name) == indent(rows[entry][0]) + 2:
+            top_level.append((name.strip(), cumulative))
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    print(f"\n{'slowest imports':<50}{'cumulative ms':>15}")
+    for name, cumulative in top_level[: args.top]:
+        print(f"{name:<50}{cumulative / 1000:>15.1f}")
+
+    loaded = {name.strip() for name, _, _ in rows}
+    print("\ndeferred modules loaded at startup:")
+    eager = [name for name in DEFERRED if name in loaded]
+    for name in eager:
+        print(f"  {name}")
+    if not eager:
+        print("  none")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Micro-benchmark: NumPy vector store vs. Qdrant local mode.
+
+Each backend runs in its own subprocess so peak RSS is not shared. Run
+from the ``backend/`` directory:
+
+    python -m benchmark.micro.rag_vector_store [--count 100000] [--dim 384]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+BACKENDS = ("qdrant", "numpy", "numpy-int8")
+INSERT_BATCH = 1000
+
+
+def _create_storage(backend: str, dim: int, path: str):
+    if backend == "qdrant":
+        from camel.storages import QdrantStorage
+
+        return QdrantStorage(vector_dim=dim, path=path, collection_name="b")
+    from app.utils.numpy_vector_storage import NumpyVectorStorage
+
+    quantize = "int8" if backend == "numpy-int8" else None
+    return NumpyVectorStorage(dim, path, "b", quantize=quantize)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _dir_size_mb(path: str) -> float:
+    total = sum(p.stat().st_size for p in Path(path).rglob("*") if p.is_file())
+    return total / (1024 * 1024)
+
+
+def run_backend(backend: str, count: int, dim: int, queries: int) -> dict:
+    from camel.storages import VectorDBQuery, VectorRecord
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as path:
+        storage = _create_storage(backend, dim, path)
+        start = time.perf_counter()
+        for offset in range(0, count, INSERT_BATCH):
+            size = min(INSERT_BATCH, count - offset)
+            vectors = rng.standard_normal((size, dim), dtype=np.float32)
+            storage.add(
+                [
+                    VectorRecord(
+                        vector=vector.tolist(),
+                        payload={"text": f"chunk {offset + i}"},
+                    )
+                    for i, vector in enumerate(vectors)
+                ]
+            )
+        insert_s = time.perf_counter() - start
+
+        probes = rng.standard_normal((queries, dim), dtype=np.float32)
+        latencies = []
+        for probe in probes:
+            start = time.perf_counter()
+            storage.query(VectorDBQuery(query_vector=probe.tolist(), top_k=5))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        result = {
+            "backend": backend,
+            "insert_s": insert_s,
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+            "batch_ms": None,
+            "disk_mb": _dir_size_mb(path),
+        }
+        if hasattr(storage, "query_batch"):
+            start = time.perf_counter()
+            storage.query_batch(probes.tolist(), top_k=5)
+            result["batch_ms"] = (time.perf_counter() - start) * 1000 / queries
+        result["peak_rss_mb"] = _peak_rss_mb()
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--backend", choices=BACKENDS)
+    args = parser.parse_args()
+
+    if args.backend:
+        result = run_backend(args.backend, args.count, args.dim, args.queries)
+        print(json.dumps(result))
+        return
+
+    print(
+        f"{args.count} chunks, dim {args.dim}, top_k 5, {args.queries} queries"
+    )
+    print(
+        f"{'backend':<12}{'insert s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'batch ms/q':>12}{'disk MB':>10}{'peak RSS MB':>13}"
+    )
+    for backend in BACKENDS:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmark.micro.rag_vector_store",
+                "--backend",
+                backend,
+                "--count",
+                str(args.count),
+                "--dim",
+                str(args.dim),
+                "--queries",
+                str(args.queries),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        batch = f"{r['batch_ms']:.3f}" if r["batch_ms"] is not None else "-"
+        print(
+            f"{r['backend']:<12}{r['insert_s']:>10.1f}{r['p50_ms']:>10.2f}"
+            f"{r['p95_ms']:>10.2f}{batch:>12}{r['disk_mb']:>10.1f}"
+            f"{r['peak_rss_mb']:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
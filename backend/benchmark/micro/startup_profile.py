@@ -0,0 +1,182 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Startup profile: import time, RSS per phase and time to first /health.
+
+Starts the backend under uvicorn with ``python -X importtime`` and
+``EIGENT_STARTUP_PROFILE`` set, polls ``/health`` until it answers, then
+writes a JSON report combining:
+
+- per-module import times (self and cumulative, microseconds),
+- the phases recorded by ``app.utils.startup_profile`` (elapsed time and
+  RSS after the app package, imports, env load, router registration,
+  telemetry init and the first ``/health`` response),
+- the wall time from process spawn to the first ``/health`` response.
+
+Exits with status 1 when time-to-health or peak phase RSS exceeds its
+budget, so it can gate CI. Run from the ``backend/`` directory:
+
+    python -m benchmark.micro.startup_profile --budget-ms 4000
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from benchmark.micro.import_time import parse_importtime
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_health(url: str, proc: subprocess.Popen, timeout: float):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"backend exited with {proc.returncode}")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as resp:
+                if resp.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(0.02)
+    raise TimeoutError(f"{url} not ready after {timeout:.0f}s")
+
+
+def profile(timeout: float) -> dict:
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        phase_path = Path(tmp) / "phases.json"
+        stderr_path = Path(tmp) / "stderr.log"
+        env = {**os.environ, "EIGENT_STARTUP_PROFILE": str(phase_path)}
+        with open(stderr_path, "w") as stderr:
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-X",
+                    "importtime",
+                    "-m",
+                    "uvicorn",
+                    "main:api",
+                    "--port",
+                    str(port),
+                    "--loop",
+                    "asyncio",
+                ],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+            )
+            try:
+                wait_for_health(
+                    f"http://127.0.0.1:{port}/health", proc, timeout
+                )
+                time_to_health = (time.perf_counter() - start) * 1000
+            finally:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+        phases = json.loads(phase_path.read_text())["phases"]
+        imports = parse_importtime(stderr_path.read_text())
+
+    return {
+        "python": sys.version.split()[0],
+        "time_to_health_ms": round(time_to_health, 1),
+        "peak_rss_bytes": max(p["rss_bytes"] for p in phases),
+        "phases": phases,
+        "imports": [
+            {"module": name.strip(), "self_us": own, "cumulative_us": cum}
+            for name, own, cum in imports
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default="startup_profile.json")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="fail when time to first /health exceeds this",
+    )
+    parser.add_argument(
+        "--budget-rss-mb",
+        type=float,
+        default=None,
+        help="fail when peak RSS across phases exceeds this",
+    )
+    args = parser.parse_args()
+
+    report = profile(args.timeout)
+    Path(args.output).write_text(json.dumps(report, indent=2))
+
+    print(f"{'phase':<16}{'elapsed ms':>12}{'rss MB':>10}")
+    for phase in report["phases"]:
+        print(
+            f"{phase['phase']:<16}{phase['elapsed_ms']:>12.1f}"
+            f"{phase['rss_bytes'] / 2**20:>10.1f}"
+        )
+    print(f"\ntime to first /health: {report['time_to_health_ms']:.0f} ms")
+
+    app_modules = sorted(
+        (m for m in report["imports"] if m["module"].startswith("app")),
+        key=lambda m: m["cumulative_us"],
+        reverse=True,
+    )
+    print(f"\n{'app module':<50}{'cumulative ms':>15}")
+    for m in app_modules[: args.top]:
+        print(f"{m['module']:<50}{m['cumulative_us'] / 1000:>15.1f}")
+    print(f"\nreport written to {args.output}")
+
+    failures = []
+    if (
+        args.budget_ms is not None
+        and report["time_to_health_ms"] > args.budget_ms
+    ):
+        failures.append(
+            f"time to /health {report['time_to_health_ms']:.0f} ms "
+            f"> budget {args.budget_ms:.0f} ms"
+        )
+    peak_mb = report["peak_rss_bytes"] / 2**20
+    if args.budget_rss_mb is not None and peak_mb > args.budget_rss_mb:
+        failures.append(
+            f"peak RSS {peak_mb:.0f} MB > budget {args.budget_rss_mb:.0f} MB"
+        )
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
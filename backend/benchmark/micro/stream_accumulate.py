@@ -0,0 +1,143 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Micro-benchmark: accumulating a long streamed response.
+
+Feeds a synthetic stream of ``--tokens`` deltas (about four characters
+each, one token per delta) through each accumulation strategy and
+reports the median time and per-chunk cost. ``str +=`` is only fast in
+CPython while nothing else references the growing string; the
+"str + (shared)" row keeps a second reference, as code that stores the
+running text elsewhere does, and shows the quadratic case. Run from the
+``backend/`` directory:
+
+    python -m benchmark.micro.stream_accumulate [--tokens 100000]
+"""
+
+import argparse
+import io
+import statistics
+import time
+from types import SimpleNamespace
+
+from app.utils.stream_accumulator import ChunkAccumulator
+from app.utils.streaming_json import StreamingJsonParser
+
+WORDS = ("the ", "agent", " wrote", " a ", "file", " to", " disk", ".\n")
+
+
+def make_deltas(tokens: int) -> list[str]:
+    return [WORDS[i % len(WORDS)] for i in range(tokens)]
+
+
+def str_concat(deltas):
+    text = ""
+    for delta in deltas:
+        text += delta
+    return text
+
+
+def str_concat_shared(deltas):
+    text = ""
+    last = text
+    for delta in deltas:
+        text = text + delta
+        last = text  # noqa: F841  a second reference defeats in-place +=
+    return text
+
+
+def list_join(deltas):
+    parts = []
+    for delta in deltas:
+        parts.append(delta)
+    return "".join(parts)
+
+
+def string_io(deltas):
+    buf = io.StringIO()
+    for delta in deltas:
+        buf.write(delta)
+    return buf.getvalue()
+
+
+def accumulator(deltas):
+    acc = ChunkAccumulator()
+    for delta in deltas:
+        acc.append(delta)
+    return acc.text
+
+
+def accumulator_chunks(chunks):
+    acc = ChunkAccumulator()
+    for chunk in chunks:
+        acc.add_chunk(chunk)
+    return acc.text
+
+
+def accumulator_flush(deltas):
+    flushed = []
+    acc = ChunkAccumulator(on_flush=flushed.append, flush_chars=512)
+    for delta in deltas:
+        acc.append(delta)
+    acc.flush()
+    return acc.text
+
+
+def json_parser(deltas):
+    parser = StreamingJsonParser(field="content")
+    parser.feed('{"failed": false, "content": "')
+    for delta in deltas:
+        parser.feed(delta.replace("\n", "\\n"))
+    parser.feed('"}')
+    return parser.result["content"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    deltas = make_deltas(args.tokens)
+    chunks = [SimpleNamespace(msg=SimpleNamespace(content=d)) for d in deltas]
+    expected = "".join(deltas)
+    cases = [
+        ("str +=", str_concat, deltas),
+        ("str + (shared)", str_concat_shared, deltas),
+        ("list + join", list_join, deltas),
+        ("io.StringIO", string_io, deltas),
+        ("ChunkAccumulator", accumulator, deltas),
+        ("ChunkAccumulator (chunks)", accumulator_chunks, chunks),
+        ("ChunkAccumulator (flush 512)", accumulator_flush, deltas),
+        ("StreamingJsonParser", json_parser, deltas),
+    ]
+
+    print(f"{args.tokens} deltas, {len(expected)} characters")
+    print(f"{'strategy':<30}{'median ms':>12}{'ns/chunk':>12}")
+    for name, fn, data in cases:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = fn(data)
+            times.append(time.perf_counter() - start)
+        assert result == expected, name
+        median = statistics.median(times)
+        print(
+            f"{name:<30}{median * 1000:>12.1f}"
+            f"{median / args.tokens * 1e9:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+"""Micro-benchmark for listen_toolkit argument/result previews.
+
+Compares the bounded formatters against serializing the whole payload and
+truncating afterwards. Run from the ``backend/`` directory:
+
+    python -m benchmark.micro.toolkit_listen_format
+"""
+
+import json
+import timeit
+
+from app.utils.listen.toolkit_listen import (
+    _format_args,
+    _format_result,
+    _truncate,
+)
+
+PAYLOADS = {
+    "large_str": "x" * 5_000_000,
+    "search_results": [
+        {
+            "title": f"result {i}",
+            "url": f"https://example.com/{i}",
+            "snippet": "lorem ipsum " * 200,
+        }
+        for i in range(5_000)
+    ],
+    "file_listing": {f"dir/file_{i}.txt": i for i in range(200_000)},
+}
+
+
+def _eager_result(res) -> str:
+    if isinstance(res, str):
+        return _truncate(res)
+    try:
+        return _truncate(json.dumps(res, ensure_ascii=False))
+    except TypeError:
+        return _truncate(str(res))
+
+
+def _eager_args(args: tuple, kwargs: dict) -> str:
+    args_str = ", ".join(repr(arg) for arg in args[1:])
+    if kwargs:
+        kwargs_str = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
+        args_str = f"{args_str}, {kwargs_str}" if args_str else kwargs_str
+    return _truncate(args_str)
+
+
+def _best_of(func, number: int = 5) -> float:
+    return min(timeit.repeat(func, number=1, repeat=number)) * 1000
+
+
+def main() -> None:
+    print(f"{'payload':<16}{'kind':<8}{'eager ms':>12}{'bounded ms':>12}")
+    for name, payload in PAYLOADS.items():
+        rows = [
+            (
+                "result",
+                lambda: _eager_result(payload),
+                lambda: _format_result(payload, None, None),
+            ),
+            (
+                "args",
+                lambda: _eager_args((None, payload), {}),
+                lambda: _format_args((None, payload), {}, None),
+            ),
+        ]
+        for kind, eager, bounded in rows:
+            print(
+                f"{name:<16}{kind:<8}"
+                f"{_best_of(eager):>12.3f}{_best_of(bounded):>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
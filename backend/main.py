@@ -26,6 +26,10 @@ if str(_project_root) not in sys.path:
 
 import logging
 
+from app.utils import startup_profile
+
+startup_profile.mark("app_package")
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,10 +42,16 @@ logging.getLogger("camel.base_model").setLevel(logging.WARNING)
 logging.getLogger("camel.agents").setLevel(logging.WARNING)
 logging.getLogger("camel.societies").setLevel(logging.WARNING)
 
-from app import api
+# Importing the environment module loads the default .env file
 from app.component.environment import env
+
+startup_profile.mark("env_load")
+
+from app import api
 from app.router import register_routers
 
+startup_profile.mark("imports")
+
 os.environ["PYTHONIOENCODING"] = "utf-8"
 
 app_logger = logging.getLogger("main")
@@ -55,6 +65,7 @@ prefix = env("url_prefix", "")
 app_logger.info(f"Loading routers with prefix: '{prefix}'")
 register_routers(api, prefix)
 app_logger.info("All routers loaded successfully")
+startup_profile.mark("routers")
 
 # Check if debug mode is enabled via environment variable
 if os.environ.get("ENABLE_PYTHON_DEBUG") == "true":
@@ -109,6 +120,7 @@ async def startup_event():
 
     initialize_tracer_provider()
     app_logger.info("Telemetry tracer provider initialized")
+    startup_profile.mark("telemetry")
 
 
 # Graceful shutdown handler
@@ -119,14 +131,10 @@ async def cleanup_resources():
     r"""Cleanup all resources on shutdown"""
     app_logger.info("Starting graceful shutdown process")
 
-    from app.service.task import _cleanup_task, task_locks
+    from app.service.task import task_locks
+    from app.service.task_lifecycle import get_task_lifecycle
 
-    if _cleanup_task and not _cleanup_task.done():
-        _cleanup_task.cancel()
-        try:
-            await _cleanup_task
-        except asyncio.CancelledError:
-            pass
+    await get_task_lifecycle().stop()
 
     # Cleanup all task locks
     for task_id in list(task_locks.keys()):
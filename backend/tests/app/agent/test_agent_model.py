@@ -41,13 +41,13 @@ class TestAgentFactoryFunctions:
         _m = sys.modules["app.agent.agent_model"]
         with (
             patch.object(_m, "ListenChatAgent") as mock_listen_agent,
-            patch.object(_m, "ModelFactory") as mock_model_factory,
+            patch.object(_m, "create_model") as mock_create_model,
             patch.object(_m, "get_task_lock", return_value=mock_task_lock),
             patch("asyncio.create_task"),
         ):
             mock_agent = MagicMock()
             mock_listen_agent.return_value = mock_agent
-            mock_model_factory.create.return_value = MagicMock()
+            mock_create_model.return_value = MagicMock()
 
             result = agent_model(agent_name, system_prompt, options, [])
 
@@ -89,13 +89,13 @@ class TestAgentIntegration:
         # Create agent
         _m = sys.modules["app.agent.agent_model"]
         with (
-            patch.object(_m, "ModelFactory") as mock_model_factory,
+            patch.object(_m, "create_model") as mock_create_model,
             patch.object(_m, "_schedule_async_task"),
             patch.object(_m, "ListenChatAgent") as mock_listen_agent,
             patch.object(_m, "get_task_lock", return_value=mock_task_lock),
         ):
             mock_model = MagicMock()
-            mock_model_factory.return_value = mock_model
+            mock_create_model.return_value = mock_model
 
             mock_agent_instance = MagicMock()
             mock_agent_instance.api_task_id = api_task_id
@@ -17,6 +17,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.agent.tools import get_mcp_tools, get_toolkits
+from app.component.environment import ProjectEnv, use_project_env
 from app.model.chat import McpServers
 
 pytestmark = pytest.mark.unit
@@ -155,6 +156,39 @@ class TestMcpTools:
             mock_mcp_toolkit.assert_called_once()
             mock_toolkit_instance.connect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_mcp_tools_passes_project_env(self):
+        """MCP servers are started with the project's configuration."""
+        mcp_servers: McpServers = {
+            "mcpServers": {
+                "notion": {
+                    "command": "npx",
+                    "args": ["@modelcontextprotocol/server-notion"],
+                    "env": {"NOTION_TOKEN": "server", "SHARED": "server"},
+                }
+            }
+        }
+        project_env = ProjectEnv({"OPENAI_API_KEY": "key", "SHARED": "p"})
+
+        with (
+            patch("app.agent.tools.MCPToolkit") as mock_mcp_toolkit,
+            use_project_env(project_env),
+        ):
+            mock_mcp_toolkit.return_value.connect = AsyncMock()
+            await get_mcp_tools(mcp_servers)
+
+        config = mock_mcp_toolkit.call_args.kwargs["config_dict"]
+        server_env = config["mcpServers"]["notion"]["env"]
+        assert server_env["OPENAI_API_KEY"] == "key"
+        assert server_env["NOTION_TOKEN"] == "server"
+        assert server_env["SHARED"] == "server"
+        assert "MCP_REMOTE_CONFIG_DIR" in server_env
+        # The installed config is left untouched
+        assert mcp_servers["mcpServers"]["notion"]["env"] == {
+            "NOTION_TOKEN": "server",
+            "SHARED": "server",
+        }
+
     @pytest.mark.asyncio
     async def test_get_mcp_tools_empty_servers(self):
         """Test get_mcp_tools with empty server configuration."""
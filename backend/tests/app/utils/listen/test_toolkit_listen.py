@@ -12,14 +12,17 @@
 # limitations under the License.
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.utils.listen.toolkit_listen import (
     MAX_LENGTH,
+    _bounded_join,
     _format_args,
     _format_result,
+    _iter_json,
     _truncate,
     listen_toolkit,
 )
@@ -181,6 +184,65 @@ def test_format_result_truncates_long_formatter_output():
     assert "truncated" in result
 
 
+@pytest.mark.unit
+def test_format_result_matches_json_dumps():
+    """Small results should serialize exactly like json.dumps."""
+    value = {
+        "s": 'héllo "quoted"\n',
+        "n": [1, 2.5, None, True, False],
+        "t": ("a",),
+        1: {"nested": []},
+        None: {},
+    }
+    result = _format_result(value, None, None)
+    assert result == json.dumps(value, ensure_ascii=False)
+
+
+@pytest.mark.unit
+def test_format_args_matches_repr():
+    """Small builtin args should format exactly like repr."""
+    args = ("self", "text", [1, ("x",), {"k": b"v"}], ())
+    kwargs = {"flag": None, "data": {"a": [1.5]}}
+    result = _format_args(args, kwargs, None)
+    assert result == (
+        "'text', [1, ('x',), {'k': b'v'}], (), flag=None, data={'a': [1.5]}"
+    )
+
+
+@pytest.mark.unit
+def test_bounded_join_stops_consuming_after_limit():
+    """Chunks past the preview limit should never be produced."""
+    produced = []
+
+    def chunks():
+        for i in range(1000):
+            produced.append(i)
+            yield "x" * 10
+
+    result = _bounded_join(chunks(), max_length=25)
+    assert result == "x" * 25 + "... (truncated)"
+    assert len(produced) == 3
+
+
+@pytest.mark.unit
+def test_format_result_large_payload_is_bounded():
+    """Huge results should be clipped without serializing everything."""
+    big = [{"id": i, "body": "y" * 10_000} for i in range(10_000)]
+    chunks = _iter_json(big)
+    result = _bounded_join(chunks)
+    assert result.endswith("... (truncated)")
+    assert len(result) <= MAX_LENGTH + len("... (truncated)")
+    # The generator is left suspended in the first element
+    assert next(chunks) is not None
+
+
+@pytest.mark.unit
+def test_format_result_non_serializable_key_falls_back_to_str():
+    """Dicts with unsupported keys should fall back to str like before."""
+    value = {("a", "b"): 1}
+    assert _format_result(value, None, None) == str(value)
+
+
 # =============================================================================
 # listen_toolkit decorator tests
 # =============================================================================
@@ -379,3 +441,59 @@ def test_listen_toolkit_with_custom_return_msg_formatter():
         mock_format.assert_called_once()
         call_args = mock_format.call_args
         assert call_args[0][2] == custom_return_msg
+
+
+@pytest.mark.unit
+def test_listen_toolkit_skips_events_without_consumer():
+    """Without an SSE consumer nothing is formatted or queued."""
+    mock_toolkit = _create_mock_toolkit()
+    mock_task_lock = MagicMock()
+    mock_task_lock.has_consumer = False
+
+    with (
+        patch(
+            "app.utils.listen.toolkit_listen.get_task_lock",
+            return_value=mock_task_lock,
+        ),
+        patch("app.utils.listen.toolkit_listen._format_args") as mock_args,
+        patch("app.utils.listen.toolkit_listen._format_result") as mock_result,
+    ):
+
+        @listen_toolkit()
+        def test_method(self, payload):
+            return payload
+
+        assert test_method(mock_toolkit, "x" * 10_000) == "x" * 10_000
+
+    mock_args.assert_not_called()
+    mock_result.assert_not_called()
+    mock_task_lock.put_queue_threadsafe.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_listen_toolkit_async_queues_events_with_consumer():
+    """With an SSE consumer both activate and deactivate are queued."""
+    mock_toolkit = _create_mock_toolkit()
+    mock_task_lock = MagicMock()
+    mock_task_lock.has_consumer = True
+    mock_task_lock.put_queue = AsyncMock()
+
+    with patch(
+        "app.utils.listen.toolkit_listen.get_task_lock",
+        return_value=mock_task_lock,
+    ):
+
+        @listen_toolkit()
+        async def test_method(self, payload):
+            return {"echo": payload}
+
+        await test_method(mock_toolkit, "hi")
+
+    events = [c.args[0] for c in mock_task_lock.put_queue.await_args_list]
+    assert [e.action for e in events] == [
+        "activate_toolkit",
+        "deactivate_toolkit",
+    ]
+    assert events[0].data["message"] == "'hi'"
+    assert events[1].data["message"] == '{"echo": "hi"}'
@@ -0,0 +1,110 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+
+import app.component.environment as environment
+from app.component.environment import ProjectEnv, use_project_env
+from app.service.task import TaskLock, task_locks
+from app.utils.toolkit.slack_toolkit import SlackToolkit
+from app.utils.toolkit.twitter_toolkit import TwitterToolkit
+
+CREDENTIALS = {
+    "GITHUB_ACCESS_TOKEN": "ghp-project",
+    "SLACK_BOT_TOKEN": "xoxb-project",
+    "REDDIT_CLIENT_ID": "reddit-id",
+    "REDDIT_CLIENT_SECRET": "reddit-secret",
+    "REDDIT_USER_AGENT": "reddit-agent",
+    "TWITTER_CONSUMER_KEY": "consumer-key",
+    "TWITTER_CONSUMER_SECRET": "consumer-secret",
+    "TWITTER_ACCESS_TOKEN": "access-token",
+    "TWITTER_ACCESS_TOKEN_SECRET": "access-secret",
+}
+
+
+@pytest.fixture
+def project_only_env(tmp_path, monkeypatch):
+    """Credentials that exist only in the project's .env file."""
+    monkeypatch.setattr(environment, "env_base_dir", str(tmp_path))
+    monkeypatch.setattr(
+        environment, "_env_file_cache", environment.EnvFileCache()
+    )
+    for key in CREDENTIALS:
+        monkeypatch.delenv(key, raising=False)
+    env_file = tmp_path / "project.env"
+    env_file.write_text(
+        "".join(f"{key}={value}\n" for key, value in CREDENTIALS.items())
+    )
+    with use_project_env(ProjectEnv(env_path=str(env_file))):
+        yield
+
+
+@pytest.mark.unit
+def test_github_toolkit_uses_project_token(project_only_env):
+    pytest.importorskip("github")
+    from app.utils.toolkit.github_toolkit import GithubToolkit
+
+    assert GithubToolkit.get_can_use_tools("test_task")
+    toolkit = GithubToolkit("test_task")
+
+    assert toolkit.github._Github__requester.auth.token == "ghp-project"
+
+
+@pytest.mark.unit
+def test_slack_toolkit_uses_project_token(project_only_env):
+    assert SlackToolkit.get_can_use_tools("test_task")
+    toolkit = SlackToolkit("test_task")
+
+    assert toolkit._login_slack().token == "xoxb-project"
+    assert "SLACK_BOT_TOKEN" not in os.environ
+
+
+@pytest.mark.unit
+def test_reddit_toolkit_uses_project_credentials(project_only_env):
+    pytest.importorskip("praw")
+    from app.utils.toolkit.reddit_toolkit import RedditToolkit
+
+    toolkit = RedditToolkit("test_task")
+
+    assert toolkit.client_id == "reddit-id"
+    assert toolkit.user_agent == "reddit-agent"
+    assert "REDDIT_CLIENT_ID" not in os.environ
+
+
+@pytest.mark.unit
+def test_twitter_calls_see_project_credentials(project_only_env):
+    task_locks["test_task"] = TaskLock(
+        id="test_task", queue=asyncio.Queue(), human_input={}
+    )
+    toolkit = TwitterToolkit("test_task")
+    seen = {}
+
+    def profile():
+        seen["key"] = os.environ.get("TWITTER_CONSUMER_KEY")
+        return "profile"
+
+    with patch(
+        "app.utils.toolkit.twitter_toolkit.get_my_user_profile", profile
+    ):
+        try:
+            assert toolkit.get_my_user_profile() == "profile"
+        finally:
+            del task_locks["test_task"]
+
+    assert seen["key"] == "consumer-key"
+    assert "TWITTER_CONSUMER_KEY" not in os.environ
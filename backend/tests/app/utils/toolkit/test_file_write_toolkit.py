@@ -0,0 +1,177 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from unittest.mock import patch
+
+import pytest
+
+from app.utils import file_utils
+from app.utils.file_utils import (
+    count_lines,
+    grep_lines,
+    read_byte_window,
+    read_line_window,
+    read_tail_lines,
+)
+from app.utils.toolkit import file_write_toolkit
+from app.utils.toolkit.file_write_toolkit import FileToolkit
+
+
+@pytest.fixture
+def log_file(temp_dir):
+    path = temp_dir / "app.log"
+    path.write_text(
+        "".join(
+            f"line {i} {'ERROR' if i % 10 == 0 else 'ok'}\n"
+            for i in range(1, 1001)
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def toolkit(temp_dir, mock_task_lock):
+    with patch(
+        "app.utils.listen.toolkit_listen.get_task_lock",
+        return_value=mock_task_lock,
+    ):
+        yield FileToolkit("test_task_123", working_directory=str(temp_dir))
+
+
+@pytest.mark.unit
+def test_count_lines_handles_missing_trailing_newline(temp_dir):
+    path = temp_dir / "a.txt"
+    path.write_bytes(b"a\nb\nc")
+    assert count_lines(path) == 3
+    path.write_bytes(b"")
+    assert count_lines(path) == 0
+
+
+@pytest.mark.unit
+def test_line_and_tail_windows(log_file):
+    assert read_line_window(log_file, 5, 2) == ["line 5 ok", "line 6 ok"]
+    assert read_line_window(log_file, 2000, 5) == []
+    assert read_tail_lines(log_file, 2) == ["line 999 ok", "line 1000 ERROR"]
+    assert read_tail_lines(log_file, 0) == []
+
+
+@pytest.mark.unit
+def test_byte_window(log_file):
+    assert read_byte_window(log_file, 0, 9) == "line 1 ok"
+
+
+@pytest.mark.unit
+def test_grep_lines_reports_line_numbers_once(log_file):
+    matches = grep_lines(log_file, r"ERROR|line", max_matches=3)
+    assert matches == [(1, "line 1 ok"), (2, "line 2 ok"), (3, "line 3 ok")]
+
+    errors = grep_lines(log_file, "error$", max_matches=2, ignore_case=True)
+    assert errors == [(10, "line 10 ERROR"), (20, "line 20 ERROR")]
+
+
+@pytest.mark.unit
+def test_grep_lines_counts_lines_across_scan_blocks(log_file):
+    with patch.object(file_utils, "_SCAN_BLOCK_SIZE", 7):
+        matches = grep_lines(log_file, "ERROR", max_matches=100)
+
+    assert matches[-1] == (1000, "line 1000 ERROR")
+    assert [line_no for line_no, _ in matches] == list(range(10, 1001, 10))
+
+
+@pytest.mark.unit
+def test_large_plain_text_file_is_summarized(toolkit, log_file):
+    with patch.object(file_write_toolkit, "LARGE_FILE_BYTES", 100):
+        result = toolkit._read_plain_text_file(log_file)
+
+    assert result.startswith("[Large file:")
+    assert "1000 lines" in result
+    assert "     1: line 1 ok" in result
+    assert "  1000: line 1000 ERROR" in result
+    assert "line 500 " not in result
+
+
+@pytest.mark.unit
+def test_windows_clip_long_lines(temp_dir):
+    path = temp_dir / "long.txt"
+    path.write_bytes(b"a" * 100 + b"\nshort\n" + b"b" * 100)
+
+    assert read_line_window(path, 1, 3, max_line_bytes=10) == [
+        "a" * 10 + " [90 more bytes]",
+        "short",
+        "b" * 10 + " [90 more bytes]",
+    ]
+    assert read_line_window(path, 2, 5, max_line_bytes=10) == [
+        "short",
+        "b" * 10 + " [90 more bytes]",
+    ]
+    # The window budget stops after the line that exhausts it
+    assert read_line_window(path, 1, 3, max_bytes=50) == [
+        "a" * 50 + " [50 more bytes]"
+    ]
+    assert read_tail_lines(path, 2, max_line_bytes=10) == [
+        "short",
+        "[90 earlier bytes] " + "b" * 10,
+    ]
+    assert read_tail_lines(path, 1, max_bytes=30) == [
+        "[70 earlier bytes] " + "b" * 30
+    ]
+
+
+@pytest.mark.unit
+def test_single_line_file_over_1mb_is_bounded(toolkit, temp_dir):
+    path = temp_dir / "one_line.txt"
+    path.write_bytes(b"x" * (5 * 1024 * 1024))
+
+    summary = toolkit._read_plain_text_file(path)
+    assert summary.startswith("[Large file:")
+    assert len(summary) < file_write_toolkit.MAX_WINDOW_BYTES
+
+    head = toolkit.read_file_range("one_line.txt")
+    assert len(head) < file_write_toolkit.MAX_WINDOW_BYTES
+    assert "more bytes]" in head
+
+    tail = toolkit.read_file_range("one_line.txt", start_line=-1)
+    assert len(tail) < file_write_toolkit.MAX_WINDOW_BYTES
+    assert "earlier bytes]" in tail
+
+
+@pytest.mark.unit
+def test_read_file_range(toolkit, log_file):
+    window = toolkit.read_file_range("app.log", start_line=10, num_lines=2)
+    assert window.splitlines()[1:] == [
+        "    10: line 10 ERROR",
+        "    11: line 11 ok",
+    ]
+
+    tail = toolkit.read_file_range(str(log_file), start_line=-1)
+    assert tail.splitlines()[0].startswith("[Lines 1000-1000 of")
+
+    raw = toolkit.read_file_range("app.log", byte_offset=0, num_bytes=6)
+    assert raw.endswith("\nline 1")
+
+
+@pytest.mark.unit
+def test_grep_file(toolkit, log_file):
+    result = toolkit.grep_file("app.log", "ERROR", max_matches=2)
+    assert "stopped after 2" in result
+    assert "    20: line 20 ERROR" in result
+
+    assert toolkit.grep_file("app.log", "(").startswith("Error: invalid")
+    assert toolkit.grep_file("app.log", "missing").startswith("No lines")
+
+
+@pytest.mark.unit
+def test_range_tools_are_exposed(toolkit):
+    names = {tool.get_function_name() for tool in toolkit.get_tools()}
+    assert {"read_file", "read_file_range", "grep_file"} <= names
@@ -4,7 +4,10 @@ from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from camel.storages import VectorRecord
 
+from app.utils.local_embedding import HashingEmbedding
+from app.utils.numpy_vector_storage import NumpyVectorStorage
 from app.utils.toolkit.rag_toolkit import RAGToolkit
 
 
@@ -145,8 +148,14 @@ def test_information_retrieval_success(
     """Test successful information retrieval."""
     mock_auto_retriever = MagicMock()
     mock_auto_retriever.run_vector_retriever.return_value = {
-        "text": ["Relevant content about the query"]
+        "Retrieved Context": [
+            {
+                "similarity score": "0.9",
+                "text": "Relevant content about the query",
+            }
+        ]
     }
+    mock_auto_retriever._collection_name_generator.return_value = "doc_abc"
     mock_auto_retriever_class.return_value = mock_auto_retriever
 
     with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
@@ -161,7 +170,7 @@ def test_information_retrieval_success(
             top_k=5,
         )
 
-        assert isinstance(result, str)
+        assert "Relevant content about the query" in result
         mock_auto_retriever.run_vector_retriever.assert_called_once()
 
 
@@ -198,8 +207,14 @@ def test_information_retrieval_with_list_contents(
     """Test information retrieval with multiple content sources."""
     mock_auto_retriever = MagicMock()
     mock_auto_retriever.run_vector_retriever.return_value = {
-        "text": ["Combined results from multiple sources"]
+        "Retrieved Context": [
+            {
+                "similarity score": "0.9",
+                "text": "Combined results from multiple sources",
+            }
+        ]
     }
+    mock_auto_retriever._collection_name_generator.return_value = "doc_abc"
     mock_auto_retriever_class.return_value = mock_auto_retriever
 
     with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
@@ -213,5 +228,133 @@ def test_information_retrieval_with_list_contents(
             contents=["/path/to/doc1.pdf", "/path/to/doc2.pdf"],
         )
 
-        assert isinstance(result, str)
+        assert "Combined results from multiple sources" in result
         mock_auto_retriever.run_vector_retriever.assert_called_once()
+
+
+@patch("app.utils.toolkit.rag_toolkit.AutoRetriever")
+def test_information_retrieval_reindexes_only_changed_files(
+    mock_auto_retriever_class, temp_storage_path
+):
+    """Test unchanged files keep their index and changed files are cleared."""
+    mock_auto_retriever = MagicMock()
+    mock_auto_retriever._collection_name_generator.return_value = "doc_abc"
+    mock_auto_retriever_class.return_value = mock_auto_retriever
+    storage = mock_auto_retriever._initialize_vector_storage.return_value
+    document = temp_storage_path / "doc.txt"
+    document.write_text("first version")
+
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+        toolkit = RAGToolkit(
+            api_task_id="test-task",
+            storage_path=temp_storage_path,
+        )
+
+        toolkit.information_retrieval("q", str(document))
+        toolkit.information_retrieval("q", str(document))
+        storage.clear.assert_not_called()
+
+        document.write_text("second, longer version")
+        toolkit.information_retrieval("q", str(document))
+
+    storage.clear.assert_called_once()
+    assert mock_auto_retriever.run_vector_retriever.call_count == 3
+
+
+def test_retrievers_share_cached_embedding(temp_storage_path):
+    """Test both retrieval paths embed through the persistent cache."""
+    with patch("app.utils.toolkit.rag_toolkit.AutoRetriever") as mock_ar:
+        toolkit = RAGToolkit(
+            api_task_id="test-task",
+            storage_path=temp_storage_path,
+            embedding_model=Mock(),
+            embed_batch_size=8,
+        )
+
+    embedding = mock_ar.call_args[1]["embedding_model"]
+    assert embedding is toolkit._cached_embedding
+    assert embedding.batch_size == 8
+
+
+def test_numpy_storage_and_local_embedding(temp_storage_path):
+    """Test string selectors pick the local model and NumPy store."""
+    with patch("app.utils.toolkit.rag_toolkit.AutoRetriever") as mock_ar:
+        toolkit = RAGToolkit(
+            api_task_id="test-task",
+            storage_path=temp_storage_path,
+            storage_type="numpy",
+            embedding_model="local",
+            vector_quantization="int8",
+        )
+
+    # AutoRetriever's per-file collections go to the NumPy store
+    auto_retriever = mock_ar.return_value
+    with patch(
+        "app.utils.toolkit.rag_toolkit.create_local_embedding",
+        return_value=HashingEmbedding(dim=16),
+    ):
+        storage = auto_retriever._initialize_vector_storage("doc_abc")
+
+    assert isinstance(storage.storage, NumpyVectorStorage)
+    assert storage.storage.vector_dim == 16
+    assert storage.storage.quantize == "int8"
+    assert auto_retriever._initialize_vector_storage("doc_abc") is storage
+    assert isinstance(toolkit._get_storage().storage, NumpyVectorStorage)
+
+
+def test_storage_and_embedding_from_env(temp_storage_path):
+    """Test RAG_* environment variables select the backends."""
+    with patch("app.utils.toolkit.rag_toolkit.AutoRetriever"):
+        with patch.dict(
+            "os.environ",
+            {"RAG_STORAGE_TYPE": "numpy", "RAG_EMBEDDING_MODEL": "bogus"},
+        ):
+            toolkit = RAGToolkit(
+                api_task_id="test-task",
+                storage_path=temp_storage_path,
+            )
+
+    assert toolkit._storage_type == "numpy"
+    with pytest.raises(ValueError, match="bogus"):
+        toolkit._get_embedding_model()
+
+
+def test_query_knowledge_base_fuses_keyword_and_vector_hits(
+    temp_storage_path,
+):
+    """Test exact-term chunks surface even below the similarity threshold."""
+    with patch("app.utils.toolkit.rag_toolkit.AutoRetriever"):
+        toolkit = RAGToolkit(
+            api_task_id="test-task",
+            storage_path=temp_storage_path,
+            storage_type="numpy",
+            embedding_model=HashingEmbedding(dim=64),
+        )
+    storage = toolkit._get_storage()
+    docs = {
+        "a": ("Deploy with the ZX-81 release script", "runbook"),
+        "b": ("Release notes are published weekly", "blog"),
+        "c": ("Unrelated cooking recipe for bread", "blog"),
+    }
+    storage.add(
+        [
+            VectorRecord(
+                id=doc_id,
+                vector=toolkit._cached_embedding.embed(text),
+                payload={"text": text, "extra_info": {"source": source}},
+            )
+            for doc_id, (text, source) in docs.items()
+        ]
+    )
+
+    result = toolkit.query_knowledge_base(
+        "zx-81", top_k=2, similarity_threshold=0.99
+    )
+    assert result.startswith("1. Deploy with the ZX-81 release script")
+    assert "(Source: runbook)" in result
+
+    filtered = toolkit.query_knowledge_base(
+        "release", similarity_threshold=0.0, source="blog"
+    )
+    assert "Release notes" in filtered
+    assert "ZX-81" not in filtered
@@ -241,7 +241,7 @@ def mock_workforce():
     """Mock Workforce for testing."""
     workforce = MagicMock()
     workforce._running = False
-    workforce.eigent_make_sub_tasks = MagicMock(return_value=[])
+    workforce.eigent_make_sub_tasks = AsyncMock(return_value=[])
     workforce.eigent_start = AsyncMock()
     workforce.add_single_agent_worker = MagicMock()
     workforce.pause = MagicMock()
@@ -279,6 +279,15 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def isolated_task_history(tmp_path, monkeypatch):
+    """Keep history written by evicted task locks inside each test."""
+    import app.service.task_lifecycle as task_lifecycle
+
+    monkeypatch.setenv("TASK_LOCK_PERSIST_DIR", str(tmp_path / "history"))
+    monkeypatch.setattr(task_lifecycle, "_lifecycle", None)
+
+
 @pytest.fixture
 def mock_environment_variables():
     """Mock environment variables for testing."""
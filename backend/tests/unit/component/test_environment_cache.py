@@ -0,0 +1,106 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import os
+
+import pytest
+
+import app.component.environment as environment
+from app.component.environment import (
+    EnvFileCache,
+    env,
+    env_snapshot,
+)
+
+
+@pytest.fixture
+def user_env(tmp_path, monkeypatch):
+    """Point the current thread at a user .env inside a temp base dir."""
+    monkeypatch.setattr(environment, "env_base_dir", str(tmp_path))
+    cache = EnvFileCache()
+    monkeypatch.setattr(environment, "_env_file_cache", cache)
+    path = tmp_path / "project.env"
+    path.write_text("CACHE_TEST_KEY=first\nCACHE_TEST_EMPTY=\n")
+    environment._thread_local.env_path = str(path.resolve())
+    yield path, cache
+    if hasattr(environment._thread_local, "env_path"):
+        del environment._thread_local.env_path
+
+
+@pytest.mark.unit
+def test_user_env_parsed_once(user_env):
+    _, cache = user_env
+    for _ in range(5):
+        assert env("CACHE_TEST_KEY") == "first"
+    stats = cache.stats()
+    assert stats["parses"] == 1
+    assert stats["hits"] == 4
+    assert stats["validations"] == 1
+
+
+@pytest.mark.unit
+def test_user_env_reparsed_after_change(user_env):
+    path, cache = user_env
+    assert env("CACHE_TEST_KEY") == "first"
+    path.write_text("CACHE_TEST_KEY=second-value\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert env("CACHE_TEST_KEY") == "second-value"
+    assert cache.stats()["parses"] == 2
+
+
+@pytest.mark.unit
+def test_deleted_user_env_falls_back_to_process_env(user_env, monkeypatch):
+    path, _ = user_env
+    monkeypatch.setenv("CACHE_TEST_KEY", "from-process")
+    assert env("CACHE_TEST_KEY") == "first"
+    path.unlink()
+    assert env("CACHE_TEST_KEY") == "from-process"
+
+
+@pytest.mark.unit
+def test_empty_value_uses_default(user_env):
+    assert env("CACHE_TEST_EMPTY", "fallback") == "fallback"
+    assert env("CACHE_TEST_MISSING", "fallback") == "fallback"
+
+
+@pytest.mark.unit
+def test_env_snapshot_matches_env(user_env, monkeypatch):
+    _, cache = user_env
+    monkeypatch.setenv("CACHE_TEST_OTHER", "process")
+    keys = (
+        "CACHE_TEST_KEY",
+        "CACHE_TEST_EMPTY",
+        "CACHE_TEST_OTHER",
+        "CACHE_TEST_MISSING",
+    )
+    snapshot = env_snapshot(*keys)
+    assert snapshot == {key: env(key) for key in keys}
+    assert cache.stats()["parses"] == 1
+
+
+@pytest.mark.unit
+def test_invalid_path_is_cleared(user_env, tmp_path):
+    outside = tmp_path.parent / "outside.env"
+    environment._thread_local.env_path = str(outside)
+    assert env("CACHE_TEST_KEY", "default") == "default"
+    assert not hasattr(environment._thread_local, "env_path")
+
+
+@pytest.mark.unit
+def test_cached_values_are_read_only(user_env):
+    path, cache = user_env
+    values = cache.get(str(path))
+    with pytest.raises(TypeError):
+        values["CACHE_TEST_KEY"] = "mutated"
@@ -0,0 +1,52 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.component.environment import ProjectEnv, use_project_env
+from app.component.model_factory import create_model
+
+
+@pytest.fixture
+def backend():
+    model = MagicMock()
+    model._log_enabled = True
+    model._log_dir = "camel_logs"
+    with patch(
+        "camel.models.ModelFactory.create", return_value=model
+    ) as create:
+        yield model, create
+
+
+@pytest.mark.unit
+def test_log_dir_comes_from_project_env(backend, tmp_path, monkeypatch):
+    model, create = backend
+    monkeypatch.delenv("CAMEL_LOG_DIR", raising=False)
+    log_dir = str(tmp_path / "camel_logs")
+    with use_project_env(ProjectEnv({"CAMEL_LOG_DIR": log_dir})):
+        assert create_model(model_type="gpt-4o") is model
+    create.assert_called_once_with(model_type="gpt-4o")
+    assert model._log_dir == log_dir
+    assert model._log_enabled is True
+
+
+@pytest.mark.unit
+def test_logging_disabled_without_log_dir(backend, monkeypatch):
+    model, _ = backend
+    monkeypatch.delenv("CAMEL_LOG_DIR", raising=False)
+    create_model(model_type="gpt-4o")
+    assert model._log_dir == "camel_logs"
+    assert model._log_enabled is False
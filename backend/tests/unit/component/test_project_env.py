@@ -0,0 +1,185 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+import os
+
+import pytest
+
+import app.component.environment as environment
+from app.component.environment import (
+    ProjectEnv,
+    env,
+    env_snapshot,
+    get_project_env,
+    project_environ,
+    set_project_env,
+    use_project_env,
+)
+from app.model.chat import Chat
+from app.utils.file_utils import get_working_directory
+
+
+@pytest.fixture
+def base_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(environment, "env_base_dir", str(tmp_path))
+    monkeypatch.setattr(
+        environment, "_env_file_cache", environment.EnvFileCache()
+    )
+    return tmp_path
+
+
+@pytest.mark.unit
+def test_project_values_shadow_process_env(monkeypatch):
+    monkeypatch.setenv("PROJECT_ENV_KEY", "process")
+    with use_project_env(ProjectEnv({"PROJECT_ENV_KEY": "project"})):
+        assert env("PROJECT_ENV_KEY") == "project"
+        assert env_snapshot("PROJECT_ENV_KEY") == {
+            "PROJECT_ENV_KEY": "project"
+        }
+    assert env("PROJECT_ENV_KEY") == "process"
+    assert get_project_env() is None
+
+
+@pytest.mark.unit
+def test_user_env_file_wins_over_project_values(base_dir):
+    env_file = base_dir / "user.env"
+    env_file.write_text("PROJECT_ENV_KEY=from-file\n")
+    project_env = ProjectEnv(
+        {"PROJECT_ENV_KEY": "project", "PROJECT_ENV_OTHER": "other"},
+        env_path=str(env_file),
+    )
+    with use_project_env(project_env):
+        assert env("PROJECT_ENV_KEY") == "from-file"
+        assert env("PROJECT_ENV_OTHER") == "other"
+
+
+@pytest.mark.unit
+def test_child_environ_layers_like_env(base_dir, monkeypatch):
+    monkeypatch.setenv("PROJECT_ENV_KEY", "process")
+    monkeypatch.setenv("PROJECT_ENV_PROCESS", "process")
+    env_file = base_dir / "user.env"
+    env_file.write_text("PROJECT_ENV_FILE=from-file\n")
+    project_env = ProjectEnv(
+        {"PROJECT_ENV_KEY": "project", "PROJECT_ENV_FILE": "project"},
+        env_path=str(env_file),
+    )
+    with use_project_env(project_env):
+        environ = project_environ()
+        assert project_environ(base={}) == {
+            "PROJECT_ENV_KEY": "project",
+            "PROJECT_ENV_FILE": "from-file",
+        }
+    assert environ["PROJECT_ENV_KEY"] == "project"
+    assert environ["PROJECT_ENV_FILE"] == "from-file"
+    assert environ["PROJECT_ENV_PROCESS"] == "process"
+    assert project_environ(project_env, base={})["PROJECT_ENV_KEY"] == (
+        "project"
+    )
+    assert project_environ()["PROJECT_ENV_KEY"] == "process"
+
+
+@pytest.mark.unit
+def test_rejected_env_path_is_ignored(base_dir):
+    project_env = ProjectEnv(env_path="/etc/passwd")
+    assert project_env.env_path is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_projects_are_isolated(base_dir):
+    """Interleaved requests each see only their own configuration."""
+    seen: dict[str, list] = {"a": [], "b": []}
+
+    async def request(name: str, env_text: str):
+        env_file = base_dir / f"{name}.env"
+        env_file.write_text(env_text)
+        set_project_env(
+            ProjectEnv(
+                {
+                    "OPENAI_API_KEY": f"key-{name}",
+                    "file_save_path": f"/tmp/{name}",
+                },
+                env_path=str(env_file),
+            )
+        )
+        for _ in range(20):
+            await asyncio.sleep(0)
+            seen[name].append(
+                (
+                    env("OPENAI_API_KEY"),
+                    env("file_save_path"),
+                    env("SEARCH_ENGINE_ID"),
+                    # Worker threads inherit the request's context
+                    await asyncio.to_thread(env, "OPENAI_API_KEY"),
+                )
+            )
+
+    await asyncio.gather(
+        request("a", "SEARCH_ENGINE_ID=engine-a\n"),
+        request("b", "SEARCH_ENGINE_ID=engine-b\n"),
+    )
+
+    for name in ("a", "b"):
+        expected = (f"key-{name}", f"/tmp/{name}", f"engine-{name}")
+        assert set(seen[name]) == {expected + (f"key-{name}",)}
+    assert get_project_env() is None
+    assert os.environ.get("OPENAI_API_KEY") != "key-a"
+
+
+@pytest.mark.unit
+def test_working_directory_uses_project_env():
+    options = Chat(
+        task_id="task",
+        project_id="project",
+        question="q",
+        email="user@example.com",
+        model_platform="openai",
+        model_type="gpt-4o",
+        api_key="key",
+    )
+
+    class Lock:
+        new_folder_path = None
+        project_env = ProjectEnv({"file_save_path": "/tmp/project-dir"})
+
+    assert get_working_directory(options, Lock()) == "/tmp/project-dir"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_api_key_requirement_reads_project_env(monkeypatch):
+    from app.agent.workflow_orchestrator import validate_requirement
+    from app.service.workflow import (
+        RequirementItem,
+        RequirementStatus,
+        RequirementType,
+    )
+
+    monkeypatch.delenv("EXA_API_KEY", raising=False)
+    monkeypatch.delenv("EXA_API_KEY_KEY", raising=False)
+
+    def requirement():
+        return RequirementItem(
+            id="exa",
+            type=RequirementType.API_KEY,
+            name="exa api key",
+            description="Exa search",
+        )
+
+    missing = await validate_requirement(requirement())
+    assert missing.status == RequirementStatus.MISSING
+    with use_project_env(ProjectEnv({"EXA_API_KEY": "key"})):
+        found = await validate_requirement(requirement())
+    assert found.status == RequirementStatus.VALIDATED
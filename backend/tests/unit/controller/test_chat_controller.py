@@ -28,6 +28,7 @@ from app.controller.chat_controller import (
     post,
     stop,
     supplement,
+    timeout_stream_wrapper,
 )
 from app.exception.exception import UserException
 from app.model.chat import Chat, HumanReply, McpServers, Status, SupplementChat
@@ -50,13 +51,13 @@ class TestChatController:
 
         with (
             patch(
-                "app.controller.chat_controller.create_task_lock",
+                "app.controller.chat_controller.get_or_create_task_lock",
                 return_value=mock_task_lock,
             ),
             patch(
                 "app.controller.chat_controller.step_solve"
             ) as mock_step_solve,
-            patch("app.controller.chat_controller.load_dotenv"),
+            patch("app.controller.chat_controller.set_current_task_id"),
             patch("pathlib.Path.mkdir"),
             patch("pathlib.Path.home", return_value=MagicMock()),
         ):
@@ -79,18 +80,18 @@ class TestChatController:
     async def test_post_chat_sets_environment_variables(
         self, sample_chat_data, mock_request, mock_task_lock
     ):
-        """Test that environment variables are properly set."""
+        """Test that request settings are stored per project."""
         chat_data = Chat(**sample_chat_data)
 
         with (
             patch(
-                "app.controller.chat_controller.create_task_lock",
+                "app.controller.chat_controller.get_or_create_task_lock",
                 return_value=mock_task_lock,
             ),
             patch(
                 "app.controller.chat_controller.step_solve"
             ) as mock_step_solve,
-            patch("app.controller.chat_controller.load_dotenv"),
+            patch("app.controller.chat_controller.set_current_task_id"),
             patch("pathlib.Path.mkdir"),
             patch("pathlib.Path.home", return_value=MagicMock()),
             patch.dict(os.environ, {}, clear=True),
@@ -103,14 +104,17 @@ class TestChatController:
 
             await post(chat_data, mock_request)
 
-            # Check environment variables were set
-            assert os.environ.get("OPENAI_API_KEY") == "test_key"
+            # Request settings go to the project, not the process
+            project_env = mock_task_lock.project_env
+            assert project_env.get("OPENAI_API_KEY") == "test_key"
             assert (
-                os.environ.get("OPENAI_API_BASE_URL")
+                project_env.get("OPENAI_API_BASE_URL")
                 == "https://api.openai.com/v1"
             )
+            assert project_env.get("browser_port") == "8080"
+            assert "OPENAI_API_KEY" not in os.environ
+            assert "browser_port" not in os.environ
             assert os.environ.get("CAMEL_MODEL_LOG_ENABLED") == "true"
-            assert os.environ.get("browser_port") == "8080"
 
     def test_improve_chat_success(self, mock_task_lock):
         """Test successful chat improvement."""
@@ -233,6 +237,27 @@ class TestChatController:
             assert response.status_code == 201
             mock_run.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_timeout_stream_wrapper_tracks_consumer(self):
+        """Test the stream counts as a queue consumer while it runs."""
+        task_lock = MagicMock()
+        seen = []
+
+        async def generator():
+            seen.append(task_lock.attach_consumer.call_count)
+            yield "data: test_response\n\n"
+
+        chunks = [
+            chunk
+            async for chunk in timeout_stream_wrapper(
+                generator(), task_lock=task_lock
+            )
+        ]
+
+        assert chunks == ["data: test_response\n\n"]
+        assert seen == [1]
+        task_lock.detach_consumer.assert_called_once()
+
 
 @pytest.mark.integration
 class TestChatControllerIntegration:
@@ -244,12 +269,12 @@ class TestChatControllerIntegration:
         """Test chat endpoint through FastAPI test client."""
         with (
             patch(
-                "app.controller.chat_controller.create_task_lock"
+                "app.controller.chat_controller.get_or_create_task_lock"
             ) as mock_create_lock,
             patch(
                 "app.controller.chat_controller.step_solve"
             ) as mock_step_solve,
-            patch("app.controller.chat_controller.load_dotenv"),
+            patch("app.controller.chat_controller.set_current_task_id"),
             patch("pathlib.Path.mkdir"),
             patch("pathlib.Path.home", return_value=MagicMock()),
         ):
@@ -455,12 +480,8 @@ class TestChatControllerErrorCases:
 
         with (
             patch(
-                "app.controller.chat_controller.create_task_lock"
+                "app.controller.chat_controller.get_or_create_task_lock"
             ) as mock_create_lock,
-            patch(
-                "app.controller.chat_controller.load_dotenv",
-                side_effect=Exception("Env load failed"),
-            ),
             patch(
                 "pathlib.Path.mkdir",
                 side_effect=Exception("Directory creation failed"),
@@ -125,7 +125,6 @@ class TestTaskController:
                 "app.controller.task_controller.get_task_lock",
                 return_value=mock_task_lock,
             ),
-            patch("app.controller.task_controller.load_dotenv"),
             patch("asyncio.run") as mock_run,
         ):
             response = add_agent(task_id, new_agent)
@@ -179,7 +178,6 @@ class TestTaskController:
                 "app.controller.task_controller.get_task_lock",
                 return_value=mock_task_lock,
             ),
-            patch("app.controller.task_controller.load_dotenv"),
             patch("asyncio.run") as mock_run,
         ):
             response = add_agent(task_id, new_agent)
@@ -290,7 +288,6 @@ class TestTaskControllerIntegration:
             patch(
                 "app.controller.task_controller.get_task_lock"
             ) as mock_get_lock,
-            patch("app.controller.task_controller.load_dotenv"),
             patch("asyncio.run"),
         ):
             mock_task_lock = MagicMock()
@@ -350,8 +347,8 @@ class TestTaskControllerErrorCases:
         with pytest.raises((ValueError, TypeError)):
             TakeControl(action="invalid_action")
 
-    def test_add_agent_env_load_failure(self, mock_task_lock):
-        """Test add agent when environment loading fails."""
+    def test_add_agent_sets_project_env_path(self, mock_task_lock):
+        """Test add agent points the project at the user's env file."""
         task_id = "test_task_123"
         new_agent = NewAgent(
             name="Test Agent",
@@ -366,15 +363,13 @@ class TestTaskControllerErrorCases:
                 "app.controller.task_controller.get_task_lock",
                 return_value=mock_task_lock,
             ),
-            patch(
-                "app.controller.task_controller.load_dotenv",
-                side_effect=Exception("Env load failed"),
-            ),
             patch("asyncio.run"),
         ):
-            # Should handle environment load failure gracefully or raise error
-            with pytest.raises(Exception, match="Env load failed"):
-                add_agent(task_id, new_agent)
+            add_agent(task_id, new_agent)
+
+            mock_task_lock.project_env.set_env_path.assert_called_once_with(
+                "nonexistent.env"
+            )
 
     def test_add_agent_with_empty_name(self, mock_task_lock):
         """Test add agent with empty name."""
@@ -392,7 +387,6 @@ class TestTaskControllerErrorCases:
                 "app.controller.task_controller.get_task_lock",
                 return_value=mock_task_lock,
             ),
-            patch("app.controller.task_controller.load_dotenv"),
             patch("asyncio.run"),
         ):
             # Should handle empty name appropriately
@@ -13,7 +13,6 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import asyncio
-import weakref
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -35,13 +34,13 @@ from app.service.task import (
     ActionUpdateTaskData,
     Agents,
     TaskLock,
+    TaskTreeIndex,
     create_task_lock,
     delete_task_lock,
     get_camel_task,
     get_task_lock,
     process_task,
     set_process_task,
-    task_index,
     task_locks,
 )
 
@@ -218,6 +217,46 @@ class TestTaskLock:
         retrieved_data = await task_lock.get_queue()
         assert retrieved_data == data
 
+    @pytest.mark.asyncio
+    async def test_task_lock_put_queue_threadsafe(self):
+        """Test putting data from the loop and from worker threads."""
+        task_lock = TaskLock("test_123", asyncio.Queue(), {})
+        in_loop, from_thread = ActionStartData(), ActionStartData()
+
+        assert task_lock.put_queue_threadsafe(in_loop) is True
+        assert task_lock.queue.get_nowait() is in_loop
+
+        result = await asyncio.to_thread(
+            task_lock.put_queue_threadsafe, from_thread
+        )
+
+        assert result is True
+        retrieved = await asyncio.wait_for(task_lock.get_queue(), 1)
+        assert retrieved is from_thread
+
+    def test_task_lock_put_queue_threadsafe_without_loop(self):
+        """Test data is dropped when no event loop owns the queue."""
+        task_lock = TaskLock("test_123", asyncio.Queue(), {})
+
+        with patch("app.service.task.get_main_event_loop", return_value=None):
+            assert task_lock.put_queue_threadsafe(ActionStartData()) is False
+        assert task_lock.queue.empty()
+
+    def test_task_lock_consumer_tracking(self):
+        """Test SSE consumers are counted and never go negative."""
+        task_lock = TaskLock("test_123", asyncio.Queue(), {})
+        assert task_lock.has_consumer is False
+
+        task_lock.attach_consumer()
+        task_lock.attach_consumer()
+        task_lock.detach_consumer()
+        assert task_lock.has_consumer is True
+
+        task_lock.detach_consumer()
+        task_lock.detach_consumer()
+        assert task_lock.sse_consumers == 0
+        assert task_lock.has_consumer is False
+
     @pytest.mark.asyncio
     async def test_task_lock_get_queue(self):
         """Test getting data from task lock queue."""
@@ -368,10 +407,6 @@ class TestTaskLockManagement:
 class TestCamelTaskManagement:
     """Test cases for CAMEL task management functions."""
 
-    def setup_method(self):
-        """Clean up task_index before each test."""
-        task_index.clear()
-
     def test_get_camel_task_direct_match(self):
         """Test getting CAMEL task with direct ID match."""
         task = Task(content="Test task", id="test_123")
@@ -398,43 +433,81 @@ class TestCamelTaskManagement:
         result = get_camel_task("nonexistent_task", tasks)
         assert result is None
 
-    def test_get_camel_task_from_cache(self):
-        """Test getting CAMEL task from weak reference cache."""
+    def test_get_camel_task_from_index(self):
+        """Test getting CAMEL task from a task tree index."""
         task = Task(content="Test task", id="test_123")
-        task_index["test_123"] = weakref.ref(task)
+        index = TaskTreeIndex()
+        index.add(task)
 
-        result = get_camel_task("test_123", [])
+        result = get_camel_task("test_123", [], index)
         assert result is task
 
-    def test_get_camel_task_dead_reference(self):
-        """Test getting CAMEL task with dead weak reference."""
-        task = Task(content="Test task", id="test_123")
-        task_ref = weakref.ref(task)
-        task_index["test_123"] = task_ref
-
-        # Delete the original task to make the weak reference dead
-        del task
-
-        # Should rebuild index and return None since task is not in tasks list
-        result = get_camel_task("test_123", [])
-        assert result is None
-        assert "test_123" not in task_index
-
-    def test_get_camel_task_rebuilds_index(self):
-        """Test that get_camel_task rebuilds the index."""
-        task1 = Task(content="Task 1", id="task_1")
-        task2 = Task(content="Task 2", id="task_2")
-        tasks = [task1, task2]
-
-        # Index should be empty initially
-        assert len(task_index) == 0
+    def test_get_camel_task_populates_index(self):
+        """Test that a fallback search adds the found task to the index."""
+        subtask = Task(content="Subtask", id="subtask_123")
+        parent_task = Task(content="Parent task", id="parent_123")
+        parent_task.add_subtask(subtask)
+        index = TaskTreeIndex()
 
-        # Getting a task should rebuild the index
-        result = get_camel_task("task_2", tasks)
-        assert result is task2
-        assert len(task_index) == 2
-        assert "task_1" in task_index
-        assert "task_2" in task_index
+        result = get_camel_task("subtask_123", [parent_task], index)
+        assert result is subtask
+        assert "subtask_123" in index
+        assert index.get_parent("subtask_123") is parent_task
+
+    def test_task_tree_index_parent_and_children(self):
+        """Test parent pointers and children maps of the task tree index."""
+        root = Task(content="Root", id="root")
+        child1 = Task(content="Child 1", id="root.1")
+        child2 = Task(content="Child 2", id="root.2")
+        root.add_subtask(child1)
+        root.add_subtask(child2)
+        index = TaskTreeIndex()
+        index.add(root)
+
+        assert len(index) == 3
+        assert index.get_parent("root.1") is root
+        assert index.get_children("root") == [child1, child2]
+        assert index.get_child("root", "root.2") is child2
+
+    def test_task_tree_index_remove_subtree(self):
+        """Test removing a task drops its descendants and parent link."""
+        root = Task(content="Root", id="root")
+        child = Task(content="Child", id="root.1")
+        grandchild = Task(content="Grandchild", id="root.1.1")
+        root.add_subtask(child)
+        child.add_subtask(grandchild)
+        index = TaskTreeIndex()
+        index.add(root)
+
+        assert index.remove("root.1") is child
+        assert "root.1" not in index
+        assert "root.1.1" not in index
+        assert index.get_children("root") == []
+        assert index.remove("missing") is None
+
+    def test_task_tree_index_set_children_drops_stale(self):
+        """Test set_children replaces children and removes stale ones."""
+        root = Task(content="Root", id="root")
+        old_child = Task(content="Old", id="root.1")
+        root.add_subtask(old_child)
+        index = TaskTreeIndex()
+        index.add(root)
+
+        new_child = Task(content="New", id="root.2")
+        index.set_children(root, [new_child])
+
+        assert "root.1" not in index
+        assert index.get_children("root") == [new_child]
+        assert index.get_parent("root.2") is root
+
+    def test_task_tree_indexes_are_isolated(self):
+        """Test separate indexes never share entries."""
+        index_a = TaskTreeIndex()
+        index_b = TaskTreeIndex()
+        index_a.add(Task(content="Project A task", id="shared_id"))
+
+        assert get_camel_task("shared_id", [], index_b) is None
+        assert len(index_b) == 0
 
 
 @pytest.mark.unit
@@ -552,7 +625,6 @@ class TestTaskServiceIntegration:
     def setup_method(self):
         """Clean up before each test."""
         task_locks.clear()
-        task_index.clear()
 
     @pytest.mark.asyncio
     async def test_full_task_lifecycle(self):
@@ -0,0 +1,197 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import app.service.task_lifecycle as task_lifecycle
+from app.controller.admin_controller import sweep_task_locks, task_lock_stats
+from app.service.task import create_task_lock, delete_task_lock, task_locks
+from app.service.task_lifecycle import (
+    TaskLockLifecycle,
+    estimate_task_lock_bytes,
+)
+
+
+@pytest.fixture
+def lifecycle(tmp_path, monkeypatch):
+    task_locks.clear()
+    manager = TaskLockLifecycle(ttl_seconds=60, persist_dir=tmp_path)
+    monkeypatch.setattr(task_lifecycle, "_lifecycle", manager)
+    yield manager
+    task_locks.clear()
+
+
+def _age(task_lock, seconds):
+    task_lock.last_accessed = datetime.now() - timedelta(seconds=seconds)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_idle_locks_evicted_after_ttl(lifecycle):
+    stale = create_task_lock("stale")
+    create_task_lock("fresh")
+    _age(stale, 120)
+
+    assert await lifecycle.sweep() == ["stale"]
+    assert set(task_locks) == {"fresh"}
+    assert lifecycle.evicted == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_busy_locks_are_kept(lifecycle):
+    streaming = create_task_lock("streaming")
+    streaming.attach_consumer()
+    working = create_task_lock("working")
+    working.background_tasks.add(asyncio.create_task(asyncio.sleep(10)))
+    _age(streaming, 120)
+    _age(working, 120)
+
+    assert await lifecycle.sweep() == []
+    for task in working.background_tasks:
+        task.cancel()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lru_eviction_over_count_budget(lifecycle):
+    lifecycle.max_locks = 2
+    for i, project_id in enumerate(["a", "b", "c", "d"]):
+        _age(create_task_lock(project_id), 40 - i * 10)
+
+    assert await lifecycle.sweep() == ["a", "b"]
+    assert set(task_locks) == {"c", "d"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lru_eviction_over_byte_budget(lifecycle):
+    big = create_task_lock("big")
+    big.conversation_history = [{"role": "user", "content": "x" * 50_000}]
+    _age(big, 30)
+    small = create_task_lock("small")
+    lifecycle.max_bytes = estimate_task_lock_bytes(small) + 1000
+
+    assert estimate_task_lock_bytes(big) > 50_000
+    assert await lifecycle.sweep() == ["big"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_evicted_history_is_rehydrated(lifecycle):
+    task_lock = create_task_lock("project/1")
+    task_lock.conversation_history = [
+        {"role": "user", "content": "hello"},
+        {"role": "assistant", "content": "hi"},
+    ]
+    task_lock.last_task_result = "result"
+    _age(task_lock, 120)
+    await lifecycle.sweep()
+    assert "project/1" not in task_locks
+
+    restored = create_task_lock("project/1")
+    assert restored.conversation_history == task_lock.conversation_history
+    assert restored.last_task_result == "result"
+    assert lifecycle.rehydrated == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_history_survives_repeated_eviction(lifecycle, tmp_path):
+    task_lock = create_task_lock("project")
+    task_lock.conversation_history = [{"role": "user", "content": "first"}]
+    assert await lifecycle.evict("project", "ttl")
+
+    restored = create_task_lock("project")
+    assert restored.conversation_history == task_lock.conversation_history
+    # The restored lock owns the history now
+    assert not (tmp_path / "project.json").exists()
+    restored.conversation_history.append({"role": "user", "content": "second"})
+    assert await lifecycle.evict("project", "ttl")
+
+    again = create_task_lock("project")
+    assert [entry["content"] for entry in again.conversation_history] == [
+        "first",
+        "second",
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ended_task_leaves_no_history(lifecycle, tmp_path):
+    task_lock = create_task_lock("project")
+    task_lock.conversation_history = [{"role": "user", "content": "old"}]
+    await delete_task_lock("project")
+    assert not (tmp_path / "project.json").exists()
+
+    # History saved by an eviction is dropped once the task ends
+    lifecycle.persist(task_lock)
+    assert (tmp_path / "project.json").exists()
+    lifecycle.persist_dir = None
+    create_task_lock("project")
+    lifecycle.persist_dir = tmp_path
+    await delete_task_lock("project")
+    assert not (tmp_path / "project.json").exists()
+
+
+@pytest.mark.unit
+def test_saved_history_is_pruned_by_count(lifecycle, tmp_path):
+    lifecycle.history_max_files = 0
+    lifecycle.history_max_age = timedelta(days=365 * 100)
+    for index, name in enumerate(["a", "b", "c"]):
+        task_lock = create_task_lock(name)
+        task_lock.conversation_history = [{"role": "user", "content": name}]
+        assert lifecycle.persist(task_lock)
+        mtime = 1_000_000 + index
+        os.utime(tmp_path / f"{name}.json", (mtime, mtime))
+
+    lifecycle.history_max_files = 2
+    assert lifecycle.prune_history() == 1
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == [
+        "b.json",
+        "c.json",
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_expired_history_is_not_restored(lifecycle, tmp_path):
+    task_lock = create_task_lock("project")
+    task_lock.conversation_history = [{"role": "user", "content": "old"}]
+    assert await lifecycle.evict("project", "ttl")
+    expired = time.time() - lifecycle.history_max_age.total_seconds() - 60
+    os.utime(tmp_path / "project.json", (expired, expired))
+
+    assert create_task_lock("project").conversation_history == []
+    assert not (tmp_path / "project.json").exists()
+    assert lifecycle.rehydrated == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_admin_endpoints(lifecycle):
+    create_task_lock("one")
+    _age(create_task_lock("two"), 120)
+
+    stats = await task_lock_stats()
+    assert stats["count"] == 2
+    assert stats["bytes"] == sum(item["bytes"] for item in stats["locks"])
+
+    assert await sweep_task_locks() == {"evicted": ["two"]}
+    assert (await task_lock_stats())["count"] == 1
@@ -0,0 +1,362 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+import fnmatch
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import app.service.task_registry as task_registry
+from app.exception.exception import ProgramException, UserException
+from app.model.chat import Status, SupplementChat
+from app.service.task import (
+    Action,
+    ActionImproveData,
+    ActionSkipTaskData,
+    RemoteTaskLock,
+    create_task_lock,
+    delete_task_lock,
+    get_remote_task_locks,
+    get_task_lock,
+    get_task_lock_if_exists,
+)
+from app.service.task_registry import (
+    LocalTaskRegistry,
+    RedisTaskRegistry,
+    create_task_registry,
+    set_task_registry,
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the registry uses."""
+
+    def __init__(self):
+        self._data: dict[str, object] = {}
+        self._expiry: dict[str, float] = {}
+        self._cond = threading.Condition()
+
+    def _live(self, key):
+        deadline = self._expiry.get(key)
+        if deadline is not None and time.monotonic() >= deadline:
+            self._data.pop(key, None)
+            self._expiry.pop(key, None)
+        return key in self._data
+
+    def set(self, key, value, nx=False, px=None):
+        with self._cond:
+            if nx and self._live(key):
+                return None
+            self._data[key] = value.encode()
+            self._expiry.pop(key, None)
+            if px is not None:
+                self._expiry[key] = time.monotonic() + px / 1000
+            return True
+
+    def get(self, key):
+        with self._cond:
+            return self._data[key] if self._live(key) else None
+
+    def pexpire(self, key, ms):
+        with self._cond:
+            if not self._live(key):
+                return 0
+            self._expiry[key] = time.monotonic() + ms / 1000
+            return 1
+
+    def delete(self, key):
+        with self._cond:
+            self._expiry.pop(key, None)
+            return int(self._data.pop(key, None) is not None)
+
+    def eval(self, script, numkeys, *keys_and_args):
+        """Run the registry's scripts atomically, as Redis would."""
+        key, worker_id, *args = keys_and_args
+        with self._cond:
+            if not self._live(key) or self._data[key] != worker_id.encode():
+                return 0
+            if script == task_registry._RENEW_SCRIPT:
+                self._expiry[key] = time.monotonic() + int(args[0]) / 1000
+                return 1
+            if script == task_registry._DROP_SCRIPT:
+                return self.delete(key)
+            raise NotImplementedError(script)
+
+    def scan_iter(self, match):
+        with self._cond:
+            return [
+                key.encode()
+                for key in list(self._data)
+                if self._live(key) and fnmatch.fnmatchcase(key, match)
+            ]
+
+    def mget(self, keys):
+        with self._cond:
+            return [self.get(key.decode()) for key in keys]
+
+    def rpush(self, key, value):
+        with self._cond:
+            if not self._live(key):
+                self._data[key] = []
+            self._data[key].append(value.encode())
+            self._cond.notify_all()
+            return len(self._data[key])
+
+    def blpop(self, keys, timeout=0):
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                for key in keys:
+                    if self._live(key) and self._data[key]:
+                        return key.encode(), self._data[key].pop(0)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+
+@pytest.fixture
+def redis_pair():
+    server = FakeRedis()
+    a = RedisTaskRegistry(server, worker_id="worker-a")
+    b = RedisTaskRegistry(server, worker_id="worker-b")
+    yield a, b
+    for registry in (a, b):
+        for project_id in registry.owned():
+            registry.release(project_id)
+    set_task_registry(None)
+
+
+@pytest.mark.unit
+def test_local_registry_never_routes():
+    registry = LocalTaskRegistry()
+    assert registry.acquire("p")
+    assert registry.owner("p") == registry.worker_id
+    assert registry.remote_owner("p") is None
+    assert registry.route("p", {"type": "action"}) is False
+    registry.release("p")
+    assert registry.owner("p") is None
+
+
+@pytest.mark.unit
+def test_default_registry_is_local():
+    assert isinstance(create_task_registry(None), LocalTaskRegistry)
+    assert isinstance(create_task_registry("memory://"), LocalTaskRegistry)
+
+
+@pytest.mark.unit
+def test_ownership_is_exclusive(redis_pair):
+    a, b = redis_pair
+    assert a.acquire("p")
+    assert not b.acquire("p")
+    assert b.remote_owner("p") == "worker-a"
+    assert a.remote_owner("p") is None
+
+    a.release("p")
+    assert b.acquire("p")
+    assert a.remote_owner("p") == "worker-b"
+
+
+@pytest.mark.unit
+def test_expired_lease_can_be_taken_over():
+    server = FakeRedis()
+    a = RedisTaskRegistry(server, worker_id="a", lease_seconds=0.05)
+    b = RedisTaskRegistry(server, worker_id="b", lease_seconds=0.05)
+    # Claim without the renewing worker, as if worker a had crashed
+    assert a._claim("p")
+    assert not b._claim("p")
+    time.sleep(0.1)
+    assert b._claim("p")
+    assert not a._renew("p")
+    # The stale owner cannot drop the new owner's lease
+    a._drop("p")
+    assert b.owner("p") == "b"
+
+
+@pytest.mark.unit
+def test_lease_is_renewed_while_owned():
+    server = FakeRedis()
+    a = RedisTaskRegistry(server, worker_id="a", lease_seconds=0.3)
+    b = RedisTaskRegistry(server, worker_id="b", lease_seconds=0.3)
+    assert a.acquire("p")
+    time.sleep(0.6)
+    assert b.owner("p") == "a"
+    a.release("p")
+    assert b.owner("p") is None
+
+
+@pytest.mark.unit
+def test_route_delivers_to_owner_inbox(redis_pair):
+    a, b = redis_pair
+    a._claim("p")
+    assert b.route("p", {"type": "action", "data": {"x": 1}})
+    assert a.receive(timeout=1) == {
+        "type": "action",
+        "data": {"x": 1},
+        "project_id": "p",
+    }
+    assert b.receive(timeout=1) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_control_actions_reach_owning_task_lock(redis_pair):
+    """An action sent from another worker lands in the owner's queue."""
+    a, b = redis_pair
+    set_task_registry(a)
+    task_lock = create_task_lock("routed-project")
+    try:
+        # What worker b hands its control endpoints for this project
+        remote = RemoteTaskLock(
+            "routed-project", b.remote_owner("routed-project"), b
+        )
+        assert remote.owner == "worker-a"
+
+        await remote.put_queue(ActionSkipTaskData(project_id="p"))
+        action = await asyncio.wait_for(task_lock.get_queue(), 5)
+        assert isinstance(action, ActionSkipTaskData)
+        assert action.project_id == "p"
+
+        task_lock.add_human_input_listen("agent")
+        await remote.put_human_input("agent", "yes")
+        reply = await asyncio.wait_for(task_lock.get_human_input("agent"), 5)
+        assert reply == "yes"
+    finally:
+        set_task_registry(a)
+        await delete_task_lock("routed-project")
+    assert a.owner("routed-project") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_improve_on_other_worker_updates_owning_task_lock(
+    redis_pair, tmp_path, monkeypatch
+):
+    """improve() from a non-owner is applied to the owner's TaskLock."""
+    from app.controller import chat_controller
+
+    a, b = redis_pair
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    project = tmp_path / "eigent" / "user@example.com" / "project_p1"
+    set_task_registry(a)
+    task_lock = create_task_lock("p1")
+    task_lock.status = Status.done
+    task_lock.project_env.set("file_save_path", str(project / "task_1"))
+    try:
+        remote = RemoteTaskLock("p1", b.remote_owner("p1"), b)
+        monkeypatch.setattr(
+            chat_controller, "get_task_lock", lambda id: remote
+        )
+        response = chat_controller.improve(
+            "p1", SupplementChat(question="and then?", task_id="2")
+        )
+        assert response.status_code == 201
+
+        action = await asyncio.wait_for(task_lock.get_queue(), 5)
+        assert isinstance(action, ActionImproveData)
+        assert (action.data, action.new_task_id) == ("and then?", "2")
+        assert task_lock.status == Status.confirming
+        assert task_lock.new_folder_path == project / "task_2"
+        assert task_lock.project_env.get("file_save_path") == str(
+            project / "task_2"
+        )
+    finally:
+        set_task_registry(a)
+        await delete_task_lock("p1")
+
+
+@pytest.mark.unit
+def test_project_owned_elsewhere_cannot_be_started(redis_pair):
+    a, b = redis_pair
+    assert a.acquire("busy-project")
+    set_task_registry(b)
+    with pytest.raises(ProgramException):
+        create_task_lock("busy-project")
+    remote = get_task_lock("busy-project")
+    assert isinstance(remote, RemoteTaskLock)
+    assert remote.owner == "worker-a"
+    with pytest.raises(ProgramException):
+        get_task_lock("unknown-project")
+
+
+@pytest.mark.unit
+def test_lost_lease_stops_being_renewed():
+    server = FakeRedis()
+    a = RedisTaskRegistry(server, worker_id="a", lease_seconds=0.3)
+    assert a.acquire("p")
+    # Another worker took the project over
+    server.set(a._owner_key("p"), "b", px=10_000)
+    deadline = time.monotonic() + 2
+    while "p" in a.owned() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert a.owned() == set()
+    assert a.owner("p") == "b"
+
+
+@pytest.mark.unit
+def test_lookups_see_projects_owned_elsewhere(redis_pair):
+    a, b = redis_pair
+    assert a.acquire("remote-project")
+    assert b.acquire("own-project")
+    set_task_registry(b)
+
+    remote = get_task_lock_if_exists("remote-project")
+    assert isinstance(remote, RemoteTaskLock)
+    assert remote.owner == "worker-a"
+    assert get_task_lock_if_exists("unknown-project") is None
+    assert [(lock.id, lock.owner) for lock in get_remote_task_locks()] == [
+        ("remote-project", "worker-a")
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_supplement_and_queries_on_other_worker(redis_pair, monkeypatch):
+    """Endpoints that need the owner's state are answered by the owner."""
+    from app.controller import chat_controller
+
+    a, b = redis_pair
+    set_task_registry(a)
+    task_lock = create_task_lock("p2")
+    try:
+        remote = RemoteTaskLock("p2", b.remote_owner("p2"), b)
+        monkeypatch.setattr(
+            chat_controller, "get_task_lock", lambda id: remote
+        )
+        data = SupplementChat(question="more detail")
+        with pytest.raises(UserException) as exc_info:
+            chat_controller.supplement("p2", data)
+        assert exc_info.value.description == "Please wait task done"
+
+        task_lock.status = Status.done
+        assert chat_controller.supplement("p2", data).status_code == 201
+        action = await asyncio.wait_for(task_lock.get_queue(), 5)
+        assert action.action == Action.supplement
+        assert action.data.question == "more detail"
+
+        assert chat_controller.get_workflow_state_endpoint("p2") == (
+            chat_controller._workflow_state_on_owner(task_lock, {})
+        )
+        assert chat_controller.get_plan_draft_endpoint("p2") == {
+            "tasks": [],
+            "summary": None,
+            "can_start": False,
+        }
+    finally:
+        set_task_registry(a)
+        await delete_task_lock("p2")
@@ -0,0 +1,155 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from camel.tasks import Task
+
+from app.service.task import TaskLock
+from app.service.workflow import PlanUpdatePayload, PlanUpdateType
+from app.service.workflow_handler import (
+    discard_speculation,
+    get_speculative_plan,
+    handle_plan_update,
+    rebase_speculation,
+    start_speculation,
+    store_original_message,
+    take_speculative_draft,
+    take_speculative_workforce,
+)
+
+
+def _make_task_lock() -> TaskLock:
+    return TaskLock("test_project", asyncio.Queue(), {})
+
+
+def _make_workforce(subtasks: list[Task]) -> MagicMock:
+    workforce = MagicMock()
+    workforce.handle_decompose_append_task = AsyncMock(return_value=subtasks)
+    return workforce
+
+
+@pytest.mark.unit
+class TestSpeculativePlanning:
+    """Test cases for speculative workforce construction and drafting."""
+
+    @pytest.mark.asyncio
+    async def test_draft_is_consumed_for_matching_content(self):
+        task_lock = _make_task_lock()
+        store_original_message(task_lock, "Build a website")
+        subtasks = [Task(content="Setup", id="1")]
+        workforce = _make_workforce(subtasks)
+        build = AsyncMock(return_value=(workforce, None))
+
+        start_speculation(task_lock, MagicMock(), build)
+
+        assert await take_speculative_workforce(task_lock) == (
+            workforce,
+            None,
+        )
+        assert (
+            await take_speculative_draft(task_lock, "Build a website")
+            == subtasks
+        )
+        # A draft is consumed at most once
+        assert (
+            await take_speculative_draft(task_lock, "Build a website") is None
+        )
+        build.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_content_change_rebases_draft_on_same_workforce(self):
+        task_lock = _make_task_lock()
+        store_original_message(task_lock, "Build a website")
+        workforce = _make_workforce([Task(content="Setup", id="1")])
+        build = AsyncMock(return_value=(workforce, None))
+
+        plan = start_speculation(task_lock, MagicMock(), build)
+        stale_draft = plan.draft_task
+
+        store_original_message(task_lock, "Build a blog")
+        rebase_speculation(task_lock, MagicMock())
+        await asyncio.sleep(0)
+
+        assert stale_draft.cancelled()
+        assert plan.draft_content == "Build a blog"
+        assert await take_speculative_draft(task_lock, "Build a blog")
+        build.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_mismatched_content_cancels_draft(self):
+        task_lock = _make_task_lock()
+        store_original_message(task_lock, "Build a website")
+        workforce = _make_workforce([])
+        start_speculation(
+            task_lock, MagicMock(), AsyncMock(return_value=(workforce, None))
+        )
+
+        assert await take_speculative_draft(task_lock, "Other") is None
+        assert get_speculative_plan(task_lock).draft_task is None
+
+    @pytest.mark.asyncio
+    async def test_plan_update_cancels_pending_draft(self):
+        task_lock = _make_task_lock()
+        store_original_message(task_lock, "Build a website")
+        started = asyncio.Event()
+
+        async def slow_build():
+            started.set()
+            await asyncio.sleep(10)
+
+        plan = start_speculation(task_lock, MagicMock(), slow_build)
+        draft_task = plan.draft_task
+        await started.wait()
+
+        async for _ in handle_plan_update(
+            task_lock, PlanUpdatePayload(update_type=PlanUpdateType.APPROVE)
+        ):
+            pass
+        await asyncio.sleep(0)
+
+        assert draft_task.cancelled()
+        # The workforce keeps building until the speculation is discarded
+        assert not plan.workforce_task.done()
+        discard_speculation(task_lock)
+        await asyncio.sleep(0)
+        assert plan.workforce_task.cancelled()
+        assert get_speculative_plan(task_lock) is None
+
+    @pytest.mark.asyncio
+    async def test_task_lock_cleanup_discards_speculation(self):
+        task_lock = _make_task_lock()
+        store_original_message(task_lock, "Build a website")
+
+        async def slow_build():
+            await asyncio.sleep(10)
+
+        plan = start_speculation(task_lock, MagicMock(), slow_build)
+        await task_lock.cleanup()
+
+        assert plan.workforce_task.cancelled()
+        assert plan.draft_task is None
+        assert get_speculative_plan(task_lock) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_workforce_construction_falls_back(self):
+        task_lock = _make_task_lock()
+        store_original_message(task_lock, "Build a website")
+        build = AsyncMock(side_effect=RuntimeError("boom"))
+        start_speculation(task_lock, MagicMock(), build)
+
+        assert await take_speculative_workforce(task_lock) is None
+        assert get_speculative_plan(task_lock) is None
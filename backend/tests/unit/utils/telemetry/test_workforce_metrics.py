@@ -249,6 +249,32 @@ def test_log_task_failed(metrics_callback):
     assert mock_span.end.called
 
 
+def test_task_indexes_track_latest_error_worker_and_timing(metrics_callback):
+    """Test per-task indexes are updated by task lifecycle events."""
+    metrics_callback.log_task_started(
+        TaskStartedEvent(task_id="task_1", worker_id="worker_1")
+    )
+    for attempt in range(2):
+        metrics_callback.log_task_failed(
+            TaskFailedEvent(
+                task_id="task_1",
+                worker_id="worker_2",
+                error_message=f"error {attempt}",
+            )
+        )
+
+    assert metrics_callback.get_task_error("task_1") == "error 1"
+    assert metrics_callback.get_task_worker("task_1") == "worker_2"
+    timing = metrics_callback.get_task_timing("task_1")
+    assert "started_at" in timing and "finished_at" in timing
+    assert metrics_callback.get_task_error("unknown") is None
+    assert metrics_callback.get_task_timing("unknown") == {}
+
+    metrics_callback.reset_task_data()
+    assert metrics_callback.get_task_error("task_1") is None
+    assert metrics_callback.get_task_timing("task_1") == {}
+
+
 def test_log_message_error(metrics_callback):
     """Test log_message function with error level."""
     event = LogEvent(
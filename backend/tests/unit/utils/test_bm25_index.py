@@ -0,0 +1,102 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from unittest.mock import MagicMock
+
+import pytest
+from camel.storages import VectorRecord
+
+from app.utils.bm25_index import (
+    BM25Index,
+    KeywordIndexedStorage,
+    reciprocal_rank_fusion,
+)
+
+
+@pytest.fixture
+def index(temp_dir):
+    index = BM25Index(temp_dir / "index.sqlite3")
+    index.add(
+        "docs",
+        [
+            ("1", "the quick brown fox", "a.txt"),
+            ("2", "the lazy dog sleeps all day, dog dog", "a.txt"),
+            ("3", "a quick dog", "b.txt"),
+        ],
+    )
+    index.add("other", [("4", "quick quick quick", "c.txt")])
+    yield index
+    index.close()
+
+
+@pytest.mark.unit
+class TestBM25Index:
+    """Test cases for the BM25 keyword index."""
+
+    def test_search_ranks_by_bm25(self, index):
+        hits = index.search("dog", 5, collections=["docs"])
+
+        assert [hit.id for hit in hits] == ["2", "3"]
+        assert hits[0].score > hits[1].score > 0
+        assert hits[0].source == "a.txt"
+
+    def test_search_prefilters_collection_and_source(self, index):
+        assert [h.id for h in index.search("quick", 5, ["docs"])] == [
+            "3",
+            "1",
+        ]
+        assert [
+            h.id for h in index.search("quick", 5, ["docs"], source="b.txt")
+        ] == ["3"]
+        assert index.search("quick", 5, ["missing"]) == []
+
+    def test_replace_delete_and_clear(self, index):
+        index.add("docs", [("3", "a sleepy cat", "b.txt")])
+        assert [h.id for h in index.search("dog", 5, ["docs"])] == ["2"]
+
+        index.delete(["2"])
+        assert index.search("dog", 5, ["docs"]) == []
+
+        index.clear("docs")
+        assert index.search("quick cat", 5, ["docs"]) == []
+        assert index.search("quick", 5, ["other"])[0].id == "4"
+
+
+@pytest.mark.unit
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]])
+
+    assert fused[0] == "b"
+    assert set(fused) == {"a", "b", "c", "d"}
+
+
+@pytest.mark.unit
+def test_keyword_indexed_storage_mirrors_writes(temp_dir):
+    inner = MagicMock()
+    index = BM25Index(temp_dir / "index.sqlite3")
+    storage = KeywordIndexedStorage(inner, index, "doc_abc")
+    record = VectorRecord(
+        id="r1",
+        vector=[1.0],
+        payload={"content path": "/tmp/a.md", "text": "hello world"},
+    )
+
+    storage.add([record])
+    hits = index.search("hello", 5, ["doc_abc"])
+    storage.clear()
+
+    inner.add.assert_called_once_with([record])
+    inner.clear.assert_called_once()
+    assert [(h.id, h.source) for h in hits] == [("r1", "/tmp/a.md")]
+    assert index.search("hello", 5, ["doc_abc"]) == []
@@ -0,0 +1,160 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.conversion_cache import ConversionCache
+
+_mod = "app.utils.conversion_cache"
+
+
+def _loader():
+    loader = MagicMock()
+    loader.convert_file.side_effect = lambda path: (
+        f"# {os.path.basename(path)}"
+    )
+    return loader
+
+
+def _write(path, content: bytes):
+    path.write_bytes(content)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestConversionCache:
+    """Test cases for the on-disk conversion cache."""
+
+    def test_unchanged_file_is_converted_once(self, temp_dir):
+        doc = _write(temp_dir / "a.pdf", b"pdf bytes")
+        cache = ConversionCache(str(temp_dir / "cache"))
+        loader = _loader()
+
+        with patch(f"{_mod}.get_markitdown_loader", return_value=loader):
+            first = cache.convert_files([doc], parallel=False)
+            # A fresh instance only has the on-disk entries
+            second = ConversionCache(str(temp_dir / "cache")).convert_files(
+                [doc], parallel=False
+            )
+
+        assert first == second == {doc: "# a.pdf"}
+        loader.convert_file.assert_called_once_with(doc)
+
+    def test_modified_file_is_reconverted(self, temp_dir):
+        doc = _write(temp_dir / "a.docx", b"v1")
+        cache = ConversionCache(str(temp_dir / "cache"))
+        loader = _loader()
+
+        with patch(f"{_mod}.get_markitdown_loader", return_value=loader):
+            cache.convert_files([doc], parallel=False)
+            _write(temp_dir / "a.docx", b"version 2")
+            cache.convert_files([doc], parallel=False)
+
+        assert loader.convert_file.call_count == 2
+
+    def test_identical_content_shares_entry(self, temp_dir):
+        first = _write(temp_dir / "a.xlsx", b"same")
+        second = _write(temp_dir / "b.xlsx", b"same")
+        cache = ConversionCache(str(temp_dir / "cache"))
+        loader = _loader()
+
+        with patch(f"{_mod}.get_markitdown_loader", return_value=loader):
+            cache.convert_files([first], parallel=False)
+            result = cache.convert_files([second], parallel=False)
+
+        assert result == {second: "# a.xlsx"}
+        loader.convert_file.assert_called_once()
+
+    def test_failures_are_reported_and_not_cached(self, temp_dir):
+        doc = _write(temp_dir / "a.pdf", b"broken")
+        cache = ConversionCache(str(temp_dir / "cache"))
+        loader = MagicMock()
+        loader.convert_file.side_effect = ValueError("bad pdf")
+
+        with patch(f"{_mod}.get_markitdown_loader", return_value=loader):
+            cache.convert_files([doc], parallel=False)
+            result = cache.convert_files([doc], parallel=False)
+            missing = cache.convert_files(["/missing.pdf"], parallel=False)
+
+        assert result == {doc: "Error: bad pdf"}
+        assert loader.convert_file.call_count == 3
+        assert list((temp_dir / "cache").glob("*.md")) == []
+        assert missing["/missing.pdf"].startswith("Error:")
+
+    def test_least_recently_used_entries_are_evicted(self, temp_dir):
+        docs = [
+            _write(temp_dir / f"{name}.pdf", name.encode())
+            for name in ("a", "b", "c")
+        ]
+        cache = ConversionCache(str(temp_dir / "cache"), max_bytes=15)
+        loader = _loader()
+
+        with patch(f"{_mod}.get_markitdown_loader", return_value=loader):
+            for i, doc in enumerate(docs[:2]):
+                cache.convert_files([doc], parallel=False)
+                entry = next(
+                    p
+                    for p in (temp_dir / "cache").glob("*.md")
+                    if p.read_text() == f"# {os.path.basename(doc)}"
+                )
+                os.utime(entry, (1000 + i, 1000 + i))
+            cache.convert_files([docs[2]], parallel=False)
+
+        remaining = sorted(
+            p.read_text() for p in (temp_dir / "cache").glob("*.md")
+        )
+        assert remaining == ["# b.pdf", "# c.pdf"]
+
+    def test_batch_misses_use_worker_pool(self, temp_dir):
+        docs = [
+            _write(temp_dir / f"{name}.pdf", name.encode())
+            for name in ("a", "b")
+        ]
+        cache = ConversionCache(str(temp_dir / "cache"))
+        loader = _loader()
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch(f"{_mod}.get_markitdown_loader", return_value=loader),
+            patch(f"{_mod}._get_process_pool", return_value=pool) as get_pool,
+        ):
+            result = cache.convert_files(docs)
+
+        get_pool.assert_called()
+        assert result == {docs[0]: "# a.pdf", docs[1]: "# b.pdf"}
+
+    def test_broken_pool_falls_back_to_in_process(self, temp_dir):
+        docs = [
+            _write(temp_dir / f"{name}.pdf", name.encode())
+            for name in ("a", "b")
+        ]
+        cache = ConversionCache(str(temp_dir / "cache"))
+        loader = _loader()
+        pool = MagicMock()
+        pool.submit.side_effect = BrokenProcessPool("worker died")
+
+        with (
+            patch(f"{_mod}.get_markitdown_loader", return_value=loader),
+            patch(f"{_mod}._get_process_pool", return_value=pool),
+            patch(f"{_mod}._discard_process_pool") as discard,
+        ):
+            result = cache.convert_files(docs)
+
+        discard.assert_called_once()
+        assert result == {docs[0]: "# a.pdf", docs[1]: "# b.pdf"}
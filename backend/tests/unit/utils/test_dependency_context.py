@@ -0,0 +1,101 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from camel.tasks import Task
+
+from app.utils.dependency_context import (
+    DependencyContextCache,
+    estimate_tokens,
+    summarize_result,
+)
+
+
+def make_task(task_id: str, result: str) -> Task:
+    task = Task(content=f"do {task_id}", id=task_id)
+    task.result = result
+    return task
+
+
+@pytest.mark.unit
+def test_summarize_result_keeps_head_and_tail():
+    text = "\n".join(f"line {i}" for i in range(1000))
+
+    summary = summarize_result(text, 50)
+
+    assert summary.startswith("line 0\n")
+    assert summary.endswith("line 999")
+    assert "characters omitted" in summary
+    assert estimate_tokens(summary) < 70
+    assert summarize_result("short", 50) == "short"
+
+
+@pytest.mark.unit
+def test_build_inlines_full_results_within_budget():
+    cache = DependencyContextCache(budget_tokens=1000)
+    deps = [make_task("a", "alpha"), make_task("b", "beta")]
+
+    context = cache.build(deps)
+
+    assert context == (
+        "id: a, content: do a. result: alpha.\n"
+        "id: b, content: do b. result: beta."
+    )
+    assert cache.stats()["tokens_saved"] == 0
+
+
+@pytest.mark.unit
+def test_build_summarizes_largest_results_over_budget():
+    cache = DependencyContextCache(budget_tokens=300, summary_tokens=50)
+    big = "x" * 4000
+    deps = [make_task("small", "ok"), make_task("big", big)]
+
+    context = cache.build(deps)
+
+    assert "result: ok." in context
+    assert big not in context
+    assert estimate_tokens(context) <= 300
+    stats = cache.stats()
+    assert stats["summaries_used"] == 1
+    assert stats["tokens_saved"] > 900
+
+
+@pytest.mark.unit
+def test_summary_computed_once_per_result():
+    cache = DependencyContextCache(budget_tokens=10, summary_tokens=5)
+    task = make_task("a", "y" * 500)
+    cache.record(task)
+    entry = cache._entries["a"]
+
+    cache.build([task])
+    cache.build([task])
+    assert cache._entries["a"] is entry
+
+    task.result = "z" * 500
+    cache.build([task])
+    assert cache._entries["a"] is not entry
+    assert cache.stats()["builds"] == 3
+
+
+@pytest.mark.unit
+def test_parent_content_summarized_only_when_over_budget():
+    cache = DependencyContextCache(budget_tokens=20, summary_tokens=10)
+    parent = Task(content="p" * 400, id="parent")
+
+    assert len(cache.parent_content(parent)) < 400
+    assert cache.parent_content(Task(content="short", id="p2")) == "short"
+    assert cache.parent_content(None) == ""
+
+    cache.clear()
+    assert cache.stats()["cached_results"] == 0
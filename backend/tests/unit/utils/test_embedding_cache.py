@@ -0,0 +1,102 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.embedding_cache import CachedEmbedding, EmbeddingCache
+
+
+def _model(dim: int = 2):
+    model = MagicMock()
+    model.model_type.value = "test-embedding"
+    model.get_output_dim.return_value = dim
+    model.embed_list.side_effect = lambda objs: [
+        [float(len(text)), 0.5] for text in objs
+    ]
+    return model
+
+
+@pytest.mark.unit
+class TestCachedEmbedding:
+    """Test cases for the persistent embedding cache."""
+
+    def test_repeated_texts_are_embedded_once(self, temp_dir):
+        model = _model()
+        cache_path = temp_dir / "cache.sqlite3"
+        embedding = CachedEmbedding(lambda: model, EmbeddingCache(cache_path))
+
+        first = embedding.embed_list(["a", "bb", "a"])
+        # A new wrapper over the same file reuses the stored vectors
+        second = CachedEmbedding(
+            lambda: model, EmbeddingCache(cache_path)
+        ).embed_list(["bb", "a"])
+
+        assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+        assert second == [[2.0, 0.5], [1.0, 0.5]]
+        model.embed_list.assert_called_once_with(["a", "bb"])
+
+    def test_cache_is_keyed_by_model(self, temp_dir):
+        cache = EmbeddingCache(temp_dir / "cache.sqlite3")
+        small, large = _model(2), _model(3)
+
+        CachedEmbedding(lambda: small, cache).embed("text")
+        CachedEmbedding(lambda: large, cache).embed("text")
+
+        small.embed_list.assert_called_once()
+        large.embed_list.assert_called_once()
+
+    def test_misses_are_sent_in_batches(self, temp_dir):
+        model = _model()
+        embedding = CachedEmbedding(
+            lambda: model,
+            EmbeddingCache(temp_dir / "cache.sqlite3"),
+            batch_size=2,
+        )
+
+        vectors = embedding.embed_list(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert [len(c.args[0]) for c in model.embed_list.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+
+    def test_model_is_created_lazily(self, temp_dir):
+        factory = MagicMock(side_effect=ValueError("no api key"))
+        embedding = CachedEmbedding(
+            factory, EmbeddingCache(temp_dir / "cache.sqlite3")
+        )
+
+        factory.assert_not_called()
+        with pytest.raises(ValueError, match="no api key"):
+            embedding.embed("text")
+
+    def test_least_recently_used_entries_are_evicted(self, temp_dir):
+        cache = EmbeddingCache(temp_dir / "cache.sqlite3", max_entries=2)
+
+        with patch(
+            "app.utils.embedding_cache.time.time", side_effect=[1, 2, 3, 4]
+        ):
+            cache.put_many("m", {"a": [1.0]})
+            cache.put_many("m", {"b": [2.0]})
+            cache.get_many("m", ["a"])
+            cache.put_many("m", {"c": [3.0]})
+
+        assert cache.get_many("m", ["a", "b", "c"]) == {
+            "a": [1.0],
+            "c": [3.0],
+        }
@@ -0,0 +1,68 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.lazy_import import LazyImport, lazy_import
+
+
+@pytest.mark.unit
+def test_lazy_import_defers_until_first_use():
+    sys.modules.pop("colorsys", None)
+    proxy = lazy_import("colorsys", "rgb_to_hsv")
+
+    assert not proxy.loaded
+    assert "colorsys" not in sys.modules
+
+    assert proxy(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert proxy.loaded
+    assert "colorsys" in sys.modules
+
+
+@pytest.mark.unit
+def test_lazy_import_forwards_attributes():
+    proxy = lazy_import("collections", "OrderedDict")
+
+    assert proxy.fromkeys("ab") == {"a": None, "b": None}
+    assert proxy.__name__ == "OrderedDict"
+
+
+@pytest.mark.unit
+def test_lazy_import_missing_name_raises_on_use():
+    proxy = lazy_import("collections", "DoesNotExist")
+
+    with pytest.raises(AttributeError):
+        proxy()
+
+
+@pytest.mark.unit
+def test_controller_service_import_is_patchable():
+    import app.controller.chat_controller as chat_controller
+
+    assert isinstance(chat_controller.step_solve, LazyImport)
+    with patch.object(chat_controller, "step_solve") as mock_step:
+        chat_controller.step_solve("x")
+    mock_step.assert_called_once_with("x")
+
+
+@pytest.mark.unit
+def test_load_toolkit_resolves_registered_and_unknown_names():
+    from app.agent import tools
+
+    assert tools.load_toolkit("does_not_exist") is None
+    toolkit = tools.load_toolkit("file_write_toolkit")
+    assert toolkit is tools.FileToolkit
@@ -0,0 +1,59 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.utils.local_embedding import HashingEmbedding, create_local_embedding
+
+
+@pytest.mark.unit
+class TestLocalEmbedding:
+    """Test cases for CPU embedding models."""
+
+    def test_hashing_embedding_is_normalized_and_deterministic(self):
+        embedding = HashingEmbedding(dim=64)
+
+        first, second = embedding.embed_list(["hello world", "hello world"])
+
+        assert len(first) == 64
+        assert first == second
+        assert np.linalg.norm(first) == pytest.approx(1.0)
+        assert embedding.embed("") == [0.0] * 64
+
+    def test_hashing_embedding_ranks_shared_terms_higher(self):
+        embedding = HashingEmbedding()
+        query, near, far = (
+            np.array(v)
+            for v in embedding.embed_list(
+                [
+                    "vector store latency",
+                    "latency of the vector store",
+                    "banana bread recipe",
+                ]
+            )
+        )
+
+        assert query @ near > query @ far
+
+    def test_falls_back_to_hashing_when_model_unavailable(self):
+        with patch(
+            "app.utils.local_embedding.SentenceTransformerEmbedding",
+            side_effect=ImportError("sentence_transformers"),
+        ):
+            embedding = create_local_embedding()
+
+        assert isinstance(embedding, HashingEmbedding)
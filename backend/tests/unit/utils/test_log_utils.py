@@ -0,0 +1,95 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.log_utils import (
+    LazyJson,
+    LogSampler,
+    Truncated,
+    get_log_sampler,
+    log_sampled,
+    truncate,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_sampler():
+    get_log_sampler().reset()
+    yield
+    get_log_sampler().reset()
+
+
+@pytest.mark.unit
+def test_truncate_keeps_short_text_and_cuts_long_text():
+    assert truncate("abc", 5) == "abc"
+    assert truncate("a" * 12, 5) == "aaaaa... [7 more chars]"
+
+
+@pytest.mark.unit
+def test_lazy_wrappers_render_only_when_formatted():
+    class Payload:
+        rendered = 0
+
+        def __str__(self):
+            Payload.rendered += 1
+            return "x" * 1000
+
+    logger = logging.getLogger("test_log_utils.lazy")
+    logger.setLevel(logging.INFO)
+    logger.debug("payload %s", Truncated(Payload()))
+    assert Payload.rendered == 0
+
+    assert len(str(Truncated(Payload(), 10))) < 40
+    assert str(LazyJson({"k": "é"})) == '{"k": "é"}'
+
+
+@pytest.mark.unit
+def test_log_sampler_limits_per_key_and_counts_suppressed():
+    sampler = LogSampler(interval=10)
+    with patch("app.utils.log_utils.time.monotonic", return_value=100.0):
+        assert sampler.allow("l", "a") == (True, 0)
+        assert sampler.allow("l", "a") == (False, 0)
+        assert sampler.allow("l", "a") == (False, 0)
+        assert sampler.allow("l", "b") == (True, 0)
+    with patch("app.utils.log_utils.time.monotonic", return_value=111.0):
+        assert sampler.allow("l", "a") == (True, 2)
+
+
+@pytest.mark.unit
+def test_log_sampler_forgets_least_recent_keys():
+    sampler = LogSampler(interval=10, max_keys=2)
+    with patch("app.utils.log_utils.time.monotonic", return_value=100.0):
+        sampler.allow("l", "a")
+        sampler.allow("l", "b")
+        assert sampler.allow("l", "a") == (False, 0)
+        sampler.allow("l", "c")
+        assert list(sampler._state) == [("l", "a"), ("l", "c")]
+        # "b" was evicted, so it is treated as new
+        assert sampler.allow("l", "b") == (True, 0)
+
+
+@pytest.mark.unit
+def test_log_sampled_skips_disabled_levels(caplog):
+    logger = logging.getLogger("test_log_utils.sampled")
+    logger.setLevel(logging.INFO)
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        log_sampled(logger, logging.DEBUG, "k", "hidden")
+        log_sampled(logger, logging.INFO, "k", "shown %s", 1)
+        log_sampled(logger, logging.INFO, "k", "shown %s", 2)
+
+    assert [r.getMessage() for r in caplog.records] == ["shown 1"]
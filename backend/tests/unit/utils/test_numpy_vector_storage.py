@@ -0,0 +1,131 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from camel.storages import VectorDBQuery, VectorRecord
+
+from app.utils.numpy_vector_storage import NumpyVectorStorage
+
+
+def _records():
+    return [
+        VectorRecord(id="x", vector=[1.0, 0.0, 0.0], payload={"t": "x"}),
+        VectorRecord(id="y", vector=[0.0, 2.0, 0.0], payload={"t": "y"}),
+        VectorRecord(id="xy", vector=[1.0, 1.0, 0.0], payload={"t": "xy"}),
+    ]
+
+
+def _ids(results):
+    return [r.record.id for r in results]
+
+
+@pytest.mark.unit
+class TestNumpyVectorStorage:
+    """Test cases for the memory-mapped NumPy vector store."""
+
+    @pytest.mark.parametrize("quantize", [None, "int8"])
+    def test_query_orders_by_cosine_similarity(self, temp_dir, quantize):
+        storage = NumpyVectorStorage(3, str(temp_dir), quantize=quantize)
+        storage.add(_records())
+
+        results = storage.query(
+            VectorDBQuery(query_vector=[1.0, 0.1, 0.0], top_k=2)
+        )
+
+        assert _ids(results) == ["x", "xy"]
+        assert results[0].similarity == pytest.approx(0.995, abs=0.01)
+        assert results[0].record.payload == {"t": "x"}
+
+    def test_query_batch_scores_across_blocks(self, temp_dir, monkeypatch):
+        monkeypatch.setattr(
+            "app.utils.numpy_vector_storage.QUERY_BLOCK_ROWS", 1
+        )
+        storage = NumpyVectorStorage(3, str(temp_dir))
+        storage.add(_records())
+
+        results = storage.query_batch(
+            [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]], top_k=5
+        )
+
+        assert _ids(results[0]) == ["y", "xy", "x"]
+        assert _ids(results[1]) == ["x", "xy", "y"]
+
+    def test_reopen_keeps_vectors_and_settings(self, temp_dir):
+        NumpyVectorStorage(3, str(temp_dir), quantize="int8").add(_records())
+
+        reopened = NumpyVectorStorage(3, str(temp_dir))
+
+        assert reopened.quantize == "int8"
+        assert reopened.status().vector_count == 3
+        top = reopened.query(VectorDBQuery(query_vector=[0, 1, 0], top_k=1))
+        assert _ids(top) == ["y"]
+
+    def test_reopen_drops_rows_past_committed_count(self, temp_dir):
+        storage = NumpyVectorStorage(3, str(temp_dir))
+        storage.add(_records()[:1])
+        # Simulate an add interrupted before meta.json was updated
+        with open(storage.directory / "vectors.bin", "ab") as f:
+            f.write(b"\0" * 12)
+        with open(storage.directory / "records.jsonl", "a") as f:
+            f.write('{"id": "partial", "payload": null}\n')
+
+        reopened = NumpyVectorStorage(3, str(temp_dir))
+        reopened.add(_records()[1:2])
+
+        results = reopened.query(
+            VectorDBQuery(query_vector=[1, 1, 0], top_k=5)
+        )
+        assert sorted(_ids(results)) == ["x", "y"]
+
+    def test_delete_and_clear(self, temp_dir):
+        storage = NumpyVectorStorage(3, str(temp_dir))
+        storage.add(_records())
+
+        storage.delete(["x"])
+        results = storage.query(VectorDBQuery(query_vector=[1, 0, 0], top_k=5))
+        assert _ids(results) == ["xy", "y"]
+
+        storage.clear()
+        assert storage.status().vector_count == 0
+        assert (
+            storage.query(VectorDBQuery(query_vector=[1, 0, 0], top_k=1)) == []
+        )
+
+    def test_dimension_mismatch_raises(self, temp_dir):
+        storage = NumpyVectorStorage(3, str(temp_dir))
+
+        with pytest.raises(ValueError, match="dimension"):
+            storage.add([VectorRecord(vector=[1.0, 0.0])])
+        with pytest.raises(ValueError, match="dimension"):
+            NumpyVectorStorage(4, str(temp_dir))
+
+    def test_filter_conditions_restrict_scored_rows(self, temp_dir):
+        storage = NumpyVectorStorage(3, str(temp_dir))
+        storage.add(
+            [
+                VectorRecord(
+                    id=r.id,
+                    vector=r.vector,
+                    payload={"extra_info": {"source": r.id[0]}},
+                )
+                for r in _records()
+            ]
+        )
+
+        results = storage.query(
+            VectorDBQuery(query_vector=[1, 0, 0], top_k=5),
+            filter_conditions={"extra_info.source": "x"},
+        )
+
+        assert _ids(results) == ["x", "xy"]
@@ -0,0 +1,103 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import platform
+
+import pytest
+
+from app.utils.persistent_shell import PersistentShell
+
+pytestmark = pytest.mark.skipif(
+    platform.system() == "Windows", reason="requires bash"
+)
+
+
+@pytest.fixture
+def shell(temp_dir):
+    shell = PersistentShell(str(temp_dir), init_script="export GREETING=hi")
+    yield shell
+    shell.close()
+
+
+@pytest.mark.unit
+class TestPersistentShell:
+    """Test cases for long-lived shell sessions."""
+
+    def test_state_carries_over_between_commands(self, shell, temp_dir):
+        (temp_dir / "sub").mkdir()
+
+        assert shell.run("cd sub && export N=2", 5).exit_code == 0
+        result = shell.run("pwd; echo $GREETING $N", 5)
+
+        assert result.output == f"{temp_dir / 'sub'}\nhi 2\n"
+        assert shell.cwd == str(temp_dir / "sub")
+
+    def test_exit_codes_and_syntax_errors(self, shell):
+        assert shell.run("false", 5).exit_code == 1
+        assert shell.run("if then", 5).exit_code == 2
+        # The shell survives both
+        assert shell.run("echo ok", 5).output == "ok\n"
+
+    def test_commands_do_not_read_shell_input(self, shell):
+        result = shell.run("cat; echo after", 5)
+
+        assert result.output == "after\n"
+
+    def test_command_input_pipe(self, temp_dir):
+        shell = PersistentShell(str(temp_dir), command_input=True)
+        try:
+            shell.start("read name; echo hello $name")
+            shell.write("world\n")
+            assert shell.wait(5)
+            output, _ = shell.read(0)
+        finally:
+            shell.close()
+
+        assert output == "hello world\n"
+
+    def test_write_needs_command_input(self, shell):
+        with pytest.raises(RuntimeError, match="do not take input"):
+            shell.write("data\n")
+
+    def test_timeout_then_incremental_reads(self, shell):
+        result = shell.run("echo first; sleep 0.3; echo second", 0.1)
+
+        assert result.exit_code is None
+        assert result.output == "first\n"
+        assert shell.busy
+        with pytest.raises(RuntimeError, match="busy"):
+            shell.start("echo other")
+
+        assert shell.wait(5)
+        output, offset = shell.read(result.offset)
+        assert output == "second\n"
+        assert shell.read(offset) == ("", offset)
+
+    def test_output_buffer_is_bounded(self, temp_dir):
+        shell = PersistentShell(str(temp_dir), max_buffer_bytes=100)
+        try:
+            result = shell.run("seq 1 1000", 5)
+        finally:
+            shell.close()
+
+        assert result.output.startswith("[... ")
+        assert result.output.endswith("999\n1000\n")
+
+    def test_exit_ends_the_shell(self, shell):
+        result = shell.run("exit 3", 5)
+
+        assert result.exit_code == 3
+        assert not shell.alive
+        with pytest.raises(RuntimeError, match="not running"):
+            shell.start("echo again")
@@ -669,3 +669,71 @@ class TestSingleAgentWorkerErrorCases:
             assert result == TaskState.DONE
             assert task.additional_info["token_usage"]["total_tokens"] == 0
             mock_return_agent.assert_called_once_with(mock_worker_agent)
+
+    @pytest.mark.asyncio
+    async def test_structured_stream_parsed_incrementally(self):
+        """Streamed TaskResult JSON is parsed without the fallback handler
+        and partial content is surfaced while it streams."""
+        mock_worker = MagicMock(spec=ListenChatAgent)
+        mock_worker.agent_id = "test_agent_123"
+        mock_worker.role_name = "test_worker"
+        mock_worker.agent_name = "test_worker"
+        worker = SingleAgentWorker(
+            description="Test",
+            worker=mock_worker,
+            use_structured_output_handler=True,
+        )
+        worker.partial_result_min_chars = 10
+        mock_structured_handler = MagicMock()
+        mock_structured_handler.generate_structured_prompt.return_value = (
+            "Enhanced prompt"
+        )
+        worker.structured_handler = mock_structured_handler
+
+        task = Task(content="Test task", id="test_123")
+        text = (
+            'Result:\n{"content": "Collected all forty-two records '
+            'into report.csv", "failed": false}'
+        )
+
+        async def chunks():
+            for i in range(0, len(text), 8):
+                chunk = MagicMock()
+                chunk.msg.content = text[i : i + 8]
+                chunk.info = {"usage": {"total_tokens": 42}}
+                yield chunk
+
+        mock_worker_agent = AsyncMock()
+        mock_worker_agent.api_task_id = "project_1"
+        mock_worker_agent.astep.return_value = AsyncStreamingChatAgentResponse(
+            chunks()
+        )
+        mock_task_lock = MagicMock()
+        mock_task_lock.put_queue = AsyncMock()
+
+        with (
+            patch.object(
+                worker, "_get_worker_agent", return_value=mock_worker_agent
+            ),
+            patch.object(worker, "_return_worker_agent"),
+            patch.object(
+                worker, "_get_dep_tasks_info", return_value="No dependencies"
+            ),
+            patch(
+                "app.utils.single_agent_worker.get_task_lock",
+                return_value=mock_task_lock,
+            ),
+        ):
+            result = await worker._process_task(task, [])
+
+        assert result == TaskState.DONE
+        assert task.result == "Collected all forty-two records into report.csv"
+        assert task.additional_info["token_usage"]["total_tokens"] == 42
+        mock_structured_handler.parse_structured_response.assert_not_called()
+
+        partials = [
+            call.args[0].data["content"]
+            for call in mock_task_lock.put_queue.call_args_list
+        ]
+        assert partials
+        assert all(task.result.startswith(p) for p in partials)
@@ -0,0 +1,58 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import json
+
+import pytest
+
+from app.utils import startup_profile
+
+
+@pytest.fixture
+def profile(monkeypatch, tmp_path):
+    report = tmp_path / "startup.json"
+    monkeypatch.setattr(startup_profile, "_report_path", str(report))
+    monkeypatch.setattr(startup_profile, "_phases", [])
+    return report
+
+
+@pytest.mark.unit
+def test_mark_is_noop_when_disabled(monkeypatch):
+    monkeypatch.setattr(startup_profile, "_report_path", None)
+    monkeypatch.setattr(startup_profile, "_phases", [])
+
+    startup_profile.mark("routers")
+
+    assert not startup_profile.enabled()
+    assert startup_profile.phases() == []
+
+
+@pytest.mark.unit
+def test_mark_writes_report_in_order(profile):
+    startup_profile.mark("imports")
+    startup_profile.mark("routers")
+
+    report = json.loads(profile.read_text())
+    assert [p["phase"] for p in report["phases"]] == ["imports", "routers"]
+    first, second = report["phases"]
+    assert second["elapsed_ms"] >= first["elapsed_ms"]
+    assert first["rss_bytes"] > 0
+
+
+@pytest.mark.unit
+def test_mark_once_records_first_call_only(profile):
+    startup_profile.mark("first_health", once=True)
+    startup_profile.mark("first_health", once=True)
+
+    assert [p["phase"] for p in startup_profile.phases()] == ["first_health"]
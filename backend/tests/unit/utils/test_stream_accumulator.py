@@ -0,0 +1,87 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.stream_accumulator import ChunkAccumulator
+
+
+def chunk(content):
+    return SimpleNamespace(msg=SimpleNamespace(content=content))
+
+
+@pytest.mark.unit
+def test_accumulator_joins_deltas():
+    acc = ChunkAccumulator()
+    for delta in ["a", "", "bc", "d"]:
+        acc.append(delta)
+    acc.add_chunk(chunk("e"))
+    acc.add_chunk(chunk(None))
+    acc.add_chunk(SimpleNamespace(msg=None))
+
+    assert acc.text == "abcde"
+    assert acc.text == "abcde"
+    assert len(acc) == 5
+    assert acc
+
+
+@pytest.mark.unit
+def test_accumulator_flushes_by_size_and_on_demand():
+    flushed = []
+    acc = ChunkAccumulator(on_flush=flushed.append, flush_chars=4)
+    for delta in ["ab", "cd", "ef"]:
+        acc.append(delta)
+    assert flushed == ["abcd"]
+
+    acc.flush()
+    acc.flush()
+    assert flushed == ["abcd", "ef"]
+    assert acc.text == "abcdef"
+
+
+@pytest.mark.unit
+def test_accumulator_flushes_by_interval():
+    flushed = []
+    with patch(
+        "app.utils.stream_accumulator.time.monotonic", return_value=0.0
+    ):
+        acc = ChunkAccumulator(
+            on_flush=flushed.append, flush_chars=100, flush_interval=1.0
+        )
+        acc.append("a")
+    with patch(
+        "app.utils.stream_accumulator.time.monotonic", return_value=2.0
+    ):
+        acc.append("b")
+
+    assert flushed == ["ab"]
+
+
+@pytest.mark.unit
+def test_listen_agent_stream_sends_deltas_then_full_text():
+    from app.agent.listen_chat_agent import ListenChatAgent
+
+    agent = ListenChatAgent.__new__(ListenChatAgent)
+    agent.stream_flush_chars = 3
+    with (
+        patch.object(agent, "_send_agent_output") as send_output,
+        patch.object(agent, "_send_agent_deactivate") as send_deactivate,
+        patch.object(agent, "_extract_tokens", return_value=7),
+    ):
+        list(agent._stream_chunks(iter([chunk("ab"), chunk("cd")])))
+        send_output.assert_called_once_with("abcd")
+        send_deactivate.assert_called_once_with("abcd", 7)
@@ -0,0 +1,85 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+
+from app.utils.streaming_json import StreamingJsonParser
+
+
+def feed_all(parser, text, step):
+    for i in range(0, len(text), step):
+        parser.feed(text[i : i + step])
+    return parser
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("step", [1, 3, 16, 1000])
+def test_parser_finds_object_across_chunk_boundaries(step):
+    text = (
+        'Sure.\n```json\n{"content": "a \\"quoted\\" {brace} \\u00e9", '
+        '"failed": false, "extra": [1, {"x": 2}]}\n```'
+    )
+    parser = feed_all(StreamingJsonParser(), text, step)
+
+    assert parser.result == {
+        "content": 'a "quoted" {brace} é',
+        "failed": False,
+        "extra": [1, {"x": 2}],
+    }
+    assert parser.text == text
+    assert len(parser) == len(text)
+
+
+@pytest.mark.unit
+def test_parser_skips_objects_missing_required_keys():
+    text = '{"example": {"content": "no"}} then {"content": "yes"}'
+    parser = feed_all(StreamingJsonParser(required=("content",)), text, 5)
+
+    assert parser.result == {"content": "yes"}
+
+
+@pytest.mark.unit
+def test_parser_stops_scanning_after_first_object():
+    parser = StreamingJsonParser()
+    parser.feed('{"content": "first"}')
+    parser.feed(' {"content": "second"}')
+
+    assert parser.result == {"content": "first"}
+    assert parser.text.endswith('second"}')
+
+
+@pytest.mark.unit
+def test_partial_field_value_while_streaming():
+    parser = StreamingJsonParser(field="content")
+    parser.feed('{"failed": false, "content": "line one\\nline')
+    assert parser.result is None
+    assert parser.partial() == "line one\nline"
+
+    # An escape split across chunks is held back until complete
+    parser.feed(" two \\u00")
+    assert parser.partial() == "line one\nline two "
+    parser.feed('e9"}')
+    assert parser.partial() == "line one\nline two é"
+    assert parser.result == {
+        "failed": False,
+        "content": "line one\nline two é",
+    }
+
+
+@pytest.mark.unit
+def test_parser_without_object_has_no_result():
+    parser = feed_all(StreamingJsonParser(), "no json here {broken", 4)
+
+    assert parser.result is None
+    assert parser.partial() == ""
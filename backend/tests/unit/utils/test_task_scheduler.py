@@ -0,0 +1,80 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from camel.tasks import Task
+
+from app.utils.task_scheduler import TaskScheduler
+
+
+def _tasks(*ids: str) -> list[Task]:
+    return [Task(content=f"task {tid}", id=tid) for tid in ids]
+
+
+@pytest.mark.unit
+class TestTaskScheduler:
+    """Test cases for the critical-path scheduler."""
+
+    def test_ranks_follow_longest_dependent_chain(self):
+        # a -> b -> c is the long chain, d is independent
+        tasks = _tasks("a", "b", "c", "d")
+        dependencies = {"a": [], "b": ["a"], "c": ["b"], "d": []}
+        scheduler = TaskScheduler({})
+
+        ranks = scheduler.update_ranks(tasks, dependencies)
+
+        assert ranks == {"a": 3, "b": 2, "c": 1, "d": 1}
+        assert scheduler.critical_path(dependencies) == ["a", "b", "c"]
+        assert [t.id for t in scheduler.prioritize(tasks[::-1])] == [
+            "a",
+            "b",
+            "d",
+            "c",
+        ]
+
+    def test_ranks_ignore_completed_dependencies_and_cycles(self):
+        tasks = _tasks("a", "b")
+        dependencies = {"a": ["b", "done"], "b": ["a"]}
+        scheduler = TaskScheduler({})
+
+        ranks = scheduler.update_ranks(tasks, dependencies)
+
+        assert set(ranks) == {"a", "b"}
+        assert all(rank >= 1 for rank in ranks.values())
+
+    def test_concurrency_limit_is_per_worker_type(self):
+        scheduler = TaskScheduler({"browser_agent": 1})
+        scheduler.register_worker("node_1", "browser_agent")
+        scheduler.register_worker("node_2", "browser_agent")
+        scheduler.register_worker("node_3", "developer_agent")
+        a, b, c, d = _tasks("a", "b", "c", "d")
+
+        assert scheduler.try_acquire(a, "node_1")
+        assert not scheduler.try_acquire(b, "node_2")
+        assert scheduler.try_acquire(c, "node_3")
+        assert scheduler.try_acquire(d, "node_3")
+        assert scheduler.take_held() == [b]
+
+        scheduler.release("a")
+        assert scheduler.try_acquire(b, "node_2")
+        assert scheduler.take_held() == []
+
+    def test_counts(self):
+        scheduler = TaskScheduler({})
+        a, b, c = _tasks("a", "b", "c")
+        scheduler.try_acquire(a, "node_1")
+
+        counts = scheduler.counts([b, c], dependencies_met={"b"})
+
+        assert counts == {"scheduled": 1, "running": 1, "waiting": 1}
@@ -0,0 +1,140 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import time
+
+import pytest
+
+from app.utils.terminal_output import TerminalOutputCoalescer
+
+
+class _Sink:
+    def __init__(self, delivered: bool = True) -> None:
+        self.frames: list[tuple[str, str]] = []
+        self.delivered = delivered
+
+    def __call__(self, session_id, frame) -> bool:
+        if self.delivered:
+            self.frames.append((session_id, frame))
+        return self.delivered
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestTerminalOutputCoalescer:
+    """Test cases for terminal output framing."""
+
+    def test_chunks_are_merged_per_session_after_interval(self):
+        sink = _Sink()
+        coalescer = TerminalOutputCoalescer(sink, flush_interval=0.05)
+
+        for i in range(100):
+            coalescer.write("a", f"{i}\n")
+        coalescer.write("b", "other\n")
+        _wait_for(lambda: len(sink.frames) == 2)
+
+        frames = dict(sink.frames)
+        assert frames["a"] == "".join(f"{i}\n" for i in range(100))
+        assert frames["b"] == "other\n"
+        assert coalescer.stats() == {
+            "sessions": 2,
+            "chunks": 101,
+            "frames": 2,
+            "merged": 99,
+            "dropped": 0,
+            "evicted_bytes": 0,
+        }
+
+    def test_size_threshold_flushes_immediately(self):
+        sink = _Sink()
+        coalescer = TerminalOutputCoalescer(
+            sink, flush_interval=60, flush_bytes=10
+        )
+
+        coalescer.write("a", "12345")
+        assert sink.frames == []
+        coalescer.write("a", "67890")
+
+        assert sink.frames == [("a", "1234567890")]
+
+    def test_history_is_bounded_and_replayed_after_drops(self):
+        sink = _Sink(delivered=False)
+        coalescer = TerminalOutputCoalescer(
+            sink, flush_interval=60, history_bytes=8
+        )
+
+        for chunk in ["aaaa", "bbbb", "cccc"]:
+            coalescer.write("a", chunk)
+        coalescer.flush()
+        assert coalescer.recent("a") == "bbbbcccc"
+
+        sink.delivered = True
+        coalescer.write("a", "dd")
+        coalescer.flush()
+
+        # The late subscriber receives the retained history
+        assert sink.frames == [("a", "ccccdd")]
+        stats = coalescer.stats()
+        assert stats["dropped"] == 3
+        assert stats["evicted_bytes"] == 8
+
+    def test_replay_skips_chunks_already_delivered(self):
+        sink = _Sink()
+        coalescer = TerminalOutputCoalescer(sink, flush_interval=60)
+
+        coalescer.write("a", "aa")
+        coalescer.flush()
+        sink.delivered = False
+        coalescer.write("a", "bb")
+        coalescer.flush()
+        sink.delivered = True
+        coalescer.write("a", "cc")
+        coalescer.flush()
+
+        assert sink.frames == [("a", "aa"), ("a", "bbcc")]
+
+    def test_ended_sessions_are_flushed_and_forgotten(self):
+        sink = _Sink()
+        coalescer = TerminalOutputCoalescer(sink, flush_interval=60)
+
+        coalescer.write(("task", "one.log"), "pending")
+        coalescer.write(("task", "two.log"), "kept")
+        coalescer.end_sessions(lambda key: key[1] == "one.log")
+
+        assert sink.frames == [(("task", "one.log"), "pending")]
+        assert coalescer.recent(("task", "one.log")) == ""
+        assert coalescer.recent(("task", "two.log")) == "kept"
+        assert coalescer.stats() == {
+            "sessions": 2,
+            "chunks": 2,
+            "frames": 1,
+            "merged": 0,
+            "dropped": 0,
+            "evicted_bytes": 0,
+        }
+
+    def test_close_flushes_and_disables_buffering(self):
+        sink = _Sink()
+        coalescer = TerminalOutputCoalescer(sink, flush_interval=60)
+
+        coalescer.write("a", "pending")
+        coalescer.close()
+        coalescer.write("a", "late")
+
+        assert sink.frames == [("a", "pending"), ("a", "late")]
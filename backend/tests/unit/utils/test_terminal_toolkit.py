@@ -13,12 +13,13 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import asyncio
+import platform
 import threading
 import time
 
 import pytest
 
-from app.service.task import TaskLock, task_locks
+from app.service.task import TaskLock, process_task, task_locks
 from app.utils.toolkit.terminal_toolkit import TerminalToolkit
 
 
@@ -125,3 +126,139 @@ class TestTerminalToolkit:
                 )
             else:
                 raise
+
+    def test_log_writes_are_coalesced_into_frames(self):
+        """Test many small writes reach the queue as one frame."""
+        test_api_task_id = "test_api_task_frames"
+        task_locks[test_api_task_id] = TaskLock(
+            id=test_api_task_id, queue=asyncio.Queue(), human_input={}
+        )
+        toolkit = TerminalToolkit(test_api_task_id)
+
+        async def write_lines():
+            # Bind the queue to this loop, as the SSE consumer would
+            task_locks[test_api_task_id]._bind_loop()
+            for i in range(50):
+                toolkit._write_to_log("/tmp/test_frames.log", f"line {i}\n")
+            await asyncio.sleep(0.3)
+
+        try:
+            asyncio.run(write_lines())
+            queue = task_locks[test_api_task_id].queue
+            frames = [queue.get_nowait() for _ in range(queue.qsize())]
+        finally:
+            toolkit.cleanup()
+            del task_locks[test_api_task_id]
+
+        assert len(frames) == 1
+        assert frames[0].data == "".join(f"line {i}\n" for i in range(50))
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="persistent shell needs bash"
+)
+class TestPersistentShellExec:
+    """Test shell_exec without an id reuses one shell session."""
+
+    @pytest.fixture
+    def toolkit(self, temp_dir):
+        task_locks["test_api_task_shell"] = TaskLock(
+            id="test_api_task_shell", queue=asyncio.Queue(), human_input={}
+        )
+        toolkit = TerminalToolkit(
+            "test_api_task_shell",
+            working_directory=str(temp_dir),
+            safe_mode=False,
+            persistent_shell=True,
+        )
+        yield toolkit
+        toolkit.cleanup()
+        del task_locks["test_api_task_shell"]
+
+    def test_state_persists_between_calls(self, toolkit, temp_dir):
+        (temp_dir / "sub").mkdir()
+
+        toolkit.shell_exec("cd sub && export STEP=build")
+        result = toolkit.shell_exec("pwd; echo $STEP")
+
+        assert result == f"{temp_dir / 'sub'}\nbuild\n"
+        assert toolkit.shell_exec("exit 0") == (
+            "Command executed successfully (no output)."
+        )
+        # A new default session starts in the last directory
+        assert toolkit.shell_exec("pwd") == f"{temp_dir / 'sub'}\n"
+
+    def test_timed_out_command_keeps_running(self, toolkit):
+        result = toolkit.shell_exec("sleep 0.3; echo done", timeout=0.05)
+
+        assert "continues in session 'default'" in result
+        assert "still running" in toolkit.shell_exec("echo next")
+        time.sleep(0.5)
+        assert toolkit.shell_view("default") == (
+            "done\n\n[finished with exit code 0]"
+        )
+
+    def test_non_blocking_commands_run_in_parallel(self, toolkit):
+        ids = [
+            toolkit.shell_exec(f"sleep 0.2; echo job{i}", block=False).split(
+                "'"
+            )[1]
+            for i in range(2)
+        ]
+        time.sleep(0.6)
+
+        assert len(set(ids)) == 2
+        for i, session_id in enumerate(ids):
+            assert toolkit.shell_view(session_id).startswith(f"job{i}\n")
+
+    def test_finished_background_session_is_closed_once_read(self, toolkit):
+        done = toolkit.shell_exec("echo job", block=False).split("'")[1]
+        running = toolkit.shell_exec("sleep 5", block=False).split("'")[1]
+        shell = toolkit._shells[done]
+        time.sleep(0.3)
+
+        assert toolkit.shell_view(done) == (
+            "job\n\n[finished with exit code 0, session closed]"
+        )
+        assert done not in toolkit._shells
+        assert not shell.alive
+        assert (
+            toolkit._output.recent(("", toolkit._shell_log_file(done))) == ""
+        )
+        assert toolkit.shell_view(running) == "[still running]"
+        assert toolkit.shell_kill_process(running) == (
+            f"Session '{running}' terminated."
+        )
+
+    def test_output_is_tagged_with_the_issuing_task(self, toolkit):
+        log_file = toolkit._shell_log_file("default")
+        token = process_task.set("subtask-7")
+        try:
+            toolkit.shell_exec("echo hello")
+        finally:
+            process_task.reset(token)
+
+        assert toolkit._output.recent(("subtask-7", log_file)) == (
+            "> echo hello\nhello\n"
+        )
+        assert toolkit._output.recent(("", log_file)) == ""
+
+    def test_ansi_codes_are_stripped(self, toolkit):
+        result = toolkit.shell_exec(r"printf '\033[31mred\033[0m\n'")
+        log_file = toolkit._shell_log_file("default")
+        # An escape sequence split across output chunks
+        toolkit._on_shell_output("default", log_file, "a\x1b[3")
+        toolkit._on_shell_output("default", log_file, "1mb\x1b[0m\n")
+
+        assert result == "red\n"
+        assert toolkit._output.recent(("", log_file)).endswith("red\nab\n")
+
+    def test_background_command_reads_written_input(self, toolkit):
+        session_id = toolkit.shell_exec(
+            "read name; echo hello $name", block=False
+        ).split("'")[1]
+
+        assert toolkit.shell_write_to_process(session_id, "world") == (
+            "hello world\n"
+        )
@@ -0,0 +1,115 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import os
+import platform
+import subprocess
+import sys
+import venv
+
+import pytest
+
+from app.utils.venv_pool import VenvPool, clone_venv, venv_python
+
+pytestmark = pytest.mark.skipif(
+    platform.system() == "Windows", reason="POSIX venv layout"
+)
+
+
+@pytest.fixture
+def base_venv(temp_dir):
+    path = temp_dir / "base"
+    venv.create(path, with_pip=False)
+    (site_packages,) = path.glob("lib/python3*/site-packages")
+    (site_packages / "shared_pkg.py").write_text("VALUE = 'base'\n")
+    return str(path)
+
+
+def _run(venv_path: str, code: str) -> str:
+    return subprocess.run(
+        [venv_python(venv_path), "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def _site_packages(venv_path: str) -> str:
+    version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    return os.path.join(venv_path, "lib", version, "site-packages")
+
+
+@pytest.mark.unit
+class TestVenvPool:
+    """Test cases for cloned agent venvs and their pool."""
+
+    def test_clone_installs_are_copy_on_write(self, base_venv, temp_dir):
+        clone = str(temp_dir / "clone")
+        clone_venv(base_venv, clone)
+        with open(
+            os.path.join(_site_packages(clone), "shared_pkg.py"), "w"
+        ) as f:
+            f.write("VALUE = 'clone'\n")
+
+        code = "import sys, shared_pkg; print(sys.prefix, shared_pkg.VALUE)"
+        assert _run(clone, code) == f"{clone} clone"
+        assert _run(base_venv, code) == f"{base_venv} base"
+        with open(os.path.join(clone, "bin", "activate")) as f:
+            assert clone in f.read()
+
+    def test_acquire_moves_a_ready_clone_and_replenishes(
+        self, base_venv, temp_dir
+    ):
+        pool = VenvPool(base_venv, str(temp_dir / "pool"), size=2)
+        target = str(temp_dir / "agent" / ".venv")
+
+        assert not pool.acquire(target)
+        pool.wait_idle()
+        assert pool.ready_count == 2
+
+        assert pool.acquire(target)
+        pool.wait_idle()
+        assert pool.ready_count == 2
+        assert _run(target, "import sys; print(sys.prefix)") == target
+        with open(os.path.join(target, "bin", "activate")) as f:
+            assert target in f.read()
+
+    def test_release_resets_clone_for_reuse(self, base_venv, temp_dir):
+        pool = VenvPool(base_venv, str(temp_dir / "pool"), size=1)
+        clone = str(temp_dir / "clone")
+        clone_venv(base_venv, clone)
+        os.makedirs(os.path.join(_site_packages(clone), "agent_pkg"))
+        open(os.path.join(clone, "bin", "agent-tool"), "w").close()
+
+        pool.release(clone)
+        pool.wait_idle()
+        target = str(temp_dir / "reused")
+        assert pool.acquire(target)
+        pool.wait_idle()
+
+        assert not os.path.exists(clone)
+        assert os.listdir(_site_packages(target)) == ["_eigent_base.pth"]
+        assert not os.path.exists(os.path.join(target, "bin", "agent-tool"))
+        assert _run(target, "import shared_pkg") == ""
+
+    def test_disabled_pool_removes_released_venvs(self, base_venv, temp_dir):
+        pool = VenvPool(base_venv, str(temp_dir / "pool"), size=0)
+        clone = str(temp_dir / "clone")
+        clone_venv(base_venv, clone)
+
+        assert not pool.acquire(str(temp_dir / "agent"))
+        pool.release(clone)
+
+        assert not os.path.exists(clone)
+        assert pool.ready_count == 0
@@ -12,9 +12,12 @@
 # limitations under the License.
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from camel.agents.chat_agent import AsyncStreamingChatAgentResponse
+from camel.societies.workforce.events import TaskFailedEvent
 from camel.societies.workforce.utils import TaskAssignment, TaskAssignResult
 from camel.societies.workforce.workforce import WorkforceState
 from camel.tasks import Task
@@ -23,6 +26,7 @@ from camel.tasks.task import TaskState
 from app.agent.listen_chat_agent import ListenChatAgent
 from app.exception.exception import UserException
 from app.service.task import ActionAssignTaskData, ActionTaskStateData
+from app.utils.telemetry.workforce_metrics import WorkforceMetricsCallback
 from app.utils.workforce import Workforce
 
 
@@ -40,7 +44,8 @@ class TestWorkforce:
         assert workforce.api_task_id == api_task_id
         assert workforce.description == description
 
-    def test_eigent_make_sub_tasks_success(self):
+    @pytest.mark.asyncio
+    async def test_eigent_make_sub_tasks_success(self):
         """Test eigent_make_sub_tasks successfully decomposes task."""
         api_task_id = "test_api_task_123"
         workforce = Workforce(
@@ -59,13 +64,16 @@ class TestWorkforce:
             patch.object(workforce, "reset"),
             patch.object(workforce, "set_channel"),
             patch.object(
-                workforce, "_decompose_task", return_value=mock_subtasks
+                workforce,
+                "_adecompose_task",
+                new_callable=AsyncMock,
+                return_value=mock_subtasks,
             ),
             patch(
                 "app.utils.workforce.validate_task_content", return_value=True
             ),
         ):
-            result = workforce.eigent_make_sub_tasks(task)
+            result = await workforce.eigent_make_sub_tasks(task)
 
             assert result == mock_subtasks
             assert workforce._task is task
@@ -73,7 +81,8 @@ class TestWorkforce:
             assert task.state == TaskState.OPEN
             assert task in workforce._pending_tasks
 
-    def test_eigent_make_sub_tasks_with_streaming_decomposition(self):
+    @pytest.mark.asyncio
+    async def test_eigent_make_sub_tasks_with_streaming_decomposition(self):
         """Test eigent_make_sub_tasks with streaming decomposition result."""
         api_task_id = "test_api_task_123"
         workforce = Workforce(
@@ -83,7 +92,7 @@ class TestWorkforce:
         task = Task(content="Complex project task", id="main_task")
 
         # Mock streaming generator
-        def mock_streaming_decomposition():
+        async def mock_streaming_decomposition():
             yield [Task(content="Phase 1", id="phase_1")]
             yield [Task(content="Phase 2", id="phase_2")]
             yield [Task(content="Phase 3", id="phase_3")]
@@ -93,14 +102,15 @@ class TestWorkforce:
             patch.object(workforce, "set_channel"),
             patch.object(
                 workforce,
-                "_decompose_task",
+                "_adecompose_task",
+                new_callable=AsyncMock,
                 return_value=mock_streaming_decomposition(),
             ),
             patch(
                 "app.utils.workforce.validate_task_content", return_value=True
             ),
         ):
-            result = workforce.eigent_make_sub_tasks(task)
+            result = await workforce.eigent_make_sub_tasks(task)
 
             # Should have flattened all streaming results
             assert len(result) == 3
@@ -109,7 +119,47 @@ class TestWorkforce:
             assert result[1].content == "Phase 2"
             assert result[2].content == "Phase 3"
 
-    def test_eigent_make_sub_tasks_invalid_content(self):
+    @pytest.mark.asyncio
+    async def test_adecompose_task_streams_on_running_loop(self):
+        """Test _adecompose_task parses streamed subtasks via astep."""
+        api_task_id = "test_api_task_123"
+        workforce = Workforce(
+            api_task_id=api_task_id, description="Test workforce"
+        )
+        task = Task(content="Build a report", id="main_task")
+
+        async def mock_chunks():
+            for content in (
+                "<task>Collect data</task>",
+                "<task>Collect data</task><task>Write report</task>",
+            ):
+                chunk = MagicMock()
+                chunk.msg.content = content
+                yield chunk
+
+        task_agent = MagicMock()
+        task_agent.astep = AsyncMock(
+            return_value=AsyncStreamingChatAgentResponse(mock_chunks())
+        )
+        workforce.task_agent = task_agent
+        stream_callback = MagicMock()
+
+        result = await workforce._adecompose_task(
+            task, stream_callback=stream_callback
+        )
+        batches = [batch async for batch in result]
+
+        assert [[t.content for t in b] for b in batches] == [
+            ["Collect data"],
+            ["Write report"],
+        ]
+        assert stream_callback.call_count == 2
+        assert [t.id for t in task.subtasks] == ["main_task.1", "main_task.2"]
+        assert all(t.parent is task for t in task.subtasks)
+        task_agent.astep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_eigent_make_sub_tasks_invalid_content(self):
         """Test eigent_make_sub_tasks with invalid task content."""
         api_task_id = "test_api_task_123"
         workforce = Workforce(
@@ -123,7 +173,7 @@ class TestWorkforce:
             "app.utils.workforce.validate_task_content", return_value=False
         ):
             with pytest.raises(UserException):
-                workforce.eigent_make_sub_tasks(task)
+                await workforce.eigent_make_sub_tasks(task)
 
             # Task should be marked as failed
             assert task.state == TaskState.FAILED
@@ -305,6 +355,10 @@ class TestWorkforce:
             added_worker = workforce._children[0]
             assert hasattr(added_worker, "worker")
             assert added_worker.worker is mock_worker
+            assert (
+                added_worker.dependency_context
+                is workforce._dependency_context
+            )
 
     def test_add_single_agent_worker_while_running(self):
         """Test add_single_agent_worker raises error when workforce is running."""
@@ -359,6 +413,39 @@ class TestWorkforce:
             # Should call parent method
             mock_super_handle.assert_called_once_with(task)
 
+    @pytest.mark.asyncio
+    async def test_eigent_start_indexes_task_tree_for_sync(self):
+        """Test subtask results sync to parent.subtasks via the index."""
+        workforce = Workforce(
+            api_task_id="test_api_task_123", description="Test workforce"
+        )
+        main_task = Task(content="Main task", id="main")
+        # parent.subtasks holds the final parse while the streamed copies
+        # are the ones that execute
+        final_subtask = Task(content="Step", id="main.1")
+        main_task.add_subtask(final_subtask)
+        streamed_subtask = Task(content="Step", id="main.1")
+        streamed_subtask.parent = main_task
+
+        with (
+            patch.object(workforce, "start", new_callable=AsyncMock),
+            patch.object(workforce, "save_snapshot"),
+        ):
+            await workforce.eigent_start([streamed_subtask])
+
+        assert workforce._task_tree.get("main.1") is streamed_subtask
+        assert workforce._task_tree.get_parent("main.1") is main_task
+
+        streamed_subtask.state = TaskState.DONE
+        streamed_subtask.result = "done"
+        workforce._sync_subtask_to_parent(streamed_subtask)
+
+        assert final_subtask.result == "done"
+        assert final_subtask.state == TaskState.DONE
+
+        workforce.reset()
+        assert len(workforce._task_tree) == 0
+
     @pytest.mark.asyncio
     async def test_handle_failed_task(self, mock_task_lock):
         """Test _handle_failed_task sends failure notification."""
@@ -398,6 +485,169 @@ class TestWorkforce:
             # Should call parent method
             mock_super_handle.assert_called_once_with(task)
 
+    @pytest.mark.asyncio
+    async def test_handle_failed_task_reads_error_from_metrics_index(
+        self, mock_task_lock
+    ):
+        """Test _handle_failed_task reports the indexed failure error."""
+        metrics = WorkforceMetricsCallback(
+            project_id="test_project", task_id="test_task"
+        )
+        workforce = Workforce(
+            api_task_id="test_api_task_123",
+            description="Test workforce",
+            callbacks=[metrics],
+        )
+        # CAMEL's default WorkforceLogger is not added next to it
+        assert workforce._callbacks == [metrics]
+        assert workforce._metrics_callback is metrics
+        assert workforce._metrics_index is metrics
+
+        task = Task(content="Failed task", id="failed_123")
+        task.state = TaskState.FAILED
+        task.failure_count = workforce.failure_handling_config.max_retries
+        metrics.log_task_failed(
+            TaskFailedEvent(
+                task_id=task.id, worker_id="worker_1", error_message="boom"
+            )
+        )
+
+        with (
+            patch(
+                "app.utils.workforce.get_task_lock",
+                return_value=mock_task_lock,
+            ),
+            patch.object(
+                workforce.__class__.__bases__[0],
+                "_handle_failed_task",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch.object(metrics, "log_task_failed") as log_task_failed,
+        ):
+            await workforce._handle_failed_task(task)
+
+        call_args = mock_task_lock.put_queue.call_args[0][0]
+        assert call_args.data["result"] == "boom"
+        # CAMEL's handler sends the failure event; it is not sent twice
+        log_task_failed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_post_ready_tasks_holds_tasks_over_worker_limit(
+        self, mock_task_lock
+    ):
+        """Test critical-path tasks go first and limits hold the rest."""
+        workforce = Workforce(
+            api_task_id="test_api_task_123",
+            description="Test workforce",
+            worker_concurrency={"browser_agent": 1},
+        )
+        workforce._scheduler.register_worker("browser_node", "browser_agent")
+        short, head, tail = (
+            Task(content="short", id="short"),
+            Task(content="head", id="head"),
+            Task(content="tail", id="tail"),
+        )
+        workforce._pending_tasks.extend([short, head, tail])
+        workforce._task_dependencies.update(
+            {"short": [], "head": [], "tail": ["head"]}
+        )
+
+        async def fake_post_ready_tasks():
+            # Mimic CAMEL: post ready tasks and drop them from pending
+            for task in list(workforce._pending_tasks):
+                if not workforce._task_dependencies[task.id]:
+                    await workforce._post_task(task, "browser_node")
+                    workforce._pending_tasks.remove(task)
+
+        async def fake_post_task(task, assignee_id):
+            # Mimic CAMEL: a posted task counts as in flight
+            workforce._in_flight_tasks += 1
+
+        base = workforce.__class__.__bases__[0]
+        with (
+            patch(
+                "app.utils.workforce.get_task_lock",
+                return_value=mock_task_lock,
+            ),
+            patch.object(
+                base, "_post_ready_tasks", side_effect=fake_post_ready_tasks
+            ),
+            patch.object(
+                base, "_post_task", side_effect=fake_post_task
+            ) as mock_post,
+        ):
+            await workforce._post_ready_tasks()
+
+        mock_post.assert_awaited_once_with(head, "browser_node")
+        assert [t.id for t in workforce._pending_tasks] == ["short", "tail"]
+        assert workforce.get_schedule_counts() == {
+            "scheduled": 1,
+            "running": 1,
+            "waiting": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_worker_slot_freed_after_timeout(self, mock_task_lock):
+        """Test a timed-out task no longer holds its worker slot."""
+        workforce = Workforce(
+            api_task_id="test_api_task_123",
+            description="Test workforce",
+            worker_concurrency={"browser_agent": 1},
+        )
+        workforce._scheduler.register_worker("browser_node", "browser_agent")
+        workforce.task_timeout_seconds = 0.01
+
+        async def never_returns(publisher_id):
+            await asyncio.sleep(1)
+
+        workforce._channel = MagicMock()
+        workforce._channel.get_returned_task_by_publisher = never_returns
+        stuck, waiting = Task(content="a", id="a"), Task(content="b", id="b")
+        assert workforce._scheduler.try_acquire(stuck, "browser_node")
+        assert not workforce._scheduler.try_acquire(waiting, "browser_node")
+
+        with patch(
+            "app.utils.workforce.get_task_lock", return_value=mock_task_lock
+        ):
+            with pytest.raises(TimeoutError):
+                await workforce._get_returned_task()
+
+        assert workforce.get_schedule_counts()["running"] == 0
+        assert workforce._scheduler.try_acquire(waiting, "browser_node")
+
+    @pytest.mark.asyncio
+    async def test_worker_slot_freed_when_post_fails(self, mock_task_lock):
+        """Test a task CAMEL failed to post does not keep its slot."""
+        workforce = Workforce(
+            api_task_id="test_api_task_123", description="Test workforce"
+        )
+        task = Task(content="a", id="a")
+        base = workforce.__class__.__bases__[0]
+        with (
+            patch(
+                "app.utils.workforce.get_task_lock",
+                return_value=mock_task_lock,
+            ),
+            # CAMEL logs channel errors and returns without posting
+            patch.object(base, "_post_task", new_callable=AsyncMock),
+        ):
+            await workforce._post_task(task, "worker_1")
+
+        assert workforce.get_schedule_counts()["running"] == 0
+
+    def test_remove_task_frees_worker_slot(self):
+        """Test removing a task releases any slot it held."""
+        workforce = Workforce(
+            api_task_id="test_api_task_123", description="Test workforce"
+        )
+        task = Task(content="a", id="a")
+        workforce._pending_tasks.append(task)
+        workforce._scheduler.mark_running(task.id, "worker_1")
+
+        assert workforce.remove_task("a")
+        assert workforce.get_schedule_counts()["running"] == 0
+
     @pytest.mark.asyncio
     async def test_stop_sends_end_notification(self, mock_task_lock):
         """Test stop method sends end notification."""
@@ -488,14 +738,19 @@ class TestWorkforceIntegration:
         ]
 
         with (
-            patch.object(workforce, "_decompose_task", return_value=subtasks),
+            patch.object(
+                workforce,
+                "_adecompose_task",
+                new_callable=AsyncMock,
+                return_value=subtasks,
+            ),
             patch(
                 "app.utils.workforce.validate_task_content", return_value=True
             ),
             patch.object(workforce, "start", new_callable=AsyncMock),
         ):
             # Make subtasks
-            result_subtasks = workforce.eigent_make_sub_tasks(main_task)
+            result_subtasks = await workforce.eigent_make_sub_tasks(main_task)
             assert len(result_subtasks) == 3
 
             # Start workforce
@@ -621,7 +876,8 @@ class TestWorkforceWithLLM:
 class TestWorkforceErrorCases:
     """Test error cases and edge conditions for Workforce."""
 
-    def test_eigent_make_sub_tasks_with_none_task(self):
+    @pytest.mark.asyncio
+    async def test_eigent_make_sub_tasks_with_none_task(self):
         """Test eigent_make_sub_tasks with None task."""
         api_task_id = "error_test_123"
         workforce = Workforce(
@@ -629,9 +885,10 @@ class TestWorkforceErrorCases:
         )
 
         with pytest.raises((AttributeError, TypeError)):
-            workforce.eigent_make_sub_tasks(None)
+            await workforce.eigent_make_sub_tasks(None)
 
-    def test_eigent_make_sub_tasks_with_malformed_task(self):
+    @pytest.mark.asyncio
+    async def test_eigent_make_sub_tasks_with_malformed_task(self):
         """Test eigent_make_sub_tasks with malformed task object."""
         api_task_id = "error_test_123"
         workforce = Workforce(
@@ -647,7 +904,7 @@ class TestWorkforceErrorCases:
             "app.utils.workforce.validate_task_content", return_value=False
         ):
             with pytest.raises(UserException):
-                workforce.eigent_make_sub_tasks(fake_task)
+                await workforce.eigent_make_sub_tasks(fake_task)
 
     @pytest.mark.asyncio
     async def test_eigent_start_with_empty_subtasks(self):